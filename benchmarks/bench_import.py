@@ -0,0 +1,63 @@
+#!/usr/bin/env python3
+"""
+Startup benchmark for importing pybt.
+
+Runs ``python -X importtime`` in fresh interpreters and reports the
+cumulative import time of the pybt modules for a few common entry points.
+Modules the interpreter loads at startup (``site`` and friends) are not
+counted. Exits with status 1 if the median exceeds the budget.
+
+Usage:
+    PYTHONPATH=. python benchmarks/bench_import.py [--runs 7] [--budget-ms 50]
+"""
+
+import argparse
+import os
+import re
+import statistics
+import subprocess
+import sys
+
+STATEMENTS = [
+    "import pybt",
+    "import pybt.api",
+    "from pybt.api import System",
+    "from pybt.api import Website, Panel",
+]
+
+LINE = re.compile(r"import time:\s+(\d+) \|\s+(\d+) \| (\s*)(\S+)")
+
+
+def measure(statement: str) -> float:
+    """Return the cumulative import time of top-level pybt imports in ms."""
+    env = dict(os.environ, PYTHONPATH=os.pathsep.join(filter(None, [os.getcwd(), os.getenv("PYTHONPATH")])))
+    stderr = subprocess.run(
+        [sys.executable, "-X", "importtime", "-c", statement],
+        capture_output=True, text=True, env=env, check=True
+    ).stderr
+    total = 0
+    for match in LINE.finditer(stderr):
+        _, cumulative, indent, module = match.groups()
+        # Only top-level entries: nested imports are already in their parent
+        if not indent and module.startswith("pybt"):
+            total += int(cumulative)
+    return total / 1000
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--runs", type=int, default=7)
+    parser.add_argument("--budget-ms", type=float, default=50.0)
+    args = parser.parse_args()
+
+    over_budget = False
+    for statement in STATEMENTS:
+        median = statistics.median(measure(statement) for _ in range(args.runs))
+        flag = "" if median <= args.budget_ms else "  OVER BUDGET"
+        over_budget = over_budget or bool(flag)
+        print(f"{statement:40s} {median:8.2f} ms{flag}")
+    sys.exit(1 if over_budget else 0)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,62 @@
+#!/usr/bin/env python3
+"""
+Benchmark decoding typical status payloads with each installed JSON backend.
+
+The payloads mirror ``get_network`` and ``get_system_total`` responses and
+are decoded from bytes, as ``Client`` does with an accelerated backend. The
+``json (response.json)`` row includes the str decoding done by requests.
+
+Usage:
+    PYTHONPATH=. python benchmarks/bench_json.py [--n 200000]
+"""
+
+import argparse
+import json
+import time
+
+from pybt.utils import jsonlib
+
+NETWORK = {
+    "down": 3.52, "up": 5.25, "downTotal": 446676332554, "upTotal": 77466559941,
+    "downPackets": 1008262163, "upPackets": 563293178, "cpu": [4.2, 12],
+    "mem": {"memFree": 1231, "memTotal": 7821, "memCached": 2480, "memBuffers": 214, "memRealUsed": 3896},
+    "load": {"one": 0.21, "five": 0.28, "fifteen": 0.3, "max": 24, "limit": 24, "safe": 18},
+    "disk": [{"path": "/", "size": ["40G", "21G", "17G", "56%"], "inodes": ["2.5M", "301K", "2.3M", "12%"]}],
+    "site_total": 12, "ftp_total": 3, "database_total": 8, "title": "宝塔Linux面板", "version": "8.0.1",
+}
+SYSTEM_TOTAL = {
+    "memTotal": 7821, "memFree": 1231, "memBuffers": 214, "memCached": 2480, "memRealUsed": 3896,
+    "cpuNum": 12, "cpuRealUsed": 4.2, "time": "36天", "system": "CentOS Linux 7.9.2009 (Core)",
+    "isuser": 0, "isport": True, "version": "8.0.1",
+}
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--n", type=int, default=200000)
+    args = parser.parse_args()
+
+    for label, payload in (("get_network", NETWORK), ("get_system_total", SYSTEM_TOTAL)):
+        body = json.dumps(payload, ensure_ascii=False).encode()
+        start = time.perf_counter()
+        for _ in range(args.n):
+            # What response.json() does for a UTF-8 body
+            json.loads(body.decode("utf-8"))
+        baseline = time.perf_counter() - start
+        print(f"{label:18s} {'json (response.json)':22s} {baseline / args.n * 1e6:7.2f} us/op")
+        for name in jsonlib.BACKENDS:
+            try:
+                jsonlib.set_backend(name)
+                loads = jsonlib.get_backend().loads
+            except ImportError:
+                print(f"{label:18s} {name:22s} not installed")
+                continue
+            start = time.perf_counter()
+            for _ in range(args.n):
+                loads(body)
+            elapsed = time.perf_counter() - start
+            print(f"{label:18s} {name:22s} {elapsed / args.n * 1e6:7.2f} us/op  {baseline / elapsed:5.2f}x")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,103 @@
+#!/usr/bin/env python3
+"""
+Benchmark comparing per-class sessions with the shared per-host pool.
+
+A local keep-alive HTTP server stands in for the panel and counts accepted
+TCP connections (one handshake each). Every "job" builds the six API objects
+an automation script typically uses and makes one call with each of them.
+
+Usage:
+    PYTHONPATH=. python benchmarks/bench_pool.py [--jobs 200]
+"""
+
+import argparse
+import json
+import statistics
+import threading
+import time
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+
+import requests
+
+from pybt.api import System, Website, WebsiteBackup, Domain, Directory, DefaultDocument
+from pybt.core.transport import registry
+
+API_CLASSES = [System, Website, WebsiteBackup, Domain, Directory, DefaultDocument]
+CALLS = [
+    lambda api: api.get_network(),
+    lambda api: api.get_website_list(),
+    lambda api: api.get_backup_list(search=1),
+    lambda api: api.get_domain_list(site_id=1),
+    lambda api: api.get_root_path(id=1),
+    lambda api: api.get_default_document(id=1),
+]
+
+
+class PanelHandler(BaseHTTPRequestHandler):
+    """Minimal keep-alive handler returning a small JSON document."""
+
+    protocol_version = "HTTP/1.1"
+    disable_nagle_algorithm = True
+    connections = 0
+    lock = threading.Lock()
+
+    def setup(self):
+        with PanelHandler.lock:
+            PanelHandler.connections += 1
+        super().setup()
+
+    def do_POST(self):
+        self.rfile.read(int(self.headers.get("Content-Length", 0)))
+        body = json.dumps({"status": True, "data": []}).encode()
+        self.send_response(200)
+        self.send_header("Content-Type", "application/json")
+        self.send_header("Content-Length", str(len(body)))
+        self.end_headers()
+        self.wfile.write(body)
+
+    def log_message(self, *args):
+        pass
+
+
+def run(host: str, jobs: int, shared: bool):
+    """Run the mixed workload and return (handshakes, latencies)."""
+    registry.close()
+    PanelHandler.connections = 0
+    latencies = []
+    for _ in range(jobs):
+        apis = []
+        for api_class in API_CLASSES:
+            session = None if shared else requests.Session()
+            apis.append(api_class(api_key="bench", bt_panel_host=host, session=session))
+        for api, call in zip(apis, CALLS):
+            start = time.perf_counter()
+            call(api)
+            latencies.append(time.perf_counter() - start)
+        if not shared:
+            for api in apis:
+                api.session.close()
+    return PanelHandler.connections, latencies
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--jobs", type=int, default=200)
+    args = parser.parse_args()
+
+    server = ThreadingHTTPServer(("127.0.0.1", 0), PanelHandler)
+    threading.Thread(target=server.serve_forever, daemon=True).start()
+    host = f"http://127.0.0.1:{server.server_address[1]}"
+
+    for label, shared in (("per-class sessions", False), ("shared pool", True)):
+        handshakes, latencies = run(host, args.jobs, shared)
+        latencies.sort()
+        print(
+            f"{label:20s} handshakes={handshakes:6d} "
+            f"p50={statistics.median(latencies) * 1000:.3f}ms "
+            f"p95={latencies[int(len(latencies) * 0.95)] * 1000:.3f}ms"
+        )
+    server.shutdown()
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,71 @@
+#!/usr/bin/env python3
+"""
+Benchmark RateEngine ticks over a large fleet.
+
+Every tick feeds one NetworkSample per panel, with a few counters reset,
+and times ``RateEngine.update`` with NumPy and with the Python fallback.
+
+Usage:
+    PYTHONPATH=. python benchmarks/bench_rates.py [--panels 5000] [--ticks 50]
+"""
+
+import argparse
+import random
+import statistics
+import time
+
+from pybt.api.records import NetworkSample
+from pybt.utils.rates import RateEngine
+
+
+def ticks(panels: int, count: int):
+    """Build ``count`` ticks of samples for ``panels`` panels."""
+    rng = random.Random(1)
+    totals = {f"http://panel-{i}:8888": [0, 0, 0, 0] for i in range(panels)}
+    result = []
+    for tick in range(count):
+        samples = {}
+        for host, counters in totals.items():
+            if rng.random() < 0.001:
+                counters[:] = [0, 0, 0, 0]
+            counters[:] = [value + rng.randint(0, 50000) for value in counters]
+            sample = NetworkSample.from_dict({
+                "upTotal": counters[0], "downTotal": counters[1],
+                "upPackets": counters[2], "downPackets": counters[3],
+            }, timestamp=tick * 5.0 + rng.random())
+            samples[host] = sample
+        result.append(samples)
+    return result
+
+
+def measure(data, numpy: bool) -> float:
+    """Run every tick and return the median seconds per tick."""
+    engine = RateEngine(half_life=30, numpy=numpy)
+    times = []
+    for samples in data:
+        start = time.perf_counter()
+        engine.update(samples)
+        times.append(time.perf_counter() - start)
+    return statistics.median(times[1:])
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--panels", type=int, default=5000)
+    parser.add_argument("--ticks", type=int, default=50)
+    args = parser.parse_args()
+
+    data = ticks(args.panels, args.ticks)
+    python_tick = measure(data, numpy=False)
+    print(f"{args.panels} panels per tick")
+    print(f"python: {python_tick * 1000:8.2f} ms per tick")
+    try:
+        numpy_tick = measure(data, numpy=True)
+    except ImportError:
+        print("numpy:  not installed")
+        return
+    print(f"numpy:  {numpy_tick * 1000:8.2f} ms per tick ({python_tick / numpy_tick:.1f}x)")
+
+
+if __name__ == "__main__":
+    main()
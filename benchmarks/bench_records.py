@@ -0,0 +1,67 @@
+#!/usr/bin/env python3
+"""
+Benchmark the memory of a site inventory held as dicts or as Site records.
+
+Rows are decoded from JSON like real responses, so every row owns its
+strings, and then kept either as the decoded dictionaries or converted with
+``Site.from_rows``. Memory is measured with tracemalloc.
+
+Usage:
+    PYTHONPATH=. python benchmarks/bench_records.py [--sites 200000]
+"""
+
+import argparse
+import json
+import time
+import tracemalloc
+
+from pybt.api.records import Site
+
+
+def site_rows(count: int) -> bytes:
+    """Build a JSON array of website list rows, half of them with SSL."""
+    rows = []
+    for i in range(count):
+        name = f"site{i}.example.com"
+        rows.append({
+            "id": i, "name": name, "path": f"/www/wwwroot/{name}", "status": "1",
+            "ps": name.replace(".", "_"), "addtime": f"2024-01-{1 + i % 28:02d} 12:00:{i % 60:02d}",
+            "edate": "0000-00-00", "type_id": 0, "backup_count": i % 3, "domain": 1,
+            "php_version": ("74", "80", "82")[i % 3],
+            "ssl": -1 if i % 2 else {
+                "issuer": "R3", "subject": name, "notBefore": "2024-12-09",
+                "notAfter": "2025-03-09", "endtime": 73, "dns": [name],
+            },
+        })
+    return json.dumps(rows).encode()
+
+
+def measure(payload: bytes, records: bool):
+    """Decode the rows and return (bytes held, seconds)."""
+    tracemalloc.start()
+    start = time.perf_counter()
+    rows = json.loads(payload)
+    if records:
+        rows = list(Site.from_rows(rows))
+    elapsed = time.perf_counter() - start
+    held = tracemalloc.get_traced_memory()[0]
+    tracemalloc.stop()
+    del rows
+    return held, elapsed
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--sites", type=int, default=200000)
+    args = parser.parse_args()
+
+    payload = site_rows(args.sites)
+    dict_held, dict_time = measure(payload, records=False)
+    record_held, record_time = measure(payload, records=True)
+    print(f"dicts    {dict_held / 2**20:8.1f} MB  {dict_held / args.sites:6.0f} B/site  {dict_time:6.2f}s")
+    print(f"records  {record_held / 2**20:8.1f} MB  {record_held / args.sites:6.0f} B/site  {record_time:6.2f}s")
+    print(f"ratio    {dict_held / record_held:8.2f}x")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,55 @@
+#!/usr/bin/env python3
+"""
+Benchmark rolling up a month of 5-second samples.
+
+Feeds ``--days`` of NetworkSample-like rows into a Rollup with the default
+resolutions, then queries the whole range and the last hour, and reports
+the ingest cost per sample, the points each query reads and the memory
+the rollup holds.
+
+Usage:
+    PYTHONPATH=. python benchmarks/bench_rollup.py [--days 30] [--interval 5]
+"""
+
+import argparse
+import math
+import time
+import tracemalloc
+
+from pybt.core.rollup import Rollup
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--days", type=float, default=30)
+    parser.add_argument("--interval", type=float, default=5.0)
+    args = parser.parse_args()
+
+    count = int(args.days * 86400 / args.interval)
+    # Buffers are preallocated, so the held memory is known before ingest
+    tracemalloc.start()
+    rollup = Rollup()
+    held = tracemalloc.get_traced_memory()[0]
+    tracemalloc.stop()
+    start = time.perf_counter()
+    for i in range(count):
+        t = i * args.interval
+        rollup.add({
+            "timestamp": t, "cpu_percent": 20 + 15 * math.sin(t / 3600), "mem_used": 2048.0 + i % 100,
+            "load_one": 0.5, "up": 12.0, "down": 30.0,
+        })
+    ingest = time.perf_counter() - start
+
+    end = (count - 1) * args.interval
+    print(f"{count} samples, {ingest / count * 1e6:.1f} us per sample, {held / 2**20:.1f} MB held")
+    for label, since in (("whole range", 0.0), ("last day", end - 86400), ("last hour", end - 3600)):
+        start = time.perf_counter()
+        columns = rollup.query(start=since)
+        elapsed = time.perf_counter() - start
+        step = rollup.choose_resolution(start=since)
+        print(f"{label:12s} {columns.length:6d} points at {step:5d}s in {elapsed * 1000:6.2f} ms "
+              f"(raw: {int((end - since) / args.interval) + 1} samples)")
+
+
+if __name__ == "__main__":
+    main()
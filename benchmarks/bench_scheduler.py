@@ -0,0 +1,122 @@
+#!/usr/bin/env python3
+"""
+Simulate adaptive polling of a fleet against fixed-interval polling.
+
+Simulated panels idle at a few percent CPU with small noise and run a CPU
+burst now and then, their disks fill slowly and an install task shows up
+occasionally. Time is virtual, so hours of polling run in seconds. Both
+strategies poll ``get_network``, ``get_disk_info`` and ``get_task_count``;
+the fixed one every ``--interval`` seconds. Reported are the request
+counts, how late burst starts and ends were first seen, and the mean error
+of the CPU series each strategy reconstructs (last polled value held).
+
+Usage:
+    PYTHONPATH=. python benchmarks/bench_scheduler.py [--panels 100] [--hours 6] [--max-interval 10]
+"""
+
+import argparse
+import random
+import statistics
+from types import SimpleNamespace
+
+from pybt.core.scheduler import AdaptiveScheduler
+
+
+class SimulatedPanel:
+    """System stand-in whose readings follow a precomputed timeline."""
+
+    def __init__(self, index: int, seconds: int, rng: random.Random) -> None:
+        self.config = SimpleNamespace(bt_panel_host=f"http://panel-{index}:8888")
+        self.now = 0
+        self.cpu = [max(0.0, rng.gauss(4, 1.2)) for _ in range(seconds)]
+        self.bursts = []
+        self.tasks = [0] * seconds
+        start = int(rng.expovariate(1 / 7200))
+        while start < seconds:
+            end = min(seconds, start + rng.randint(120, 600))
+            level = rng.uniform(50, 90)
+            for t in range(start, end):
+                self.cpu[t] = level + rng.gauss(0, 3)
+            self.bursts.append((start, end))
+            start = end + int(rng.expovariate(1 / 7200))
+        start = int(rng.expovariate(1 / 14400))
+        while start < seconds:
+            for t in range(start, min(seconds, start + rng.randint(60, 300))):
+                self.tasks[t] = 1
+            start += 300 + int(rng.expovariate(1 / 14400))
+        self.disk_rate = rng.uniform(0, 2) / 3600
+
+    def get_network(self):
+        return {"cpu": [round(self.cpu[self.now], 1), 4], "load": {"one": 0.2}, "up": 3.0, "down": 5.0}
+
+    def get_disk_info(self):
+        usage = 40 + self.disk_rate * self.now
+        return [{"path": "/", "size": ["50G", "20G", "30G", f"{usage:.0f}%"], "inodes": ["1M", "1K", "1M", "1%"]}]
+
+    def get_task_count(self):
+        return self.tasks[self.now]
+
+
+def simulate(panels, seconds, adaptive, interval, max_interval):
+    """Run one strategy and return (requests, delays, cpu error)."""
+    clock = SimpleNamespace(now=0.0)
+    scheduler = AdaptiveScheduler(
+        min_interval=interval, max_interval=max_interval, max_workers=1,
+        clock=lambda: clock.now, seed=1,
+    ) if adaptive else AdaptiveScheduler(
+        min_interval=interval, max_interval=interval, jitter=0.0, max_workers=1,
+        clock=lambda: clock.now, seed=1,
+    )
+    seen = {}
+    scheduler.subscribe(lambda job, result: seen.setdefault(job.client, []).append(
+        (clock.now, result["cpu"][0])) if job.method == "get_network" else None)
+    for panel in panels:
+        scheduler.add(panel)
+    for now in range(seconds):
+        clock.now = float(now)
+        for panel in panels:
+            panel.now = now
+        scheduler.run_due(now)
+
+    delays, error = [], []
+    for panel in panels:
+        readings = seen.get(panel, [])
+        times = [t for t, _ in readings]
+        for start, end in panel.bursts:
+            for edge, busy in ((start, True), (end, False)):
+                first = next((t for t, cpu in readings if t >= edge and (cpu > 30) == busy), None)
+                if first is not None and edge < seconds - 900:
+                    delays.append(first - edge)
+        held, index = 0.0, 0
+        for now in range(seconds):
+            while index < len(times) and times[index] <= now:
+                held = readings[index][1]
+                index += 1
+            error.append(abs(held - panel.cpu[now]))
+    return scheduler.requests, delays, statistics.mean(error)
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--panels", type=int, default=100)
+    parser.add_argument("--hours", type=float, default=6)
+    parser.add_argument("--interval", type=float, default=5.0)
+    parser.add_argument("--max-interval", type=float, default=10.0)
+    args = parser.parse_args()
+
+    seconds = int(args.hours * 3600)
+    rng = random.Random(7)
+    panels = [SimulatedPanel(i, seconds, rng) for i in range(args.panels)]
+    results = {}
+    for name, adaptive in (("fixed", False), ("adaptive", True)):
+        requests, delays, error = simulate(panels, seconds, adaptive, args.interval, args.max_interval)
+        results[name] = requests
+        delays.sort()
+        p95 = delays[int(len(delays) * 0.95)] if delays else float("nan")
+        print(f"{name:9s} {requests:9d} requests  edge delay median {statistics.median(delays):5.1f}s "
+              f"p95 {p95:5.1f}s  mean cpu error {error:5.2f} points")
+    print(f"ratio     {results['adaptive'] / results['fixed']:.2f}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,73 @@
+#!/usr/bin/env python3
+"""
+Benchmark SiteSearch query latency over a fleet-sized site inventory.
+
+Synthetic sites are spread over several panels, each with a remark, a root
+path and a couple of extra domains. The script reports the time to build the
+index and the median and worst latency of prefix, substring and combined
+queries (``limit=20``).
+
+Usage:
+    PYTHONPATH=. python benchmarks/bench_search.py [--sites 200000] [--panels 50]
+"""
+
+import argparse
+import random
+import statistics
+import time
+
+from pybt.core.site_search import SiteSearch
+
+WORDS = ["shop", "blog", "api", "cdn", "mail", "static", "news", "store", "app", "portal",
+         "crm", "wiki", "docs", "test", "dev", "img", "m", "pay", "user", "admin"]
+TLDS = ["com", "net", "cn", "org", "io"]
+
+
+def build(search: SiteSearch, sites: int, panels: int, rng: random.Random) -> None:
+    """Index synthetic sites for every panel."""
+    per_panel = sites // panels
+    for p in range(panels):
+        rows, domains = [], []
+        for i in range(per_panel):
+            word = rng.choice(WORDS)
+            name = f"{word}{rng.randrange(100000)}.example{p}.{rng.choice(TLDS)}"
+            rows.append({"id": i, "name": name, "ps": f"{word} site for customer {rng.randrange(10000)}",
+                         "path": f"/www/wwwroot/{name}"})
+            domains += [{"pid": i, "name": f"www.{name}"}, {"pid": i, "name": f"m.{name}"}]
+        search.load_rows(f"https://panel{p}.example.com:8888", rows, domains)
+
+
+def time_queries(method, queries):
+    """Return (median, max) latency in milliseconds."""
+    latencies = []
+    for query in queries:
+        start = time.perf_counter()
+        method(query, 20)
+        latencies.append((time.perf_counter() - start) * 1000)
+    return statistics.median(latencies), max(latencies)
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--sites", type=int, default=200000)
+    parser.add_argument("--panels", type=int, default=50)
+    args = parser.parse_args()
+    rng = random.Random(1)
+
+    search = SiteSearch()
+    start = time.perf_counter()
+    build(search, args.sites, args.panels, rng)
+    print(f"indexed {len(search)} sites in {time.perf_counter() - start:.1f}s")
+
+    queries = [rng.choice(WORDS)[:n] + (str(rng.randrange(100)) if n > 3 else "")
+               for n in (1, 2, 3, 4, 5) for _ in range(200)]
+    queries += [f"customer {rng.randrange(10000)}" for _ in range(200)]
+    queries += [f"example{rng.randrange(args.panels)}.c" for _ in range(200)]
+    queries += ["zzz-no-match"] * 50
+    for name in ("prefix", "substring", "search"):
+        median, worst = time_queries(getattr(search, name), queries)
+        print(f"{name:9s} median {median:6.3f} ms  max {worst:7.3f} ms")
+
+
+if __name__ == "__main__":
+    main()
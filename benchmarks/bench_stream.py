@@ -0,0 +1,132 @@
+#!/usr/bin/env python3
+"""
+Benchmark comparing peak memory of post_data and stream_data on a large body.
+
+A local HTTP server stands in for the panel and returns a ~100 MB response,
+either one huge ``GetFileBody`` string or a ``getData`` page with many rows.
+Each measurement runs in a fresh interpreter so that peak RSS is not shared.
+
+Usage:
+    PYTHONPATH=. python benchmarks/bench_stream.py [--size-mb 100]
+"""
+
+import argparse
+import json
+import resource
+import subprocess
+import sys
+import time
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+
+CHUNK = 1 << 20
+
+
+def file_body(size: int) -> bytes:
+    """Build a GetFileBody response with a log file of about size bytes."""
+    line = '127.0.0.1 - - [18/Oct/2026:12:00:00 +0800] "GET /index.php HTTP/1.1" 200 512 "-" "curl"\n'
+    content = line * (size // len(line))
+    return json.dumps({"status": True, "only_read": False, "encoding": "utf-8", "data": content}).encode()
+
+
+def table_body(size: int) -> bytes:
+    """Build a getData page with about size bytes of site rows."""
+    row = {
+        "id": 0, "name": "site.example.com", "path": "/www/wwwroot/site.example.com",
+        "status": "1", "ps": "benchmark site", "addtime": "2024-01-01 00:00:00",
+        "edate": "0000-00-00", "backup_count": 0, "domain": 2, "php_version": "74",
+        "ssl": {"issuer": "R3", "notAfter": "2025-03-09", "dns": ["site.example.com"], "endtime": 73},
+    }
+    count = size // len(json.dumps(row))
+    rows = [dict(row, id=i) for i in range(count)]
+    page = f"<div><span class='Pcount'>共{count}条</span></div>"
+    return json.dumps({"where": "", "data": rows, "page": page}).encode()
+
+
+class PanelHandler(BaseHTTPRequestHandler):
+    """Handler returning the prepared body in 1 MiB writes."""
+
+    protocol_version = "HTTP/1.1"
+    bodies = {}
+
+    def do_POST(self):
+        self.rfile.read(int(self.headers.get("Content-Length", 0)))
+        body = PanelHandler.bodies["file" if "GetFileBody" in self.path else "table"]
+        self.send_response(200)
+        self.send_header("Content-Type", "application/json")
+        self.send_header("Content-Length", str(len(body)))
+        self.end_headers()
+        view = memoryview(body)
+        for start in range(0, len(body), CHUNK):
+            self.wfile.write(view[start:start + CHUNK])
+
+    def log_message(self, *args):
+        pass
+
+
+def child(host: str, body: str, mode: str) -> None:
+    """Fetch one body and print the peak RSS growth in MiB and elapsed time."""
+    from pybt.api import Rewrite
+
+    api = Rewrite(api_key="bench", bt_panel_host=host, timeout=300)
+    endpoint = api.config.get_endpoint("GetFileBody" if body == "file" else "Websites")
+    baseline = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+    start = time.perf_counter()
+    if mode == "post_data":
+        result = api.post_data(endpoint, {"path": "/www/wwwlogs/access.log"})
+        count = len(result["data"])
+        del result
+    elif body == "file":
+        count = sum(len(piece) for piece in api.stream_data(endpoint, {"path": "/www/wwwlogs/access.log"}).text())
+    else:
+        count = sum(1 for _ in api.stream_data(endpoint, {"p": 1}).items())
+    elapsed = time.perf_counter() - start
+    peak = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+    print(json.dumps({"peak_mb": (peak - baseline) / 1024, "elapsed": elapsed, "count": count}))
+
+
+def serve(size: int) -> None:
+    """Serve both bodies and print the panel URL."""
+    PanelHandler.bodies = {"file": file_body(size), "table": table_body(size)}
+    server = ThreadingHTTPServer(("127.0.0.1", 0), PanelHandler)
+    print(f"http://127.0.0.1:{server.server_address[1]}", flush=True)
+    server.serve_forever()
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--size-mb", type=int, default=100)
+    parser.add_argument("--serve", type=int, help=argparse.SUPPRESS)
+    parser.add_argument("--child", nargs=3, metavar=("HOST", "BODY", "MODE"), help=argparse.SUPPRESS)
+    args = parser.parse_args()
+    if args.serve:
+        serve(args.serve)
+        return
+    if args.child:
+        child(*args.child)
+        return
+
+    # The server runs in its own process so that its copy of the bodies does
+    # not count towards the peak RSS of the measured processes
+    server = subprocess.Popen(
+        [sys.executable, __file__, "--serve", str(args.size_mb << 20)],
+        stdout=subprocess.PIPE, text=True
+    )
+    try:
+        host = server.stdout.readline().strip()
+        for body in ("file", "table"):
+            for mode in ("post_data", "stream_data"):
+                output = subprocess.run(
+                    [sys.executable, __file__, "--child", host, body, mode],
+                    check=True, capture_output=True, text=True
+                ).stdout
+                result = json.loads(output.strip().splitlines()[-1])
+                print(
+                    f"{body:5s} {args.size_mb:4d} MB  {mode:12s} peak RSS +{result['peak_mb']:8.1f} MB  "
+                    f"{result['elapsed']:6.2f}s  items={result['count']}"
+                )
+    finally:
+        server.terminate()
+
+
+if __name__ == "__main__":
+    main()
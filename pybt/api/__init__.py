@@ -1,16 +1,51 @@
-"""BaoTa Panel API modules."""
-
-from .system import System
-from .website import Website, WebsiteBackup, Domain, Rewrite, Directory, PasswordAccess, TrafficLimit, DefaultDocument
-
-__all__ = [
-    'System',
-    'Website',
-    'WebsiteBackup',
-    'Domain',
-    'Rewrite',
-    'Directory',
-    'PasswordAccess',
-    'TrafficLimit',
-    'DefaultDocument',
-]
+"""BaoTa Panel API modules.
+
+API classes are imported lazily on first attribute access, so importing
+``pybt.api`` does not load ``requests`` or any API module up front.
+"""
+
+import importlib
+
+_exports = {
+    'System': '.system',
+    'Website': '.website',
+    'WebsiteBackup': '.website',
+    'Domain': '.website',
+    'Rewrite': '.website',
+    'Directory': '.website',
+    'PasswordAccess': '.website',
+    'TrafficLimit': '.website',
+    'DefaultDocument': '.website',
+    'Panel': '.panel',
+    'Fleet': '.fleet',
+    'FleetResult': '.fleet',
+    'Site': '..core.records',
+    'DomainEntry': '..core.records',
+    'Backup': '..core.records',
+    'DiskPartition': '..core.records',
+    'NetworkSample': '..core.records',
+    'AsyncSystem': '.aio',
+    'AsyncWebsite': '.aio',
+    'AsyncWebsiteBackup': '.aio',
+    'AsyncDomain': '.aio',
+    'AsyncRewrite': '.aio',
+    'AsyncDirectory': '.aio',
+    'AsyncPasswordAccess': '.aio',
+    'AsyncTrafficLimit': '.aio',
+    'AsyncDefaultDocument': '.aio',
+}
+
+__all__ = list(_exports)
+
+
+def __getattr__(name):
+    module_name = _exports.get(name)
+    if module_name is None:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+    value = getattr(importlib.import_module(module_name, __name__), name)
+    globals()[name] = value
+    return value
+
+
+def __dir__():
+    return sorted(list(globals()) + __all__)
@@ -0,0 +1,64 @@
+"""Asynchronous API classes.
+
+Each class mirrors its synchronous counterpart: the API methods are shared
+and return awaitables because ``post_data`` is resolved from
+:class:`~pybt.core.async_client.AsyncClient`. Listing iterators such as
+``iter_websites`` are async iterators, ``get_*_columns`` are coroutines and
+streamed reads (``iter_rewrite_content``) raise TypeError.
+
+Example:
+    >>> system = AsyncSystem()
+    >>> await system.get_network()
+"""
+
+from typing import Optional
+
+from ..core.async_client import AsyncClient
+from ..utils.columns import Columns, to_columns
+from ..core.records import DiskPartition
+from .system import System
+from .website import (
+    Website, WebsiteBackup, Domain, Rewrite, Directory,
+    PasswordAccess, TrafficLimit, DefaultDocument
+)
+
+
+class AsyncSystem(AsyncClient, System):
+    """Asynchronous system management API."""
+
+    async def get_disk_columns(self, numpy: Optional[bool] = None) -> Columns:
+        """Get disk partition information as column arrays; see :meth:`System.get_disk_columns`."""
+        disks = DiskPartition.convert(await self.get_disk_info())
+        return to_columns(disks if isinstance(disks, list) else [], DiskPartition._fields, numpy)
+
+
+class AsyncWebsite(AsyncClient, Website):
+    """Asynchronous website basic operations API."""
+
+
+class AsyncWebsiteBackup(AsyncClient, WebsiteBackup):
+    """Asynchronous website backup management API."""
+
+
+class AsyncDomain(AsyncClient, Domain):
+    """Asynchronous domain management API."""
+
+
+class AsyncRewrite(AsyncClient, Rewrite):
+    """Asynchronous rewrite and configuration management API."""
+
+
+class AsyncDirectory(AsyncClient, Directory):
+    """Asynchronous website directory and runtime configuration API."""
+
+
+class AsyncPasswordAccess(AsyncClient, PasswordAccess):
+    """Asynchronous password access control API."""
+
+
+class AsyncTrafficLimit(AsyncClient, TrafficLimit):
+    """Asynchronous traffic limit management API (nginx only)."""
+
+
+class AsyncDefaultDocument(AsyncClient, DefaultDocument):
+    """Asynchronous default document management API."""
@@ -0,0 +1,228 @@
+"""Multi-panel fleet API.
+
+This module runs the same API call across many panels concurrently and
+collects a per-panel result, so one slow or broken panel does not hold up or
+fail the whole sweep.
+"""
+
+import time
+from concurrent.futures import ThreadPoolExecutor, wait, FIRST_COMPLETED
+from dataclasses import dataclass
+from typing import TYPE_CHECKING, Any, Callable, Dict, Iterable, Iterator, List, Optional, Sequence, Tuple, Union
+
+from .panel import Panel
+from .system import System
+from .website import (
+    Website, WebsiteBackup, Domain, Rewrite, Directory,
+    PasswordAccess, TrafficLimit, DefaultDocument
+)
+
+if TYPE_CHECKING:
+    from ..core.metrics import MetricsRegistry
+
+API_CLASSES = (
+    System, Website, WebsiteBackup, Domain, Rewrite, Directory,
+    PasswordAccess, TrafficLimit, DefaultDocument
+)
+
+PanelEntry = Union[Tuple[str, str], Tuple[str, str, int], Panel]
+
+
+@dataclass
+class FleetResult:
+    """Outcome of a fleet call on one panel.
+
+    Attributes:
+        host: Panel URL
+        result: Value returned by the call, or None if it failed
+        error: Exception raised by the call, or None if it succeeded
+        elapsed: Wall-clock time of the call in seconds
+    """
+    host: str
+    result: Any = None
+    error: Optional[BaseException] = None
+    elapsed: float = 0.0
+
+    @property
+    def ok(self) -> bool:
+        """Whether the call succeeded."""
+        return self.error is None
+
+
+def _resolve(method: Callable) -> Callable[..., Any]:
+    """Turn an unbound API method into a function of ``(panel, *args)``.
+
+    Args:
+        method: Unbound API method such as ``System.get_network``, or any
+            callable taking the panel as first argument
+
+    Returns:
+        Function calling the method on the right API object of a panel
+    """
+    for api_class in API_CLASSES:
+        if getattr(api_class, getattr(method, "__name__", ""), None) is method:
+            return lambda panel, *args, **kwargs: method(panel.client(api_class), *args, **kwargs)
+    return method
+
+
+class Fleet:
+    """Fan API calls out to many BaoTa Panels concurrently.
+
+    Example:
+        >>> fleet = Fleet([("http://10.0.0.1:8888", "key1"), ("http://10.0.0.2:8888", "key2")])
+        >>> for r in fleet.run(System.get_network):
+        ...     print(r.host, r.result if r.ok else r.error)
+    """
+
+    def __init__(
+        self,
+        panels: Iterable[PanelEntry],
+        max_workers: int = 32,
+        timeout: Optional[int] = None,
+        verify_ssl: Optional[bool] = None,
+        pool_size: Optional[int] = None,
+        metrics: Union[bool, "MetricsRegistry", None] = None,
+        records: bool = False
+    ) -> None:
+        """Initialize the fleet.
+
+        Args:
+            panels: ``(host, api_key)`` or ``(host, api_key, timeout)``
+                entries, or ready-made Panel objects
+            max_workers: Global cap on calls in flight across the fleet
+            timeout: Default per-panel request timeout in seconds
+            verify_ssl: Whether to verify SSL certificates
+            pool_size: Keep-alive connection pool size per panel
+            metrics: MetricsRegistry recording the requests of every panel
+            records: Return listing rows as compact records instead of dicts
+        """
+        self.max_workers = max_workers
+        self.panels: Dict[str, Panel] = {}
+        for entry in panels:
+            if isinstance(entry, Panel):
+                panel = entry
+            else:
+                host, api_key = entry[0], entry[1]
+                panel_timeout = entry[2] if len(entry) > 2 else timeout
+                panel = Panel(
+                    api_key=api_key,
+                    bt_panel_host=host,
+                    timeout=panel_timeout,
+                    verify_ssl=verify_ssl,
+                    pool_size=pool_size,
+                    metrics=metrics,
+                    records=records
+                )
+            self.panels[panel.config.bt_panel_host] = panel
+        self._executor: Optional[ThreadPoolExecutor] = None
+
+    @property
+    def hosts(self) -> List[str]:
+        """Hosts of every panel in the fleet."""
+        return list(self.panels)
+
+    def panel(self, host: str) -> Panel:
+        """Get the Panel object for a host."""
+        return self.panels[host]
+
+    def _get_executor(self) -> ThreadPoolExecutor:
+        if self._executor is None:
+            self._executor = ThreadPoolExecutor(
+                max_workers=max(1, min(self.max_workers, len(self.panels))),
+                thread_name_prefix="pybt-fleet"
+            )
+        return self._executor
+
+    @staticmethod
+    def _call(host: str, func: Callable, panel: Panel, args: Sequence, kwargs: Dict) -> FleetResult:
+        start = time.perf_counter()
+        try:
+            result = func(panel, *args, **kwargs)
+            return FleetResult(host, result=result, elapsed=time.perf_counter() - start)
+        except Exception as e:
+            return FleetResult(host, error=e, elapsed=time.perf_counter() - start)
+
+    def iter_run(
+        self,
+        method: Callable,
+        *args: Any,
+        deadline: Optional[float] = None,
+        hosts: Optional[Iterable[str]] = None,
+        **kwargs: Any
+    ) -> Iterator[FleetResult]:
+        """Run a method on every panel, yielding results as they complete.
+
+        Args:
+            method: Unbound API method (e.g. ``Website.get_website_list``) or
+                a callable taking a Panel as first argument
+            *args: Positional arguments for the method
+            deadline: Seconds to wait for the whole sweep; panels still
+                running afterwards are reported with a ``TimeoutError``
+            hosts: Subset of hosts to run on (defaults to all panels)
+            **kwargs: Keyword arguments for the method
+
+        Yields:
+            FleetResult for each panel, in completion order
+        """
+        func = _resolve(method)
+        executor = self._get_executor()
+        started = time.perf_counter()
+        pending = {
+            executor.submit(self._call, host, func, self.panels[host], args, kwargs): host
+            for host in (hosts if hosts is not None else self.panels)
+        }
+        while pending:
+            remaining = None
+            if deadline is not None:
+                remaining = max(0.0, deadline - (time.perf_counter() - started))
+            done, _ = wait(pending, timeout=remaining, return_when=FIRST_COMPLETED)
+            if not done:
+                break
+            for future in done:
+                pending.pop(future)
+                yield future.result()
+        for future, host in pending.items():
+            future.cancel()
+            yield FleetResult(
+                host,
+                error=TimeoutError(f"No result from {host} within {deadline}s"),
+                elapsed=time.perf_counter() - started
+            )
+
+    def run(
+        self,
+        method: Callable,
+        *args: Any,
+        deadline: Optional[float] = None,
+        hosts: Optional[Iterable[str]] = None,
+        **kwargs: Any
+    ) -> List[FleetResult]:
+        """Run a method on every panel and collect the results.
+
+        Args:
+            method: Unbound API method (e.g. ``System.get_network``) or a
+                callable taking a Panel as first argument
+            *args: Positional arguments for the method
+            deadline: Seconds to wait for the whole sweep
+            hosts: Subset of hosts to run on (defaults to all panels)
+            **kwargs: Keyword arguments for the method
+
+        Returns:
+            List of FleetResult ordered like the fleet's panels
+        """
+        order = {host: index for index, host in enumerate(self.panels)}
+        results = list(self.iter_run(method, *args, deadline=deadline, hosts=hosts, **kwargs))
+        results.sort(key=lambda r: order[r.host])
+        return results
+
+    def close(self) -> None:
+        """Shut down the fleet's worker threads."""
+        if self._executor is not None:
+            self._executor.shutdown(wait=False)
+            self._executor = None
+
+    def __enter__(self) -> "Fleet":
+        return self
+
+    def __exit__(self, *exc_info) -> None:
+        self.close()
@@ -0,0 +1,156 @@
+"""Panel facade API.
+
+This module groups every API class of one panel behind a single object so
+they share configuration and one keep-alive connection pool.
+"""
+
+from typing import TYPE_CHECKING, Any, Dict, Optional, Type, TypeVar, Union
+
+from ..core.client import Client
+from .system import System
+from .website import (
+    Website, WebsiteBackup, Domain, Rewrite, Directory,
+    PasswordAccess, TrafficLimit, DefaultDocument
+)
+
+if TYPE_CHECKING:
+    from ..core.cache import ResponseCache
+    from ..core.metrics import MetricsRegistry
+
+T = TypeVar("T", bound=Client)
+
+
+class Panel:
+    """Facade over all API classes of a single BaoTa Panel.
+
+    API objects are created lazily on first access and all of them reuse the
+    session of the first one, so the panel is served by one connection pool.
+
+    Example:
+        >>> panel = Panel(api_key="...", bt_panel_host="http://1.2.3.4:8888")
+        >>> panel.system.get_network()
+        >>> panel.website.get_website_list()
+    """
+
+    def __init__(
+        self,
+        api_key: Optional[str] = None,
+        bt_panel_host: Optional[str] = None,
+        debug: Optional[bool] = None,
+        timeout: Optional[int] = None,
+        verify_ssl: Optional[bool] = None,
+        pool_size: Optional[int] = None,
+        cache: Union[bool, "ResponseCache", None] = None,
+        metrics: Union[bool, "MetricsRegistry", None] = None,
+        records: bool = False
+    ) -> None:
+        """Initialize the panel facade.
+
+        Args:
+            api_key: API key for authentication
+            bt_panel_host: Panel URL
+            debug: Enable debug mode
+            timeout: Request timeout in seconds
+            verify_ssl: Whether to verify SSL certificates
+            pool_size: Keep-alive connection pool size for the panel
+            cache: Enable one response cache shared by all API objects
+            metrics: MetricsRegistry recording every API object's requests
+            records: Return listing rows as compact records instead of dicts
+        """
+        self._options: Dict[str, Any] = {
+            "api_key": api_key,
+            "bt_panel_host": bt_panel_host,
+            "debug": debug,
+            "timeout": timeout,
+            "verify_ssl": verify_ssl,
+            "pool_size": pool_size,
+            "metrics": metrics,
+            "records": records,
+        }
+        self._clients: Dict[Type[Client], Client] = {}
+        # Resolve configuration (and the shared session) eagerly
+        system = self.client(System)
+        if cache is True:
+            from ..core.cache import ResponseCache
+            cache = ResponseCache(system.config.cache_size)
+        if cache is False:
+            cache = None
+        self._options["cache"] = system.cache = cache
+
+    def client(self, api_class: Type[T]) -> T:
+        """Get the API object of the given class for this panel.
+
+        Args:
+            api_class: API class, e.g. ``System`` or ``Website``
+
+        Returns:
+            Cached API object sharing this panel's session
+        """
+        api = self._clients.get(api_class)
+        if api is None:
+            options = dict(self._options)
+            if self._clients:
+                options["session"] = self.session
+            api = api_class(**options)
+            self._clients[api_class] = api
+        return api
+
+    @property
+    def session(self):
+        """Session shared by every API object of this panel."""
+        return self.system.session
+
+    @property
+    def cache(self) -> Optional["ResponseCache"]:
+        """Response cache shared by every API object of this panel."""
+        return self._options["cache"]
+
+    @property
+    def config(self):
+        """Resolved configuration of this panel."""
+        return self.system.config
+
+    @property
+    def system(self) -> System:
+        """System status API."""
+        return self.client(System)
+
+    @property
+    def website(self) -> Website:
+        """Website basic operations API."""
+        return self.client(Website)
+
+    @property
+    def backup(self) -> WebsiteBackup:
+        """Website backup management API."""
+        return self.client(WebsiteBackup)
+
+    @property
+    def domain(self) -> Domain:
+        """Domain management API."""
+        return self.client(Domain)
+
+    @property
+    def rewrite(self) -> Rewrite:
+        """Rewrite and configuration management API."""
+        return self.client(Rewrite)
+
+    @property
+    def directory(self) -> Directory:
+        """Website directory and runtime configuration API."""
+        return self.client(Directory)
+
+    @property
+    def password_access(self) -> PasswordAccess:
+        """Password access control API."""
+        return self.client(PasswordAccess)
+
+    @property
+    def traffic_limit(self) -> TrafficLimit:
+        """Traffic limit management API."""
+        return self.client(TrafficLimit)
+
+    @property
+    def default_document(self) -> DefaultDocument:
+        """Default document management API."""
+        return self.client(DefaultDocument)
@@ -0,0 +1,29 @@
+"""Compact record types for API listing results.
+
+The record types live in :mod:`pybt.core.records`, so the core helpers can
+use them without importing the API layer; they are re-exported here.
+"""
+
+from ..core.records import (
+    Backup,
+    Certificate,
+    DiskPartition,
+    DomainEntry,
+    NetworkSample,
+    Record,
+    Site,
+    parse_percent,
+    parse_size,
+)
+
+__all__ = [
+    'Record',
+    'Certificate',
+    'Site',
+    'DomainEntry',
+    'Backup',
+    'DiskPartition',
+    'NetworkSample',
+    'parse_size',
+    'parse_percent',
+]
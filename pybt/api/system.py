@@ -1,9 +1,12 @@
 """System management API."""
 
-from typing import Dict, Any, List
+from typing import TYPE_CHECKING, Dict, Any, List, Optional
 from ..core.client import Client
 from pybt.utils.logger import logger
 
+if TYPE_CHECKING:
+    from ..utils.columns import Columns
+
 
 class System(Client):
     """System management API class.
@@ -40,10 +43,31 @@ class System(Client):
             - path: Partition mount point
             - inodes: List of inode information [total, used, available, usage%]
             - size: List of size information [total, used, available, usage%]
+            
+            Or DiskPartition records, with the sizes parsed to bytes.
         """
         logger.debug("Getting disk information")
         endpoint = self.config.get_endpoint("GetDiskInfo")
-        return self.post_data(endpoint)
+        from ..core.records import DiskPartition
+        return self._as_records(self.post_data(endpoint), DiskPartition)
+
+    def get_disk_columns(self, numpy: Optional[bool] = None) -> "Columns":
+        """Get disk partition information as column arrays.
+        
+        Partitions are decoded as DiskPartition records, so sizes are in
+        bytes and usages in percent (e.g. ``size_usage``).
+        
+        Args:
+            numpy: Return NumPy arrays; by default they are used when NumPy
+                is installed
+            
+        Returns:
+            Columns keyed by DiskPartition field name
+        """
+        from ..core.records import DiskPartition
+        from ..utils.columns import to_columns
+        disks = DiskPartition.convert(self.get_disk_info())
+        return to_columns(disks if isinstance(disks, list) else [], DiskPartition._fields, numpy)
 
     def get_network(self) -> Dict[str, Any]:
         """Get real-time status information (CPU, memory, network, load).
@@ -70,10 +94,13 @@ class System(Client):
                 - five: 5-minute load average
                 - limit: Load limit
                 - fifteen: 15-minute load average
+            
+            Or one NetworkSample record, flattened to numbers.
         """
         logger.debug("Getting network and system status")
         endpoint = self.config.get_endpoint("GetNetWork")
-        return self.post_data(endpoint)
+        from ..core.records import NetworkSample
+        return self._as_records(self.post_data(endpoint), NetworkSample)
 
     def get_task_count(self) -> int:
         """Check for installation tasks.
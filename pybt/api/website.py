@@ -1,8 +1,11 @@
 """Website management API classes."""
 
-from typing import Dict, Any, List, Optional
+from typing import TYPE_CHECKING, Dict, Any, Iterator, List, Optional, Sequence
 from ..core.client import Client
 
+if TYPE_CHECKING:
+    from ..utils.columns import Columns
+
 
 class Website(Client):
     """Website basic operations API.
@@ -25,7 +28,8 @@ class Website(Client):
             search: Search keyword
             
         Returns:
-            Dict containing website list and pagination info
+            Dict containing website list and pagination info, with the rows
+            as dictionaries or Site records
         """
         data = {
             "p": page,
@@ -39,8 +43,68 @@ class Website(Client):
             data["search"] = search
             
         endpoint = self.config.get_endpoint("Websites")
-        return self.post_data(endpoint, data)
-    
+        from ..core.records import Site
+        return self._as_records(self.post_data(endpoint, data), Site)
+
+    def iter_websites(self, limit: int = 100, type_id: int = -1,
+                      order: str = "id desc", search: Optional[str] = None,
+                      window: int = 1) -> Iterator[Dict[str, Any]]:
+        """Iterate over all websites, fetching pages lazily.
+
+        By default only one page is held in memory at a time. With
+        ``window > 1`` the remaining pages are fetched concurrently once the
+        first page gives the total. No further pages are requested once the
+        caller stops iterating. On async clients this is an async iterator.
+
+        Args:
+            limit: Number of items fetched per page
+            type_id: Category ID (-1 for all categories, 0 for default)
+            order: Sort order (e.g., "id desc", "name desc")
+            search: Search keyword
+            window: Maximum number of pages fetched concurrently
+
+        Yields:
+            Website dictionaries (or Site records) as returned by
+            ``get_website_list``
+
+        Raises:
+            ClientException: If a page request returns a panel error
+        """
+        return self._paginate(
+            lambda page: self.get_website_list(page=page, limit=limit, type_id=type_id,
+                                               order=order, search=search),
+            limit,
+            window=window
+        )
+
+    def get_website_columns(self, fields: Optional[Sequence[str]] = None,
+                            limit: int = 100, type_id: int = -1,
+                            search: Optional[str] = None, window: int = 1,
+                            numpy: Optional[bool] = None) -> "Columns":
+        """Fetch every website as column arrays.
+
+        Pages are read with ``iter_websites`` and added to the columns as
+        they arrive, so the rows themselves are never all held in memory.
+
+        Args:
+            fields: Columns to keep (e.g. ``["id", "backup_count"]``), or None
+                for every column
+            limit: Number of items fetched per page
+            type_id: Category ID (-1 for all categories, 0 for default)
+            search: Search keyword
+            window: Maximum number of pages fetched concurrently
+            numpy: Return NumPy arrays; by default they are used when NumPy
+                is installed
+
+        Returns:
+            Columns keyed by column name
+        """
+        return self._to_columns(
+            self.iter_websites(limit=limit, type_id=type_id, search=search, window=window),
+            fields,
+            numpy
+        )
+
     def get_site_types(self) -> List[Dict[str, Any]]:
         """Get list of website categories.
         
@@ -223,7 +287,8 @@ class WebsiteBackup(Client):
             limit: Number of items per page
             
         Returns:
-            Dict containing backup list and pagination info
+            Dict containing backup list and pagination info, with the rows
+            as dictionaries or Backup records
         """
         data = {
             "p": page,
@@ -232,7 +297,48 @@ class WebsiteBackup(Client):
             "search": search
         }
         endpoint = self.config.get_endpoint("WebBackupList")
-        return self.post_data(endpoint, data)
+        from ..core.records import Backup
+        return self._as_records(self.post_data(endpoint, data), Backup)
+
+    def iter_backups(self, search: int, limit: int = 100, window: int = 1) -> Iterator[Dict[str, Any]]:
+        """Iterate over all backups of a website, fetching pages lazily.
+
+        Args:
+            search: Website ID
+            limit: Number of items fetched per page
+            window: Maximum number of pages fetched concurrently
+
+        Yields:
+            Backup dictionaries (or Backup records) as returned by
+            ``get_backup_list``
+
+        Raises:
+            ClientException: If a page request returns a panel error
+        """
+        return self._paginate(
+            lambda page: self.get_backup_list(search=search, page=page, limit=limit),
+            limit,
+            window=window
+        )
+
+    def get_backup_columns(self, search: int, fields: Optional[Sequence[str]] = None,
+                           limit: int = 100, window: int = 1,
+                           numpy: Optional[bool] = None) -> "Columns":
+        """Fetch every backup of a website as column arrays.
+
+        Args:
+            search: Website ID
+            fields: Columns to keep (e.g. ``["pid", "size"]``), or None for
+                every column
+            limit: Number of items fetched per page
+            window: Maximum number of pages fetched concurrently
+            numpy: Return NumPy arrays; by default they are used when NumPy
+                is installed
+
+        Returns:
+            Columns keyed by column name
+        """
+        return self._to_columns(self.iter_backups(search, limit=limit, window=window), fields, numpy)
     
     def create_backup(self, id: int) -> Dict[str, Any]:
         """Create website backup.
@@ -271,14 +377,41 @@ class Domain(Client):
             site_id: Website ID
             
         Returns:
-            List of domain dictionaries
+            List of domain dictionaries or DomainEntry records
         """
         data = {
             "search": site_id,
             "list": True
         }
+        from ..core.records import DomainEntry
         endpoint = self.config.get_endpoint("WebDomainList")
-        return self.post_data(endpoint, data)
+        return self._as_records(self.post_data(endpoint, data), DomainEntry)
+
+    def iter_domains(self, site_id: Optional[int] = None, limit: int = 100,
+                     window: int = 1) -> Iterator[Dict[str, Any]]:
+        """Iterate over the domain table, fetching pages lazily.
+
+        Args:
+            site_id: Website ID, or None for the domains of every website
+            limit: Number of items fetched per page
+            window: Maximum number of pages fetched concurrently
+
+        Yields:
+            Domain dictionaries, or DomainEntry records
+
+        Raises:
+            ClientException: If a page request returns a panel error
+        """
+        from ..core.records import DomainEntry
+        endpoint = self.config.get_endpoint("WebDomainList")
+
+        def fetch(page: int) -> Dict[str, Any]:
+            data = {"p": page, "limit": limit}
+            if site_id is not None:
+                data["search"] = site_id
+            return self._as_records(self.post_data(endpoint, data), DomainEntry)
+
+        return self._paginate(fetch, limit, window)
     
     def add_domain(self, id: int, webname: str, domain: str) -> Dict[str, Any]:
         """Add domain to website.
@@ -349,6 +482,23 @@ class Rewrite(Client):
         data = {"path": path}
         endpoint = self.config.get_endpoint("GetFileBody")
         return self.post_data(endpoint, data)
+
+    def iter_rewrite_content(self, path: str, chunk_size: int = 65536) -> Iterator[str]:
+        """Stream the content of a file in chunks.
+        
+        Unlike ``get_rewrite_content`` the file is never held in memory as a
+        whole, which suits large files such as logs. Async clients raise
+        TypeError instead of blocking the event loop.
+        
+        Args:
+            path: Path to the file
+            chunk_size: Approximate size of each chunk in bytes
+            
+        Yields:
+            Pieces of the file content
+        """
+        endpoint = self.config.get_endpoint("GetFileBody")
+        return self.stream_data(endpoint, {"path": path}, chunk_size=chunk_size).text()
     
     def save_rewrite_content(self, path: str, content: str) -> Dict[str, Any]:
         """Save rewrite rule content.
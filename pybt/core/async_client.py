@@ -0,0 +1,447 @@
+"""Asynchronous client module for BaoTa Panel SDK.
+
+This module provides an asyncio-based client built on ``aiohttp``. Requests
+are signed exactly like the synchronous :class:`~pybt.core.client.Client` and
+all async clients of the same panel share one connection pool per event loop.
+
+``aiohttp`` is an optional dependency; install it with
+``pip install bt-python-sdk[async]``.
+"""
+
+import asyncio
+import time
+from typing import Any, AsyncIterator, Dict, List, Optional, Sequence
+
+from .batch import BatchResult, Call, normalize_calls
+from .client import _MISS, Client
+from .metrics import RequestEvent
+from .transport import normalize_host
+from pybt.utils import jsonlib
+from pybt.utils.exceptions import ClientException, EmptyResponse, connection_refused
+from pybt.utils.logger import logger, LazyRedacted
+
+
+def _import_aiohttp():
+    """Import aiohttp or raise a helpful error."""
+    try:
+        import aiohttp
+    except ImportError as e:
+        raise ImportError(
+            "AsyncClient requires aiohttp, install it with "
+            "'pip install bt-python-sdk[async]'"
+        ) from e
+    return aiohttp
+
+
+def _encode_form(body: Dict[str, Any]) -> str:
+    """Encode a request body as a form, like requests does for the sync client.
+
+    Sequence values become repeated fields and None values are left out.
+    """
+    from urllib.parse import urlencode
+    return urlencode([(key, value) for key, value in body.items() if value is not None], doseq=True)
+
+
+class AsyncTransportRegistry:
+    """Registry of shared ``aiohttp`` sessions, one per host and event loop.
+
+    ``aiohttp`` sessions are bound to the loop they were created in, so the
+    registry keeps a separate pool per running loop. A loop's sessions are
+    closed when ``asyncio.run()`` shuts the loop down, or explicitly with
+    :meth:`close` inside the loop or :meth:`close_loop` from outside it.
+    """
+
+    def __init__(self) -> None:
+        """Initialize an empty registry."""
+        self._sessions: Dict[asyncio.AbstractEventLoop, Dict[str, Any]] = {}
+        self._reapers: Dict[asyncio.AbstractEventLoop, "asyncio.Task[None]"] = {}
+
+    def get_session(self, bt_panel_host: str, pool_size: int, verify_ssl: bool = True):
+        """Get the shared session for a panel host in the running loop.
+
+        Args:
+            bt_panel_host: Panel URL
+            pool_size: Maximum number of concurrent connections to the host
+            verify_ssl: Whether to verify SSL certificates
+
+        Returns:
+            The ``aiohttp.ClientSession`` shared by this host's async clients
+        """
+        aiohttp = _import_aiohttp()
+        loop = asyncio.get_running_loop()
+        sessions = self._sessions.setdefault(loop, {})
+        if loop not in self._reapers:
+            self._reapers[loop] = loop.create_task(self._close_at_shutdown(loop))
+        key = normalize_host(bt_panel_host)
+        session = sessions.get(key)
+        if session is None or session.closed:
+            connector = aiohttp.TCPConnector(
+                limit=pool_size,
+                limit_per_host=pool_size,
+                ssl=None if verify_ssl else False
+            )
+            session = aiohttp.ClientSession(connector=connector)
+            sessions[key] = session
+        return session
+
+    async def close(self) -> None:
+        """Close every session created in the running loop."""
+        await self._close_sessions(asyncio.get_running_loop())
+
+    def close_loop(self, loop: asyncio.AbstractEventLoop) -> None:
+        """Close every session created in a loop that is not running.
+
+        Use this before ``loop.close()`` when driving a loop by hand instead
+        of with ``asyncio.run()``.
+
+        Args:
+            loop: Event loop the sessions were created in
+        """
+        reaper = self._reapers.get(loop)
+        if reaper is not None and not loop.is_closed():
+            reaper.cancel()
+            loop.run_until_complete(asyncio.gather(reaper, return_exceptions=True))
+
+    async def _close_sessions(self, loop: asyncio.AbstractEventLoop) -> None:
+        """Close and forget the sessions of a loop."""
+        for session in self._sessions.pop(loop, {}).values():
+            await session.close()
+
+    async def _close_at_shutdown(self, loop: asyncio.AbstractEventLoop) -> None:
+        """Wait until the loop cancels its remaining tasks, then close its sessions."""
+        try:
+            await loop.create_future()
+        finally:
+            self._reapers.pop(loop, None)
+            await self._close_sessions(loop)
+
+
+# Default async registry instance
+async_registry = AsyncTransportRegistry()
+
+
+class AsyncClient(Client):
+    """Asynchronous base client class for BaoTa Panel API.
+
+    Configuration is resolved exactly like :class:`Client`. The HTTP session
+    is created lazily inside the running event loop on the first request.
+
+    Example:
+        >>> async with AsyncSystem() as system:
+        ...     await system.get_network()
+    """
+
+    def _open_session(self, session):
+        """Keep an explicit session; otherwise defer to the first request."""
+        return session
+
+    def _get_session(self):
+        """Get the aiohttp session for the running loop."""
+        if self.session is not None and not self.session.closed:
+            return self.session
+        return async_registry.get_session(
+            self.config.bt_panel_host,
+            self.config.pool_size,
+            self.config.verify_ssl
+        )
+
+    async def post_data(
+        self,
+        endpoint: str,
+        data: Optional[Dict[str, Any]] = None
+    ) -> Dict[str, Any]:
+        """Make a POST request to the API.
+
+        The response cache, retry policy, circuit breaker and request hooks
+        apply exactly as in :meth:`Client.post_data`; hooks are called on
+        the event loop and must not block.
+
+        Args:
+            endpoint: API endpoint name or full URL
+            data: Request data to send
+
+        Returns:
+            API response data
+
+        Raises:
+            ConnectionRefused: If the panel cannot be reached or its circuit
+                breaker is open; it is also an ``aiohttp.ClientConnectionError``
+                or ``asyncio.TimeoutError``
+            EmptyResponse: If the panel returns an empty body
+            aiohttp.ClientError: If the request fails otherwise
+        """
+        name = self.config.get_endpoint_name(endpoint)
+        if not (self.hooks["before"] or self.hooks["after"]):
+            return await self._post(endpoint, data, name)
+
+        event = RequestEvent(endpoint, name, self.config.bt_panel_host, data)
+        self._fire("before", event)
+        started = time.perf_counter()
+        try:
+            event.result = await self._post(endpoint, data, name, event)
+            if event.status == "pending":
+                event.status = "ok"
+            return event.result
+        except Exception as e:
+            event.status = "error"
+            event.error = e
+            raise
+        finally:
+            event.latency = time.perf_counter() - started
+            self._fire("after", event)
+
+    async def _post(
+        self,
+        endpoint: str,
+        data: Optional[Dict[str, Any]],
+        name: Optional[str],
+        event: Optional[RequestEvent] = None
+    ) -> Any:
+        """Serve a request from the cache or the panel.
+
+        Args:
+            endpoint: API endpoint path
+            data: Request data to send
+            name: Endpoint name, if known
+            event: Event to fill in for request hooks
+
+        Returns:
+            API response data
+        """
+        aiohttp = _import_aiohttp()
+        log_debug = self._log_debug(name, endpoint)
+        cache_key, cached = self._cache_lookup(endpoint, data, name, event, log_debug)
+        if cached is not _MISS:
+            return cached
+
+        if log_debug:
+            logger.debug(
+                "Making async POST request to %s with data %s", endpoint, LazyRedacted(data),
+                extra={"endpoint": name, "host": self.config.bt_panel_host}
+            )
+
+        try:
+            result = await self._request(endpoint, data, name in self.config.idempotent_endpoints, event)
+        except (aiohttp.ClientError, asyncio.TimeoutError, ClientException):
+            # The write may still have been applied on the panel
+            if self.cache is not None:
+                self._invalidate(name)
+            raise
+
+        self._cache_store(cache_key, name, result)
+        return result
+
+    async def _fetch(
+        self,
+        endpoint: str,
+        data: Optional[Dict[str, Any]],
+        event: Optional[RequestEvent] = None
+    ) -> Any:
+        """Sign and send a single request and decode the response.
+
+        Args:
+            endpoint: API endpoint name or full URL
+            data: Request data to send
+            event: Event to fill in for request hooks
+
+        Returns:
+            Decoded API response data
+        """
+        aiohttp = _import_aiohttp()
+        url, body = self._build_request(endpoint, data)
+        payload = _encode_form(body)
+        async with self._get_session().post(
+            url,
+            data=payload,
+            headers={"Content-Type": "application/x-www-form-urlencoded"},
+            timeout=aiohttp.ClientTimeout(total=self.config.timeout)
+        ) as response:
+            content = await response.read()
+            if event is not None:
+                event.request_bytes = len(payload)
+                event.response_bytes = len(content)
+            response.raise_for_status()
+            if not content.strip():
+                raise EmptyResponse(f"Empty response from {endpoint}")
+            if jsonlib.get_backend().name == "json":
+                return await response.json(content_type=None)
+            return jsonlib.loads(content)
+
+    async def _request(
+        self,
+        endpoint: str,
+        data: Optional[Dict[str, Any]],
+        idempotent: bool,
+        event: Optional[RequestEvent] = None
+    ) -> Any:
+        """Send a request with retries and circuit breaking.
+
+        Args:
+            endpoint: API endpoint name or full URL
+            data: Request data to send
+            idempotent: Whether the endpoint is safe to retry
+            event: Event to fill in for request hooks
+
+        Returns:
+            Decoded API response data
+        """
+        aiohttp = _import_aiohttp()
+        policy = self.retry_policy
+        breaker = self.circuit_breaker
+        attempt = 0
+        while True:
+            if breaker is not None and not breaker.allow():
+                logger.error("Circuit open for %s, not calling %s", self.config.bt_panel_host, endpoint)
+                raise connection_refused(
+                    f"Circuit open for {self.config.bt_panel_host}", aiohttp.ClientConnectionError
+                )
+            try:
+                result = await self._fetch(endpoint, data, event)
+            except (
+                aiohttp.ClientConnectionError, aiohttp.ClientResponseError, asyncio.TimeoutError, EmptyResponse
+            ) as e:
+                transient = not isinstance(e, aiohttp.ClientResponseError) or e.status in policy.retry_statuses
+                if breaker is not None:
+                    # Only an unreachable or overloaded panel counts against the circuit
+                    if transient and not isinstance(e, EmptyResponse):
+                        breaker.record_failure()
+                    else:
+                        breaker.record_success()
+                if transient and policy.should_retry(attempt, idempotent):
+                    delay = policy.backoff(attempt)
+                    attempt += 1
+                    if event is not None:
+                        event.retries = attempt
+                    logger.warning("Retrying %s in %.2fs (attempt %d): %s", endpoint, delay, attempt, e)
+                    await asyncio.sleep(delay)
+                    continue
+                logger.error("API request failed: %s", e)
+                if isinstance(e, (aiohttp.ClientConnectionError, asyncio.TimeoutError)):
+                    error_type = aiohttp.ClientConnectionError
+                    if isinstance(e, asyncio.TimeoutError):
+                        error_type = asyncio.TimeoutError
+                    raise connection_refused(f"{self.config.bt_panel_host}: {e}", error_type) from e
+                raise
+            except Exception as e:
+                # The panel answered, e.g. with a page that is not JSON
+                if breaker is not None:
+                    breaker.record_success()
+                logger.error("API request failed: %s", e)
+                raise
+            if breaker is not None:
+                breaker.record_success()
+            return result
+
+    def _as_records(self, result: Any, record: Any) -> Any:
+        """Convert the response once the awaitable from ``post_data`` resolves."""
+        if not self.config.records:
+            return result
+
+        async def convert():
+            return record.convert(await result)
+
+        return convert()
+
+    def stream_data(self, endpoint: str, data: Optional[Dict[str, Any]] = None, **kwargs: Any) -> Any:
+        """Not supported: streamed decoding reads the body with blocking calls.
+
+        Raises:
+            TypeError: Always; use ``post_data`` (e.g. ``get_rewrite_content``)
+                or a synchronous client to stream large responses
+        """
+        raise TypeError(
+            f"{type(self).__name__} does not support streamed responses; "
+            "await the non-streaming method or use a synchronous client"
+        )
+
+    def _paginate(self, fetch: Any, limit: int, window: int) -> AsyncIterator[Any]:
+        """Iterate over a paged table endpoint with ``async for``."""
+        from pybt.utils.pagination import apaginate
+        return apaginate(fetch, limit, window=window)
+
+    async def _to_columns(self, rows: AsyncIterator[Any], fields: Optional[Sequence[str]],
+                          numpy: Optional[bool]) -> Any:
+        """Convert the rows of an async listing iterator to column arrays."""
+        from pybt.utils.columns import ColumnBuilder
+        builder = ColumnBuilder(fields)
+        async for row in rows:
+            builder.append(row)
+        return builder.build(numpy)
+
+    async def _run_one(
+        self,
+        semaphore: asyncio.Semaphore,
+        index: int,
+        endpoint: str,
+        data: Optional[Dict[str, Any]]
+    ) -> BatchResult:
+        """Make one call of a batch, capturing its error."""
+        async with semaphore:
+            try:
+                return BatchResult(index, endpoint, data, result=await self.post_data(endpoint, data))
+            except Exception as e:
+                return BatchResult(index, endpoint, data, error=e)
+
+    async def post_many(
+        self,
+        calls: Sequence[Call],
+        max_workers: Optional[int] = None
+    ) -> List[BatchResult]:
+        """Make many POST requests concurrently on the running loop.
+
+        Args:
+            calls: Sequence of ``(endpoint, data)`` pairs
+            max_workers: Maximum number of requests in flight
+                (defaults to the connection pool size)
+
+        Returns:
+            List of BatchResult in the same order as ``calls``
+        """
+        semaphore = asyncio.Semaphore(max_workers or self.config.pool_size)
+        return list(await asyncio.gather(*(
+            self._run_one(semaphore, index, endpoint, data)
+            for index, (endpoint, data) in enumerate(normalize_calls(calls))
+        )))
+
+    async def iter_post_many(
+        self,
+        calls: Sequence[Call],
+        max_workers: Optional[int] = None
+    ) -> AsyncIterator[BatchResult]:
+        """Make many POST requests concurrently, yielding as they complete.
+
+        Args:
+            calls: Sequence of ``(endpoint, data)`` pairs
+            max_workers: Maximum number of requests in flight
+                (defaults to the connection pool size)
+
+        Yields:
+            BatchResult for each call in completion order; calls still
+            running when the iteration is abandoned are cancelled
+        """
+        semaphore = asyncio.Semaphore(max_workers or self.config.pool_size)
+        tasks = [
+            asyncio.ensure_future(self._run_one(semaphore, index, endpoint, data))
+            for index, (endpoint, data) in enumerate(normalize_calls(calls))
+        ]
+        try:
+            for done in asyncio.as_completed(tasks):
+                yield await done
+        finally:
+            for task in tasks:
+                task.cancel()
+
+    async def close(self) -> None:
+        """Close an explicitly provided session.
+
+        Shared sessions stay open for other clients until their loop shuts
+        down; close them earlier with ``await async_registry.close()``.
+        """
+        if self.session is not None:
+            await self.session.close()
+
+    async def __aenter__(self) -> "AsyncClient":
+        return self
+
+    async def __aexit__(self, *exc_info) -> None:
+        await self.close()
@@ -0,0 +1,113 @@
+"""Batch execution module for BaoTa Panel SDK.
+
+This module runs many API calls through a bounded worker pool and reports
+the outcome of each call separately.
+"""
+
+from dataclasses import dataclass
+from typing import Any, Callable, Dict, Iterable, Iterator, List, Optional, Sequence, Tuple, Union
+
+Call = Union[str, Tuple[str], Tuple[str, Optional[Dict[str, Any]]]]
+
+
+@dataclass
+class BatchResult:
+    """Outcome of a single call in a batch.
+
+    Attributes:
+        index: Position of the call in the submitted batch
+        endpoint: API endpoint of the call
+        data: Request data of the call
+        result: API response data, or None if the call failed
+        error: Exception raised by the call, or None if it succeeded
+    """
+    index: int
+    endpoint: str
+    data: Optional[Dict[str, Any]] = None
+    result: Any = None
+    error: Optional[BaseException] = None
+
+    @property
+    def ok(self) -> bool:
+        """Whether the call succeeded."""
+        return self.error is None
+
+
+def normalize_calls(calls: Iterable[Call]) -> List[Tuple[str, Optional[Dict[str, Any]]]]:
+    """Turn ``(endpoint,)`` and ``(endpoint, data)`` items into pairs."""
+    normalized = []
+    for call in calls:
+        if isinstance(call, str):
+            normalized.append((call, None))
+        elif len(call) == 1:
+            normalized.append((call[0], None))
+        else:
+            normalized.append((call[0], call[1]))
+    return normalized
+
+
+def _run_one(
+    post: Callable[[str, Optional[Dict[str, Any]]], Any],
+    index: int,
+    endpoint: str,
+    data: Optional[Dict[str, Any]]
+) -> BatchResult:
+    """Run one call and capture its result or error."""
+    try:
+        return BatchResult(index, endpoint, data, result=post(endpoint, data))
+    except Exception as e:
+        return BatchResult(index, endpoint, data, error=e)
+
+
+def iter_batch(
+    post: Callable[[str, Optional[Dict[str, Any]]], Any],
+    calls: Sequence[Call],
+    max_workers: int
+) -> Iterator[BatchResult]:
+    """Run calls concurrently and yield results as they complete.
+
+    Args:
+        post: Function performing one request, e.g. ``Client.post_data``
+        calls: Sequence of ``(endpoint, data)`` pairs
+        max_workers: Maximum number of calls in flight
+
+    Yields:
+        BatchResult for each call, in completion order
+    """
+    from concurrent.futures import ThreadPoolExecutor, as_completed
+
+    pairs = normalize_calls(calls)
+    if not pairs:
+        return
+    with ThreadPoolExecutor(max_workers=max(1, min(max_workers, len(pairs)))) as executor:
+        futures = [
+            executor.submit(_run_one, post, index, endpoint, data)
+            for index, (endpoint, data) in enumerate(pairs)
+        ]
+        try:
+            for future in as_completed(futures):
+                yield future.result()
+        finally:
+            # Do not start calls the consumer is no longer waiting for
+            for future in futures:
+                future.cancel()
+
+
+def run_batch(
+    post: Callable[[str, Optional[Dict[str, Any]]], Any],
+    calls: Sequence[Call],
+    max_workers: int
+) -> List[BatchResult]:
+    """Run calls concurrently and return results in submission order.
+
+    Args:
+        post: Function performing one request, e.g. ``Client.post_data``
+        calls: Sequence of ``(endpoint, data)`` pairs
+        max_workers: Maximum number of calls in flight
+
+    Returns:
+        List of BatchResult ordered like ``calls``
+    """
+    results = list(iter_batch(post, calls, max_workers))
+    results.sort(key=lambda r: r.index)
+    return results
@@ -0,0 +1,160 @@
+"""Response cache module for BaoTa Panel SDK.
+
+This module provides an opt-in, size-bounded LRU cache with per-endpoint TTLs
+for responses of read-mostly endpoints.
+"""
+
+import json
+import threading
+import time
+from collections import OrderedDict
+from dataclasses import dataclass
+from typing import Any, Dict, Iterable, Optional, Set, Tuple
+
+from ..utils import jsonlib
+
+
+@dataclass
+class CacheStats:
+    """Hit/miss statistics of a response cache."""
+    hits: int = 0
+    misses: int = 0
+    evictions: int = 0
+    expirations: int = 0
+    invalidations: int = 0
+
+    @property
+    def hit_rate(self) -> float:
+        """Fraction of lookups served from the cache."""
+        total = self.hits + self.misses
+        return self.hits / total if total else 0.0
+
+
+class ResponseCache:
+    """LRU cache of API responses with per-entry expiry.
+
+    Entries are keyed by panel host, endpoint and normalized request data,
+    and tagged with their endpoint name so a write can evict exactly the
+    reads it affects. Cached values are stored JSON-encoded and decoded on
+    every read, so callers get their own copy and cannot corrupt them.
+
+    Example:
+        >>> cache = ResponseCache(max_size=512)
+        >>> website = Website(cache=cache)
+        >>> website.get_php_versions()  # fetched from the panel
+        >>> website.get_php_versions()  # served from the cache
+        >>> cache.stats.hits
+        1
+    """
+
+    def __init__(self, max_size: int = 256) -> None:
+        """Initialize the cache.
+
+        Args:
+            max_size: Maximum number of entries kept before evicting the
+                least recently used one
+        """
+        self.max_size = max_size
+        self.stats = CacheStats()
+        self._lock = threading.Lock()
+        # key -> (expires_at, value, tag)
+        self._entries: "OrderedDict[str, Tuple[float, Any, Tuple[str, str]]]" = OrderedDict()
+        # (host, endpoint name) -> keys
+        self._tags: Dict[Tuple[str, str], Set[str]] = {}
+
+    @staticmethod
+    def make_key(host: str, endpoint: str, data: Optional[Dict[str, Any]] = None) -> str:
+        """Build a cache key from a request.
+
+        Args:
+            host: Panel URL
+            endpoint: API endpoint path
+            data: Request data (order of keys does not matter)
+
+        Returns:
+            Cache key string
+        """
+        normalized = json.dumps(data or {}, sort_keys=True, default=str, separators=(",", ":"))
+        return f"{host}{endpoint}\n{normalized}"
+
+    def get(self, key: str) -> Tuple[bool, Any]:
+        """Look up a cached response.
+
+        Args:
+            key: Cache key from :meth:`make_key`
+
+        Returns:
+            Tuple of (found, value)
+        """
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is None:
+                self.stats.misses += 1
+                return False, None
+            expires_at, value, _ = entry
+            if expires_at <= time.monotonic():
+                self._remove(key)
+                self.stats.expirations += 1
+                self.stats.misses += 1
+                return False, None
+            self._entries.move_to_end(key)
+            self.stats.hits += 1
+        return True, jsonlib.loads(value)
+
+    def set(self, key: str, value: Any, ttl: float, host: str = "", name: str = "") -> None:
+        """Store a response.
+
+        Args:
+            key: Cache key from :meth:`make_key`
+            value: Response data
+            ttl: Time to live in seconds
+            host: Panel URL the response came from
+            name: Endpoint name, used by :meth:`invalidate`
+        """
+        value = jsonlib.dumps(value)
+        tag = (host, name)
+        with self._lock:
+            if key in self._entries:
+                self._remove(key)
+            self._entries[key] = (time.monotonic() + ttl, value, tag)
+            self._tags.setdefault(tag, set()).add(key)
+            while len(self._entries) > self.max_size:
+                self._remove(next(iter(self._entries)))
+                self.stats.evictions += 1
+
+    def invalidate(self, names: Iterable[str], host: str = "") -> int:
+        """Drop every cached response of the given endpoints.
+
+        Args:
+            names: Endpoint names whose responses became stale
+            host: Panel URL the responses came from
+
+        Returns:
+            Number of entries dropped
+        """
+        dropped = 0
+        with self._lock:
+            for name in names:
+                for key in list(self._tags.get((host, name), ())):
+                    self._remove(key)
+                    dropped += 1
+            self.stats.invalidations += dropped
+        return dropped
+
+    def _remove(self, key: str) -> None:
+        """Remove an entry and its tag reference (lock must be held)."""
+        _, _, tag = self._entries.pop(key)
+        keys = self._tags.get(tag)
+        if keys is not None:
+            keys.discard(key)
+            if not keys:
+                del self._tags[tag]
+
+    def clear(self) -> None:
+        """Drop every cached response."""
+        with self._lock:
+            self._entries.clear()
+            self._tags.clear()
+
+    def __len__(self) -> int:
+        return len(self._entries)
@@ -0,0 +1,334 @@
+"""Change detection module for BaoTa Panel SDK.
+
+This module fingerprints normalized responses so pollers can skip payloads
+identical to the previous fetch, and diffs the rows of listing responses
+against the previous snapshot so consumers only handle rows that were
+added, removed or modified.
+"""
+
+import threading
+from dataclasses import dataclass, field
+from typing import TYPE_CHECKING, Any, Callable, Dict, Iterable, List, NamedTuple, Optional, Union
+
+from .cache import ResponseCache
+from .metrics import RequestEvent
+from ..utils.jsonlib import content_hash
+
+if TYPE_CHECKING:
+    from .client import Client
+
+RowKey = Union[str, Callable[[Any], Any], None]
+
+
+class RowSpec(NamedTuple):
+    """Where the rows of a response are and how they are identified.
+
+    Attributes:
+        member: Member of the response holding the row list, or None when
+            the response itself is the list
+        key: Row field identifying a row, a function of the row, or None
+            when rows are plain values identified by themselves
+    """
+    member: Optional[str]
+    key: RowKey
+
+
+# Row layout of the listing endpoints, by endpoint name
+ROW_SPECS: Dict[str, RowSpec] = {
+    "Websites": RowSpec("data", "id"),
+    "WebBackupList": RowSpec("data", "id"),
+    "WebDomainList": RowSpec("data", "id"),
+    "GetDiskInfo": RowSpec(None, "path"),
+    "GetRewriteList": RowSpec("rewrite", None),
+}
+
+
+_MISSING = object()
+
+
+def normalize(value: Any, ignore: Iterable[str] = ()) -> Any:
+    """Normalize a response for comparison.
+
+    Records are converted to dictionaries and ``ignore`` keys are dropped
+    from every dictionary, e.g. volatile counters.
+
+    Args:
+        value: Response or row
+        ignore: Keys to drop at any depth
+
+    Returns:
+        Normalized copy of the value
+    """
+    return _normalize(value, frozenset(ignore))
+
+
+def _normalize(value: Any, ignore: frozenset) -> Any:
+    to_dict = getattr(value, "to_dict", None)
+    if to_dict is not None and not isinstance(value, dict):
+        value = to_dict()
+    if isinstance(value, dict):
+        return {k: _normalize(v, ignore) for k, v in value.items() if k not in ignore}
+    if isinstance(value, (list, tuple)):
+        return [_normalize(v, ignore) for v in value]
+    return value
+
+
+def fingerprint(value: Any, ignore: Iterable[str] = ()) -> str:
+    """Get a content hash of a response that ignores key order.
+
+    Args:
+        value: Response data
+        ignore: Keys to drop at any depth before hashing
+
+    Returns:
+        Hex digest
+    """
+    return content_hash(normalize(value, ignore))
+
+
+def stream_key(host: str, endpoint: str, data: Optional[Dict[str, Any]] = None) -> str:
+    """Get the stream name :meth:`ChangeTracker.track` uses for a request.
+
+    Args:
+        host: Panel URL
+        endpoint: API endpoint path
+        data: Request data
+
+    Returns:
+        Stream name
+    """
+    return ResponseCache.make_key(host, endpoint, data)
+
+
+@dataclass
+class RowChange:
+    """A row present in both snapshots with different content.
+
+    Attributes:
+        key: Row key
+        old: Previous row
+        new: Current row
+        fields: Top-level fields whose values differ
+    """
+    key: Any
+    old: Any
+    new: Any
+    fields: List[str] = field(default_factory=list)
+
+
+@dataclass
+class Delta:
+    """Row-level difference between two snapshots of a listing."""
+    added: List[Any] = field(default_factory=list)
+    removed: List[Any] = field(default_factory=list)
+    modified: List[RowChange] = field(default_factory=list)
+
+    def __bool__(self) -> bool:
+        return bool(self.added or self.removed or self.modified)
+
+    @property
+    def count(self) -> int:
+        """Number of changed rows."""
+        return len(self.added) + len(self.removed) + len(self.modified)
+
+
+def _key_func(key: RowKey) -> Callable[[Any], Any]:
+    if key is None:
+        return lambda row: row
+    if callable(key):
+        return key
+    return lambda row: row.get(key) if isinstance(row, dict) else row
+
+
+def _changed_fields(old: Any, new: Any) -> List[str]:
+    if not isinstance(old, dict) or not isinstance(new, dict):
+        return []
+    return sorted(k for k in old.keys() | new.keys() if old.get(k, _MISSING) != new.get(k, _MISSING))
+
+
+def diff(old_rows: Iterable[Any], new_rows: Iterable[Any], key: RowKey = "id") -> Delta:
+    """Compare two lists of rows by key.
+
+    Args:
+        old_rows: Previous rows
+        new_rows: Current rows
+        key: Row field identifying a row, a function of the row, or None
+            when rows are plain values
+
+    Returns:
+        Delta of added, removed and modified rows, in current row order
+    """
+    get_key = _key_func(key)
+    old = {get_key(row): row for row in old_rows}
+    delta = Delta()
+    seen = set()
+    for row in new_rows:
+        row_key = get_key(row)
+        seen.add(row_key)
+        previous = old.get(row_key, _MISSING)
+        if previous is _MISSING:
+            delta.added.append(row)
+        elif previous != row:
+            delta.modified.append(RowChange(row_key, previous, row, _changed_fields(previous, row)))
+    delta.removed = [row for row_key, row in old.items() if row_key not in seen]
+    return delta
+
+
+@dataclass
+class Change:
+    """Outcome of comparing a response with the previous one of its stream.
+
+    Attributes:
+        name: Stream name
+        fingerprint: Fingerprint of the current response
+        previous: Fingerprint of the previous response, None on first sight
+        delta: Row-level difference, None if the response has no rows or
+            is unchanged
+        response: The current response
+    """
+    name: str
+    fingerprint: str
+    previous: Optional[str]
+    delta: Optional[Delta] = None
+    response: Any = None
+
+    @property
+    def unchanged(self) -> bool:
+        """Whether the response equals the previous one."""
+        return self.fingerprint == self.previous
+
+
+class _Snapshot:
+    """Last seen state of one stream."""
+
+    __slots__ = ("fingerprint", "rows")
+
+    def __init__(self, fingerprint: str, rows: Optional[List[Any]]) -> None:
+        self.fingerprint = fingerprint
+        self.rows = rows
+
+
+class ChangeTracker:
+    """Remembers the last response of each stream and reports changes.
+
+    Example:
+        >>> tracker = ChangeTracker()
+        >>> change = tracker.update("sites", website.get_website_list())
+        >>> if not change.unchanged:
+        ...     handle(change.delta.added, change.delta.modified)
+
+    Responses of tracked clients can also be compared automatically; the
+    stream of a request is its host, endpoint and request data, and
+    subscribers are only called when a response changed.
+    """
+
+    def __init__(self, ignore: Iterable[str] = ()) -> None:
+        """Initialize an empty tracker.
+
+        Args:
+            ignore: Keys dropped from every response before comparison
+        """
+        self.ignore = frozenset(ignore)
+        self._snapshots: Dict[str, _Snapshot] = {}
+        self._subscribers: List[Callable[[Change], None]] = []
+        self._lock = threading.Lock()
+
+    def update(
+        self,
+        name: str,
+        response: Any,
+        member: Optional[str] = "data",
+        key: RowKey = "id"
+    ) -> Change:
+        """Record a response and compare it with the previous one.
+
+        Args:
+            name: Stream name, e.g. ``"sites page 1"``
+            response: Response data (dicts, lists or records)
+            member: Member holding the row list when the response is a
+                dict; a list response is always treated as rows
+            key: Row field identifying a row, a function of the row, or None
+                when rows are plain values
+
+        Returns:
+            Change with the fingerprints and, for row responses, the delta
+        """
+        normalized = _normalize(response, self.ignore)
+        if isinstance(normalized, list):
+            rows: Optional[List[Any]] = normalized
+        elif isinstance(normalized, dict) and member is not None and isinstance(normalized.get(member), list):
+            rows = normalized[member]
+        else:
+            rows = None
+        digest = content_hash(normalized)
+        with self._lock:
+            snapshot = self._snapshots.get(name)
+            self._snapshots[name] = _Snapshot(digest, rows)
+        change = Change(name, digest, snapshot.fingerprint if snapshot else None, response=response)
+        if rows is not None and not change.unchanged:
+            previous = snapshot.rows if snapshot is not None and snapshot.rows is not None else []
+            change.delta = diff(previous, rows, key)
+        return change
+
+    def unchanged(self, name: str, response: Any) -> bool:
+        """Record a response and tell whether it equals the previous one.
+
+        Args:
+            name: Stream name
+            response: Response data
+
+        Returns:
+            True if the response is identical to the last one of the stream
+        """
+        return self.update(name, response, member=None).unchanged
+
+    def forget(self, name: Optional[str] = None) -> None:
+        """Drop the snapshot of a stream, or of every stream.
+
+        Args:
+            name: Stream name, or None for all
+        """
+        with self._lock:
+            if name is None:
+                self._snapshots.clear()
+            else:
+                self._snapshots.pop(name, None)
+
+    def __contains__(self, name: str) -> bool:
+        return name in self._snapshots
+
+    def __len__(self) -> int:
+        return len(self._snapshots)
+
+    def subscribe(self, callback: Callable[[Change], None]) -> None:
+        """Call a function with every changed response of tracked clients.
+
+        Args:
+            callback: Receives the Change
+        """
+        self._subscribers.append(callback)
+
+    def track(self, *clients: "Client", names: Iterable[str] = tuple(ROW_SPECS)) -> None:
+        """Compare every successful response of the given endpoints.
+
+        Args:
+            clients: Clients whose responses are compared
+            names: Endpoint names to watch, by default the listings of
+                ``ROW_SPECS``
+        """
+        watched = frozenset(names)
+        for client in clients:
+            client.add_hook("after", lambda event, watched=watched: self._on_request(event, watched))
+
+    def _on_request(self, event: RequestEvent, watched: frozenset) -> None:
+        """After hook comparing a response with the previous one of its stream."""
+        if event.status != "ok" or event.name not in watched:
+            return
+        spec = ROW_SPECS.get(event.name, RowSpec("data", "id"))
+        stream = stream_key(event.host, event.endpoint, event.data)
+        change = self.update(stream, event.result, spec.member, spec.key)
+        if change.unchanged:
+            return
+        for callback in list(self._subscribers):
+            callback(change)
+
@@ -4,17 +4,38 @@ This module provides the base client class that handles API communication
 and authentication.
 """
 
-from typing import Dict, Any, Optional
-import requests
+from typing import TYPE_CHECKING, Callable, Dict, Any, Iterator, List, Optional, Sequence, Tuple, Union
+import logging
 import time 
 import os
-from dotenv import load_dotenv, find_dotenv
 from .config import Config
 from .token import get_token
-from pybt.utils.logger import logger
-from pybt.utils.exceptions import InvalidAPIKey
+from .transport import registry
+from pybt.utils.logger import logger, configure_logger, LazyRedacted, LogSampler
+from pybt.utils import jsonlib
+from pybt.utils.exceptions import ClientException, EmptyResponse, InvalidAPIKey, connection_refused
 
-load_dotenv(find_dotenv())
+if TYPE_CHECKING:
+    import requests
+    from .batch import BatchResult, Call
+    from .cache import ResponseCache
+    from .metrics import MetricsRegistry, RequestEvent
+    from .retry import CircuitBreaker, RetryPolicy
+    from pybt.utils.jsonstream import JSONStream
+
+_env_loaded = False
+
+# Marks a cache miss, since None is a valid cached response
+_MISS = object()
+
+
+def _load_env() -> None:
+    """Load the nearest ``.env`` file once, when a client first needs it."""
+    global _env_loaded
+    if not _env_loaded:
+        _env_loaded = True
+        from dotenv import load_dotenv, find_dotenv
+        load_dotenv(find_dotenv())
 
 
 class Client:
@@ -30,7 +51,14 @@ class Client:
         bt_panel_host: Optional[str] = None,
         debug: Optional[bool] = None,
         timeout: Optional[int] = None,
-        verify_ssl: Optional[bool] = None
+        verify_ssl: Optional[bool] = None,
+        pool_size: Optional[int] = None,
+        session: Optional["requests.Session"] = None,
+        cache: Union[bool, "ResponseCache", None] = None,
+        retry_policy: Optional["RetryPolicy"] = None,
+        circuit_breaker: Union[bool, "CircuitBreaker", None] = None,
+        metrics: Union[bool, "MetricsRegistry", None] = None,
+        records: bool = False
     ) -> None:
         """Initialize the client with configuration.
         
@@ -41,11 +69,28 @@ class Client:
             debug: Enable debug mode
             timeout: Request timeout in seconds
             verify_ssl: Whether to verify SSL certificates
+            pool_size: Keep-alive connection pool size for the panel host
+            session: Explicit session to use instead of the shared one
+            cache: Enable the response cache for endpoints listed in
+                ``Config.cache_ttl``; pass a ResponseCache to share one
+            retry_policy: Retry policy for transient failures
+            circuit_breaker: Circuit breaker to use; True uses the breaker
+                shared by every client of the panel host. Off by default.
+            metrics: Record request metrics in a MetricsRegistry; True uses
+                the default ``pybt.core.metrics.metrics`` registry
+            records: Return listing rows as compact ``pybt.api.records``
+                objects instead of dictionaries: Site, Backup and DomainEntry
+                rows of the website listings, DiskPartition rows of
+                ``get_disk_info`` and a NetworkSample from ``get_network``.
+                Records support item access and ``to_dict()``
         """
-        self.session = requests.Session()
         self.__cookies = None
         self.config = Config()
         
+        # Only settings left unset fall back to the environment
+        if None in (api_key, bt_panel_host, debug, timeout, verify_ssl, pool_size):
+            _load_env()
+        
         # Override default config with provided values
         if api_key is None:
             self.config.api_key = os.getenv("BT_API_KEY")
@@ -70,11 +115,77 @@ class Client:
             self.config.verify_ssl = verify_ssl_env.lower() == "true" if verify_ssl_env else True
         else:
             self.config.verify_ssl = verify_ssl
+        if pool_size is None:
+            pool_size_env = os.getenv("POOL_SIZE")
+            self.config.pool_size = int(pool_size_env) if pool_size_env else self.config.pool_size
+        else:
+            self.config.pool_size = pool_size
+        self.config.records = records
             
         if not self.config.api_key:
             raise InvalidAPIKey("API key is required")
+        
+        configure_logger(self.config.debug)
+        self.log_sampler = LogSampler(self.config.log_sample_rate)
+
+        self.session = self._open_session(session)
+        from .retry import RetryPolicy, breakers
+        if cache is True:
+            from .cache import ResponseCache
+            cache = ResponseCache(self.config.cache_size)
+        self.cache: Optional["ResponseCache"] = None if cache is None or cache is False else cache
+        self.retry_policy = retry_policy or RetryPolicy()
+        if circuit_breaker is True:
+            circuit_breaker = breakers.get_breaker(self.config.bt_panel_host)
+        self.circuit_breaker: Optional["CircuitBreaker"] = circuit_breaker or None
+        self.hooks: Dict[str, List[Callable[["RequestEvent"], None]]] = {"before": [], "after": []}
+        if metrics is True:
+            from .metrics import metrics as default_metrics
+            metrics = default_metrics
+        self.metrics: Optional["MetricsRegistry"] = metrics or None
+        if self.metrics is not None:
+            self.add_hook("after", self.metrics.observe)
+
+    def add_hook(self, kind: str, hook: Callable[["RequestEvent"], None]) -> None:
+        """Register a request hook.
+        
+        Args:
+            kind: ``before`` (called before the request is sent) or
+                ``after`` (called with the outcome, also for failures)
+            hook: Callable receiving the RequestEvent
+        """
+        if kind not in self.hooks:
+            raise ValueError(f"Unknown hook kind '{kind}', expected one of {list(self.hooks)}")
+        self.hooks[kind].append(hook)
+
+    def remove_hook(self, kind: str, hook: Callable[["RequestEvent"], None]) -> None:
+        """Unregister a request hook.
+        
+        Args:
+            kind: ``before`` or ``after``
+            hook: Previously registered callable
+        """
+        self.hooks[kind].remove(hook)
+
+    def _fire(self, kind: str, event: "RequestEvent") -> None:
+        """Call the hooks of one kind; hook errors never fail a request."""
+        for hook in self.hooks[kind]:
+            try:
+                hook(event)
+            except Exception:
+                logger.exception("Request hook %r failed", hook)
+
+    def _open_session(self, session: Optional["requests.Session"]) -> "requests.Session":
+        """Get the session used for requests.
+        
+        Clients of the same panel share one keep-alive pool unless an
+        explicit session is given.
+        """
+        if session is None:
+            session = registry.get_session(self.config.bt_panel_host, self.config.pool_size)
+        return session
     
-    def __get_key(self) -> str:
+    def _get_key(self) -> Dict[str, Any]:
         """Get API key for request"""
         now_time = time.time()
         p_data = {
@@ -83,6 +194,27 @@ class Client:
         }
         return p_data
     
+    def _build_request(
+        self,
+        endpoint: str,
+        data: Optional[Dict[str, Any]] = None
+    ) -> Tuple[str, Dict[str, Any]]:
+        """Build the signed URL and body for a request.
+        
+        Args:
+            endpoint: API endpoint name or full URL
+            data: Request data to send
+            
+        Returns:
+            Tuple of request URL and signed request body
+        """
+        body = self._get_key()
+        url = self.config.bt_panel_host + endpoint
+        
+        if data:
+            body.update(data)
+        return url, body
+
     def post_data(
         self,
         endpoint: str,
@@ -90,6 +222,10 @@ class Client:
     ) -> Dict[str, Any]:
         """Make a POST request to the API.
         
+        Transient failures of idempotent endpoints are retried according to
+        ``retry_policy``, and requests fail fast while the panel's circuit
+        breaker is open.
+        
         Args:
             endpoint: API endpoint name or full URL
             data: Request data to send
@@ -98,35 +234,398 @@ class Client:
             API response data
             
         Raises:
-            requests.RequestException: If the request fails
+            ConnectionRefused: If the panel cannot be reached or its circuit
+                breaker is open; it is also a ``requests.ConnectionError``
+                or ``requests.Timeout``
+            EmptyResponse: If the panel returns an empty body
+            requests.RequestException: If the request fails otherwise
         """ 
-        body = self.__get_key()
-        url = self.config.bt_panel_host + endpoint
+        name = self.config.get_endpoint_name(endpoint)
+        if not (self.hooks["before"] or self.hooks["after"]):
+            return self._post(endpoint, data, name)
         
-        if data:
-            body.update(data)
+        from .metrics import RequestEvent
+        event = RequestEvent(endpoint, name, self.config.bt_panel_host, data)
+        self._fire("before", event)
+        started = time.perf_counter()
+        try:
+            event.result = self._post(endpoint, data, name, event)
+            if event.status == "pending":
+                event.status = "ok"
+            return event.result
+        except Exception as e:
+            event.status = "error"
+            event.error = e
+            raise
+        finally:
+            event.latency = time.perf_counter() - started
+            self._fire("after", event)
+    
+    def _post(
+        self,
+        endpoint: str,
+        data: Optional[Dict[str, Any]],
+        name: Optional[str],
+        event: Optional["RequestEvent"] = None
+    ) -> Any:
+        """Serve a request from the cache or the panel.
+        
+        Args:
+            endpoint: API endpoint path
+            data: Request data to send
+            name: Endpoint name, if known
+            event: Event to fill in for request hooks
+            
+        Returns:
+            API response data
+        """
+        import requests
+        
+        log_debug = self._log_debug(name, endpoint)
+        cache_key, cached = self._cache_lookup(endpoint, data, name, event, log_debug)
+        if cached is not _MISS:
+            return cached
         
-        logger.debug(f"Making POST request to {endpoint}")
-        logger.debug(f"Request data: {data}")
+        if log_debug:
+            logger.debug(
+                "Making POST request to %s with data %s", endpoint, LazyRedacted(data),
+                extra={"endpoint": name, "host": self.config.bt_panel_host}
+            )
         
         try:
-            if self.__cookies:
-                response = self.session.post(
-                    url,
-                    body,
-                    timeout=self.config.timeout,
-                    verify=self.config.verify_ssl,
-                    cookies=self.__cookies
-                )
-            else:
-                response = self.session.post(
-                    url,
-                    body,
-                    timeout=self.config.timeout,
-                    verify=self.config.verify_ssl
+            result = self._request(endpoint, data, name in self.config.idempotent_endpoints, event)
+        except (requests.RequestException, ClientException):
+            # The write may still have been applied on the panel
+            if self.cache is not None:
+                self._invalidate(name)
+            raise
+        
+        self._cache_store(cache_key, name, result)
+        return result
+    
+    def _log_debug(self, name: Optional[str], endpoint: str) -> bool:
+        """Check whether to log a request at debug level."""
+        # Level-gated so payloads are never formatted when debug is off
+        return (
+            self.config.debug
+            and logger.isEnabledFor(logging.DEBUG)
+            and self.log_sampler.sample(name or endpoint)
+        )
+    
+    def _cache_lookup(
+        self,
+        endpoint: str,
+        data: Optional[Dict[str, Any]],
+        name: Optional[str],
+        event: Optional["RequestEvent"],
+        log_debug: bool
+    ) -> Tuple[Optional[str], Any]:
+        """Look a request up in the response cache.
+        
+        Args:
+            endpoint: API endpoint path
+            data: Request data to send
+            name: Endpoint name, if known
+            event: Event to fill in for request hooks
+            log_debug: Whether to log a cache hit
+            
+        Returns:
+            Tuple of the cache key (None if the endpoint is not cached) and
+            the cached response, or ``_MISS``
+        """
+        if self.cache is None or not self.config.cache_ttl.get(name):
+            return None, _MISS
+        cache_key = self.cache.make_key(self.config.bt_panel_host, endpoint, data)
+        found, cached = self.cache.get(cache_key)
+        if not found:
+            return cache_key, _MISS
+        if log_debug:
+            logger.debug("Cache hit for %s", endpoint, extra={"endpoint": name})
+        if event is not None:
+            event.status = "cache_hit"
+        return cache_key, cached
+    
+    def _cache_store(self, cache_key: Optional[str], name: Optional[str], result: Any) -> None:
+        """Cache a read or invalidate the reads made stale by a write.
+        
+        Args:
+            cache_key: Key from ``_cache_lookup``, None for uncached endpoints
+            name: Endpoint name, if known
+            result: Decoded API response data
+        """
+        # Panel errors such as a failed IP check are neither cached nor
+        # treated as applied writes
+        if self.cache is None or (isinstance(result, dict) and result.get("status") is False):
+            return
+        if cache_key is not None:
+            self.cache.set(cache_key, result, self.config.cache_ttl[name], self.config.bt_panel_host, name)
+        else:
+            self._invalidate(name)
+    
+    def _send(
+        self,
+        endpoint: str,
+        data: Optional[Dict[str, Any]],
+        stream: bool = False
+    ) -> "requests.Response":
+        """Sign and send a single request.
+        
+        Args:
+            endpoint: API endpoint name or full URL
+            data: Request data to send
+            stream: Whether to defer downloading the response body
+            
+        Returns:
+            The HTTP response
+        """
+        url, body = self._build_request(endpoint, data)
+        kwargs = {"timeout": self.config.timeout, "verify": self.config.verify_ssl}
+        if self.__cookies:
+            kwargs["cookies"] = self.__cookies
+        if stream:
+            kwargs["stream"] = True
+        return self.session.post(url, body, **kwargs)
+    
+    def _request(
+        self,
+        endpoint: str,
+        data: Optional[Dict[str, Any]],
+        idempotent: bool,
+        event: Optional["RequestEvent"] = None
+    ) -> Any:
+        """Send a request with retries and circuit breaking.
+        
+        Args:
+            endpoint: API endpoint name or full URL
+            data: Request data to send
+            idempotent: Whether the endpoint is safe to retry
+            event: Event to fill in for request hooks
+            
+        Returns:
+            Decoded API response data
+        """
+        import requests
+        
+        policy = self.retry_policy
+        breaker = self.circuit_breaker
+        attempt = 0
+        while True:
+            if breaker is not None and not breaker.allow():
+                logger.error("Circuit open for %s, not calling %s", self.config.bt_panel_host, endpoint)
+                raise connection_refused(f"Circuit open for {self.config.bt_panel_host}", requests.ConnectionError)
+            try:
+                response = self._send(endpoint, data)
+                if event is not None:
+                    body = getattr(response.request, "body", None)
+                    event.request_bytes = len(body) if isinstance(body, (str, bytes)) else 0
+                    event.response_bytes = len(response.content)
+                response.raise_for_status()
+                if not response.content.strip():
+                    raise EmptyResponse(f"Empty response from {endpoint}")
+                result = self._decode(response)
+            except (requests.ConnectionError, requests.Timeout, requests.HTTPError, EmptyResponse) as e:
+                transient = not isinstance(e, requests.HTTPError) or (
+                    e.response is not None and e.response.status_code in policy.retry_statuses
                 )
-            response.raise_for_status()
+                if breaker is not None:
+                    # Only an unreachable or overloaded panel counts against the circuit
+                    if transient and not isinstance(e, EmptyResponse):
+                        breaker.record_failure()
+                    else:
+                        breaker.record_success()
+                if transient and policy.should_retry(attempt, idempotent):
+                    delay = policy.backoff(attempt)
+                    attempt += 1
+                    if event is not None:
+                        event.retries = attempt
+                    logger.warning("Retrying %s in %.2fs (attempt %d): %s", endpoint, delay, attempt, e)
+                    time.sleep(delay)
+                    continue
+                logger.error("API request failed: %s", e)
+                if isinstance(e, (requests.ConnectionError, requests.Timeout)):
+                    raise connection_refused(f"{self.config.bt_panel_host}: {e}", type(e)) from e
+                raise
+            except Exception as e:
+                # The panel answered, e.g. with an HTML login page that is not
+                # JSON; recording the outcome also ends a half-open trial
+                if breaker is not None:
+                    breaker.record_success()
+                logger.error("API request failed: %s", e)
+                raise
+            if breaker is not None:
+                breaker.record_success()
+            return result
+    
+    @staticmethod
+    def _decode(response: "requests.Response") -> Any:
+        """Decode a JSON response with the selected JSON backend.
+        
+        Accelerated backends decode the raw body bytes directly; the default
+        ``json`` backend keeps the encoding detection of ``response.json()``.
+        
+        Args:
+            response: HTTP response with a non-empty body
+            
+        Returns:
+            Decoded API response data
+            
+        Raises:
+            requests.JSONDecodeError: If the body is not valid JSON
+        """
+        import requests
+        
+        if jsonlib.get_backend().name == "json":
             return response.json()
+        try:
+            return jsonlib.loads(response.content)
+        except ValueError as e:
+            raise requests.JSONDecodeError(str(e), response.text, 0) from e
+    
+    def _as_records(self, result: Any, record: Any) -> Any:
+        """Convert a listing response to records when ``config.records`` is set.
+        
+        Args:
+            result: Response returned by ``post_data``
+            record: Record class from ``pybt.api.records``
+            
+        Returns:
+            The converted response, or ``result`` unchanged
+        """
+        if not self.config.records:
+            return result
+        return record.convert(result)
+    
+    def _paginate(self, fetch: Callable[[int], Any], limit: int, window: int) -> Iterator[Any]:
+        """Iterate over every row of a paged table endpoint.
+        
+        Args:
+            fetch: Function calling the listing method for a page number
+            limit: Rows per page
+            window: Maximum number of pages fetched concurrently
+            
+        Returns:
+            Iterator over the rows, see ``pybt.utils.pagination.paginate``
+        """
+        from pybt.utils.pagination import paginate
+        return paginate(fetch, limit, window=window)
+    
+    def _to_columns(self, rows: Iterator[Any], fields: Optional[Sequence[str]], numpy: Optional[bool]) -> Any:
+        """Convert the rows of a listing iterator to column arrays.
+        
+        Args:
+            rows: Iterator returned by ``_paginate``
+            fields: Columns to keep, or None for every column
+            numpy: Return NumPy arrays; None uses NumPy when installed
+            
+        Returns:
+            Columns, see ``pybt.utils.columns.to_columns``
+        """
+        from pybt.utils.columns import to_columns
+        return to_columns(rows, fields, numpy)
+    
+    def stream_data(
+        self,
+        endpoint: str,
+        data: Optional[Dict[str, Any]] = None,
+        key: Optional[str] = "data",
+        chunk_size: int = 65536
+    ) -> "JSONStream":
+        """Make a POST request and decode the response as it arrives.
+        
+        Use ``items()`` of the returned stream for array members such as the
+        rows of a ``getData`` page, or ``text()`` for string members such as
+        the file content returned by ``GetFileBody``. Streamed requests bypass
+        the response cache, retries and request hooks.
+        
+        Args:
+            endpoint: API endpoint name or full URL
+            data: Request data to send
+            key: Member of the response object to stream, or None to stream
+                a top-level array
+            chunk_size: Size of the chunks read from the network
+            
+        Returns:
+            JSONStream over the response body
+            
+        Raises:
+            ConnectionRefused: If the panel cannot be reached or its circuit
+                breaker is open; it is also a ``requests.ConnectionError``
+                or ``requests.Timeout``
+            requests.RequestException: If the request fails otherwise
+        """
+        import requests
+        from pybt.utils.jsonstream import JSONStream
+        
+        breaker = self.circuit_breaker
+        if breaker is not None and not breaker.allow():
+            raise connection_refused(f"Circuit open for {self.config.bt_panel_host}", requests.ConnectionError)
+        if self.config.debug and logger.isEnabledFor(logging.DEBUG):
+            logger.debug(
+                "Streaming POST request to %s with data %s", endpoint, LazyRedacted(data),
+                extra={"endpoint": self.config.get_endpoint_name(endpoint), "host": self.config.bt_panel_host}
+            )
+        try:
+            response = self._send(endpoint, data, stream=True)
+        except (requests.ConnectionError, requests.Timeout) as e:
+            if breaker is not None:
+                breaker.record_failure()
+            logger.error("API request failed: %s", e)
+            raise connection_refused(f"{self.config.bt_panel_host}: {e}", type(e)) from e
+        if breaker is not None:
+            breaker.record_success()
+        try:
+            response.raise_for_status()
         except requests.RequestException as e:
-            logger.error(f"API request failed: {str(e)}")
+            response.close()
+            logger.error("API request failed: %s", e)
             raise
+        return JSONStream(response.iter_content(chunk_size), key, chunk_size, close=response.close)
+    
+    def _invalidate(self, name: Optional[str]) -> None:
+        """Evict cached reads made stale by a call to a mutating endpoint.
+        
+        Args:
+            name: Name of the endpoint that was called
+        """
+        stale = self.config.cache_invalidates.get(name)
+        if stale:
+            dropped = self.cache.invalidate(stale, self.config.bt_panel_host)
+            logger.debug("Invalidated %d cached responses after %s", dropped, name)
+
+    def post_many(
+        self,
+        calls: Sequence["Call"],
+        max_workers: Optional[int] = None
+    ) -> List["BatchResult"]:
+        """Make many POST requests concurrently on the shared session.
+        
+        Args:
+            calls: Sequence of ``(endpoint, data)`` pairs
+            max_workers: Maximum number of requests in flight
+                (defaults to the connection pool size)
+            
+        Returns:
+            List of BatchResult in the same order as ``calls``; failed
+            calls carry their exception in ``error`` instead of raising
+        """
+        from .batch import run_batch
+        return run_batch(self.post_data, calls, max_workers or self.config.pool_size)
+
+    def iter_post_many(
+        self,
+        calls: Sequence["Call"],
+        max_workers: Optional[int] = None
+    ) -> Iterator["BatchResult"]:
+        """Make many POST requests concurrently, yielding as they complete.
+        
+        Args:
+            calls: Sequence of ``(endpoint, data)`` pairs
+            max_workers: Maximum number of requests in flight
+                (defaults to the connection pool size)
+            
+        Yields:
+            BatchResult for each call in completion order; use ``index``
+            to match it with its call
+        """
+        from .batch import iter_batch
+        return iter_batch(self.post_data, calls, max_workers or self.config.pool_size)
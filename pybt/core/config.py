@@ -4,7 +4,7 @@ This module contains all the configuration settings, API endpoints, and constant
 used throughout the SDK.
 """
 
-from typing import Dict, Optional
+from typing import Dict, List, Optional
 from dataclasses import dataclass, field
 
 
@@ -71,14 +71,74 @@ class Config:
         "WebSetIndex": "/site?action=SetIndex"
     })
     
+    # Endpoints that are safe to retry, by endpoint name
+    idempotent_endpoints: List[str] = field(default_factory=lambda: [
+        "GetSystemTotal", "GetDiskInfo", "GetNetWork", "GetTaskCount",
+        "Websites", "Webtypes", "GetPHPVersion", "WebBackupList",
+        "WebDomainList", "GetRewriteList", "GetFileBody", "GetDirUserINI",
+        "GetLimitNet", "WebGetIndex"
+    ])
+    
+    # Response cache TTLs in seconds, by endpoint name (opt-in, see Client)
+    cache_ttl: Dict[str, float] = field(default_factory=lambda: {
+        "Webtypes": 300,
+        "GetPHPVersion": 300,
+        "GetRewriteList": 300,
+        "GetDirUserINI": 60,
+        "WebGetIndex": 60
+    })
+    
+    # Read endpoints made stale by each mutating endpoint, by endpoint name
+    cache_invalidates: Dict[str, List[str]] = field(default_factory=lambda: {
+        # Website basic operations
+        "WebAddSite": ["Websites", "WebDomainList"],
+        "WebDeleteSite": ["Websites", "WebDomainList", "WebBackupList"],
+        "WebSiteStop": ["Websites"],
+        "WebSiteStart": ["Websites"],
+        "WebSetEdate": ["Websites"],
+        "WebSetPs": ["Websites"],
+        
+        # Website backup management
+        "WebToBackup": ["WebBackupList", "Websites"],
+        "WebDelBackup": ["WebBackupList", "Websites"],
+        
+        # Domain management
+        "WebAddDomain": ["WebDomainList", "Websites"],
+        "WebDelDomain": ["WebDomainList", "Websites"],
+        
+        # Rewrite and configuration management
+        "SaveFileBody": ["GetFileBody"],
+        
+        # Website directory and runtime configuration
+        "SetDirUserINI": ["GetDirUserINI"],
+        "LogsOpen": ["GetDirUserINI"],
+        "SetPath": ["GetDirUserINI", "Websites"],
+        "SetSiteRunPath": ["GetDirUserINI"],
+        
+        # Password access control
+        "SetHasPwd": ["GetDirUserINI"],
+        "CloseHasPwd": ["GetDirUserINI"],
+        
+        # Traffic limit (nginx only)
+        "SetLimitNet": ["GetLimitNet"],
+        "CloseLimitNet": ["GetLimitNet"],
+        
+        # Default document management
+        "WebSetIndex": ["WebGetIndex"]
+    })
+    
     # Authentication settings
     api_key: Optional[str] = None
     bt_panel_host: str = None
     
     # Runtime settings
     debug: bool = False
+    log_sample_rate: float = 1.0
     timeout: int = 30
     verify_ssl: bool = True
+    pool_size: int = 10
+    cache_size: int = 256
+    records: bool = False
     
     def get_endpoint(self, name: str) -> str:
         """Get API endpoint by name.
@@ -95,6 +155,20 @@ class Config:
         if name not in self.endpoints:
             raise KeyError(f"Endpoint '{name}' not found in configuration")
         return f"{self.endpoints[name]}"
+    
+    def get_endpoint_name(self, endpoint: str) -> Optional[str]:
+        """Get endpoint name by API endpoint path.
+        
+        Args:
+            endpoint: API endpoint path, e.g. ``/site?action=GetPHPVersion``
+            
+        Returns:
+            Name of the endpoint, or None if it is not configured
+        """
+        for name, path in self.endpoints.items():
+            if path == endpoint:
+                return name
+        return None
 
 
 # Default configuration instance
@@ -0,0 +1,333 @@
+"""Domain index module for BaoTa Panel SDK.
+
+This module maps domains to the sites serving them with a trie keyed by
+reversed domain labels (``www.example.com`` is stored as ``com`` ->
+``example`` -> ``www``), so exact, wildcard and suffix lookups cost one step
+per label instead of one ``get_domain_list`` call per site.
+"""
+
+import json
+import threading
+from typing import TYPE_CHECKING, Any, Dict, Iterable, Iterator, List, NamedTuple, Optional, Tuple
+
+from .metrics import RequestEvent
+from .transport import normalize_host
+from ..utils.pagination import paginate
+
+if TYPE_CHECKING:
+    from .client import Client
+
+WILDCARD = "*"
+
+
+class DomainMatch(NamedTuple):
+    """A domain bound to a site.
+
+    Attributes:
+        domain: Domain name as bound on the panel, e.g. ``*.example.com``
+        site_id: Website ID
+        port: Listening port
+    """
+    domain: str
+    site_id: int
+    port: int
+
+
+class _Node:
+    """Trie node for one domain label."""
+
+    __slots__ = ("children", "sites")
+
+    def __init__(self) -> None:
+        self.children: Dict[str, "_Node"] = {}
+        # Port -> site ID of the domain ending at this node
+        self.sites: Dict[int, int] = {}
+
+
+def _labels(domain: str) -> List[str]:
+    """Split a domain into lower-cased labels, top-level label first."""
+    return domain.strip().rstrip(".").lower().split(".")[::-1]
+
+
+def parse_domains(value: str, default_port: int = 80) -> List[Tuple[str, int]]:
+    """Parse the panel's ``domain[:port]`` list format.
+
+    Args:
+        value: Domains separated by commas or newlines, e.g. ``a.com,b.com:81``
+        default_port: Port of domains given without one
+
+    Returns:
+        List of ``(domain, port)`` pairs
+    """
+    pairs = []
+    for item in str(value).replace("\n", ",").split(","):
+        item = item.strip()
+        if not item:
+            continue
+        name, _, port = item.partition(":")
+        pairs.append((name.strip().lower(), int(port) if port.strip().isdigit() else default_port))
+    return pairs
+
+
+def created_site_domains(data: Dict[str, Any]) -> List[Tuple[str, int]]:
+    """Get the domains bound by a ``create_website`` (``WebAddSite``) request.
+
+    Args:
+        data: Request data, whose ``webname`` holds ``domain`` and an
+            optional ``domainlist``, as a dict or its JSON encoding
+
+    Returns:
+        List of ``(domain, port)`` pairs, the main domain first; domains
+        without a port get the request's ``port`` (80 by default)
+    """
+    webname = data.get("webname") or {}
+    if isinstance(webname, str):
+        webname = json.loads(webname)
+    port = int(data.get("port") or 80)
+    pairs = []
+    for value in [webname.get("domain", "")] + list(webname.get("domainlist") or []):
+        pairs += parse_domains(value, port)
+    return pairs
+
+
+class DomainIndex:
+    """Reverse index from domains to the sites serving them.
+
+    Wildcard bindings such as ``*.example.com`` match any subdomain; the most
+    specific binding wins, as in nginx. Successful ``add_domain``,
+    ``delete_domain``, ``create_website`` and ``delete_website`` calls made
+    through a tracked client update the index in place.
+
+    Example:
+        >>> index = DomainIndex(Domain())
+        >>> index.load()
+        >>> index.lookup("shop.example.com")
+        DomainMatch(domain='*.example.com', site_id=5, port=80)
+    """
+
+    def __init__(self, client: Optional["Client"] = None) -> None:
+        """Initialize an empty index.
+
+        Args:
+            client: Client used to load the domain table; it is also tracked
+        """
+        self.client = client
+        self._root = _Node()
+        self._size = 0
+        self._lock = threading.Lock()
+        if client is not None:
+            self.track(client)
+
+    def load(self, limit: int = 500, window: int = 4) -> int:
+        """Replace the index with the panel's whole domain table.
+
+        Args:
+            limit: Rows fetched per page
+            window: Maximum number of pages fetched concurrently
+
+        Returns:
+            Number of indexed bindings
+        """
+        if self.client is None:
+            raise ValueError("DomainIndex has no client to load from")
+        endpoint = self.client.config.get_endpoint("WebDomainList")
+        rows = paginate(
+            lambda page: self.client.post_data(endpoint, {"p": page, "limit": limit}),
+            limit,
+            window=window
+        )
+        return self.load_rows(rows)
+
+    def load_rows(self, rows: Iterable[Dict[str, Any]]) -> int:
+        """Replace the index with domain table rows.
+
+        Args:
+            rows: Rows with ``name``, ``pid`` and ``port``, e.g. from
+                ``Domain.iter_domains`` or ``PanelMirror.rows("domain")``
+
+        Returns:
+            Number of indexed bindings
+        """
+        root = _Node()
+        size = 0
+        for row in rows:
+            size += self._insert(root, row["name"], int(row["pid"]), int(row.get("port") or 80))
+        with self._lock:
+            self._root = root
+            self._size = size
+        return size
+
+    @staticmethod
+    def _insert(root: _Node, domain: str, site_id: int, port: int) -> int:
+        """Insert a binding below root and return 1 if it is new."""
+        node = root
+        for label in _labels(domain):
+            child = node.children.get(label)
+            if child is None:
+                child = node.children[label] = _Node()
+            node = child
+        is_new = port not in node.sites
+        node.sites[port] = site_id
+        return int(is_new)
+
+    def add(self, domain: str, site_id: int, port: int = 80) -> None:
+        """Bind a domain to a site.
+
+        Args:
+            domain: Domain name, may start with ``*.``
+            site_id: Website ID
+            port: Listening port
+        """
+        with self._lock:
+            self._size += self._insert(self._root, domain, site_id, port)
+
+    def remove(self, domain: str, port: Optional[int] = None) -> None:
+        """Unbind a domain.
+
+        Args:
+            domain: Domain name
+            port: Port to unbind, or None for every port
+        """
+        with self._lock:
+            path = [self._root]
+            for label in _labels(domain):
+                node = path[-1].children.get(label)
+                if node is None:
+                    return
+                path.append(node)
+            node = path[-1]
+            ports = list(node.sites) if port is None else [port]
+            for p in ports:
+                if node.sites.pop(p, None) is not None:
+                    self._size -= 1
+            self._prune(path, _labels(domain))
+
+    def remove_site(self, site_id: int) -> None:
+        """Unbind every domain of a site.
+
+        Args:
+            site_id: Website ID
+        """
+        for match in [m for m in self if m.site_id == site_id]:
+            self.remove(match.domain, match.port)
+
+    @staticmethod
+    def _prune(path: List[_Node], labels: List[str]) -> None:
+        """Drop trie nodes left without bindings or children."""
+        for depth in range(len(labels), 0, -1):
+            node = path[depth]
+            if node.sites or node.children:
+                break
+            del path[depth - 1].children[labels[depth - 1]]
+
+    def lookup(self, host: str, port: Optional[int] = None) -> Optional[DomainMatch]:
+        """Find the site serving a host name.
+
+        Args:
+            host: Host name, e.g. ``shop.example.com``
+            port: Port to match, or None for any port
+
+        Returns:
+            DomainMatch of the exact or most specific wildcard binding, or None
+        """
+        labels = _labels(host)
+        node = self._root
+        best = None
+        for depth, label in enumerate(labels):
+            wildcard = node.children.get(WILDCARD)
+            if wildcard is not None and self._pick(wildcard, port) is not None:
+                best = (wildcard, depth)
+            node = node.children.get(label)
+            if node is None:
+                break
+        else:
+            site = self._pick(node, port)
+            if site is not None:
+                return DomainMatch(".".join(labels[::-1]), site[1], site[0])
+        if best is None:
+            return None
+        wildcard, depth = best
+        site = self._pick(wildcard, port)
+        return DomainMatch(".".join((labels[:depth] + [WILDCARD])[::-1]), site[1], site[0])
+
+    @staticmethod
+    def _pick(node: _Node, port: Optional[int]) -> Optional[Tuple[int, int]]:
+        """Get the ``(port, site_id)`` bound at a node."""
+        if port is not None:
+            site_id = node.sites.get(port)
+            return None if site_id is None else (port, site_id)
+        if not node.sites:
+            return None
+        first = min(node.sites)
+        return first, node.sites[first]
+
+    def suffix(self, suffix: str) -> List[DomainMatch]:
+        """List every binding at or below a domain suffix.
+
+        Args:
+            suffix: Domain suffix, e.g. ``example.com``
+
+        Returns:
+            List of DomainMatch sorted by domain
+        """
+        labels = _labels(suffix)
+        node = self._root
+        for label in labels:
+            node = node.children.get(label)
+            if node is None:
+                return []
+        return sorted(self._walk(node, labels))
+
+    def _walk(self, node: _Node, labels: List[str]) -> Iterator[DomainMatch]:
+        """Yield every binding at or below a node."""
+        stack = [(node, labels)]
+        while stack:
+            node, labels = stack.pop()
+            domain = ".".join(labels[::-1])
+            for port, site_id in node.sites.items():
+                yield DomainMatch(domain, site_id, port)
+            for label, child in node.children.items():
+                stack.append((child, labels + [label]))
+
+    def __iter__(self) -> Iterator[DomainMatch]:
+        return self._walk(self._root, [])
+
+    def __len__(self) -> int:
+        return self._size
+
+    def __contains__(self, domain: str) -> bool:
+        node = self._root
+        for label in _labels(domain):
+            node = node.children.get(label)
+            if node is None:
+                return False
+        return bool(node.sites)
+
+    def track(self, *clients: "Client") -> None:
+        """Keep the index current with domain changes made by clients.
+
+        Args:
+            clients: Clients whose successful calls update the index
+        """
+        for client in clients:
+            client.add_hook("after", self._on_request)
+
+    def _on_request(self, event: RequestEvent) -> None:
+        """After hook applying domain changes of a successful call."""
+        if event.status != "ok" or not event.data:
+            return
+        if self.client is not None and normalize_host(event.host) != normalize_host(self.client.config.bt_panel_host):
+            return
+        if isinstance(event.result, dict) and event.result.get("status") is False:
+            return
+        data = event.data
+        if event.name == "WebAddDomain":
+            for domain, port in parse_domains(data["domain"]):
+                self.add(domain, int(data["id"]), port)
+        elif event.name == "WebDelDomain":
+            self.remove(data["domain"], int(data.get("port") or 80))
+        elif event.name == "WebDeleteSite":
+            self.remove_site(int(data["id"]))
+        elif event.name == "WebAddSite" and isinstance(event.result, dict) and event.result.get("siteId"):
+            for name, port in created_site_domains(data):
+                self.add(name, int(event.result["siteId"]), port)
@@ -0,0 +1,361 @@
+"""Disk-fill forecasting module for BaoTa Panel SDK.
+
+This module keeps a bounded history of ``get_disk_info`` readings per mount
+point and fits an online linear trend to the bytes and inodes used, so the
+time until a partition fills up can be estimated at any moment. Each
+reading updates the fits in constant time.
+"""
+
+import threading
+import time
+from typing import TYPE_CHECKING, Any, Dict, Iterable, List, NamedTuple, Optional, Tuple
+
+from .metrics import RequestEvent
+from .sampler import RingBuffer
+from .transport import normalize_host
+from .records import DiskPartition
+from ..utils.columns import Columns
+
+if TYPE_CHECKING:
+    from .client import Client
+
+# Stored fields of a disk reading
+DISK_FIELDS = ("timestamp", "size_used", "size_total", "inodes_used", "inodes_total")
+
+
+class OnlineTrend:
+    """Exponentially weighted least-squares line, updated in O(1).
+
+    The weighted sums are kept relative to the newest sample's time, so the
+    fitted intercept is the current level and old samples fade with
+    ``half_life``. Samples far from the trend, measured in a running scale
+    of residuals, get Huber weights instead of full weight. A drop of more
+    than ``reset_drop`` (a cleanup) restarts the fit.
+
+    Example:
+        >>> trend = OnlineTrend(half_life=86400)
+        >>> for t, used in readings:
+        ...     trend.add(t, used)
+        >>> trend.time_to(total)
+        183000.0
+    """
+
+    __slots__ = (
+        "half_life", "huber", "reset_drop", "count", "last_time",
+        "_w", "_x", "_y", "_xx", "_xy", "_scale",
+    )
+
+    def __init__(
+        self,
+        half_life: Optional[float] = 7 * 86400.0,
+        huber: float = 3.0,
+        reset_drop: Optional[float] = None
+    ) -> None:
+        """Initialize an empty fit.
+
+        Args:
+            half_life: Seconds after which a sample's weight halves, None to
+                weigh all samples equally
+            huber: Residuals beyond this many scales are down-weighted
+            reset_drop: Drop below the fitted level that restarts the fit
+        """
+        self.half_life = half_life
+        self.huber = huber
+        self.reset_drop = reset_drop
+        self.reset()
+
+    def reset(self) -> None:
+        """Forget every sample."""
+        self.count = 0
+        self.last_time: Optional[float] = None
+        self._w = self._x = self._y = self._xx = self._xy = 0.0
+        self._scale = 0.0
+
+    def _fit(self) -> Tuple[float, float]:
+        """Get the level at the newest sample and the slope per second."""
+        det = self._w * self._xx - self._x * self._x
+        slope = (self._w * self._xy - self._x * self._y) / det if det > 1e-12 * self._w * self._xx else 0.0
+        return (self._y - slope * self._x) / self._w, slope
+
+    def add(self, timestamp: float, value: float) -> None:
+        """Add a sample; samples must come in time order.
+
+        Args:
+            timestamp: Sample time in seconds
+            value: Observed value
+        """
+        if self.count and timestamp <= self.last_time:
+            return
+        weight = 1.0
+        if self.count:
+            shift = timestamp - self.last_time
+            level, slope = self._fit()
+            residual = value - (level + slope * shift)
+            if self.reset_drop is not None and residual < -self.reset_drop:
+                self.reset()
+                return self.add(timestamp, value)
+            if self.count >= 3:
+                scale = max(self._scale, 1e-9 * abs(value), 1e-12)
+                if abs(residual) > self.huber * scale:
+                    weight = self.huber * scale / abs(residual)
+                self._scale = 0.9 * self._scale + 0.1 * min(abs(residual), 4 * self.huber * scale)
+            else:
+                self._scale = max(self._scale, abs(residual))
+            # Move the origin to the new sample, then fade the old weights
+            self._xx += shift * (shift * self._w - 2 * self._x)
+            self._xy -= shift * self._y
+            self._x -= shift * self._w
+            if self.half_life:
+                decay = 0.5 ** (shift / self.half_life)
+                self._w *= decay
+                self._x *= decay
+                self._y *= decay
+                self._xx *= decay
+                self._xy *= decay
+        self._w += weight
+        self._y += weight * value
+        self.count += 1
+        self.last_time = timestamp
+
+    @property
+    def level(self) -> Optional[float]:
+        """Fitted value at the newest sample, None without samples."""
+        return self._fit()[0] if self.count else None
+
+    @property
+    def slope(self) -> Optional[float]:
+        """Fitted change per second, None with fewer than two samples."""
+        return self._fit()[1] if self.count >= 2 else None
+
+    def time_to(self, target: float) -> Optional[float]:
+        """Estimate the seconds from the newest sample until the trend reaches a value.
+
+        Args:
+            target: Value to reach, e.g. the partition size
+
+        Returns:
+            Seconds (0 if already reached), or None if the trend is not rising
+            towards it or there are fewer than two samples
+        """
+        if self.count < 2:
+            return None
+        level, slope = self._fit()
+        if level >= target:
+            return 0.0
+        if slope <= 0:
+            return None
+        return (target - level) / slope
+
+
+class Forecast(NamedTuple):
+    """Fill estimate of one resource of a mount point.
+
+    Attributes:
+        used: Fitted amount used now (bytes or inodes)
+        total: Capacity
+        rate: Fitted growth per second
+        time_to_full: Seconds until full, None if not growing
+        full_at: Unix time when full, None if not growing
+    """
+    used: Optional[float]
+    total: Optional[float]
+    rate: Optional[float]
+    time_to_full: Optional[float]
+    full_at: Optional[float]
+
+
+class DiskForecast(NamedTuple):
+    """Fill estimates of a mount point.
+
+    Attributes:
+        host: Normalized panel host
+        path: Mount point
+        bytes: Forecast of the space used
+        inodes: Forecast of the inodes used
+    """
+    host: str
+    path: str
+    bytes: Forecast
+    inodes: Forecast
+
+    @property
+    def time_to_full(self) -> Optional[float]:
+        """Seconds until space or inodes run out, whichever is first."""
+        times = [f.time_to_full for f in (self.bytes, self.inodes) if f.time_to_full is not None]
+        return min(times) if times else None
+
+
+class _Mount:
+    """History and trends of one mount point."""
+
+    __slots__ = ("history", "size", "inodes", "size_total", "inodes_total")
+
+    def __init__(self, capacity: int, half_life: Optional[float]) -> None:
+        self.history = RingBuffer(capacity, DISK_FIELDS) if capacity else None
+        self.size = OnlineTrend(half_life)
+        self.inodes = OnlineTrend(half_life)
+        self.size_total: Optional[float] = None
+        self.inodes_total: Optional[float] = None
+
+    def forecast(self, trend: OnlineTrend, total: Optional[float]) -> Forecast:
+        remaining = trend.time_to(total) if total else None
+        full_at = None if remaining is None else trend.last_time + remaining
+        return Forecast(trend.level, total, trend.slope, remaining, full_at)
+
+
+class DiskForecaster:
+    """Time-to-full estimates for every mount point of a fleet.
+
+    Feed it ``get_disk_info`` responses with :meth:`update`, or let it
+    watch clients with :meth:`track`. Each mount keeps the last
+    ``capacity`` readings in a ring buffer and one :class:`OnlineTrend` each
+    for bytes and inodes used. A drop of more than ``reset_fraction`` of
+    the capacity (files deleted) restarts the trend.
+
+    Example:
+        >>> forecaster = DiskForecaster(half_life=3 * 86400)
+        >>> forecaster.track(panel.system)
+        >>> for forecast in forecaster.forecasts(within=7 * 86400):
+        ...     print(forecast.host, forecast.path, forecast.time_to_full / 3600, "hours")
+    """
+
+    def __init__(
+        self,
+        half_life: Optional[float] = 7 * 86400.0,
+        reset_fraction: float = 0.02,
+        capacity: int = 288
+    ) -> None:
+        """Initialize an empty forecaster.
+
+        Args:
+            half_life: Seconds after which a reading's weight halves
+            reset_fraction: Drop, as a fraction of capacity, that restarts a trend
+            capacity: Readings kept per mount, 0 to keep no history
+        """
+        self.half_life = half_life
+        self.reset_fraction = reset_fraction
+        self.capacity = capacity
+        self._mounts: Dict[Tuple[str, str], _Mount] = {}
+        self._lock = threading.Lock()
+
+    def __len__(self) -> int:
+        return len(self._mounts)
+
+    def update(self, host: str, partitions: Iterable[Any], timestamp: Optional[float] = None) -> int:
+        """Add a ``get_disk_info`` reading of a panel.
+
+        Args:
+            host: Panel URL
+            partitions: Response rows (dicts or DiskPartition records)
+            timestamp: Time of the reading, defaults to now
+
+        Returns:
+            Number of mount points updated
+        """
+        host = normalize_host(host)
+        timestamp = time.time() if timestamp is None else timestamp
+        updated = 0
+        with self._lock:
+            for partition in partitions:
+                if not isinstance(partition, DiskPartition):
+                    partition = DiskPartition.from_dict(partition) if isinstance(partition, dict) else None
+                if partition is None or not partition.path:
+                    continue
+                mount = self._mounts.get((host, partition.path))
+                if mount is None:
+                    mount = self._mounts[(host, partition.path)] = _Mount(self.capacity, self.half_life)
+                self._add(mount, partition, timestamp)
+                updated += 1
+        return updated
+
+    def _add(self, mount: _Mount, partition: DiskPartition, timestamp: float) -> None:
+        for trend, used, total in (
+            (mount.size, partition.size_used, partition.size_total),
+            (mount.inodes, partition.inodes_used, partition.inodes_total),
+        ):
+            if used is None:
+                continue
+            trend.reset_drop = self.reset_fraction * total if total else None
+            trend.add(timestamp, float(used))
+        mount.size_total = partition.size_total or mount.size_total
+        mount.inodes_total = partition.inodes_total or mount.inodes_total
+        if mount.history is not None:
+            mount.history.append({
+                "timestamp": timestamp,
+                "size_used": partition.size_used, "size_total": partition.size_total,
+                "inodes_used": partition.inodes_used, "inodes_total": partition.inodes_total,
+            })
+
+    def forecast(self, host: str, path: str) -> Optional[DiskForecast]:
+        """Get the fill estimates of a mount point.
+
+        Args:
+            host: Panel URL
+            path: Mount point
+
+        Returns:
+            DiskForecast, or None for an unknown mount point
+        """
+        key = (normalize_host(host), path)
+        with self._lock:
+            mount = self._mounts.get(key)
+            if mount is None:
+                return None
+            return DiskForecast(
+                key[0], path,
+                mount.forecast(mount.size, mount.size_total),
+                mount.forecast(mount.inodes, mount.inodes_total),
+            )
+
+    def forecasts(self, within: Optional[float] = None) -> List[DiskForecast]:
+        """Get the estimates of every mount point, soonest to fill first.
+
+        Args:
+            within: Only mounts expected to fill within this many seconds
+
+        Returns:
+            List of DiskForecast; mounts that are not filling come last
+        """
+        result = [self.forecast(host, path) for host, path in list(self._mounts)]
+        if within is not None:
+            result = [f for f in result if f.time_to_full is not None and f.time_to_full <= within]
+        return sorted(result, key=lambda f: (f.time_to_full is None, f.time_to_full or 0.0))
+
+    def history(self, host: str, path: str, **kwargs) -> Optional[Columns]:
+        """Get the stored readings of a mount point; see :meth:`RingBuffer.read`.
+
+        Returns:
+            Columns of ``DISK_FIELDS``, or None for an unknown mount point
+            or when no history is kept
+        """
+        mount = self._mounts.get((normalize_host(host), path))
+        if mount is None or mount.history is None:
+            return None
+        return mount.history.read(**kwargs)
+
+    def forget(self, host: str, path: Optional[str] = None) -> None:
+        """Drop the state of a mount point, or of every mount of a panel.
+
+        Args:
+            host: Panel URL
+            path: Mount point, or None for all of the panel's
+        """
+        host = normalize_host(host)
+        with self._lock:
+            for key in list(self._mounts):
+                if key[0] == host and (path is None or key[1] == path):
+                    del self._mounts[key]
+
+    def track(self, *clients: "Client") -> None:
+        """Add every successful ``get_disk_info`` response of the given clients.
+
+        Args:
+            clients: Clients whose responses are added
+        """
+        for client in clients:
+            client.add_hook("after", self._on_request)
+
+    def _on_request(self, event: RequestEvent) -> None:
+        """After hook adding disk readings."""
+        if event.status == "ok" and event.name == "GetDiskInfo" and isinstance(event.result, list):
+            self.update(event.host, event.result)
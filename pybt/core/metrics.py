@@ -0,0 +1,269 @@
+"""Request instrumentation module for BaoTa Panel SDK.
+
+This module defines the event passed to ``Client`` request hooks and an
+in-process metrics registry with per-endpoint latency histograms and
+counters, exportable in the Prometheus text format.
+"""
+
+import bisect
+import threading
+from dataclasses import dataclass
+from typing import Any, Dict, List, Optional, Sequence, Tuple
+
+# Latency bucket upper bounds in seconds
+DEFAULT_BUCKETS = (0.005, 0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1.0, 2.5, 5.0, 10.0, 30.0)
+
+
+@dataclass
+class RequestEvent:
+    """Details of one ``post_data`` call, passed to request hooks.
+
+    Before hooks see the request fields; after hooks also see the outcome.
+
+    Attributes:
+        endpoint: API endpoint path
+        name: Endpoint name from ``Config.endpoints``, if known
+        host: Panel URL
+        data: Request data
+        status: ``ok``, ``error`` or ``cache_hit`` once the call finished
+        latency: Wall-clock time of the call in seconds
+        request_bytes: Size of the encoded request body
+        response_bytes: Size of the response body
+        retries: Number of retries made
+        result: Decoded response data
+        error: Exception raised by the call
+    """
+    endpoint: str
+    name: Optional[str] = None
+    host: str = ""
+    data: Optional[Dict[str, Any]] = None
+    status: str = "pending"
+    latency: float = 0.0
+    request_bytes: int = 0
+    response_bytes: int = 0
+    retries: int = 0
+    result: Any = None
+    error: Optional[BaseException] = None
+
+
+class Histogram:
+    """Cumulative bucket histogram, as used by Prometheus."""
+
+    def __init__(self, buckets: Sequence[float] = DEFAULT_BUCKETS) -> None:
+        """Initialize the histogram.
+
+        Args:
+            buckets: Sorted bucket upper bounds
+        """
+        self.buckets = tuple(buckets)
+        # One extra slot for observations above the last bound (+Inf)
+        self.counts = [0] * (len(self.buckets) + 1)
+        self.sum = 0.0
+        self.count = 0
+
+    def observe(self, value: float) -> None:
+        """Record a value."""
+        self.counts[bisect.bisect_left(self.buckets, value)] += 1
+        self.sum += value
+        self.count += 1
+
+    def merge(self, other: "Histogram") -> None:
+        """Add the observations of a histogram with the same buckets."""
+        for i, n in enumerate(other.counts):
+            self.counts[i] += n
+        self.sum += other.sum
+        self.count += other.count
+
+    def quantile(self, q: float) -> float:
+        """Estimate a quantile by linear interpolation inside its bucket.
+
+        Args:
+            q: Quantile between 0 and 1
+
+        Returns:
+            Estimated value, or 0.0 without observations
+        """
+        if not self.count:
+            return 0.0
+        rank = q * self.count
+        seen = 0
+        for i, n in enumerate(self.counts):
+            if seen + n >= rank and n:
+                lower = self.buckets[i - 1] if i > 0 else 0.0
+                if i == len(self.buckets):
+                    return lower
+                return lower + (self.buckets[i] - lower) * (rank - seen) / n
+            seen += n
+        return self.buckets[-1]
+
+
+def _escape(value: str) -> str:
+    return str(value).replace("\\", "\\\\").replace("\n", "\\n").replace('"', '\\"')
+
+
+def _labels(**labels: Any) -> str:
+    return ",".join(f'{key}="{_escape(value)}"' for key, value in labels.items())
+
+
+class MetricsRegistry:
+    """In-process metrics for API requests, labelled by host and endpoint.
+
+    Register it on a client with ``Client(metrics=registry)`` or use it as an
+    after hook directly.
+
+    Example:
+        >>> registry = MetricsRegistry()
+        >>> system = System(metrics=registry)
+        >>> system.get_network()
+        >>> registry.quantiles(endpoint="GetNetWork")
+        {'p50': 0.012, 'p95': 0.024, 'p99': 0.025}
+        >>> print(registry.to_prometheus())
+    """
+
+    def __init__(self, buckets: Sequence[float] = DEFAULT_BUCKETS) -> None:
+        """Initialize an empty registry.
+
+        Args:
+            buckets: Latency histogram bucket upper bounds in seconds
+        """
+        self.buckets = tuple(buckets)
+        self._lock = threading.Lock()
+        self._latency: Dict[Tuple[str, str], Histogram] = {}
+        self._requests: Dict[Tuple[str, str, str], int] = {}
+        self._request_bytes: Dict[Tuple[str, str], int] = {}
+        self._response_bytes: Dict[Tuple[str, str], int] = {}
+        self._retries: Dict[Tuple[str, str], int] = {}
+
+    def observe(self, event: RequestEvent) -> None:
+        """Record a finished request (usable as an after hook).
+
+        Args:
+            event: The finished request event
+        """
+        key = (event.host, event.name or event.endpoint)
+        with self._lock:
+            self._requests[key + (event.status,)] = self._requests.get(key + (event.status,), 0) + 1
+            if event.status == "cache_hit":
+                return
+            histogram = self._latency.get(key)
+            if histogram is None:
+                histogram = self._latency[key] = Histogram(self.buckets)
+            histogram.observe(event.latency)
+            self._request_bytes[key] = self._request_bytes.get(key, 0) + event.request_bytes
+            self._response_bytes[key] = self._response_bytes.get(key, 0) + event.response_bytes
+            self._retries[key] = self._retries.get(key, 0) + event.retries
+
+    __call__ = observe
+
+    def histogram(self, endpoint: Optional[str] = None, host: Optional[str] = None) -> Histogram:
+        """Get the latency histogram merged over matching hosts/endpoints.
+
+        Args:
+            endpoint: Endpoint name to filter on
+            host: Panel URL to filter on
+
+        Returns:
+            Merged Histogram
+        """
+        merged = Histogram(self.buckets)
+        with self._lock:
+            for (h, e), histogram in self._latency.items():
+                if (host is None or h == host) and (endpoint is None or e == endpoint):
+                    merged.merge(histogram)
+        return merged
+
+    def quantiles(
+        self,
+        endpoint: Optional[str] = None,
+        host: Optional[str] = None,
+        qs: Sequence[float] = (0.5, 0.95, 0.99)
+    ) -> Dict[str, float]:
+        """Get latency quantiles in seconds.
+
+        Args:
+            endpoint: Endpoint name to filter on
+            host: Panel URL to filter on
+            qs: Quantiles to estimate
+
+        Returns:
+            Dict such as ``{"p50": ..., "p95": ..., "p99": ...}``
+        """
+        histogram = self.histogram(endpoint, host)
+        return {f"p{q * 100:g}": histogram.quantile(q) for q in qs}
+
+    def count(self, endpoint: Optional[str] = None, host: Optional[str] = None,
+              status: Optional[str] = None) -> int:
+        """Count requests matching the filters."""
+        with self._lock:
+            return sum(
+                n for (h, e, s), n in self._requests.items()
+                if (host is None or h == host) and (endpoint is None or e == endpoint)
+                and (status is None or s == status)
+            )
+
+    def slowest(self, n: int = 10, q: float = 0.95) -> List[Tuple[str, str, float]]:
+        """List the slowest host/endpoint pairs.
+
+        Args:
+            n: Number of entries to return
+            q: Quantile to rank by
+
+        Returns:
+            List of ``(host, endpoint, latency)`` sorted slowest first
+        """
+        with self._lock:
+            ranked = [(h, e, histogram.quantile(q)) for (h, e), histogram in self._latency.items()]
+        return sorted(ranked, key=lambda item: item[2], reverse=True)[:n]
+
+    def to_prometheus(self, prefix: str = "pybt") -> str:
+        """Export all metrics in the Prometheus text exposition format.
+
+        Args:
+            prefix: Metric name prefix
+
+        Returns:
+            Exposition text
+        """
+        lines = []
+        with self._lock:
+            lines.append(f"# HELP {prefix}_request_duration_seconds API request latency.")
+            lines.append(f"# TYPE {prefix}_request_duration_seconds histogram")
+            for (host, endpoint), histogram in sorted(self._latency.items()):
+                cumulative = 0
+                for bound, n in zip(self.buckets + (float("inf"),), histogram.counts):
+                    cumulative += n
+                    le = "+Inf" if bound == float("inf") else f"{bound:g}"
+                    labels = _labels(host=host, endpoint=endpoint, le=le)
+                    lines.append(f"{prefix}_request_duration_seconds_bucket{{{labels}}} {cumulative}")
+                labels = _labels(host=host, endpoint=endpoint)
+                lines.append(f"{prefix}_request_duration_seconds_sum{{{labels}}} {histogram.sum:g}")
+                lines.append(f"{prefix}_request_duration_seconds_count{{{labels}}} {histogram.count}")
+
+            lines.append(f"# HELP {prefix}_requests_total API requests by outcome.")
+            lines.append(f"# TYPE {prefix}_requests_total counter")
+            for (host, endpoint, status), n in sorted(self._requests.items()):
+                lines.append(f"{prefix}_requests_total{{{_labels(host=host, endpoint=endpoint, status=status)}}} {n}")
+
+            for metric, help_text, values in (
+                ("request_bytes_total", "Encoded request body bytes sent.", self._request_bytes),
+                ("response_bytes_total", "Response body bytes received.", self._response_bytes),
+                ("request_retries_total", "Retries made after transient failures.", self._retries),
+            ):
+                lines.append(f"# HELP {prefix}_{metric} {help_text}")
+                lines.append(f"# TYPE {prefix}_{metric} counter")
+                for (host, endpoint), n in sorted(values.items()):
+                    lines.append(f"{prefix}_{metric}{{{_labels(host=host, endpoint=endpoint)}}} {n}")
+        return "\n".join(lines) + "\n"
+
+    def reset(self) -> None:
+        """Drop all recorded metrics."""
+        with self._lock:
+            self._latency.clear()
+            self._requests.clear()
+            self._request_bytes.clear()
+            self._response_bytes.clear()
+            self._retries.clear()
+
+
+# Default metrics registry instance
+metrics = MetricsRegistry()
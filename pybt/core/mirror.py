@@ -0,0 +1,417 @@
+"""Local mirror module for BaoTa Panel SDK.
+
+This module mirrors the panel's ``sites``, ``domain`` and ``backup`` tables
+into a local SQLite file, one file per panel, so that reporting queries can
+be answered locally instead of going to the panel.
+"""
+
+import json
+import os
+import re
+import sqlite3
+import threading
+import time
+from dataclasses import dataclass
+from typing import TYPE_CHECKING, Any, Dict, Iterable, List, Optional, Set, Tuple
+
+from .metrics import RequestEvent
+from .transport import normalize_host
+from ..utils import jsonlib
+from ..utils.pagination import page_count, page_rows, paginate, parse_total
+
+if TYPE_CHECKING:
+    from .client import Client
+
+# Mirrored tables: endpoint name, extra request data and indexed columns
+MIRROR_TABLES: Dict[str, Tuple[str, Dict[str, Any], Tuple[str, ...]]] = {
+    "sites": ("Websites", {"type": -1}, ("name", "status", "path", "edate")),
+    "domain": ("WebDomainList", {}, ("name", "pid", "port")),
+    "backup": ("WebBackupList", {"type": 0}, ("pid", "name", "filename")),
+}
+
+
+def default_path(bt_panel_host: str) -> str:
+    """Get the default mirror file of a panel.
+
+    Args:
+        bt_panel_host: Panel URL
+
+    Returns:
+        Path under ``~/.pybt/mirror`` derived from the panel host
+    """
+    slug = re.sub(r"[^a-z0-9]+", "_", normalize_host(bt_panel_host)).strip("_")
+    return os.path.join(os.path.expanduser("~"), ".pybt", "mirror", f"{slug}.sqlite3")
+
+
+@dataclass
+class RefreshStats:
+    """Outcome of refreshing one mirrored table.
+
+    Attributes:
+        table: Table name
+        pages: Number of pages fetched from the panel
+        inserted: Number of new rows
+        updated: Number of rows whose content changed
+        deleted: Number of rows no longer on the panel
+        full: Whether every page was fetched
+    """
+    table: str
+    pages: int = 0
+    inserted: int = 0
+    updated: int = 0
+    deleted: int = 0
+    full: bool = False
+
+
+class PanelMirror:
+    """SQLite mirror of a panel's website, domain and backup tables.
+
+    Rows are stored as JSON together with their ``id``, ``addtime``, a few
+    indexed columns and a content hash. An incremental refresh walks pages
+    newest first (``id desc``) and stops at the first page whose ids are all
+    known with unchanged hashes, once the local row count matches the pager
+    total; if it reaches the last page instead, rows it did not see are
+    removed. A full refresh fetches every page concurrently; it is used for
+    the first sync and for tables touched by mutating calls made through a
+    tracked client. A page that comes back as a panel error raises
+    ClientException and never deletes mirrored rows.
+
+    The incremental walk only compares the pages it reads and does not use
+    ``addtime``: edits made outside the SDK to older rows (``status``,
+    ``edate``, ``ps``) are not seen until a ``refresh(full=True)``.
+
+    Example:
+        >>> mirror = PanelMirror(Website())
+        >>> mirror.refresh()
+        >>> mirror.rows("sites", status="1")
+    """
+
+    def __init__(
+        self,
+        client: "Client",
+        path: Optional[str] = None,
+        page_size: int = 100,
+        window: int = 4,
+        tables: Optional[Iterable[str]] = None
+    ) -> None:
+        """Open (or create) the mirror of a client's panel.
+
+        Args:
+            client: Client used to fetch the tables
+            path: SQLite file, or None for ``default_path`` of the panel
+            page_size: Rows fetched per page
+            window: Maximum number of pages fetched concurrently on full refresh
+            tables: Tables to mirror, defaults to all of ``MIRROR_TABLES``
+        """
+        self.client = client
+        self.host = normalize_host(client.config.bt_panel_host)
+        self.path = path or default_path(client.config.bt_panel_host)
+        self.page_size = page_size
+        self.window = window
+        self.tables = tuple(tables or MIRROR_TABLES)
+        for table in self.tables:
+            if table not in MIRROR_TABLES:
+                raise ValueError(f"Unknown mirror table: {table}")
+        self._dirty = set()
+        self._lock = threading.RLock()
+        if self.path != ":memory:":
+            os.makedirs(os.path.dirname(os.path.abspath(self.path)), exist_ok=True)
+        self._conn = sqlite3.connect(self.path, check_same_thread=False)
+        self._conn.row_factory = sqlite3.Row
+        self._create_schema()
+        self.track(client)
+
+    def _create_schema(self) -> None:
+        """Create the mirror tables and indexes."""
+        with self._lock, self._conn:
+            self._conn.execute(
+                "CREATE TABLE IF NOT EXISTS mirror_state "
+                "(tbl TEXT PRIMARY KEY, refreshed REAL, total INTEGER)"
+            )
+            for table in self.tables:
+                columns = MIRROR_TABLES[table][2]
+                self._conn.execute(
+                    f"CREATE TABLE IF NOT EXISTS {table} (id INTEGER PRIMARY KEY, addtime TEXT, "
+                    + "".join(f"{column} TEXT, " for column in columns)
+                    + "hash TEXT NOT NULL, data TEXT NOT NULL)"
+                )
+                for column in columns:
+                    self._conn.execute(
+                        f"CREATE INDEX IF NOT EXISTS {table}_{column} ON {table} ({column})"
+                    )
+
+    def track(self, *clients: "Client") -> None:
+        """Mark tables for a full refresh when tracked clients mutate them.
+
+        Args:
+            clients: Clients whose successful mutating calls are watched
+        """
+        for client in clients:
+            client.add_hook("after", self._on_request)
+
+    def _on_request(self, event: RequestEvent) -> None:
+        """After hook marking tables made stale by a mutating call."""
+        if event.status != "ok" or normalize_host(event.host) != self.host:
+            return
+        stale = self.client.config.cache_invalidates.get(event.name or "", ())
+        for table in self.tables:
+            if MIRROR_TABLES[table][0] in stale:
+                self._dirty.add(table)
+
+    def _fetch(self, table: str, page: int) -> Dict[str, Any]:
+        """Fetch one page of a table, newest first."""
+        name, extra, _ = MIRROR_TABLES[table]
+        data = {"p": page, "limit": self.page_size, "order": "id desc"}
+        data.update(extra)
+        return self.client.post_data(self.client.config.get_endpoint(name), data)
+
+    def refresh(self, full: bool = False) -> List[RefreshStats]:
+        """Bring the mirrored tables up to date.
+
+        Args:
+            full: Fetch every page instead of stopping at unchanged pages
+
+        Returns:
+            RefreshStats for each table
+
+        Raises:
+            ClientException: If the panel returns an error for a page
+        """
+        return [self.refresh_table(table, full) for table in self.tables]
+
+    def refresh_table(self, table: str, full: bool = False) -> RefreshStats:
+        """Bring one mirrored table up to date.
+
+        Args:
+            table: Table name
+            full: Fetch every page instead of stopping at unchanged pages
+
+        Returns:
+            RefreshStats of the table
+
+        Raises:
+            ClientException: If the panel returns an error for a page
+        """
+        with self._lock:
+            local = dict(self._conn.execute(f"SELECT id, hash FROM {table}").fetchall())
+            if full or not local or table in self._dirty:
+                stats = self._refresh_full(table, local)
+            else:
+                stats = self._refresh_incremental(table, local)
+            self._dirty.discard(table)
+            return stats
+
+    def _refresh_incremental(self, table: str, local: Dict[int, str]) -> RefreshStats:
+        """Fetch pages newest first until they stop changing."""
+        stats = RefreshStats(table)
+        seen = set()
+        page = 1
+        while True:
+            response = self._fetch(table, page)
+            stats.pages += 1
+            # A panel error raises here, before anything can be deleted
+            rows = page_rows(response)
+            total = parse_total(response.get("page"))
+            if total is None:
+                # Without a pager total there is nothing to stop against
+                return self._refresh_full(table, local, stats)
+            changed = self._upsert(table, rows, local, stats)
+            seen.update(int(row["id"]) for row in rows if isinstance(row, dict) and "id" in row)
+            if not rows or page >= page_count(total, self.page_size):
+                # Every page was seen, so unseen rows were deleted
+                self._delete_unseen(table, local, seen, stats)
+                stats.full = True
+                self._save_state(table, len(local))
+                return stats
+            if not changed and len(local) == total:
+                self._save_state(table, total)
+                return stats
+            page += 1
+
+    def _refresh_full(
+        self,
+        table: str,
+        local: Dict[int, str],
+        stats: Optional[RefreshStats] = None
+    ) -> RefreshStats:
+        """Fetch every page, upsert changed rows and drop deleted ones.
+
+        A failed page raises from ``paginate``, so rows are only dropped
+        after a walk that reached the end of the table.
+        """
+        if stats is None:
+            stats = RefreshStats(table)
+        stats.full = True
+        pages = []
+
+        def fetch(page: int) -> Dict[str, Any]:
+            pages.append(page)
+            return self._fetch(table, page)
+
+        seen = set()
+        chunk = []
+        for row in paginate(fetch, self.page_size, window=self.window):
+            if "id" in row:
+                seen.add(int(row["id"]))
+            chunk.append(row)
+            if len(chunk) >= self.page_size:
+                self._upsert(table, chunk, local, stats)
+                chunk = []
+        self._upsert(table, chunk, local, stats)
+        stats.pages += len(pages)
+
+        self._delete_unseen(table, local, seen, stats)
+        self._save_state(table, len(local))
+        return stats
+
+    def _delete_unseen(self, table: str, local: Dict[int, str], seen: Set[int], stats: RefreshStats) -> None:
+        """Drop mirrored rows that were not seen during a complete walk."""
+        deleted = [row_id for row_id in local if row_id not in seen]
+        if deleted:
+            with self._conn:
+                self._conn.executemany(f"DELETE FROM {table} WHERE id = ?", [(i,) for i in deleted])
+            for row_id in deleted:
+                del local[row_id]
+            stats.deleted += len(deleted)
+
+    def _upsert(
+        self,
+        table: str,
+        rows: List[Dict[str, Any]],
+        local: Dict[int, str],
+        stats: RefreshStats
+    ) -> int:
+        """Write rows whose hash changed and return how many were written."""
+        columns = MIRROR_TABLES[table][2]
+        values = []
+        for row in rows:
+            if not isinstance(row, dict) or "id" not in row:
+                continue
+            row_id = int(row["id"])
+            digest = jsonlib.content_hash(row)
+            if local.get(row_id) == digest:
+                continue
+            if row_id in local:
+                stats.updated += 1
+            else:
+                stats.inserted += 1
+            local[row_id] = digest
+            values.append(
+                (row_id, row.get("addtime"))
+                + tuple(_column_value(row.get(column)) for column in columns)
+                + (digest, jsonlib.dumps(row).decode("utf-8"))
+            )
+        if values:
+            placeholders = ", ".join("?" * (len(columns) + 4))
+            with self._conn:
+                self._conn.executemany(
+                    f"INSERT OR REPLACE INTO {table} (id, addtime, {', '.join(columns)}, hash, data) "
+                    f"VALUES ({placeholders})",
+                    values
+                )
+        return len(values)
+
+    def _save_state(self, table: str, total: int) -> None:
+        """Record when a table was last brought up to date."""
+        with self._conn:
+            self._conn.execute(
+                "INSERT OR REPLACE INTO mirror_state (tbl, refreshed, total) VALUES (?, ?, ?)",
+                (table, time.time(), total)
+            )
+
+    def last_refresh(self, table: str) -> Optional[float]:
+        """Get the time of the last refresh of a table.
+
+        Args:
+            table: Table name
+
+        Returns:
+            Unix timestamp, or None if the table was never refreshed
+        """
+        with self._lock:
+            row = self._conn.execute("SELECT refreshed FROM mirror_state WHERE tbl = ?", (table,)).fetchone()
+        return row[0] if row else None
+
+    def _check_table(self, table: str) -> Tuple[str, ...]:
+        """Validate a table name and return its indexed columns."""
+        if table not in self.tables:
+            raise ValueError(f"Table is not mirrored: {table}")
+        return ("id", "addtime") + MIRROR_TABLES[table][2]
+
+    def rows(self, table: str, limit: Optional[int] = None, **filters: Any) -> List[Dict[str, Any]]:
+        """Get mirrored rows, newest first.
+
+        Args:
+            table: Table name
+            limit: Maximum number of rows
+            **filters: Equality filters on ``id``, ``addtime`` or indexed columns
+
+        Returns:
+            List of rows as returned by the panel
+        """
+        columns = self._check_table(table)
+        for column in filters:
+            if column not in columns:
+                raise ValueError(f"Column {column} of {table} is not indexed")
+        sql = f"SELECT data FROM {table}"
+        if filters:
+            sql += " WHERE " + " AND ".join(f"{column} = ?" for column in filters)
+        sql += " ORDER BY id DESC"
+        if limit is not None:
+            sql += f" LIMIT {int(limit)}"
+        params = [_column_value(value) for value in filters.values()]
+        with self._lock:
+            return [jsonlib.loads(row[0]) for row in self._conn.execute(sql, params)]
+
+    def get(self, table: str, id: int) -> Optional[Dict[str, Any]]:
+        """Get one mirrored row by id.
+
+        Args:
+            table: Table name
+            id: Row ID
+
+        Returns:
+            The row, or None if it is not mirrored
+        """
+        rows = self.rows(table, limit=1, id=id)
+        return rows[0] if rows else None
+
+    def count(self, table: str) -> int:
+        """Count the mirrored rows of a table."""
+        self._check_table(table)
+        with self._lock:
+            return self._conn.execute(f"SELECT COUNT(*) FROM {table}").fetchone()[0]
+
+    def query(self, sql: str, params: Iterable[Any] = ()) -> List[Dict[str, Any]]:
+        """Run a read-only SQL query against the mirror.
+
+        Args:
+            sql: SQL statement
+            params: Statement parameters
+
+        Returns:
+            List of result rows as dictionaries
+        """
+        with self._lock:
+            return [dict(row) for row in self._conn.execute(sql, tuple(params))]
+
+    def close(self) -> None:
+        """Stop tracking the client and close the SQLite file."""
+        self.client.remove_hook("after", self._on_request)
+        with self._lock:
+            self._conn.close()
+
+    def __enter__(self) -> "PanelMirror":
+        return self
+
+    def __exit__(self, *exc_info: Any) -> None:
+        self.close()
+
+
+def _column_value(value: Any) -> Any:
+    """Store indexed values as text so lookups match panel strings and ints."""
+    if value is None:
+        return None
+    if isinstance(value, (dict, list)):
+        return json.dumps(value, ensure_ascii=False, sort_keys=True)
+    return str(value)
@@ -0,0 +1,340 @@
+"""Compact record types for API listing results.
+
+By default the SDK returns rows as the dictionaries the panel sends. With
+``records=True`` on a client, listing methods return these ``__slots__``
+records instead, which need a fraction of the memory of a dictionary per row
+and intern the low-cardinality string columns shared by many rows. Rows are
+converted one at a time as they are read, so iterating a listing never holds
+both representations of more than one page.
+
+Records of table rows keep the panel's column names and support ``row["name"]``
+and ``row.get("name")``, so code written against dictionaries keeps working.
+"""
+
+import re
+import sys
+import time
+from typing import Any, Dict, FrozenSet, Iterable, Iterator, Optional, Tuple, Type, TypeVar, Union
+
+R = TypeVar("R", bound="Record")
+
+_SIZE_RE = re.compile(r"^\s*(\d+(?:\.\d+)?)\s*([KMGTPE]?)(?:i?B)?\s*$", re.IGNORECASE)
+_SIZE_UNITS = {"": 1, "K": 1 << 10, "M": 1 << 20, "G": 1 << 30, "T": 1 << 40, "P": 1 << 50, "E": 1 << 60}
+
+
+def parse_size(value: Union[str, int, float, None]) -> Optional[int]:
+    """Convert a human-readable size such as ``"8.3G"`` to bytes.
+
+    Args:
+        value: Size as printed by ``df -h`` (binary units), or a number
+
+    Returns:
+        Size in bytes, or None if the value is empty or not a size
+    """
+    if value is None or isinstance(value, bool):
+        return None
+    if isinstance(value, (int, float)):
+        return int(value)
+    match = _SIZE_RE.match(value)
+    if match is None:
+        return None
+    return int(float(match.group(1)) * _SIZE_UNITS[match.group(2).upper()])
+
+
+def parse_percent(value: Union[str, int, float, None]) -> Optional[float]:
+    """Convert a percentage such as ``"49%"`` to a float.
+
+    Args:
+        value: Percentage string or number
+
+    Returns:
+        Percentage, or None if the value is not a number
+    """
+    if value is None or isinstance(value, bool):
+        return None
+    try:
+        return float(str(value).strip().rstrip("%"))
+    except ValueError:
+        return None
+
+
+def _number(value: Any) -> Optional[float]:
+    """Convert a numeric field to float, or None."""
+    if value is None or isinstance(value, bool):
+        return None
+    try:
+        return float(value)
+    except (TypeError, ValueError):
+        return None
+
+
+class Record:
+    """Base class of the listing records.
+
+    Subclasses declare their fields in ``__slots__``. Keys of a decoded row
+    that are not fields are kept in ``extra`` (None when there are none), so
+    :meth:`to_dict` gives back the original row.
+    """
+
+    __slots__ = ("extra",)
+
+    _fields: Tuple[str, ...] = ()
+    _field_set: FrozenSet[str] = frozenset()
+    _interned: FrozenSet[str] = frozenset()
+
+    def __init_subclass__(cls, **kwargs: Any) -> None:
+        super().__init_subclass__(**kwargs)
+        cls._fields = cls._fields + tuple(cls.__dict__.get("__slots__", ()))
+        cls._field_set = frozenset(cls._fields)
+
+    def __init__(self, **values: Any) -> None:
+        for name in self._fields:
+            setattr(self, name, values.pop(name, None))
+        self.extra: Optional[Dict[str, Any]] = values or None
+
+    @classmethod
+    def from_dict(cls: Type[R], data: Dict[str, Any]) -> R:
+        """Decode a record from a response row.
+
+        Args:
+            data: Row dictionary
+
+        Returns:
+            Record holding the row's values
+        """
+        return cls._decode(data)
+
+    @classmethod
+    def _decode(cls: Type[R], data: Dict[str, Any]) -> R:
+        """Build a record from a dictionary keyed by field name."""
+        record = cls.__new__(cls)
+        interned = cls._interned
+        for name in cls._fields:
+            value = data.get(name)
+            if name in interned and type(value) is str:
+                value = sys.intern(value)
+            setattr(record, name, value)
+        if not cls._field_set.issuperset(data):
+            record.extra = {key: value for key, value in data.items() if key not in cls._field_set}
+        else:
+            record.extra = None
+        return record
+
+    @classmethod
+    def from_rows(cls: Type[R], rows: Iterable[Any]) -> Iterator[R]:
+        """Lazily decode records from response rows.
+
+        Args:
+            rows: Row dictionaries; other values are passed through unchanged
+
+        Yields:
+            A record per row
+        """
+        for row in rows:
+            yield cls.from_dict(row) if isinstance(row, dict) else row
+
+    @classmethod
+    def convert(cls, result: Any) -> Any:
+        """Replace the rows of a listing response with records.
+
+        Args:
+            result: ``getData`` page with a ``data`` list, or a bare list of rows
+
+        Returns:
+            The response with its rows converted; error responses are
+            returned unchanged
+        """
+        if isinstance(result, list):
+            return list(cls.from_rows(result))
+        if isinstance(result, dict) and isinstance(result.get("data"), list):
+            result["data"] = list(cls.from_rows(result["data"]))
+        return result
+
+    def to_dict(self) -> Dict[str, Any]:
+        """Convert the record back to a row dictionary."""
+        data = {}
+        for name in self._fields:
+            value = getattr(self, name)
+            data[name] = value.to_dict() if isinstance(value, Record) else value
+        if self.extra:
+            data.update(self.extra)
+        return data
+
+    def __getitem__(self, key: str) -> Any:
+        if key in self._field_set:
+            return getattr(self, key)
+        if self.extra and key in self.extra:
+            return self.extra[key]
+        raise KeyError(key)
+
+    def __contains__(self, key: object) -> bool:
+        return key in self._field_set or bool(self.extra and key in self.extra)
+
+    def get(self, key: str, default: Any = None) -> Any:
+        """Get a field by its column name, like ``dict.get``."""
+        try:
+            return self[key]
+        except KeyError:
+            return default
+
+    def __eq__(self, other: object) -> bool:
+        if type(other) is not type(self):
+            return NotImplemented
+        return self.to_dict() == other.to_dict()
+
+    __hash__ = None  # type: ignore[assignment]
+
+    def __getstate__(self) -> Dict[str, Any]:
+        return self.to_dict()
+
+    def __setstate__(self, state: Dict[str, Any]) -> None:
+        self.__init__(**state)
+
+    def __repr__(self) -> str:
+        fields = ", ".join(f"{name}={getattr(self, name)!r}" for name in self._fields[:4])
+        return f"{type(self).__name__}({fields}, ...)"
+
+
+class Certificate(Record):
+    """The ``ssl`` column of a website row."""
+
+    __slots__ = ("issuer", "subject", "notBefore", "notAfter", "endtime", "dns")
+    _interned = frozenset({"issuer", "notBefore", "notAfter"})
+
+
+class Site(Record):
+    """A row of the website list (``sites`` table).
+
+    ``ssl`` is a Certificate, or the panel's ``-1`` for sites without one.
+    """
+
+    __slots__ = (
+        "id", "name", "path", "status", "ps", "addtime", "edate",
+        "type_id", "backup_count", "domain", "php_version", "ssl",
+    )
+    _interned = frozenset({"status", "edate", "php_version"})
+
+    @classmethod
+    def from_dict(cls, data: Dict[str, Any]) -> "Site":
+        """Decode a site from a website list row.
+
+        Args:
+            data: Row dictionary
+
+        Returns:
+            Site record
+        """
+        site = cls._decode(data)
+        if isinstance(site.ssl, dict):
+            site.ssl = Certificate.from_dict(site.ssl)
+        return site
+
+
+class DomainEntry(Record):
+    """A row of the domain list (``domain`` table)."""
+
+    __slots__ = ("id", "pid", "name", "port", "addtime")
+
+
+class Backup(Record):
+    """A row of the backup list (``backup`` table)."""
+
+    __slots__ = ("id", "pid", "type", "name", "filename", "size", "addtime")
+
+
+class DiskPartition(Record):
+    """A partition of ``get_disk_info`` with sizes parsed to numbers.
+
+    Sizes are in bytes and usages in percent.
+    """
+
+    __slots__ = (
+        "path", "filesystem", "type",
+        "size_total", "size_used", "size_available", "size_usage",
+        "inodes_total", "inodes_used", "inodes_available", "inodes_usage",
+    )
+    _interned = frozenset({"path", "filesystem", "type"})
+
+    @classmethod
+    def from_dict(cls, data: Dict[str, Any]) -> "DiskPartition":
+        """Decode a partition from a ``get_disk_info`` item.
+
+        Args:
+            data: Item with ``size`` and ``inodes`` lists of
+                ``[total, used, available, usage%]``
+
+        Returns:
+            DiskPartition record
+        """
+        size = list(data.get("size") or ()) + [None] * 4
+        inodes = list(data.get("inodes") or ()) + [None] * 4
+        values = {key: value for key, value in data.items() if key not in ("size", "inodes")}
+        values.update(
+            size_total=parse_size(size[0]),
+            size_used=parse_size(size[1]),
+            size_available=parse_size(size[2]),
+            size_usage=parse_percent(size[3]),
+            inodes_total=parse_size(inodes[0]),
+            inodes_used=parse_size(inodes[1]),
+            inodes_available=parse_size(inodes[2]),
+            inodes_usage=parse_percent(inodes[3]),
+        )
+        return cls._decode(values)
+
+
+class NetworkSample(Record):
+    """A ``get_network`` reading flattened to numbers.
+
+    ``timestamp`` is the local time the sample was decoded. Traffic rates are
+    in KB/s, totals in bytes and memory in MB.
+    """
+
+    __slots__ = (
+        "timestamp", "down", "up", "down_total", "up_total", "down_packets", "up_packets",
+        "cpu_percent", "cpu_count", "mem_total", "mem_free", "mem_cached", "mem_buffers",
+        "mem_used", "load_one", "load_five", "load_fifteen",
+    )
+
+    _SOURCES = {
+        "down": "down", "up": "up", "down_total": "downTotal", "up_total": "upTotal",
+        "down_packets": "downPackets", "up_packets": "upPackets",
+    }
+
+    @classmethod
+    def from_dict(cls, data: Dict[str, Any], timestamp: Optional[float] = None) -> "NetworkSample":
+        """Decode a sample from a ``get_network`` response.
+
+        Args:
+            data: Response dictionary
+            timestamp: Time of the reading, defaults to now
+
+        Returns:
+            NetworkSample record
+        """
+        record = cls.__new__(cls)
+        record.extra = None
+        record.timestamp = time.time() if timestamp is None else timestamp
+        for name, key in cls._SOURCES.items():
+            setattr(record, name, _number(data.get(key)))
+        cpu = list(data.get("cpu") or ()) + [None, None]
+        record.cpu_percent = _number(cpu[0])
+        count = _number(cpu[1])
+        record.cpu_count = None if count is None else int(count)
+        mem = data.get("mem") or {}
+        record.mem_total = _number(mem.get("memTotal"))
+        record.mem_free = _number(mem.get("memFree"))
+        record.mem_cached = _number(mem.get("memCached"))
+        record.mem_buffers = _number(mem.get("memBuffers"))
+        record.mem_used = _number(mem.get("memRealUsed"))
+        load = data.get("load") or {}
+        record.load_one = _number(load.get("one"))
+        record.load_five = _number(load.get("five"))
+        record.load_fifteen = _number(load.get("fifteen"))
+        return record
+
+    @classmethod
+    def convert(cls, result: Any) -> Any:
+        """Decode a ``get_network`` response, leaving error responses unchanged."""
+        if isinstance(result, dict) and result.get("status") is not False:
+            return cls.from_dict(result)
+        return result
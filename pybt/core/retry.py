@@ -0,0 +1,170 @@
+"""Retry and circuit breaker module for BaoTa Panel SDK.
+
+This module provides the retry policy (exponential backoff with jitter) and
+the per-host circuit breaker that :meth:`Client.post_data` uses when enabled.
+"""
+
+import random
+import threading
+import time
+from dataclasses import dataclass
+from typing import Dict, Optional
+
+from .transport import normalize_host
+
+
+@dataclass
+class RetryPolicy:
+    """Retry policy for transient request failures.
+
+    Attributes:
+        max_retries: Maximum number of retries after the first attempt
+        backoff_factor: Base delay in seconds, doubled on every retry
+        max_backoff: Upper bound of a single delay in seconds
+        jitter: Randomize each delay between 0 and its exponential value
+        retry_mutations: Also retry endpoints that are not idempotent
+        retry_statuses: HTTP status codes treated as transient
+    """
+    max_retries: int = 2
+    backoff_factor: float = 0.5
+    max_backoff: float = 10.0
+    jitter: bool = True
+    retry_mutations: bool = False
+    retry_statuses: tuple = (502, 503, 504)
+
+    def should_retry(self, attempt: int, idempotent: bool) -> bool:
+        """Check whether another attempt is allowed.
+
+        Args:
+            attempt: Number of retries already made
+            idempotent: Whether the endpoint is safe to call twice
+
+        Returns:
+            True if the request should be retried
+        """
+        return attempt < self.max_retries and (idempotent or self.retry_mutations)
+
+    def backoff(self, attempt: int) -> float:
+        """Get the delay before a retry.
+
+        Args:
+            attempt: Number of retries already made
+
+        Returns:
+            Delay in seconds
+        """
+        delay = min(self.max_backoff, self.backoff_factor * (2 ** attempt))
+        if self.jitter:
+            delay = random.uniform(0, delay)
+        return delay
+
+
+class CircuitBreaker:
+    """Circuit breaker failing fast once a panel keeps failing.
+
+    After ``failure_threshold`` consecutive failures the circuit opens and
+    requests are rejected without touching the network. Once
+    ``recovery_timeout`` seconds have passed a single trial request is let
+    through; its outcome closes or re-opens the circuit.
+    """
+
+    CLOSED = "closed"
+    OPEN = "open"
+    HALF_OPEN = "half_open"
+
+    def __init__(self, failure_threshold: int = 5, recovery_timeout: float = 30.0) -> None:
+        """Initialize the circuit breaker.
+
+        Args:
+            failure_threshold: Consecutive failures before opening
+            recovery_timeout: Seconds to wait before a trial request
+        """
+        self.failure_threshold = failure_threshold
+        self.recovery_timeout = recovery_timeout
+        self.failures = 0
+        self._state = self.CLOSED
+        self._opened_at = 0.0
+        self._lock = threading.Lock()
+
+    @property
+    def state(self) -> str:
+        """Current state: closed, open or half_open."""
+        with self._lock:
+            if self._state == self.OPEN and time.monotonic() - self._opened_at >= self.recovery_timeout:
+                return self.HALF_OPEN
+            return self._state
+
+    def allow(self) -> bool:
+        """Check whether a request may be sent.
+
+        Returns:
+            False while the circuit is open
+        """
+        with self._lock:
+            if self._state == self.CLOSED:
+                return True
+            if self._state == self.OPEN and time.monotonic() - self._opened_at >= self.recovery_timeout:
+                # Let exactly one trial request through
+                self._state = self.HALF_OPEN
+                return True
+            return False
+
+    def record_success(self) -> None:
+        """Record a successful request and close the circuit."""
+        with self._lock:
+            self.failures = 0
+            self._state = self.CLOSED
+
+    def record_failure(self) -> None:
+        """Record a failed request, opening the circuit if needed."""
+        with self._lock:
+            self.failures += 1
+            if self._state == self.HALF_OPEN or self.failures >= self.failure_threshold:
+                self._state = self.OPEN
+                self._opened_at = time.monotonic()
+
+
+class CircuitBreakerRegistry:
+    """Registry of circuit breakers, one per panel host."""
+
+    def __init__(self) -> None:
+        """Initialize an empty registry."""
+        self._lock = threading.Lock()
+        self._breakers: Dict[str, CircuitBreaker] = {}
+
+    def get_breaker(
+        self,
+        bt_panel_host: str,
+        failure_threshold: Optional[int] = None,
+        recovery_timeout: Optional[float] = None
+    ) -> CircuitBreaker:
+        """Get the circuit breaker shared by all clients of a host.
+
+        Args:
+            bt_panel_host: Panel URL
+            failure_threshold: Consecutive failures before opening
+            recovery_timeout: Seconds to wait before a trial request
+
+        Returns:
+            The host's circuit breaker
+        """
+        key = normalize_host(bt_panel_host)
+        with self._lock:
+            breaker = self._breakers.get(key)
+            if breaker is None:
+                breaker = CircuitBreaker()
+                self._breakers[key] = breaker
+            if failure_threshold is not None:
+                breaker.failure_threshold = failure_threshold
+            if recovery_timeout is not None:
+                breaker.recovery_timeout = recovery_timeout
+            return breaker
+
+    def reset(self) -> None:
+        """Forget every circuit breaker."""
+        with self._lock:
+            self._breakers.clear()
+
+
+# Default circuit breaker registry instance
+breakers = CircuitBreakerRegistry()
@@ -0,0 +1,244 @@
+"""Metric rollup module for BaoTa Panel SDK.
+
+This module downsamples a stream of samples, e.g. from a metrics sampler,
+into fixed-width buckets at several resolutions (1 minute, 5 minutes and
+1 hour by default) holding the min, max, average and last value of each
+field. Raw samples are kept for a short window only, so long-range queries
+read a few hundred buckets instead of every sample.
+"""
+
+import threading
+from typing import Any, List, Mapping, Optional, Sequence, Tuple
+
+from .sampler import RingBuffer
+from ..utils.columns import Columns, import_numpy
+
+# Fields rolled up by default, named like the NetworkSample attributes
+ROLLUP_FIELDS = ("cpu_percent", "mem_used", "load_one", "up", "down")
+
+# Bucket width and number of buckets kept: 6 hours of minutes, 3 days of
+# 5 minutes and 35 days of hours
+DEFAULT_RESOLUTIONS: Tuple[Tuple[int, int], ...] = ((60, 360), (300, 864), (3600, 840))
+
+# Aggregates stored per field, as ``<field>_<aggregate>`` columns
+AGGREGATES = ("min", "max", "avg", "last")
+
+_NAN = float("nan")
+
+
+def _read_values(sample: Any, fields: Sequence[str]) -> List[Optional[float]]:
+    if isinstance(sample, dict) or isinstance(sample, Mapping):
+        values = [sample.get(name) for name in fields]
+    else:
+        values = [getattr(sample, name, None) for name in fields]
+    # NaN (a missing value read back from a ring buffer) counts as missing
+    return [None if value is None or value != value else float(value) for value in values]
+
+
+class _Level:
+    """Closed buckets of one resolution plus the bucket being filled."""
+
+    __slots__ = ("width", "ring", "start", "acc")
+
+    def __init__(self, width: int, capacity: int, fields: Sequence[str]) -> None:
+        self.width = width
+        columns = ["timestamp"] + [f"{name}_{agg}" for name in fields for agg in AGGREGATES]
+        self.ring = RingBuffer(capacity, columns)
+        self.start: Optional[float] = None
+        # min, max, sum, count, last of each field in the open bucket
+        self.acc: List[List[float]] = []
+
+    def open(self, start: float, size: int) -> None:
+        self.start = start
+        self.acc = [[_NAN, _NAN, 0.0, 0, _NAN] for _ in range(size)]
+
+    def row(self) -> List[float]:
+        """Values of the open bucket in ring column order."""
+        row = [self.start]
+        for low, high, total, count, last in self.acc:
+            row += (low, high, total / count if count else _NAN, last)
+        return row
+
+    def close(self) -> None:
+        if self.start is not None:
+            self.ring.append(self.row())
+
+    def add(self, values: List[Optional[float]]) -> None:
+        for acc, value in zip(self.acc, values):
+            if value is None:
+                continue
+            if acc[3]:
+                if value < acc[0]:
+                    acc[0] = value
+                if value > acc[1]:
+                    acc[1] = value
+            else:
+                acc[0] = acc[1] = value
+            acc[2] += value
+            acc[3] += 1
+            acc[4] = value
+
+
+class Rollup:
+    """Incremental multi-resolution downsampling of a sample stream.
+
+    Every sample is added to the open bucket of each resolution in
+    O(fields); a bucket is written to that resolution's ring buffer once,
+    when the first sample of a later bucket arrives. Queries read the
+    closed buckets plus the open one. Samples older than the newest one are
+    counted in ``late`` and not kept raw, but are still added to the open
+    buckets they fall in; a sample older than the open bucket of every
+    resolution is discarded and counted in ``dropped``.
+
+    Example:
+        >>> rollup = Rollup()
+        >>> sampler.subscribe(rollup.add)
+        >>> month = rollup.query(start=time.time() - 30 * 86400)
+        >>> month.length, month["cpu_percent_max"]
+        (721, array('d', [...]))
+    """
+
+    def __init__(
+        self,
+        fields: Sequence[str] = ROLLUP_FIELDS,
+        resolutions: Sequence[Tuple[int, int]] = DEFAULT_RESOLUTIONS,
+        raw: int = 720
+    ) -> None:
+        """Initialize an empty rollup.
+
+        Args:
+            fields: Sample fields (or dict keys, e.g. ``cpuRealUsed`` of
+                ``get_system_total``) to roll up
+            resolutions: ``(bucket seconds, buckets kept)`` pairs
+            raw: Raw samples kept, 0 to keep none
+        """
+        self.fields = tuple(fields)
+        self.levels = [_Level(width, capacity, self.fields) for width, capacity in sorted(resolutions)]
+        self.raw_ring = RingBuffer(raw, ("timestamp",) + self.fields) if raw else None
+        self.late = 0
+        self.dropped = 0
+        self.last_time: Optional[float] = None
+        self._lock = threading.Lock()
+
+    @property
+    def resolutions(self) -> List[int]:
+        """Bucket widths in seconds, finest first."""
+        return [level.width for level in self.levels]
+
+    def add(self, sample: Any, timestamp: Optional[float] = None) -> None:
+        """Add a sample to every resolution.
+
+        Args:
+            sample: Mapping or record with the fields, e.g. a NetworkSample
+            timestamp: Sample time, defaults to the sample's ``timestamp``
+        """
+        if timestamp is None:
+            timestamp = sample["timestamp"] if isinstance(sample, dict) else getattr(sample, "timestamp")
+        values = _read_values(sample, self.fields)
+        with self._lock:
+            accepted = False
+            for level in self.levels:
+                start = timestamp - timestamp % level.width
+                if level.start is None or start > level.start:
+                    level.close()
+                    level.open(start, len(self.fields))
+                elif start < level.start:
+                    continue
+                level.add(values)
+                accepted = True
+            if self.last_time is not None and timestamp < self.last_time:
+                self.late += 1
+            else:
+                self.last_time = timestamp
+                if self.raw_ring is not None:
+                    self.raw_ring.append([timestamp] + values)
+            if not accepted:
+                self.dropped += 1
+
+    def _level(self, resolution: int) -> _Level:
+        for level in self.levels:
+            if level.width == resolution:
+                return level
+        raise ValueError(f"Unknown resolution {resolution}, expected one of {self.resolutions}")
+
+    def choose_resolution(
+        self,
+        start: Optional[float] = None,
+        end: Optional[float] = None,
+        max_points: int = 1000
+    ) -> int:
+        """Pick the finest resolution that covers a range in few enough points.
+
+        Args:
+            start: Range start, defaults to everything kept
+            end: Range end, defaults to the newest sample
+            max_points: Most buckets the range may take
+
+        Returns:
+            Bucket width in seconds; the coarsest one if none fits
+        """
+        newest = self.last_time or 0.0
+        end = newest if end is None else end
+        for level in self.levels:
+            oldest = newest - level.width * level.ring.capacity
+            if start is not None and start >= oldest and (end - start) / level.width <= max_points:
+                return level.width
+        return self.levels[-1].width
+
+    def query(
+        self,
+        start: Optional[float] = None,
+        end: Optional[float] = None,
+        resolution: Optional[int] = None,
+        max_points: int = 1000,
+        fields: Optional[Sequence[str]] = None,
+        numpy: Optional[bool] = False
+    ) -> Columns:
+        """Read buckets overlapping a time range.
+
+        Args:
+            start: Range start, defaults to everything kept
+            end: Range end, defaults to the newest sample
+            resolution: Bucket width, defaults to :meth:`choose_resolution`
+            max_points: Passed to :meth:`choose_resolution`
+            fields: Fields to read, defaults to all
+            numpy: Return NumPy arrays; None uses NumPy when installed
+
+        Returns:
+            Columns of ``timestamp`` (bucket start) and ``<field>_min``,
+            ``_max``, ``_avg`` and ``_last`` for each field, oldest first
+
+        Raises:
+            ValueError: If ``resolution`` is not one of ``resolutions``
+            ImportError: If ``numpy=True`` and NumPy is not installed
+        """
+        np = import_numpy(numpy)
+        with self._lock:
+            if resolution is None:
+                resolution = self.choose_resolution(start, end, max_points)
+            level = self._level(resolution)
+            names = [
+                name for name in level.ring.fields
+                if name == "timestamp" or fields is None or name.rsplit("_", 1)[0] in fields
+            ]
+            since = None if start is None else start - level.width
+            columns = level.ring.read(since=since, until=end, fields=names)
+            data = {name: columns[name] for name in names}
+            length = columns.length
+            if level.start is not None and (since is None or level.start > since) and (end is None or level.start <= end):
+                for name, value in zip(level.ring.fields, level.row()):
+                    if name in data:
+                        data[name].append(value)
+                length += 1
+        if np is not None:
+            data = {name: np.frombuffer(values, dtype=np.float64).copy() for name, values in data.items()}
+        return Columns(data, length, np is not None)
+
+    def raw(self, **kwargs) -> Optional[Columns]:
+        """Read the raw samples kept; see :meth:`RingBuffer.read`.
+
+        Returns:
+            Columns of ``timestamp`` and the fields, or None if no raw
+            samples are kept
+        """
+        return None if self.raw_ring is None else self.raw_ring.read(**kwargs)
@@ -0,0 +1,325 @@
+"""Metrics sampler module for BaoTa Panel SDK.
+
+This module polls a panel's ``get_network`` and ``get_system_total`` on a
+schedule and keeps the readings in a fixed-size ring buffer, so dashboards
+and alerts in the same process read recent history without calling the
+panel themselves.
+"""
+
+import bisect
+import math
+import threading
+import time
+from array import array
+from typing import TYPE_CHECKING, Any, Callable, Dict, List, Mapping, Optional, Sequence
+
+from .transport import normalize_host
+from .records import NetworkSample
+from ..utils.columns import Columns, import_numpy
+from ..utils.logger import logger
+
+if TYPE_CHECKING:
+    from ..api.system import System
+
+# Stored fields, named like the NetworkSample attributes they come from
+SAMPLE_FIELDS = (
+    "timestamp", "cpu_percent", "mem_used", "mem_total", "load_one", "load_five", "load_fifteen",
+    "up", "down", "up_total", "down_total", "up_packets", "down_packets",
+)
+
+_NAN = float("nan")
+
+
+class RingBuffer:
+    """Fixed-capacity history of numeric samples, one array per field.
+
+    Every field is a preallocated ``array('d')``; once full, each new sample
+    overwrites the oldest one, so memory stays at ``8 * capacity`` bytes per
+    field however long sampling runs. Missing values are stored as NaN.
+    Samples are expected in ``timestamp`` order.
+
+    Example:
+        >>> ring = RingBuffer(3)
+        >>> for t in range(5):
+        ...     ring.append({"timestamp": t, "cpu_percent": t * 10})
+        >>> list(ring.read()["cpu_percent"])
+        [20.0, 30.0, 40.0]
+    """
+
+    def __init__(self, capacity: int, fields: Sequence[str] = SAMPLE_FIELDS) -> None:
+        """Allocate the buffer.
+
+        Args:
+            capacity: Maximum number of samples kept
+            fields: Field names; must include ``timestamp``
+        """
+        if capacity < 1:
+            raise ValueError("capacity must be at least 1")
+        if "timestamp" not in fields:
+            raise ValueError("fields must include 'timestamp'")
+        self.capacity = capacity
+        self.fields = tuple(fields)
+        self._arrays = {name: array("d", [_NAN]) * capacity for name in self.fields}
+        self._next = 0
+        self._size = 0
+        self.total = 0
+        self._lock = threading.Lock()
+
+    def append(self, sample: Any) -> None:
+        """Store a sample, overwriting the oldest one when full.
+
+        Args:
+            sample: Mapping or record (e.g. NetworkSample) with the fields,
+                or a list or tuple of values in ``fields`` order
+        """
+        if isinstance(sample, (list, tuple)):
+            values = sample
+        elif isinstance(sample, dict) or isinstance(sample, Mapping):
+            values = [sample.get(name) for name in self.fields]
+        else:
+            values = [getattr(sample, name, None) for name in self.fields]
+        with self._lock:
+            index = self._next
+            for name, value in zip(self.fields, values):
+                self._arrays[name][index] = _NAN if value is None else value
+            self._next = (index + 1) % self.capacity
+            self._size = min(self._size + 1, self.capacity)
+            self.total += 1
+
+    def __len__(self) -> int:
+        return self._size
+
+    def clear(self) -> None:
+        """Drop every sample, keeping the allocated arrays."""
+        with self._lock:
+            self._next = self._size = 0
+
+    def _ordered(self, name: str) -> array:
+        """Copy a field oldest first; the lock must be held."""
+        values = self._arrays[name]
+        if self._size < self.capacity:
+            return values[:self._size]
+        return values[self._next:] + values[:self._next]
+
+    def latest(self) -> Optional[Dict[str, float]]:
+        """Get the newest sample.
+
+        Returns:
+            Dict of field values, or None if the buffer is empty
+        """
+        with self._lock:
+            if not self._size:
+                return None
+            index = (self._next - 1) % self.capacity
+            return {name: self._arrays[name][index] for name in self.fields}
+
+    def read(
+        self,
+        last: Optional[int] = None,
+        since: Optional[float] = None,
+        fields: Optional[Sequence[str]] = None,
+        numpy: Optional[bool] = False,
+        until: Optional[float] = None
+    ) -> Columns:
+        """Copy stored samples out as columns, oldest first.
+
+        Args:
+            last: Only the newest ``last`` samples
+            since: Only samples with a timestamp after this time
+            until: Only samples with a timestamp up to this time
+            fields: Fields to copy, defaults to all
+            numpy: Return NumPy arrays; None uses NumPy when installed
+
+        Returns:
+            Columns of ``array('d')`` (or NumPy float arrays) by field name
+
+        Raises:
+            ImportError: If ``numpy=True`` and NumPy is not installed
+        """
+        np = import_numpy(numpy)
+        names = self.fields if fields is None else tuple(fields)
+        with self._lock:
+            start, stop = 0, self._size
+            if since is not None or until is not None:
+                timestamps = self._ordered("timestamp")
+                if since is not None:
+                    start = bisect.bisect_right(timestamps, since)
+                if until is not None:
+                    stop = bisect.bisect_right(timestamps, until)
+            if last is not None:
+                start = max(start, self._size - last)
+            stop = max(start, stop)
+            columns = {name: self._ordered(name)[start:stop] for name in names}
+            length = stop - start
+        if np is not None:
+            columns = {name: np.frombuffer(values, dtype=np.float64).copy() for name, values in columns.items()}
+        return Columns(columns, length, np is not None)
+
+
+class MetricsSampler:
+    """Background poller of one panel's status into a ring buffer.
+
+    ``get_network`` is read every ``interval`` seconds and stored as a
+    NetworkSample row; ``get_system_total``, which changes rarely, is read
+    every ``info_every`` samples and kept in ``info``. Readers call
+    ``read`` or ``latest`` and never reach the panel. Failed polls are
+    logged and counted in ``errors``; sampling carries on.
+
+    Example:
+        >>> sampler = get_sampler(System(), interval=5, capacity=720)
+        >>> sampler.start()
+        >>> sampler.read(since=time.time() - 300)["cpu_percent"]
+    """
+
+    def __init__(
+        self,
+        system: "System",
+        interval: float = 5.0,
+        capacity: int = 720,
+        info_every: int = 12
+    ) -> None:
+        """Initialize the sampler; call ``start`` to begin polling.
+
+        Args:
+            system: Synchronous System client of the panel
+            interval: Seconds between ``get_network`` polls
+            capacity: Samples kept (720 at 5 s is one hour)
+            info_every: Polls between ``get_system_total`` refreshes
+        """
+        self.system = system
+        self.host = normalize_host(system.config.bt_panel_host)
+        self.interval = interval
+        self.info_every = max(1, info_every)
+        self.ring = RingBuffer(capacity)
+        self.info: Optional[Dict[str, Any]] = None
+        self.errors = 0
+        self.last_error: Optional[BaseException] = None
+        self._subscribers: List[Callable[[NetworkSample], None]] = []
+        self._stop = threading.Event()
+        self._thread: Optional[threading.Thread] = None
+        self._lock = threading.Lock()
+
+    def sample(self) -> Optional[NetworkSample]:
+        """Poll the panel once and store the reading.
+
+        Returns:
+            The stored NetworkSample, or None if the poll failed
+        """
+        try:
+            if self.info is None or self.ring.total % self.info_every == 0:
+                info = self.system.get_system_total()
+                if isinstance(info, dict) and info.get("status") is not False:
+                    self.info = info
+            result = self.system.get_network()
+            sample = result if isinstance(result, NetworkSample) else NetworkSample.convert(result)
+            if not isinstance(sample, NetworkSample):
+                raise ValueError(f"Unexpected get_network response: {result!r}")
+        except Exception as e:
+            self.errors += 1
+            self.last_error = e
+            logger.warning("Sampling %s failed: %s", self.host, e)
+            return None
+        if sample.mem_total is None and self.info:
+            sample.mem_total = self.info.get("memTotal")
+        self.ring.append(sample)
+        for callback in list(self._subscribers):
+            try:
+                callback(sample)
+            except Exception:
+                logger.exception("Sampler subscriber %r failed", callback)
+        return sample
+
+    def read(self, last: Optional[int] = None, since: Optional[float] = None, **kwargs) -> Columns:
+        """Copy stored samples out as columns; see :meth:`RingBuffer.read`."""
+        return self.ring.read(last=last, since=since, **kwargs)
+
+    def latest(self) -> Optional[Dict[str, float]]:
+        """Get the newest stored sample, or None before the first poll."""
+        return self.ring.latest()
+
+    def subscribe(self, callback: Callable[[NetworkSample], None]) -> None:
+        """Call a function with every new sample, on the sampling thread.
+
+        Args:
+            callback: Receives the NetworkSample
+        """
+        self._subscribers.append(callback)
+
+    @property
+    def running(self) -> bool:
+        """Whether the background thread is polling."""
+        return self._thread is not None and self._thread.is_alive()
+
+    def start(self) -> "MetricsSampler":
+        """Start polling on a daemon thread; does nothing if already running."""
+        with self._lock:
+            if not self.running:
+                self._stop.clear()
+                self._thread = threading.Thread(
+                    target=self._run, name=f"pybt-sampler-{self.host}", daemon=True
+                )
+                self._thread.start()
+        return self
+
+    def stop(self, timeout: Optional[float] = None) -> None:
+        """Stop polling and wait for the thread to finish.
+
+        Args:
+            timeout: Seconds to wait for an in-flight poll
+        """
+        self._stop.set()
+        thread = self._thread
+        if thread is not None and thread is not threading.current_thread():
+            thread.join(timeout)
+
+    def _run(self) -> None:
+        """Poll every ``interval`` seconds until stopped, skipping missed slots."""
+        due = time.monotonic()
+        while not self._stop.is_set():
+            self.sample()
+            now = time.monotonic()
+            due += self.interval
+            if due < now:
+                due = now + self.interval - math.fmod(now - due, self.interval)
+            self._stop.wait(due - now)
+
+    def __enter__(self) -> "MetricsSampler":
+        return self.start()
+
+    def __exit__(self, *exc_info) -> None:
+        self.stop()
+
+
+_samplers: Dict[str, MetricsSampler] = {}
+_samplers_lock = threading.Lock()
+
+
+def get_sampler(system: "System", **kwargs) -> MetricsSampler:
+    """Get the process-wide sampler of a panel, creating it on first use.
+
+    Every caller asking for the same panel shares one sampler, so the panel
+    is polled once however many consumers read from it. Keyword arguments
+    only apply when the sampler is created.
+
+    Args:
+        system: System client of the panel
+        **kwargs: MetricsSampler arguments
+
+    Returns:
+        The panel's MetricsSampler (not started)
+    """
+    host = normalize_host(system.config.bt_panel_host)
+    with _samplers_lock:
+        sampler = _samplers.get(host)
+        if sampler is None:
+            sampler = _samplers[host] = MetricsSampler(system, **kwargs)
+        return sampler
+
+
+def stop_samplers() -> None:
+    """Stop and forget every sampler created by :func:`get_sampler`."""
+    with _samplers_lock:
+        samplers = list(_samplers.values())
+        _samplers.clear()
+    for sampler in samplers:
+        sampler.stop()
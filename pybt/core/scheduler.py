@@ -0,0 +1,422 @@
+"""Adaptive polling module for BaoTa Panel SDK.
+
+This module polls status endpoints (``get_network``, ``get_disk_info``,
+``get_task_count``) of many panels from one scheduler. Each panel and
+endpoint gets its own interval: it shrinks while the readings move and
+grows while they stay put, never drops below a multiple of the panel's
+response latency, and stays within the configured bounds. Polls are
+jittered so panels added together do not stay in lockstep.
+"""
+
+import heapq
+import itertools
+import random
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
+from dataclasses import dataclass, field
+from typing import TYPE_CHECKING, Any, Callable, Dict, Iterable, List, Optional, Tuple
+
+from .transport import normalize_host
+from .records import DiskPartition, NetworkSample
+from ..utils.logger import logger
+
+if TYPE_CHECKING:
+    from ..api.system import System
+
+# Status endpoints polled by default, as System method names
+POLLED_METHODS = ("get_network", "get_disk_info", "get_task_count")
+
+# Smallest change of each signal that counts as activity, in the signal's
+# unit: percentage points, load average, KB/s, or tasks
+DEFAULT_TOLERANCES: Dict[str, float] = {
+    "cpu": 5.0,
+    "mem": 2.0,
+    "load": 0.5,
+    "up": 64.0,
+    "down": 64.0,
+    "disk": 1.0,
+    "inodes": 1.0,
+    "tasks": 0.5,
+}
+
+
+def signals(method: str, result: Any) -> Dict[str, float]:
+    """Reduce a status response to the numbers its volatility is judged on.
+
+    Signals of one partition are named ``disk:<path>`` and
+    ``inodes:<path>``; their tolerance is looked up by the part before the
+    colon.
+
+    Args:
+        method: System method name
+        result: Its response (a dict, list or records)
+
+    Returns:
+        Dict of signal values; empty if the response has none
+    """
+    values: Dict[str, Optional[float]] = {}
+    if method == "get_network":
+        sample = result if isinstance(result, NetworkSample) else NetworkSample.convert(result)
+        if isinstance(sample, NetworkSample):
+            mem = None
+            if sample.mem_used is not None and sample.mem_total:
+                mem = 100.0 * sample.mem_used / sample.mem_total
+            values = {
+                "cpu": sample.cpu_percent, "mem": mem, "load": sample.load_one,
+                "up": sample.up, "down": sample.down,
+            }
+    elif method == "get_disk_info":
+        for partition in DiskPartition.convert(result) if isinstance(result, list) else ():
+            if isinstance(partition, DiskPartition):
+                values[f"disk:{partition.path}"] = partition.size_usage
+                values[f"inodes:{partition.path}"] = partition.inodes_usage
+    elif isinstance(result, (int, float)) and not isinstance(result, bool):
+        values = {"tasks": result}
+    return {name: float(value) for name, value in values.items() if value is not None}
+
+
+def change_score(previous: Dict[str, float], current: Dict[str, float], tolerances: Dict[str, float]) -> float:
+    """Get how far two sets of signals are apart, in tolerances.
+
+    Args:
+        previous: Earlier signals
+        current: Later signals
+        tolerances: Tolerance by signal kind; unknown kinds use 1.0
+
+    Returns:
+        Largest change over its tolerance; 1.0 or more means activity.
+        Signals appearing or disappearing always count as activity.
+    """
+    if previous.keys() != current.keys():
+        return float("inf")
+    score = 0.0
+    for name, value in current.items():
+        tolerance = tolerances.get(name.split(":", 1)[0], 1.0)
+        score = max(score, abs(value - previous[name]) / tolerance)
+    return score
+
+
+@dataclass(eq=False)
+class PollJob:
+    """Polling state of one endpoint of one panel.
+
+    Attributes:
+        client: System client of the panel
+        method: System method name
+        interval: Current poll interval in seconds
+        due: Clock time of the next poll
+        latency: Smoothed response time in seconds, None before the first poll
+        polls: Number of polls made
+        changes: Number of polls that showed activity
+        errors: Number of failed polls
+        result: Last successful response
+        polling: Whether a poll of the job is in flight
+    """
+    client: "System"
+    method: str
+    interval: float
+    due: float = 0.0
+    latency: Optional[float] = None
+    polls: int = 0
+    changes: int = 0
+    errors: int = 0
+    result: Any = None
+    polling: bool = False
+    previous: Optional[Dict[str, float]] = field(default=None, repr=False)
+    active: bool = field(default=True, repr=False)
+    token: int = field(default=0, repr=False)
+
+    @property
+    def host(self) -> str:
+        """Normalized panel host."""
+        return normalize_host(self.client.config.bt_panel_host)
+
+
+class AdaptiveScheduler:
+    """Polls status endpoints of many panels at adaptive intervals.
+
+    After every poll the job's signals are compared with the previous
+    ones. A change of at least one tolerance multiplies the interval by
+    ``shrink``; otherwise it is multiplied by ``grow``. The result is
+    clamped to ``[min_interval, max_interval]`` and raised to at least
+    ``latency_factor`` times the smoothed response time, so slow panels are
+    not polled back to back. The next poll is due after the interval
+    scaled by a random factor in ``1 +/- jitter``. Failed polls back off
+    like calm ones.
+
+    Due polls run on a pool of ``max_workers`` threads, so a slow panel
+    only delays its own jobs. A job is polled at most once at a time: its
+    next poll is scheduled when the current one finishes.
+
+    Example:
+        >>> scheduler = AdaptiveScheduler(min_interval=5, max_interval=120)
+        >>> for panel in fleet.panels.values():
+        ...     scheduler.add(panel.system)
+        >>> scheduler.subscribe(lambda job, result: print(job.host, job.method, result))
+        >>> scheduler.start()
+    """
+
+    def __init__(
+        self,
+        min_interval: float = 5.0,
+        max_interval: float = 120.0,
+        tolerances: Optional[Dict[str, float]] = None,
+        shrink: float = 0.5,
+        grow: float = 1.5,
+        latency_factor: float = 20.0,
+        jitter: float = 0.1,
+        max_workers: int = 8,
+        clock: Callable[[], float] = time.monotonic,
+        seed: Optional[int] = None
+    ) -> None:
+        """Initialize a scheduler with no jobs.
+
+        Args:
+            min_interval: Shortest poll interval in seconds
+            max_interval: Longest poll interval in seconds
+            tolerances: Overrides of ``DEFAULT_TOLERANCES``
+            shrink: Interval factor after activity
+            grow: Interval factor after a calm poll
+            latency_factor: Minimum interval in multiples of response time
+            jitter: Relative spread of poll times
+            max_workers: Polls run concurrently; 1 polls on the calling
+                thread
+            clock: Monotonic time source
+            seed: Seed of the jitter generator
+        """
+        if not 0 < min_interval <= max_interval:
+            raise ValueError("Expected 0 < min_interval <= max_interval")
+        self.min_interval = min_interval
+        self.max_interval = max_interval
+        self.tolerances = dict(DEFAULT_TOLERANCES, **(tolerances or {}))
+        self.shrink = shrink
+        self.grow = grow
+        self.latency_factor = latency_factor
+        self.jitter = jitter
+        self.max_workers = max_workers
+        self.clock = clock
+        self._random = random.Random(seed)
+        self._heap: List[Tuple[float, int, PollJob]] = []
+        self._jobs: Dict[Tuple[str, str], PollJob] = {}
+        self._counter = itertools.count()
+        self._subscribers: List[Callable[[PollJob, Any], None]] = []
+        self._lock = threading.Lock()
+        self._wake = threading.Event()
+        self._stop = threading.Event()
+        self._thread: Optional[threading.Thread] = None
+        self._executor: Optional[ThreadPoolExecutor] = None
+
+    @property
+    def jobs(self) -> List[PollJob]:
+        """Scheduled jobs."""
+        return list(self._jobs.values())
+
+    def __len__(self) -> int:
+        return len(self._jobs)
+
+    @property
+    def requests(self) -> int:
+        """Number of polls made by every job, failed ones included."""
+        return sum(job.polls for job in self._jobs.values())
+
+    def _push(self, job: PollJob) -> None:
+        """Queue a job at its due time; the lock must be held.
+
+        Earlier entries of the job become stale and are skipped when popped.
+        """
+        job.token = next(self._counter)
+        heapq.heappush(self._heap, (job.due, job.token, job))
+
+    @staticmethod
+    def _current(entry: Tuple[float, int, PollJob]) -> bool:
+        return entry[2].active and entry[2].token == entry[1]
+
+    def add(
+        self,
+        system: "System",
+        methods: Iterable[str] = POLLED_METHODS,
+        interval: Optional[float] = None
+    ) -> List[PollJob]:
+        """Start polling endpoints of a panel.
+
+        The first poll of each job is due at a random point of its first
+        interval. Adding an endpoint already polled returns its job.
+
+        Args:
+            system: Synchronous System client of the panel
+            methods: System method names to poll
+            interval: Initial interval, defaults to ``min_interval``
+
+        Returns:
+            The panel's jobs for ``methods``
+        """
+        start = self.min_interval if interval is None else min(max(interval, self.min_interval), self.max_interval)
+        now = self.clock()
+        jobs = []
+        with self._lock:
+            for method in methods:
+                key = (normalize_host(system.config.bt_panel_host), method)
+                job = self._jobs.get(key)
+                if job is None:
+                    job = PollJob(system, method, start, due=now + self._random.uniform(0, start))
+                    self._jobs[key] = job
+                    self._push(job)
+                jobs.append(job)
+        self._wake.set()
+        return jobs
+
+    def remove(self, system: "System", methods: Optional[Iterable[str]] = None) -> None:
+        """Stop polling endpoints of a panel.
+
+        Args:
+            system: System client of the panel
+            methods: Method names to stop, defaults to all
+        """
+        host = normalize_host(system.config.bt_panel_host)
+        with self._lock:
+            for key in list(self._jobs):
+                if key[0] == host and (methods is None or key[1] in methods):
+                    self._jobs.pop(key).active = False
+
+    def subscribe(self, callback: Callable[[PollJob, Any], None]) -> None:
+        """Call a function with every successful poll result.
+
+        Args:
+            callback: Receives the job and the response
+        """
+        self._subscribers.append(callback)
+
+    def next_due(self) -> Optional[float]:
+        """Get the clock time of the next poll, None without jobs."""
+        with self._lock:
+            while self._heap and not self._current(self._heap[0]):
+                heapq.heappop(self._heap)
+            return self._heap[0][0] if self._heap else None
+
+    def _take_due(self, now: float) -> List[PollJob]:
+        with self._lock:
+            due = []
+            while self._heap and self._heap[0][0] <= now:
+                entry = heapq.heappop(self._heap)
+                if self._current(entry) and not entry[2].polling:
+                    entry[2].polling = True
+                    due.append(entry[2])
+            return due
+
+    def run_due(self, now: Optional[float] = None) -> int:
+        """Start polling every job that is due.
+
+        With ``max_workers`` above 1 the polls are handed to the worker
+        threads and this returns without waiting for them; each poll
+        schedules the job's next poll when it finishes. Otherwise the polls
+        run on the calling thread.
+
+        Args:
+            now: Clock time, defaults to ``clock()``
+
+        Returns:
+            Number of polls started
+        """
+        jobs = self._take_due(self.clock() if now is None else now)
+        if self.max_workers > 1:
+            if self._executor is None:
+                self._executor = ThreadPoolExecutor(max_workers=self.max_workers, thread_name_prefix="pybt-poll")
+            for job in jobs:
+                self._executor.submit(self.poll, job)
+        else:
+            for job in jobs:
+                self.poll(job)
+        return len(jobs)
+
+    def poll(self, job: PollJob) -> Any:
+        """Poll one job now, adapt its interval and schedule its next poll.
+
+        Args:
+            job: Job to poll
+
+        Returns:
+            The response, or None if the poll failed
+        """
+        started = self.clock()
+        try:
+            result = getattr(job.client, job.method)()
+        except Exception as e:
+            job.errors += 1
+            logger.warning("Polling %s %s failed: %s", job.host, job.method, e)
+            result = None
+            active = False
+        else:
+            latency = self.clock() - started
+            job.latency = latency if job.latency is None else 0.7 * job.latency + 0.3 * latency
+            current = signals(job.method, result)
+            active = job.previous is not None and change_score(job.previous, current, self.tolerances) >= 1
+            job.previous = current
+            job.result = result
+            job.changes += active
+        job.polls += 1
+
+        interval = job.interval * (self.shrink if active else self.grow)
+        interval = min(max(interval, self.min_interval), self.max_interval)
+        if job.latency is not None:
+            interval = max(interval, min(job.latency * self.latency_factor, self.max_interval))
+        job.interval = interval
+        job.due = started + interval * self._random.uniform(1 - self.jitter, 1 + self.jitter)
+        with self._lock:
+            job.polling = False
+            if job.active:
+                self._push(job)
+        self._wake.set()
+
+        if result is not None:
+            for callback in list(self._subscribers):
+                try:
+                    callback(job, result)
+                except Exception:
+                    logger.exception("Poll subscriber %r failed", callback)
+        return result
+
+    @property
+    def running(self) -> bool:
+        """Whether the background thread is polling."""
+        return self._thread is not None and self._thread.is_alive()
+
+    def start(self) -> "AdaptiveScheduler":
+        """Start polling on a daemon thread; does nothing if already running."""
+        with self._lock:
+            if not self.running:
+                self._stop.clear()
+                self._thread = threading.Thread(target=self._run, name="pybt-scheduler", daemon=True)
+                self._thread.start()
+        return self
+
+    def stop(self, timeout: Optional[float] = None) -> None:
+        """Stop polling and wait for in-flight polls.
+
+        Args:
+            timeout: Seconds to wait for the thread
+        """
+        self._stop.set()
+        self._wake.set()
+        thread = self._thread
+        if thread is not None and thread is not threading.current_thread():
+            thread.join(timeout)
+        if self._executor is not None:
+            self._executor.shutdown(wait=True)
+            self._executor = None
+
+    def _run(self) -> None:
+        """Poll due jobs, sleeping until the next one or a new job."""
+        while not self._stop.is_set():
+            self._wake.clear()
+            self.run_due()
+            due = self.next_due()
+            delay = self.max_interval if due is None else due - self.clock()
+            if delay > 0:
+                self._wake.wait(delay)
+
+    def __enter__(self) -> "AdaptiveScheduler":
+        return self.start()
+
+    def __exit__(self, *exc_info) -> None:
+        self.stop()
@@ -0,0 +1,397 @@
+"""Site search module for BaoTa Panel SDK.
+
+This module keeps a client-side inverted index over the name, remark
+(``ps``), root path and domains of every site of one or more panels, so
+type-ahead search does not send a ``get_website_list(search=...)`` request
+per keystroke. Substring queries use trigram postings and prefix queries a
+sorted token list; both stop as soon as ``limit`` sites are found.
+"""
+
+import bisect
+import re
+import threading
+from array import array
+from typing import TYPE_CHECKING, Any, Dict, Iterable, Iterator, List, NamedTuple, Optional, Set, Tuple
+
+from .domain_index import created_site_domains, parse_domains
+from .metrics import RequestEvent
+from .transport import normalize_host
+from ..utils.pagination import paginate
+
+if TYPE_CHECKING:
+    from .client import Client
+
+_TOKEN_RE = re.compile(r"\w+")
+
+
+class SiteHit(NamedTuple):
+    """A site matching a search.
+
+    Attributes:
+        host: Panel URL of the site
+        site_id: Website ID
+        name: Website name
+    """
+    host: str
+    site_id: int
+    name: str
+
+
+class _Doc:
+    """Searchable fields of one site."""
+
+    __slots__ = ("host", "site_id", "name", "ps", "path", "domains", "text")
+
+    def __init__(self, host: str, site_id: int, name: str, ps: str, path: str, domains: List[str]) -> None:
+        self.host = host
+        self.site_id = site_id
+        self.name = name
+        self.ps = ps
+        self.path = path
+        self.domains = domains
+        # Lower-cased fields, one per line, to verify substring candidates
+        self.text = "\n".join([name, ps, path] + domains).lower()
+
+
+def _trigrams(value: str) -> Set[str]:
+    """Distinct trigrams of a lower-cased string."""
+    return {value[i:i + 3] for i in range(len(value) - 2)}
+
+
+def _tokens(doc: _Doc) -> Set[str]:
+    """Prefix-searchable tokens: every word plus the whole name and domains."""
+    tokens = set(_TOKEN_RE.findall(doc.text))
+    tokens.add(doc.name.lower())
+    tokens.update(domain.lower() for domain in doc.domains)
+    tokens.discard("")
+    return tokens
+
+
+class SiteSearch:
+    """Inverted index over the sites of one or more panels.
+
+    Documents are never edited in place: a changed site is re-added under a
+    new document number and the old one is left as a tombstone that queries
+    skip. The postings are rebuilt once tombstones outnumber live sites.
+
+    Successful ``create_website``, ``delete_website``, ``set_website_remark``,
+    ``set_root_path``, ``add_domain`` and ``delete_domain`` calls made
+    through a tracked client update the index in place.
+
+    Example:
+        >>> search = SiteSearch()
+        >>> search.load(panel.website)
+        >>> search.track(panel.website, panel.domain)
+        >>> search.search("shop")
+        [SiteHit(host='https://panel.example.com:8888', site_id=5, name='shop.example.com')]
+    """
+
+    def __init__(self) -> None:
+        """Initialize an empty index."""
+        self._lock = threading.Lock()
+        self._reset()
+
+    def _reset(self) -> None:
+        """Drop every document and posting (lock must be held or unshared)."""
+        self._docs: List[Optional[_Doc]] = []
+        self._ids: Dict[Tuple[str, int], int] = {}
+        self._grams: Dict[str, array] = {}
+        self._token_docs: Dict[str, array] = {}
+        self._tokens: List[str] = []
+        self._new_tokens: List[str] = []
+        self._dead = 0
+
+    def load(self, client: "Client", limit: int = 500, window: int = 4) -> int:
+        """Replace a panel's sites with its website and domain tables.
+
+        Args:
+            client: Client of the panel to load
+            limit: Rows fetched per page
+            window: Maximum number of pages fetched concurrently
+
+        Returns:
+            Number of indexed sites of the panel
+        """
+        sites_endpoint = client.config.get_endpoint("Websites")
+        domains_endpoint = client.config.get_endpoint("WebDomainList")
+        sites = paginate(
+            lambda page: client.post_data(sites_endpoint, {"p": page, "limit": limit, "type": -1, "order": "id desc"}),
+            limit,
+            window=window
+        )
+        domains = paginate(
+            lambda page: client.post_data(domains_endpoint, {"p": page, "limit": limit}),
+            limit,
+            window=window
+        )
+        return self.load_rows(client.config.bt_panel_host, sites, domains)
+
+    def load_rows(self, host: str, sites: Iterable[Any], domains: Iterable[Any] = ()) -> int:
+        """Replace a panel's sites with table rows.
+
+        Args:
+            host: Panel URL the rows come from
+            sites: Website rows with ``id``, ``name``, ``ps`` and ``path``
+                (dicts or Site records)
+            domains: Domain rows with ``pid`` and ``name``
+
+        Returns:
+            Number of indexed sites of the panel
+        """
+        host = normalize_host(host)
+        fields: Dict[int, Tuple[str, str, str, Dict[str, None]]] = {}
+        for row in sites:
+            fields[int(row["id"])] = (row.get("name") or "", row.get("ps") or "", row.get("path") or "", {})
+        for row in domains:
+            site = fields.get(int(row["pid"]))
+            if site is not None and row["name"] != site[0]:
+                site[3][row["name"]] = None
+        with self._lock:
+            for key in [key for key in self._ids if key[0] == host]:
+                self._kill(self._ids.pop(key))
+            for site_id, (name, ps, path, site_domains) in fields.items():
+                self._insert(_Doc(host, site_id, name, ps, path, list(site_domains)), bulk=True)
+            self._sort_tokens()
+            self._maybe_compact()
+        return len(fields)
+
+    def _insert(self, doc: _Doc, bulk: bool = False) -> None:
+        """Index a document under a new number (lock must be held).
+
+        With ``bulk`` new tokens are queued; the caller merges them into the
+        sorted token list once with :meth:`_sort_tokens`.
+        """
+        number = len(self._docs)
+        self._docs.append(doc)
+        self._ids[(doc.host, doc.site_id)] = number
+        # Trigrams spanning two fields contain a newline and never match a query
+        postings = self._grams
+        for gram in _trigrams(doc.text):
+            try:
+                postings[gram].append(number)
+            except KeyError:
+                postings[gram] = array("i", [number])
+        postings = self._token_docs
+        for token in _tokens(doc):
+            try:
+                postings[token].append(number)
+            except KeyError:
+                postings[token] = array("i", [number])
+                if bulk:
+                    self._new_tokens.append(token)
+                else:
+                    bisect.insort(self._tokens, token)
+
+    def _sort_tokens(self) -> None:
+        """Merge tokens queued by bulk inserts (lock must be held)."""
+        if self._new_tokens:
+            # Timsort merges the sorted list and the sorted new run in linear time
+            self._tokens += sorted(self._new_tokens)
+            self._tokens.sort()
+            self._new_tokens = []
+
+    def _kill(self, number: int) -> None:
+        """Turn a document into a tombstone (lock must be held)."""
+        if self._docs[number] is not None:
+            self._docs[number] = None
+            self._dead += 1
+
+    def _maybe_compact(self) -> None:
+        """Rebuild the postings once tombstones outnumber live documents."""
+        if self._dead > 1024 and self._dead > len(self._ids):
+            live = [doc for doc in self._docs if doc is not None]
+            self._reset()
+            for doc in live:
+                self._insert(doc, bulk=True)
+            self._sort_tokens()
+
+    def add_site(self, host: str, site_id: int, name: str, ps: str = "", path: str = "",
+                 domains: Iterable[str] = ()) -> None:
+        """Index or replace a site.
+
+        Args:
+            host: Panel URL
+            site_id: Website ID
+            name: Website name
+            ps: Remark
+            path: Root directory
+            domains: Domains bound to the site other than its name
+        """
+        domains = [domain for domain in dict.fromkeys(domains) if domain and domain != name]
+        doc = _Doc(normalize_host(host), int(site_id), name or "", ps or "", path or "", domains)
+        with self._lock:
+            number = self._ids.get((doc.host, doc.site_id))
+            if number is not None:
+                self._kill(number)
+            self._insert(doc)
+            self._maybe_compact()
+
+    def update_site(self, host: str, site_id: int, **fields: Any) -> bool:
+        """Change fields of an indexed site.
+
+        Args:
+            host: Panel URL
+            site_id: Website ID
+            fields: New ``name``, ``ps``, ``path`` or ``domains`` values
+
+        Returns:
+            False if the site is not indexed
+        """
+        values = self.get(host, site_id)
+        if values is None:
+            return False
+        values.update(fields)
+        self.add_site(host, site_id, **values)
+        return True
+
+    def remove_site(self, host: str, site_id: int) -> None:
+        """Drop a site from the index.
+
+        Args:
+            host: Panel URL
+            site_id: Website ID
+        """
+        with self._lock:
+            number = self._ids.pop((normalize_host(host), int(site_id)), None)
+            if number is not None:
+                self._kill(number)
+                self._maybe_compact()
+
+    def get(self, host: str, site_id: int) -> Optional[Dict[str, Any]]:
+        """Get the indexed fields of a site.
+
+        Returns:
+            Dict of ``name``, ``ps``, ``path`` and ``domains``, or None
+        """
+        number = self._ids.get((normalize_host(host), int(site_id)))
+        doc = None if number is None else self._docs[number]
+        if doc is None:
+            return None
+        return {"name": doc.name, "ps": doc.ps, "path": doc.path, "domains": list(doc.domains)}
+
+    def substring(self, query: str, limit: int = 20) -> List[SiteHit]:
+        """Find sites with a field containing the query, case-insensitively.
+
+        Args:
+            query: Text to find anywhere in a name, remark, path or domain
+            limit: Maximum number of results
+
+        Returns:
+            List of SiteHit in indexing order
+        """
+        query = query.strip().lower()
+        if not query or "\n" in query:
+            return []
+        with self._lock:
+            docs = self._docs
+            if len(query) < 3:
+                # Too short for trigrams: scan until enough matches are found
+                candidates: Iterable[int] = range(len(docs))
+            else:
+                postings = []
+                for gram in _trigrams(query):
+                    posting = self._grams.get(gram)
+                    if posting is None:
+                        return []
+                    postings.append(posting)
+                candidates = min(postings, key=len)
+            hits = []
+            for number in candidates:
+                doc = docs[number]
+                if doc is not None and query in doc.text:
+                    hits.append(SiteHit(doc.host, doc.site_id, doc.name))
+                    if len(hits) >= limit:
+                        break
+            return hits
+
+    def prefix(self, query: str, limit: int = 20) -> List[SiteHit]:
+        """Find sites with a word, name or domain starting with the query.
+
+        Args:
+            query: Start of a word, e.g. ``sho`` or ``shop.exa``
+            limit: Maximum number of results
+
+        Returns:
+            List of SiteHit, ordered by matching token
+        """
+        query = query.strip().lower()
+        if not query:
+            return []
+        with self._lock:
+            docs, tokens = self._docs, self._tokens
+            seen: Set[int] = set()
+            hits = []
+            index = bisect.bisect_left(tokens, query)
+            while index < len(tokens) and tokens[index].startswith(query):
+                for number in self._token_docs[tokens[index]]:
+                    doc = docs[number]
+                    if doc is None or number in seen:
+                        continue
+                    seen.add(number)
+                    hits.append(SiteHit(doc.host, doc.site_id, doc.name))
+                    if len(hits) >= limit:
+                        return hits
+                index += 1
+            return hits
+
+    def search(self, query: str, limit: int = 20) -> List[SiteHit]:
+        """Find sites by prefix first, then by substring.
+
+        Args:
+            query: Search text
+            limit: Maximum number of results
+
+        Returns:
+            List of SiteHit, prefix matches first
+        """
+        hits = self.prefix(query, limit)
+        if len(hits) < limit:
+            found = set(hits)
+            hits += [hit for hit in self.substring(query, limit) if hit not in found][:limit - len(hits)]
+        return hits
+
+    def __len__(self) -> int:
+        return len(self._ids)
+
+    def __iter__(self) -> Iterator[SiteHit]:
+        with self._lock:
+            docs = [doc for doc in self._docs if doc is not None]
+        return iter([SiteHit(doc.host, doc.site_id, doc.name) for doc in docs])
+
+    def track(self, *clients: "Client") -> None:
+        """Keep the index current with site changes made by clients.
+
+        Args:
+            clients: Clients whose successful calls update the index
+        """
+        for client in clients:
+            client.add_hook("after", self._on_request)
+
+    def _on_request(self, event: RequestEvent) -> None:
+        """After hook applying site changes of a successful call."""
+        if event.status != "ok" or not event.data:
+            return
+        if isinstance(event.result, dict) and event.result.get("status") is False:
+            return
+        data, host = event.data, event.host
+        if event.name == "WebAddSite" and isinstance(event.result, dict) and event.result.get("siteId"):
+            names = [name for name, _ in created_site_domains(data)]
+            if names:
+                self.add_site(host, int(event.result["siteId"]), names[0], data.get("ps") or "",
+                              data.get("path") or "", names[1:])
+        elif event.name == "WebDeleteSite":
+            self.remove_site(host, int(data["id"]))
+        elif event.name == "WebSetPs":
+            self.update_site(host, int(data["id"]), ps=data.get("ps") or "")
+        elif event.name == "SetPath":
+            self.update_site(host, int(data["id"]), path=data.get("path") or "")
+        elif event.name in ("WebAddDomain", "WebDelDomain"):
+            current = self.get(host, int(data["id"]))
+            if current is None:
+                return
+            names = [name for name, _ in parse_domains(data["domain"])]
+            if event.name == "WebAddDomain":
+                domains = current["domains"] + names
+            else:
+                domains = [domain for domain in current["domains"] if domain not in names]
+            self.update_site(host, int(data["id"]), domains=domains)
@@ -0,0 +1,115 @@
+"""Transport registry module for BaoTa Panel SDK.
+
+This module keeps one keep-alive ``requests.Session`` per panel host so that
+every API class talking to the same panel shares a single connection pool.
+"""
+
+import threading
+from typing import TYPE_CHECKING, Dict, Optional
+from urllib.parse import urlsplit
+
+if TYPE_CHECKING:
+    import requests
+
+
+DEFAULT_POOL_SIZE = 10
+
+
+def normalize_host(bt_panel_host: str) -> str:
+    """Normalize a panel host into a registry key.
+
+    Args:
+        bt_panel_host: Panel URL, e.g. ``http://192.168.1.168:8888/``
+
+    Returns:
+        Lower-cased ``scheme://netloc`` of the panel
+    """
+    parts = urlsplit(bt_panel_host or "")
+    if not parts.scheme:
+        return (bt_panel_host or "").rstrip("/").lower()
+    return f"{parts.scheme}://{parts.netloc}".lower()
+
+
+class TransportRegistry:
+    """Registry of shared HTTP sessions, one per panel host.
+
+    Sessions are created on first use and mounted with an ``HTTPAdapter``
+    sized to the requested pool size. Asking for a larger pool later
+    re-mounts the adapter with the bigger size and closes the replaced one;
+    requests still running on it finish and their connections are then
+    discarded instead of pooled.
+    """
+
+    def __init__(self) -> None:
+        """Initialize an empty registry."""
+        self._lock = threading.Lock()
+        self._sessions: Dict[str, "requests.Session"] = {}
+        self._pool_sizes: Dict[str, int] = {}
+
+    def get_session(
+        self,
+        bt_panel_host: str,
+        pool_size: Optional[int] = None
+    ) -> "requests.Session":
+        """Get the shared session for a panel host.
+
+        Args:
+            bt_panel_host: Panel URL
+            pool_size: Maximum number of pooled keep-alive connections
+
+        Returns:
+            The session shared by all clients of this host
+        """
+        # requests is imported on first use to keep importing pybt cheap
+        import requests
+        from requests.adapters import HTTPAdapter
+
+        key = normalize_host(bt_panel_host)
+        pool_size = pool_size or DEFAULT_POOL_SIZE
+        with self._lock:
+            session = self._sessions.get(key)
+            if session is None:
+                session = requests.Session()
+                self._sessions[key] = session
+                self._pool_sizes[key] = 0
+            if pool_size > self._pool_sizes[key]:
+                replaced = session.adapters.get("https://") if self._pool_sizes[key] else None
+                adapter = HTTPAdapter(pool_connections=1, pool_maxsize=pool_size)
+                session.mount("http://", adapter)
+                session.mount("https://", adapter)
+                self._pool_sizes[key] = pool_size
+                if replaced is not None:
+                    replaced.close()
+            return session
+
+    def pool_size(self, bt_panel_host: str) -> int:
+        """Get the current pool size for a panel host.
+
+        Args:
+            bt_panel_host: Panel URL
+
+        Returns:
+            Pool size, or 0 if no session exists yet
+        """
+        return self._pool_sizes.get(normalize_host(bt_panel_host), 0)
+
+    def close(self, bt_panel_host: Optional[str] = None) -> None:
+        """Close and forget shared sessions.
+
+        Args:
+            bt_panel_host: Host to close, or None to close every session
+        """
+        with self._lock:
+            if bt_panel_host is None:
+                keys = list(self._sessions)
+            else:
+                keys = [normalize_host(bt_panel_host)]
+            for key in keys:
+                session = self._sessions.pop(key, None)
+                self._pool_sizes.pop(key, None)
+                if session is not None:
+                    session.close()
+
+
+# Default registry instance
+registry = TransportRegistry()
@@ -0,0 +1,291 @@
+"""Columnar export of listings and samples for BaoTa Panel SDK.
+
+This module turns rows, whether dictionaries from the panel or records from
+``pybt.api.records``, into one array per column. Integer columns are stored
+as 64-bit integers and numeric columns with floats or missing values as
+doubles (missing values become NaN); anything else is kept as Python
+objects. Columns are NumPy arrays when NumPy is installed and ``array``
+module arrays (or lists, for object columns) otherwise.
+
+Example:
+    >>> backups = to_columns(panel.backup.iter_backups(site_id), ["pid", "size"])
+    >>> backups.sum_by("pid", "size")
+    {7: 1073741824}
+"""
+
+import math
+from array import array
+from typing import Any, Dict, Iterable, Iterator, List, Mapping, Optional, Sequence, Union
+
+_INT64_MIN = -(1 << 63)
+_INT64_MAX = (1 << 63) - 1
+
+
+def import_numpy(use: Optional[bool] = None):
+    """Import NumPy for an optional ``numpy`` argument.
+
+    Args:
+        use: True requires NumPy, None uses it when installed and False
+            never does
+
+    Returns:
+        The ``numpy`` module, or None when it is not used
+
+    Raises:
+        ImportError: If ``use`` is True and NumPy is not installed
+    """
+    if use is False:
+        return None
+    try:
+        import numpy
+    except ImportError:
+        if use:
+            raise ImportError("NumPy is not installed, install it with 'pip install bt-python-sdk[numpy]'") from None
+        return None
+    return numpy
+
+
+def _row_items(row: Any) -> Mapping[str, Any]:
+    """Get the columns of a row dictionary or record."""
+    if isinstance(row, Mapping):
+        return row
+    to_dict = getattr(row, "to_dict", None)
+    if to_dict is None:
+        raise TypeError(f"Cannot export {type(row).__name__} rows as columns")
+    return to_dict()
+
+
+class _Column:
+    """A growing column that widens its storage as values require."""
+
+    __slots__ = ("kind", "values")
+
+    def __init__(self, missing: int = 0) -> None:
+        self.kind = "int"
+        self.values: Union[array, List[Any]] = array("q")
+        for _ in range(missing):
+            self.append(None)
+
+    def append(self, value: Any) -> None:
+        if self.kind == "int":
+            if (type(value) is int or type(value) is bool) and _INT64_MIN <= value <= _INT64_MAX:
+                self.values.append(value)
+                return
+            self._widen("float" if value is None or type(value) is float else "object")
+        if self.kind == "float":
+            if value is None:
+                value = math.nan
+            elif type(value) is not float and type(value) is not int and type(value) is not bool:
+                self._widen("object")
+        self.values.append(value)
+
+    def _widen(self, kind: str) -> None:
+        if kind == "float":
+            self.values = array("d", self.values)
+        else:
+            self.values = [None if type(v) is float and math.isnan(v) else v for v in self.values]
+        self.kind = kind
+
+
+class Columns(Mapping[str, Any]):
+    """Column arrays of a listing, keyed by column name.
+
+    Attributes:
+        length: Number of rows
+        numpy: Whether the columns are NumPy arrays
+    """
+
+    def __init__(self, columns: Dict[str, Any], length: int, numpy: bool) -> None:
+        """Initialize the columns.
+
+        Args:
+            columns: Column arrays by name, all of ``length`` items
+            length: Number of rows
+            numpy: Whether the columns are NumPy arrays
+        """
+        self._columns = columns
+        self.length = length
+        self.numpy = numpy
+
+    def __getitem__(self, name: str) -> Any:
+        return self._columns[name]
+
+    def __iter__(self) -> Iterator[str]:
+        return iter(self._columns)
+
+    def __len__(self) -> int:
+        return len(self._columns)
+
+    def __repr__(self) -> str:
+        return f"Columns({list(self._columns)}, length={self.length})"
+
+    def sum_by(self, key: str, value: str) -> Dict[Any, Union[int, float]]:
+        """Total one column per distinct value of another.
+
+        Missing values are skipped.
+
+        Args:
+            key: Column to group by, e.g. ``pid``
+            value: Numeric column to total, e.g. ``size``
+
+        Returns:
+            Dict mapping each key to its total
+        """
+        keys, values = self._columns[key], self._columns[value]
+        integral = _is_integral(values)
+        np = import_numpy(self.numpy)
+        if np is not None and values.dtype != object:
+            present = ~np.isnan(values) if values.dtype.kind == "f" else slice(None)
+            uniques, inverse = np.unique(keys[present], return_inverse=True)
+            totals = np.bincount(inverse, weights=values[present], minlength=len(uniques))
+            return {
+                k.item() if hasattr(k, "item") else k: int(t) if integral else float(t)
+                for k, t in zip(uniques, totals)
+            }
+        result: Dict[Any, Union[int, float]] = {}
+        for k, v in zip(keys, values):
+            if v is None or (type(v) is float and math.isnan(v)):
+                continue
+            result[k] = result.get(k, 0) + v
+        return result
+
+    def percentile(self, name: str, q: Union[float, Sequence[float]]) -> Union[float, List[float]]:
+        """Percentiles of a numeric column with linear interpolation.
+
+        Missing values are ignored.
+
+        Args:
+            name: Numeric column, e.g. ``size_usage``
+            q: Percentile or sequence of percentiles between 0 and 100
+
+        Returns:
+            The percentile value, or a list matching ``q``; NaN if the
+            column has no values
+        """
+        values = self._columns[name]
+        single = isinstance(q, (int, float))
+        np = import_numpy(self.numpy)
+        if np is not None and values.dtype != object:
+            data = values[~np.isnan(values)] if values.dtype.kind == "f" else values
+            if len(data):
+                result = np.percentile(data, q)
+                return float(result) if single else [float(x) for x in result]
+            return math.nan if single else [math.nan] * len(q)
+        data = sorted(v for v in values if v is not None and not (type(v) is float and math.isnan(v)))
+        if single:
+            return _interpolate(data, q)
+        return [_interpolate(data, p) for p in q]
+
+
+def _is_integral(values: Any) -> bool:
+    """Whether a column holds integers."""
+    if isinstance(values, array):
+        return values.typecode == "q"
+    dtype = getattr(values, "dtype", None)
+    return dtype is not None and dtype.kind in "iub"
+
+
+def _interpolate(data: List[float], q: float) -> float:
+    """Percentile of sorted data, interpolating like ``numpy.percentile``."""
+    if not data:
+        return math.nan
+    rank = (len(data) - 1) * q / 100
+    low = math.floor(rank)
+    high = min(low + 1, len(data) - 1)
+    return float(data[low] + (data[high] - data[low]) * (rank - low))
+
+
+class ColumnBuilder:
+    """Accumulates rows into typed columns without keeping the rows.
+
+    Example:
+        >>> builder = ColumnBuilder(["id", "name"])
+        >>> for page in pages:
+        ...     builder.extend(page["data"])
+        >>> columns = builder.build()
+    """
+
+    def __init__(self, fields: Optional[Sequence[str]] = None) -> None:
+        """Initialize the builder.
+
+        Args:
+            fields: Columns to keep; by default every key seen in the rows,
+                in order of first appearance
+        """
+        self.fields = list(fields) if fields is not None else None
+        self.length = 0
+        self._columns: Dict[str, _Column] = {
+            name: _Column() for name in self.fields or ()
+        }
+
+    def append(self, row: Any) -> None:
+        """Add one row, a dictionary or record.
+
+        Args:
+            row: Row to add; missing columns are recorded as missing values
+        """
+        items = _row_items(row)
+        columns = self._columns
+        if self.fields is None:
+            for name in items:
+                if name not in columns:
+                    columns[name] = _Column(self.length)
+        for name, column in columns.items():
+            column.append(items.get(name))
+        self.length += 1
+
+    def extend(self, rows: Iterable[Any]) -> None:
+        """Add rows, e.g. one page of a listing or a whole ``iter_*`` iterator."""
+        for row in rows:
+            self.append(row)
+
+    def build(self, numpy: Optional[bool] = None) -> Columns:
+        """Build the column arrays.
+
+        Args:
+            numpy: Return NumPy arrays; by default they are used when NumPy
+                is installed
+
+        Returns:
+            Columns of every row added so far
+
+        Raises:
+            ImportError: If ``numpy=True`` and NumPy is not installed
+        """
+        np = import_numpy(numpy)
+        result = {}
+        for name, column in self._columns.items():
+            values = column.values
+            if np is None:
+                result[name] = values
+            elif column.kind == "object":
+                array_ = np.empty(len(values), dtype=object)
+                array_[:] = values
+                result[name] = array_
+            else:
+                dtype = np.int64 if column.kind == "int" else np.float64
+                result[name] = np.frombuffer(values, dtype=dtype).copy()
+        return Columns(result, self.length, np is not None)
+
+
+def to_columns(
+    rows: Iterable[Any],
+    fields: Optional[Sequence[str]] = None,
+    numpy: Optional[bool] = None
+) -> Columns:
+    """Convert rows to column arrays.
+
+    Rows are consumed one at a time, so an ``iter_*`` listing is exported
+    without holding its pages in memory.
+
+    Args:
+        rows: Row dictionaries or records
+        fields: Columns to keep; by default every key seen in the rows
+        numpy: Return NumPy arrays; by default they are used when installed
+
+    Returns:
+        Columns of the rows
+    """
+    builder = ColumnBuilder(fields)
+    builder.extend(rows)
+    return builder.build(numpy)
@@ -1,4 +1,4 @@
-from typing import Optional
+from typing import Dict, Optional, Type
 
 class ClientException(Exception):
     """Base exception for all API client errors."""
@@ -46,3 +46,28 @@ class IPBlocked(ClientException):
 class InvalidAPIKey(ClientException):
     """Raised when the API key is invalid."""
     message = 'Invalid API key'
+
+
+# ConnectionRefused subclasses by the transport error class they also extend
+_refused_types: Dict[type, type] = {}
+
+
+def connection_refused(message: str, error_type: Type[Exception]) -> ConnectionRefused:
+    """Create a ConnectionRefused that is also an instance of a transport error.
+
+    Handlers written for the HTTP library's own exceptions, such as
+    ``except requests.RequestException``, keep catching the error.
+
+    Args:
+        message: Error message
+        error_type: Exception class of the transport error; it must accept
+            a message as its only argument
+
+    Returns:
+        Exception to raise
+    """
+    refused_type = _refused_types.get(error_type)
+    if refused_type is None:
+        refused_type = type("ConnectionRefused", (ConnectionRefused, error_type), {"__module__": __name__})
+        refused_type = _refused_types.setdefault(error_type, refused_type)
+    return refused_type(message)
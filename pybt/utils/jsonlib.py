@@ -0,0 +1,163 @@
+"""JSON backend module for BaoTa Panel SDK.
+
+This module lets the SDK decode responses and encode cached or mirrored data
+with an accelerated JSON library when one is installed. The standard library
+``json`` is used unless another backend is selected with :func:`set_backend`
+or the ``BT_JSON_BACKEND`` environment variable (``json``, ``orjson``,
+``msgspec`` or ``auto`` for the fastest installed one).
+"""
+
+import json
+import os
+import threading
+from typing import Any, Callable, NamedTuple, Optional, Union
+
+BACKENDS = ("orjson", "msgspec", "json")
+
+Buffer = Union[bytes, bytearray, memoryview, str]
+
+
+class Backend(NamedTuple):
+    """A JSON implementation.
+
+    Attributes:
+        name: Backend name
+        loads: Decode JSON from bytes or str
+        dumps: Encode an object to UTF-8 bytes, optionally with sorted keys
+    """
+    name: str
+    loads: Callable[[Buffer], Any]
+    dumps: Callable[[Any, bool], bytes]
+
+
+def _json_backend() -> Backend:
+    def dumps(obj: Any, sort_keys: bool = False) -> bytes:
+        return json.dumps(
+            obj, sort_keys=sort_keys, ensure_ascii=False, separators=(",", ":"), default=str
+        ).encode("utf-8")
+
+    return Backend("json", json.loads, dumps)
+
+
+def _orjson_backend() -> Backend:
+    import orjson
+
+    def dumps(obj: Any, sort_keys: bool = False) -> bytes:
+        option = orjson.OPT_NON_STR_KEYS | (orjson.OPT_SORT_KEYS if sort_keys else 0)
+        return orjson.dumps(obj, default=str, option=option)
+
+    return Backend("orjson", orjson.loads, dumps)
+
+
+def _msgspec_backend() -> Backend:
+    import msgspec
+
+    decoder = msgspec.json.Decoder()
+    encoder = msgspec.json.Encoder(enc_hook=str)
+    sorted_encoder = msgspec.json.Encoder(enc_hook=str, order="sorted")
+
+    def loads(data: Buffer) -> Any:
+        try:
+            return decoder.decode(data)
+        except msgspec.DecodeError as e:
+            raise ValueError(str(e)) from e
+
+    def dumps(obj: Any, sort_keys: bool = False) -> bytes:
+        return (sorted_encoder if sort_keys else encoder).encode(obj)
+
+    return Backend("msgspec", loads, dumps)
+
+
+_FACTORIES = {"orjson": _orjson_backend, "msgspec": _msgspec_backend, "json": _json_backend}
+
+_backend: Optional[Backend] = None
+_lock = threading.Lock()
+
+
+def set_backend(name: str = "auto") -> str:
+    """Select the JSON backend.
+
+    Args:
+        name: ``json``, ``orjson``, ``msgspec``, or ``auto`` for the first
+            installed of ``BACKENDS``
+
+    Returns:
+        Name of the selected backend
+
+    Raises:
+        ValueError: If the name is unknown
+        ImportError: If the named library is not installed
+    """
+    global _backend
+    name = (name or "json").lower()
+    if name == "auto":
+        for candidate in BACKENDS:
+            try:
+                backend = _FACTORIES[candidate]()
+                break
+            except ImportError:
+                continue
+    elif name in _FACTORIES:
+        backend = _FACTORIES[name]()
+    else:
+        raise ValueError(f"Unknown JSON backend: {name} (expected one of {', '.join(BACKENDS)} or auto)")
+    with _lock:
+        _backend = backend
+    return backend.name
+
+
+def get_backend() -> Backend:
+    """Get the selected backend, resolving ``BT_JSON_BACKEND`` on first use."""
+    backend = _backend
+    if backend is None:
+        set_backend(os.getenv("BT_JSON_BACKEND", "json"))
+        backend = _backend
+    return backend
+
+
+def loads(data: Buffer) -> Any:
+    """Decode JSON, preferably straight from response bytes.
+
+    Args:
+        data: UTF-8 encoded JSON bytes or a str
+
+    Returns:
+        Decoded object
+
+    Raises:
+        ValueError: If the data is not valid JSON
+    """
+    return get_backend().loads(data)
+
+
+def dumps(obj: Any, sort_keys: bool = False) -> bytes:
+    """Encode an object as compact UTF-8 JSON.
+
+    Values the backend cannot encode are converted with ``str``.
+
+    Args:
+        obj: Object to encode
+        sort_keys: Whether to sort object keys
+
+    Returns:
+        Encoded bytes
+    """
+    return get_backend().dumps(obj, sort_keys)
+
+
+def content_hash(obj: Any) -> str:
+    """Get a stable SHA-1 hash of a JSON-compatible object.
+
+    Keys are sorted and the standard library encoder is always used, so
+    hashes stored by the mirror or compared by change detection survive a
+    change of backend.
+
+    Args:
+        obj: Object to hash; values JSON cannot encode are converted with ``str``
+
+    Returns:
+        Hex digest
+    """
+    import hashlib
+    encoded = json.dumps(obj, sort_keys=True, ensure_ascii=False, default=str)
+    return hashlib.sha1(encoded.encode("utf-8")).hexdigest()
@@ -0,0 +1,301 @@
+"""Streaming JSON decoding for BaoTa Panel SDK.
+
+This module decodes one member of a large top-level JSON object as the
+response body arrives, instead of buffering and decoding the whole body:
+array items of ``getData`` pages are decoded one at a time and string
+members such as the ``data`` of ``GetFileBody`` are yielded in chunks.
+Memory use is bounded by the network chunk size plus the largest item.
+"""
+
+import codecs
+import json
+import re
+from typing import Any, Callable, Dict, Iterable, Iterator, Optional
+
+_WHITESPACE = frozenset(" \t\r\n")
+
+# Longest run of complete characters and escapes inside a JSON string
+_STRING_BODY_RE = re.compile(r'(?:[^"\\]+|\\(?:["\\/bfnrt]|u[0-9a-fA-F]{4}))*')
+_HIGH_SURROGATE_RE = re.compile(r"\\u[dD][89abAB][0-9a-fA-F]{2}$")
+
+# Runs skipped while looking for the end of a value: string contents up to
+# the closing quote and text between strings and brackets; and the character
+# ending a bare scalar
+_STRING_RUN_RE = re.compile(r'(?:[^"\\]+|\\.)*', re.DOTALL)
+_CONTAINER_RUN_RE = re.compile(r'[^"\[\]{}]*')
+_SCALAR_END_RE = re.compile(r"[\s,\]}]")
+
+
+class JSONStream:
+    """Incremental decoder for one member of a JSON response.
+
+    Members of the top-level object other than ``key`` are decoded into
+    ``meta`` as they are passed, e.g. ``status`` and ``msg``; members after
+    ``key`` are available once iteration has finished.
+
+    Example:
+        >>> stream = JSONStream(response.iter_content(65536), key="data")
+        >>> for site in stream.items():
+        ...     print(site["name"])
+    """
+
+    def __init__(
+        self,
+        chunks: Iterable[bytes],
+        key: Optional[str] = "data",
+        chunk_size: int = 65536,
+        close: Optional[Callable[[], None]] = None
+    ) -> None:
+        """Initialize the stream.
+
+        Args:
+            chunks: Response body as an iterable of byte chunks
+            key: Member of the top-level object to stream, or None when the
+                top-level value itself is the array to stream
+            chunk_size: Minimum number of characters in the pieces yielded
+                by ``text``, except the last
+            close: Called once the stream is exhausted or closed, e.g.
+                ``response.close``
+        """
+        self.key = key
+        self.chunk_size = chunk_size
+        self.meta: Dict[str, Any] = {}
+        self.found = False
+        self._chunks = iter(chunks)
+        self._close = close
+        self._utf8 = codecs.getincrementaldecoder("utf-8")()
+        self._decoder = json.JSONDecoder(strict=False)
+        self._buf = ""
+        self._pos = 0
+        self._eof = False
+        self._started = False
+
+    def close(self) -> None:
+        """Release the underlying response."""
+        if self._close is not None:
+            close, self._close = self._close, None
+            close()
+
+    def __enter__(self) -> "JSONStream":
+        return self
+
+    def __exit__(self, *exc_info: Any) -> None:
+        self.close()
+
+    def _fill(self) -> int:
+        """Append the next chunk, dropping consumed text.
+
+        Returns:
+            Number of characters dropped from the front of the buffer, which
+            callers subtract from their indexes, or -1 at end of input
+        """
+        for chunk in self._chunks:
+            text = self._utf8.decode(chunk)
+            if text:
+                shift = self._pos
+                self._buf = self._buf[shift:] + text
+                self._pos = 0
+                return shift
+        if not self._eof:
+            self._eof = True
+            # Raises on a truncated multi-byte sequence
+            self._utf8.decode(b"", final=True)
+        return -1
+
+    def _peek(self) -> Optional[str]:
+        """Skip whitespace and return the next character, or None at end of input."""
+        while True:
+            buf, pos = self._buf, self._pos
+            while pos < len(buf) and buf[pos] in _WHITESPACE:
+                pos += 1
+            self._pos = pos
+            if pos < len(buf):
+                return buf[pos]
+            if self._fill() < 0:
+                return None
+
+    def _expect(self, char: str) -> None:
+        """Consume one structural character."""
+        found = self._peek()
+        if found != char:
+            raise ValueError(f"Expected {char!r} in JSON stream, got {found!r}")
+        self._pos += 1
+
+    def _read_value(self) -> Any:
+        """Decode the next complete JSON value."""
+        if self._peek() is None:
+            raise ValueError("Unexpected end of JSON stream")
+        self._buffer_value()
+        value, self._pos = self._decoder.raw_decode(self._buf, self._pos)
+        return value
+
+    def _buffer_value(self) -> None:
+        """Read chunks until the value at the current position is in the buffer.
+
+        The end of the value is found by tracking string and bracket depth,
+        resuming where the previous chunk left off, so a value spanning many
+        chunks is scanned once and decoded once. Malformed values are left
+        for the decoder to reject.
+        """
+        scan = self._pos
+        if self._buf[scan] not in '"[{':
+            # A number at the end of the buffer may continue in the next chunk
+            while not _SCALAR_END_RE.search(self._buf, scan):
+                scan = len(self._buf)
+                shift = self._fill()
+                if shift < 0:
+                    return
+                scan -= shift
+            return
+        depth = 0
+        in_string = False
+        while True:
+            buf = self._buf
+            while scan < len(buf):
+                if in_string:
+                    scan = _STRING_RUN_RE.match(buf, scan).end()
+                    # Otherwise an escape is split across chunks
+                    if scan == len(buf) or buf[scan] != '"':
+                        break
+                    in_string = False
+                    scan += 1
+                    if not depth:
+                        return
+                    continue
+                scan = _CONTAINER_RUN_RE.match(buf, scan).end()
+                if scan == len(buf):
+                    break
+                char = buf[scan]
+                scan += 1
+                if char == '"':
+                    in_string = True
+                elif char in "[{":
+                    depth += 1
+                else:
+                    depth -= 1
+                    if not depth:
+                        return
+            shift = self._fill()
+            if shift < 0:
+                return
+            scan -= shift
+
+    def _read_member_key(self) -> Optional[str]:
+        """Consume the next member key of the top-level object, or None at its end."""
+        while True:
+            char = self._peek()
+            if char == ",":
+                self._pos += 1
+                continue
+            if char == "}":
+                self._pos += 1
+                return None
+            if char != '"':
+                raise ValueError("Expected a member name in JSON stream")
+            key = self._read_value()
+            self._expect(":")
+            return key
+
+    def _locate(self) -> bool:
+        """Position the stream at the value of ``key``."""
+        if self._started:
+            raise RuntimeError("JSONStream can only be iterated once")
+        self._started = True
+        if self.key is None:
+            self.found = True
+            return True
+        self._expect("{")
+        while True:
+            key = self._read_member_key()
+            if key is None:
+                return False
+            if key == self.key:
+                self.found = True
+                return True
+            self.meta[key] = self._read_value()
+
+    def _read_rest(self) -> None:
+        """Decode the members following ``key`` into ``meta``."""
+        if self.key is None:
+            return
+        while True:
+            key = self._read_member_key()
+            if key is None:
+                return
+            self.meta[key] = self._read_value()
+
+    def items(self) -> Iterator[Any]:
+        """Iterate over the items of the streamed array.
+
+        Yields:
+            Each decoded array item
+
+        Raises:
+            ValueError: If the body is malformed or the member is not an array
+        """
+        try:
+            if not self._locate():
+                return
+            if self._peek() != "[":
+                raise ValueError(f"JSON member {self.key!r} is not an array")
+            self._pos += 1
+            while True:
+                char = self._peek()
+                if char == "]":
+                    self._pos += 1
+                    break
+                if char == ",":
+                    self._pos += 1
+                    continue
+                yield self._read_value()
+            self._read_rest()
+        finally:
+            self.close()
+
+    def text(self) -> Iterator[str]:
+        """Iterate over the streamed string in chunks.
+
+        Yields:
+            Decoded pieces of the string
+
+        Raises:
+            ValueError: If the body is malformed or the member is not a string
+        """
+        try:
+            if not self._locate():
+                return
+            if self._peek() != '"':
+                if self._read_value() is not None:
+                    raise ValueError(f"JSON member {self.key!r} is not a string")
+                self._read_rest()
+                return
+            self._pos += 1
+            scan = self._pos
+            while True:
+                scan = _STRING_BODY_RE.match(self._buf, scan).end()
+                if scan < len(self._buf) and self._buf[scan] == '"':
+                    if scan > self._pos:
+                        yield self._decode_piece(scan)
+                    self._pos = scan + 1
+                    break
+                if len(self._buf) - scan >= 6:
+                    raise ValueError("Invalid escape in JSON string")
+                # Keep a surrogate pair together so it decodes to one character
+                end = scan
+                if _HIGH_SURROGATE_RE.search(self._buf, max(self._pos, end - 6), end):
+                    end -= 6
+                if end - self._pos >= self.chunk_size:
+                    yield self._decode_piece(end)
+                shift = self._fill()
+                if shift < 0:
+                    raise ValueError("Unterminated string in JSON stream")
+                scan -= shift
+            self._read_rest()
+        finally:
+            self.close()
+
+    def _decode_piece(self, end: int) -> str:
+        """Decode the raw string contents up to end and consume them."""
+        piece = self._decoder.decode('"' + self._buf[self._pos:end] + '"')
+        self._pos = end
+        return piece
@@ -1,6 +1,15 @@
 import logging
 import sys
-from typing import Optional
+import threading
+from typing import Any, Dict, Optional
+
+# Request fields whose values must never be written to logs
+SECRET_KEYS = frozenset({
+    "request_token", "api_key", "password", "ftp_password", "datapassword",
+})
+
+# String values longer than this are replaced by their length
+MAX_VALUE_LENGTH = 256
 
 def setup_logger(
     name: str = "pybt",
@@ -38,5 +47,101 @@ def setup_logger(
     
     return logger
 
-# Create default logger instance
-logger = setup_logger() 
\ No newline at end of file
+# Default logger instance. Handlers are attached by configure_logger() when
+# the first client is created, so importing pybt has no side effects.
+logger = logging.getLogger("pybt")
+logger.addHandler(logging.NullHandler())
+_configured = False
+
+
+def configure_logger(debug: bool = False) -> logging.Logger:
+    """Attach the default handlers to the pybt logger once.
+    
+    The logger level honours ``Config.debug``: it is INFO unless a client
+    is created with debug enabled.
+    
+    Args:
+        debug: Whether the client being created has debug enabled
+    
+    Returns:
+        logging.Logger: The default logger instance
+    """
+    global _configured
+    level = logging.DEBUG if debug else logging.INFO
+    if not _configured:
+        _configured = True
+        setup_logger(level=level)
+    elif debug and logger.level > logging.DEBUG:
+        logger.setLevel(logging.DEBUG)
+    return logger
+
+
+def redact(data: Any) -> Any:
+    """Return a copy of request data that is safe to log.
+    
+    Secret values such as ``request_token`` and passwords are masked and
+    long strings (e.g. ``SaveFileBody`` payloads) are replaced by their size.
+    
+    Args:
+        data: Request data
+        
+    Returns:
+        Redacted copy of the data
+    """
+    if isinstance(data, dict):
+        return {
+            key: "***" if str(key).lower() in SECRET_KEYS else redact(value)
+            for key, value in data.items()
+        }
+    if isinstance(data, (list, tuple)):
+        return [redact(value) for value in data]
+    if isinstance(data, str) and len(data) > MAX_VALUE_LENGTH:
+        return f"<{len(data)} chars>"
+    return data
+
+
+class LazyRedacted:
+    """Defer redaction until a log record is actually formatted."""
+    
+    __slots__ = ("data",)
+    
+    def __init__(self, data: Any) -> None:
+        self.data = data
+    
+    def __str__(self) -> str:
+        return str(redact(self.data))
+
+
+class LogSampler:
+    """Deterministic per-key log sampler for high-volume calls.
+    
+    With a rate of 0.1 one out of every ten calls per key is logged.
+    """
+    
+    def __init__(self, rate: float = 1.0) -> None:
+        """Initialize the sampler.
+        
+        Args:
+            rate: Fraction of calls to log, between 0 and 1
+        """
+        self.rate = rate
+        self._lock = threading.Lock()
+        self._counters: Dict[Any, int] = {}
+    
+    def sample(self, key: Any) -> bool:
+        """Check whether this call should be logged.
+        
+        Args:
+            key: Sampling key, e.g. the endpoint name
+            
+        Returns:
+            True for the calls selected by the sampling rate
+        """
+        if self.rate >= 1:
+            return True
+        if self.rate <= 0:
+            return False
+        with self._lock:
+            n = self._counters.get(key, 0)
+            self._counters[key] = n + 1
+        return n % max(1, round(1 / self.rate)) == 0
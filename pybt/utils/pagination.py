@@ -0,0 +1,204 @@
+"""Pagination helpers for BaoTa Panel SDK.
+
+The panel's ``getData`` table endpoints return one page of rows under
+``data`` and the pager as an HTML snippet under ``page``, e.g.
+``<span class='Pcount'>Total: 42</span>`` or ``<span class='Pcount'>共42条</span>``.
+"""
+
+import re
+from itertools import islice
+from typing import Any, AsyncIterator, Awaitable, Callable, Dict, Iterable, Iterator, List, Optional
+
+from .exceptions import ClientException
+
+# Row count inside the Pcount span, in English or Chinese panels
+_PCOUNT_RE = re.compile(r"class=['\"]Pcount['\"][^>]*>[^<\d]*(\d+)")
+
+
+def parse_total(page_html: Optional[str]) -> Optional[int]:
+    """Parse the total row count from a pager HTML snippet.
+
+    Args:
+        page_html: Value of the ``page`` field of a table response
+
+    Returns:
+        Total number of rows, or None if the pager has no count
+    """
+    if not isinstance(page_html, str):
+        return None
+    match = _PCOUNT_RE.search(page_html)
+    return int(match.group(1)) if match else None
+
+
+def page_count(total: int, limit: int) -> int:
+    """Get the number of pages needed for a row count.
+
+    Args:
+        total: Total number of rows
+        limit: Rows per page
+
+    Returns:
+        Number of pages
+    """
+    return -(-total // limit) if limit > 0 else 0
+
+
+def page_rows(response: Any) -> List[Dict[str, Any]]:
+    """Get the rows of a table response.
+
+    Raises:
+        ClientException: If the response is a panel error or has no rows
+            list, so a failed page never looks like the end of the table
+    """
+    if isinstance(response, dict) and response.get("status") is not False:
+        rows = response.get("data")
+        if isinstance(rows, list):
+            return rows
+    message = response.get("msg") if isinstance(response, dict) else None
+    raise ClientException(f"Table page request failed: {message or repr(response)[:200]}")
+
+
+def paginate(
+    fetch: Callable[[int], Dict[str, Any]],
+    limit: int,
+    start: int = 1,
+    window: int = 1
+) -> Iterator[Dict[str, Any]]:
+    """Lazily iterate over the rows of a paged table endpoint.
+
+    With ``window=1`` pages are fetched one at a time as the consumer
+    advances, so only the current page is held in memory. With a larger
+    window the first page is fetched to learn the total, then up to
+    ``window`` further pages are fetched concurrently; rows are still yielded
+    in page order. Closing the iterator stops fetching in both modes.
+
+    Iteration ends on the last page given by the pager total or, when the
+    panel sends no total, on the first short page. Without a total the pages
+    cannot be planned ahead, so they are always fetched one at a time.
+
+    Args:
+        fetch: Function returning the response for a page number
+        limit: Rows per page requested by ``fetch``
+        start: First page number
+        window: Maximum number of pages fetched concurrently
+
+    Yields:
+        Row dictionaries in panel order
+
+    Raises:
+        ClientException: If a page request returns a panel error
+    """
+    page = start
+    while True:
+        response = fetch(page)
+        rows = page_rows(response)
+        total = parse_total(response.get("page"))
+        del response
+        yield from rows
+        if not rows:
+            return
+        if total is not None:
+            last = page_count(total, limit)
+            if page >= last:
+                return
+            if window > 1:
+                yield from _prefetch(fetch, range(page + 1, last + 1), window)
+                return
+        elif len(rows) < limit:
+            return
+        page += 1
+
+
+def _prefetch(
+    fetch: Callable[[int], Dict[str, Any]],
+    pages: Iterable[int],
+    window: int
+) -> Iterator[Dict[str, Any]]:
+    """Fetch pages through a sliding window and yield their rows in order."""
+    from collections import deque
+    from concurrent.futures import ThreadPoolExecutor
+
+    pages = iter(pages)
+    with ThreadPoolExecutor(max_workers=window) as executor:
+        pending = deque(executor.submit(fetch, page) for page in islice(pages, window))
+        try:
+            while pending:
+                rows = page_rows(pending.popleft().result())
+                # Keep the window full while the consumer works on this page
+                for page in islice(pages, 1):
+                    pending.append(executor.submit(fetch, page))
+                yield from rows
+        finally:
+            # Do not fetch pages the consumer is no longer waiting for
+            for future in pending:
+                future.cancel()
+
+
+async def apaginate(
+    fetch: Callable[[int], Awaitable[Dict[str, Any]]],
+    limit: int,
+    start: int = 1,
+    window: int = 1
+) -> AsyncIterator[Dict[str, Any]]:
+    """Lazily iterate over the rows of a paged table endpoint on an event loop.
+
+    The asyncio counterpart of :func:`paginate`, for ``fetch`` functions
+    returning awaitables: with ``window > 1`` up to ``window`` pages are
+    requested concurrently once the first page gives the total.
+
+    Args:
+        fetch: Function returning an awaitable response for a page number
+        limit: Rows per page requested by ``fetch``
+        start: First page number
+        window: Maximum number of pages fetched concurrently
+
+    Yields:
+        Row dictionaries in panel order
+
+    Raises:
+        ClientException: If a page request returns a panel error
+    """
+    page = start
+    while True:
+        response = await fetch(page)
+        rows = page_rows(response)
+        total = parse_total(response.get("page"))
+        del response
+        for row in rows:
+            yield row
+        if not rows:
+            return
+        if total is not None:
+            last = page_count(total, limit)
+            if page >= last:
+                return
+            if window > 1:
+                async for row in _aprefetch(fetch, range(page + 1, last + 1), window):
+                    yield row
+                return
+        elif len(rows) < limit:
+            return
+        page += 1
+
+
+async def _aprefetch(
+    fetch: Callable[[int], Awaitable[Dict[str, Any]]],
+    pages: Iterable[int],
+    window: int
+) -> AsyncIterator[Dict[str, Any]]:
+    """Fetch pages as tasks through a sliding window and yield their rows in order."""
+    import asyncio
+    from collections import deque
+
+    pages = iter(pages)
+    pending = deque(asyncio.ensure_future(fetch(page)) for page in islice(pages, window))
+    try:
+        while pending:
+            rows = page_rows(await pending.popleft())
+            for page in islice(pages, 1):
+                pending.append(asyncio.ensure_future(fetch(page)))
+            for row in rows:
+                yield row
+    finally:
+        for task in pending:
+            task.cancel()
@@ -0,0 +1,325 @@
+"""Counter rate module for BaoTa Panel SDK.
+
+``get_network`` reports cumulative ``upTotal``, ``downTotal``,
+``upPackets`` and ``downPackets`` counters. This module turns them into
+per-second rates: a counter that goes down is taken to have restarted from
+zero (a network or panel restart), intervals may be irregular, and rates
+can be smoothed with a time-aware EWMA. ``RateEngine`` keeps the state of
+many panels in flat arrays and updates all of them in one vectorized step
+per tick when NumPy is installed.
+"""
+
+import math
+from array import array
+from operator import attrgetter
+from typing import Any, Dict, List, Mapping, NamedTuple, Optional, Sequence, Tuple
+
+from .columns import Columns, import_numpy
+
+# Cumulative counters, as NetworkSample attributes and as get_network keys
+COUNTER_FIELDS = ("up_total", "down_total", "up_packets", "down_packets")
+COUNTER_KEYS = ("upTotal", "downTotal", "upPackets", "downPackets")
+
+# Rate of each counter, per second
+RATE_FIELDS = ("up_bytes", "down_bytes", "up_packets", "down_packets")
+
+_NAN = float("nan")
+_WIDTH = len(COUNTER_FIELDS)
+
+
+class Rates(NamedTuple):
+    """Per-second rates of one panel's counters.
+
+    Attributes:
+        up_bytes: Bytes sent per second
+        down_bytes: Bytes received per second
+        up_packets: Packets sent per second
+        down_packets: Packets received per second
+        reset: Whether a counter went down since the previous sample
+    """
+    up_bytes: float
+    down_bytes: float
+    up_packets: float
+    down_packets: float
+    reset: bool = False
+
+
+def _decay(half_life: Optional[float]) -> Optional[float]:
+    """Get the EWMA time constant of a half-life, None for no smoothing."""
+    if half_life is None or half_life <= 0:
+        return None
+    return half_life / math.log(2)
+
+
+def _number(value: Any) -> float:
+    if value is None:
+        return _NAN
+    try:
+        return float(value)
+    except (TypeError, ValueError):
+        return _NAN
+
+
+_get_record = attrgetter("timestamp", *COUNTER_FIELDS)
+
+
+def _read_sample(sample: Any) -> Tuple[Any, ...]:
+    """Get the timestamp and counters of a NetworkSample or a dict.
+
+    Record values are already numbers or None; dict values, which may come
+    straight from a response, are converted.
+    """
+    if isinstance(sample, dict):
+        return (sample.get("timestamp"),) + tuple(
+            _number(sample[field] if field in sample else sample.get(key))
+            for field, key in zip(COUNTER_FIELDS, COUNTER_KEYS)
+        )
+    return _get_record(sample)
+
+
+def counter_rate(previous: float, current: float, dt: float) -> Tuple[float, bool]:
+    """Get the per-second rate between two readings of a counter.
+
+    Args:
+        previous: Earlier reading
+        current: Later reading
+        dt: Seconds between the readings
+
+    Returns:
+        Tuple of the rate (NaN if unknown) and whether the counter was reset
+    """
+    if not dt > 0 or math.isnan(previous) or math.isnan(current):
+        return _NAN, False
+    if current < previous:
+        return current / dt, True
+    return (current - previous) / dt, False
+
+
+def rate_series(
+    timestamps: Sequence[float],
+    values: Sequence[float],
+    half_life: Optional[float] = None
+) -> array:
+    """Get the rates of one counter over a series of samples.
+
+    The first rate, and rates across missing readings or non-increasing
+    timestamps, are NaN; smoothing carries over them.
+
+    Args:
+        timestamps: Sample times in seconds
+        values: Counter readings
+        half_life: EWMA half-life in seconds, None for raw rates
+
+    Returns:
+        ``array('d')`` of rates, one per sample
+    """
+    tau = _decay(half_life)
+    rates = array("d", [_NAN]) * len(values)
+    smoothed = _NAN
+    for i in range(1, len(values)):
+        dt = timestamps[i] - timestamps[i - 1]
+        rate = counter_rate(values[i - 1], values[i], dt)[0]
+        if tau is not None and not math.isnan(rate) and not math.isnan(smoothed):
+            rate = smoothed + (1 - math.exp(-dt / tau)) * (rate - smoothed)
+        if not math.isnan(rate):
+            smoothed = rate
+        rates[i] = rate if tau is None else smoothed
+    return rates
+
+
+def network_rates(columns: Columns, half_life: Optional[float] = None) -> Columns:
+    """Get network rates from sampled counters, e.g. a sampler read.
+
+    Args:
+        columns: Columns with ``timestamp`` and the ``COUNTER_FIELDS``
+        half_life: EWMA half-life in seconds, None for raw rates
+
+    Returns:
+        Columns of ``timestamp`` and the ``RATE_FIELDS``, as NumPy arrays
+        if the input columns are
+    """
+    timestamps = columns["timestamp"]
+    result = {"timestamp": timestamps}
+    for field, counter in zip(RATE_FIELDS, COUNTER_FIELDS):
+        result[field] = rate_series(timestamps, columns[counter], half_life)
+    if columns.numpy:
+        np = import_numpy(True)
+        result = {name: np.asarray(values, dtype=np.float64) for name, values in result.items()}
+    return Columns(result, columns.length, columns.numpy)
+
+
+class RateEngine:
+    """Smoothed counter rates of many panels, updated a tick at a time.
+
+    State is three flat ``array('d')`` buffers indexed by panel slot: the
+    last sample time, the last counter readings and the smoothed rates.
+    With NumPy, ``update`` runs as a handful of array operations over every
+    panel of the tick; without it, as a Python loop. Samples older than, or
+    as old as, the previous one of a panel are ignored. After a gap longer
+    than ``max_gap`` smoothing starts over from the new rate.
+
+    Example:
+        >>> engine = RateEngine(half_life=30)
+        >>> engine.update({host: sampler.latest() for host, sampler in samplers.items()})
+        {'http://panel-1:8888': Rates(up_bytes=1520.3, ...), ...}
+    """
+
+    def __init__(
+        self,
+        half_life: Optional[float] = 30.0,
+        max_gap: Optional[float] = None,
+        numpy: Optional[bool] = None
+    ) -> None:
+        """Initialize an engine with no panels.
+
+        Args:
+            half_life: EWMA half-life in seconds, None for raw rates
+            max_gap: Seconds without samples after which smoothing restarts
+            numpy: Use NumPy; None uses it when installed
+
+        Raises:
+            ImportError: If ``numpy=True`` and NumPy is not installed
+        """
+        self._np = import_numpy(numpy)
+        self.half_life = half_life
+        self.max_gap = max_gap
+        self._slots: Dict[str, int] = {}
+        self._free: List[int] = []
+        self._time = array("d")
+        self._last = array("d")
+        self._smooth = array("d")
+
+    def __len__(self) -> int:
+        return len(self._slots)
+
+    def __contains__(self, key: str) -> bool:
+        return key in self._slots
+
+    def _slot(self, key: str) -> int:
+        slot = self._slots.get(key)
+        if slot is None:
+            if self._free:
+                slot = self._free.pop()
+                self._time[slot] = _NAN
+                self._last[slot * _WIDTH:(slot + 1) * _WIDTH] = array("d", [_NAN]) * _WIDTH
+                self._smooth[slot * _WIDTH:(slot + 1) * _WIDTH] = array("d", [_NAN]) * _WIDTH
+            else:
+                slot = len(self._time)
+                self._time.append(_NAN)
+                self._last.extend([_NAN] * _WIDTH)
+                self._smooth.extend([_NAN] * _WIDTH)
+            self._slots[key] = slot
+        return slot
+
+    def forget(self, key: str) -> None:
+        """Drop the state of a panel.
+
+        Args:
+            key: Panel key passed to ``update``
+        """
+        slot = self._slots.pop(key, None)
+        if slot is not None:
+            self._free.append(slot)
+
+    def rates(self, key: str) -> Optional[Rates]:
+        """Get the current smoothed rates of a panel.
+
+        Args:
+            key: Panel key passed to ``update``
+
+        Returns:
+            Rates, or None for an unknown panel
+        """
+        slot = self._slots.get(key)
+        if slot is None:
+            return None
+        return Rates(*self._smooth[slot * _WIDTH:(slot + 1) * _WIDTH])
+
+    def update(self, samples: Mapping[str, Any], timestamp: Optional[float] = None) -> Dict[str, Rates]:
+        """Feed one sample per panel and get the new rates.
+
+        Args:
+            samples: NetworkSample records, sampler rows or ``get_network``
+                responses by panel key (e.g. host)
+            timestamp: Sample time for samples without a ``timestamp``
+
+        Returns:
+            Dict of Rates by panel key; rates stay NaN until a panel has
+            two samples
+        """
+        keys = list(samples)
+        slots = [self._slots.get(key) for key in keys]
+        if None in slots:
+            slots = [self._slot(key) if slot is None else slot for key, slot in zip(keys, slots)]
+        rows = [_read_sample(samples[key]) for key in keys]
+        if timestamp is not None:
+            rows = [(timestamp,) + row[1:] if row[0] is None else row for row in rows]
+        if self._np is not None:
+            columns = self._update_numpy(slots, rows)
+        else:
+            columns = self._update_python(slots, rows)
+        return dict(zip(keys, map(Rates._make, zip(*columns))))
+
+    def _update_numpy(self, slots: List[int], rows: List[Tuple[Any, ...]]) -> List[List[Any]]:
+        np = self._np
+        tau = _decay(self.half_life)
+        index = np.asarray(slots, dtype=np.intp)
+        state_time = np.frombuffer(self._time, dtype=np.float64)
+        state_last = np.frombuffer(self._last, dtype=np.float64).reshape(-1, _WIDTH)
+        state_smooth = np.frombuffer(self._smooth, dtype=np.float64).reshape(-1, _WIDTH)
+        table = np.array(rows, dtype=np.float64).reshape(-1, _WIDTH + 1)
+        t = table[:, 0]
+        v = table[:, 1:]
+
+        previous_time = state_time[index]
+        previous = state_last[index]
+        smooth = state_smooth[index]
+        dt = t - previous_time
+        fresh = ~(dt <= 0)
+        delta = v - previous
+        reset = delta < 0
+        with np.errstate(invalid="ignore", divide="ignore"):
+            rate = np.where(reset, v, delta) / np.where(dt > 0, dt, np.nan)[:, None]
+            if self.max_gap is not None:
+                smooth[dt > self.max_gap] = np.nan
+            if tau is None:
+                blended = rate
+            else:
+                alpha = (1 - np.exp(-dt / tau))[:, None]
+                blended = np.where(np.isnan(smooth), rate, smooth + alpha * (rate - smooth))
+        smooth = np.where(np.isnan(blended), smooth, blended)
+
+        state_smooth[index] = np.where(fresh[:, None], smooth, state_smooth[index])
+        state_last[index] = np.where(fresh[:, None] & ~np.isnan(v), v, previous)
+        state_time[index] = np.where(fresh & ~np.isnan(t), t, previous_time)
+        return state_smooth[index].T.tolist() + [(reset & fresh[:, None]).any(axis=1).tolist()]
+
+    def _update_python(self, slots: List[int], rows: List[Tuple[Any, ...]]) -> List[List[Any]]:
+        tau = _decay(self.half_life)
+        columns: List[List[Any]] = [[] for _ in range(_WIDTH + 1)]
+        for slot, row in zip(slots, rows):
+            base = slot * _WIDTH
+            t = _number(row[0])
+            dt = t - self._time[slot]
+            any_reset = False
+            if not dt <= 0:
+                gap = self.max_gap is not None and dt > self.max_gap
+                for j in range(_WIDTH):
+                    current = _number(row[j + 1])
+                    rate, reset = counter_rate(self._last[base + j], current, dt)
+                    any_reset = any_reset or reset
+                    smooth = _NAN if gap else self._smooth[base + j]
+                    if tau is not None and not math.isnan(smooth) and not math.isnan(rate):
+                        rate = smooth + (1 - math.exp(-dt / tau)) * (rate - smooth)
+                    if not math.isnan(rate):
+                        self._smooth[base + j] = rate
+                    elif gap:
+                        self._smooth[base + j] = _NAN
+                    if not math.isnan(current):
+                        self._last[base + j] = current
+                if not math.isnan(t):
+                    self._time[slot] = t
+            for j in range(_WIDTH):
+                columns[j].append(self._smooth[base + j])
+            columns[_WIDTH].append(any_reset)
+        return columns
@@ -0,0 +1,297 @@
+"""Test cases for asynchronous API classes."""
+
+import asyncio
+import json
+import pytest
+from pybt.core.token import get_md5
+
+aiohttp = pytest.importorskip("aiohttp")
+from aiohttp import web  # noqa: E402
+
+from pybt.api import AsyncDefaultDocument, AsyncRewrite, AsyncSystem, AsyncWebsite, System  # noqa: E402
+from pybt.core.async_client import async_registry  # noqa: E402
+from pybt.core.metrics import MetricsRegistry  # noqa: E402
+from pybt.core.retry import CircuitBreaker, RetryPolicy  # noqa: E402
+from pybt.utils.exceptions import ConnectionRefused, EmptyResponse  # noqa: E402
+
+
+API_KEY = "test_api_key"
+
+
+async def start_panel(handler):
+    """Start a local fake panel and return (runner, host)."""
+    app = web.Application()
+    app.router.add_post("/{tail:.*}", handler)
+    runner = web.AppRunner(app)
+    await runner.setup()
+    site = web.TCPSite(runner, "127.0.0.1", 0)
+    await site.start()
+    port = runner.addresses[0][1]
+    return runner, f"http://127.0.0.1:{port}"
+
+
+async def signed_handler(request):
+    """Echo the action and check the request signature."""
+    if request.path == "/missing":
+        raise web.HTTPNotFound()
+    form = await request.post()
+    expected = get_md5(form["request_time"] + get_md5(API_KEY))
+    return web.json_response({
+        "signed": form["request_token"] == expected,
+        "action": request.query.get("action"),
+        "form": {k: v for k, v in form.items() if not k.startswith("request_")},
+    })
+
+
+class TestAsyncClient:
+    """Test cases for AsyncClient subclasses."""
+
+    def test_methods_mirror_sync_api(self):
+        """Test that async classes expose the synchronous API methods."""
+        assert issubclass(AsyncSystem, System)
+        assert AsyncSystem.get_network is System.get_network
+
+    def test_streaming_rejected(self):
+        """Test that streamed reads fail instead of blocking the event loop."""
+        rewrite = AsyncRewrite(api_key=API_KEY, bt_panel_host="http://stream.example.com")
+        with pytest.raises(TypeError, match="AsyncRewrite"):
+            rewrite.iter_rewrite_content("/www/wwwlogs/big.log")
+
+    def test_signed_request(self):
+        """Test that async requests are signed like sync requests."""
+        async def run():
+            runner, host = await start_panel(signed_handler)
+            try:
+                system = AsyncSystem(api_key=API_KEY, bt_panel_host=host)
+                result = await system.get_network()
+                website = AsyncWebsite(api_key=API_KEY, bt_panel_host=host)
+                stopped = await website.stop_website(1, "example.com")
+                same_session = system._get_session() is website._get_session()
+            finally:
+                await async_registry.close()
+                await runner.cleanup()
+            return result, stopped, same_session
+
+        result, stopped, same_session = asyncio.run(run())
+        assert result == {"signed": True, "action": "GetNetWork", "form": {}}
+        assert stopped["form"] == {"id": "1", "name": "example.com"}
+        assert same_session
+
+    def test_many_requests_in_flight(self):
+        """Test that many concurrent requests complete on one loop."""
+        async def run():
+            runner, host = await start_panel(signed_handler)
+            try:
+                system = AsyncSystem(api_key=API_KEY, bt_panel_host=host, pool_size=20)
+                return await asyncio.gather(*(system.get_task_count() for _ in range(200)))
+            finally:
+                await async_registry.close()
+                await runner.cleanup()
+
+        results = asyncio.run(run())
+        assert len(results) == 200
+        assert all(r["signed"] for r in results)
+
+    def test_http_error(self):
+        """Test that HTTP errors are raised."""
+        async def failing_handler(request):
+            return web.Response(status=500)
+
+        async def run():
+            runner, host = await start_panel(failing_handler)
+            try:
+                system = AsyncSystem(api_key=API_KEY, bt_panel_host=host)
+                await system.get_network()
+            finally:
+                await async_registry.close()
+                await runner.cleanup()
+
+        with pytest.raises(aiohttp.ClientResponseError):
+            asyncio.run(run())
+
+    def test_form_encoding(self):
+        """Test that the form is encoded like requests encodes it."""
+        async def handler(request):
+            form = await request.post()
+            return web.json_response([[k, v] for k, v in form.items() if not k.startswith("request_")])
+
+        async def run():
+            runner, host = await start_panel(handler)
+            try:
+                system = AsyncSystem(api_key=API_KEY, bt_panel_host=host)
+                return await system.post_data("/files", {"ids": [1, 2], "skip": None, "path": "/www/中 文&x"})
+            finally:
+                await async_registry.close()
+                await runner.cleanup()
+
+        assert asyncio.run(run()) == [["ids", "1"], ["ids", "2"], ["path", "/www/中 文&x"]]
+
+    def test_sessions_closed_with_loop(self):
+        """Test that shared sessions are closed when their loop shuts down."""
+        async def open_session():
+            runner, host = await start_panel(signed_handler)
+            try:
+                system = AsyncSystem(api_key=API_KEY, bt_panel_host=host)
+                await system.get_network()
+                return system._get_session()
+            finally:
+                await runner.cleanup()
+
+        assert asyncio.run(open_session()).closed
+
+        loop = asyncio.new_event_loop()
+        try:
+            session = loop.run_until_complete(open_session())
+            assert not session.closed
+            async_registry.close_loop(loop)
+            assert session.closed
+        finally:
+            loop.close()
+
+    def test_post_many(self):
+        """Test async batch execution with per-item errors."""
+        async def run():
+            runner, host = await start_panel(signed_handler)
+            try:
+                system = AsyncSystem(api_key=API_KEY, bt_panel_host=host)
+                calls = [("/system?action=GetNetWork",), ("/ajax?action=GetTaskCount", {"n": 1})]
+                calls.append(("/missing", None))
+                return await system.post_many(calls, max_workers=2)
+            finally:
+                await async_registry.close()
+                await runner.cleanup()
+
+        results = asyncio.run(run())
+        assert [r.index for r in results] == [0, 1, 2]
+        assert results[0].result["action"] == "GetNetWork"
+        assert results[1].result["form"] == {"n": "1"}
+        assert not results[2].ok
+        assert isinstance(results[2].error, aiohttp.ClientResponseError)
+
+    def test_iter_post_many(self):
+        """Test yielding batch results as they complete."""
+        async def run():
+            runner, host = await start_panel(signed_handler)
+            try:
+                system = AsyncSystem(api_key=API_KEY, bt_panel_host=host)
+                calls = [("/system?action=GetNetWork",), ("/missing", None)]
+                return [result async for result in system.iter_post_many(calls)]
+            finally:
+                await async_registry.close()
+                await runner.cleanup()
+
+        results = sorted(asyncio.run(run()), key=lambda r: r.index)
+        assert results[0].result["action"] == "GetNetWork"
+        assert isinstance(results[1].error, aiohttp.ClientResponseError)
+
+
+class TestAsyncClientPolicies:
+    """Test cases for caching, retries and circuit breaking in AsyncClient."""
+
+    @staticmethod
+    def serve(responses, client_class=AsyncSystem, **kwargs):
+        """Build a runner of client calls against a panel replying with responses in turn."""
+        seen = []
+
+        async def handler(request):
+            seen.append(request.query.get("action"))
+            status, body = responses[min(len(seen), len(responses)) - 1]
+            return web.Response(status=status, body=body, content_type="application/json")
+
+        async def run(calls):
+            runner, host = await start_panel(handler)
+            try:
+                client = client_class(api_key=API_KEY, bt_panel_host=host, **kwargs)
+                results = []
+                for call in calls:
+                    try:
+                        results.append(await call(client))
+                    except Exception as e:
+                        results.append(e)
+                return results
+            finally:
+                await async_registry.close()
+                await runner.cleanup()
+
+        return seen, run
+
+    def test_transient_failure_retried(self):
+        """Test that a gateway error of a read endpoint is retried."""
+        seen, run = self.serve(
+            [(503, b""), (200, b'{"cpu": [1, 2]}')],
+            retry_policy=RetryPolicy(backoff_factor=0), circuit_breaker=False
+        )
+        assert asyncio.run(run([AsyncSystem.get_network])) == [{"cpu": [1, 2]}]
+        assert len(seen) == 2
+
+    def test_circuit_and_empty_response(self):
+        """Test EmptyResponse and that an open circuit fails fast."""
+        breaker = CircuitBreaker(failure_threshold=1)
+        seen, run = self.serve(
+            [(200, b" "), (502, b"")],
+            retry_policy=RetryPolicy(max_retries=0), circuit_breaker=breaker
+        )
+        results = asyncio.run(run([AsyncSystem.get_network] * 3))
+        assert isinstance(results[0], EmptyResponse)
+        assert isinstance(results[1], aiohttp.ClientResponseError)
+        assert isinstance(results[2], ConnectionRefused)
+        assert isinstance(results[2], aiohttp.ClientConnectionError)
+        assert len(seen) == 2 and breaker.state == CircuitBreaker.OPEN
+
+    def test_cache(self):
+        """Test that reads are cached, errors are not and writes invalidate."""
+        seen, run = self.serve(
+            [(200, b'{"status": false, "msg": "denied"}'), (200, b'{"index": "a"}'),
+             (200, b'{"status": true}'), (200, b'{"index": "b"}')],
+            AsyncDefaultDocument, cache=True, circuit_breaker=False
+        )
+        index = lambda website: website.get_default_document(1)  # noqa: E731
+        results = asyncio.run(run([
+            index, index, index, lambda website: website.set_default_document(1, "b"), index,
+        ]))
+        assert results[0]["status"] is False
+        assert results[1] == results[2] == {"index": "a"}
+        assert results[4] == {"index": "b"}
+        assert len(seen) == 4
+
+    def test_hooks_and_metrics(self):
+        """Test that async requests fire hooks and record metrics."""
+        registry = MetricsRegistry()
+        seen, run = self.serve([(200, b'{"cpu": [1, 2]}')], metrics=registry)
+        before = []
+
+        async def call(system):
+            system.add_hook("before", before.append)
+            return await system.get_network()
+
+        asyncio.run(run([call]))
+        assert before[0].name == "GetNetWork"
+        assert registry.count(endpoint="GetNetWork", status="ok") == 1
+        assert before[0].response_bytes == len(b'{"cpu": [1, 2]}')
+
+    def test_iter_websites(self):
+        """Test that async listing iterators are async iterators."""
+        pager = "<span class='Pcount'>Total: 3</span>"
+        seen, run = self.serve(
+            [(200, json.dumps({"data": [{"id": 3}, {"id": 2}], "page": pager}).encode()),
+             (200, json.dumps({"data": [{"id": 1}], "page": pager}).encode())],
+            AsyncWebsite
+        )
+
+        async def collect(website):
+            return [site["id"] async for site in website.iter_websites(limit=2)]
+
+        assert asyncio.run(run([collect])) == [[3, 2, 1]]
+        assert len(seen) == 2
+
+    def test_columns(self):
+        """Test that column helpers are coroutines on async clients."""
+        disk = {"path": "/", "size": ["10G", "4G", "6G", "40%"], "inodes": ["100", "10", "90", "10%"]}
+        sites = {"data": [{"id": 2, "name": "b.com"}, {"id": 1, "name": "a.com"}], "page": ""}
+        seen, run = self.serve([(200, json.dumps([disk]).encode())])
+        disks = asyncio.run(run([lambda system: system.get_disk_columns(numpy=False)]))[0]
+        assert disks.length == 1 and list(disks["size_usage"]) == [40.0]
+
+        seen, run = self.serve([(200, json.dumps(sites).encode())], AsyncWebsite)
+        columns = asyncio.run(run([lambda website: website.get_website_columns(["id"], numpy=False)]))[0]
+        assert list(columns["id"]) == [2, 1]
@@ -0,0 +1,77 @@
+"""Test cases for concurrent batch execution."""
+
+import threading
+import time
+import pytest
+import requests
+from unittest.mock import patch
+from pybt.api.website import Domain
+
+
+@pytest.fixture
+def domain():
+    """Create a Domain instance with mocked config."""
+    return Domain(
+        api_key="test_api_key",
+        bt_panel_host="http://test.example.com",
+        debug=False,
+        timeout=30,
+        verify_ssl=False
+    )
+
+
+class TestPostMany:
+    """Test cases for Client.post_many and Client.iter_post_many."""
+
+    def test_results_in_order(self, domain):
+        """Test that results come back in submission order."""
+        def fake_post(endpoint, data=None):
+            time.sleep(0.01 * (5 - data["search"]))
+            return [{"pid": data["search"]}]
+
+        endpoint = domain.config.get_endpoint("WebDomainList")
+        calls = [(endpoint, {"search": site_id, "list": True}) for site_id in range(5)]
+        with patch.object(domain, 'post_data', side_effect=fake_post):
+            results = domain.post_many(calls, max_workers=5)
+
+        assert [r.index for r in results] == list(range(5))
+        assert [r.result for r in results] == [[{"pid": i}] for i in range(5)]
+        assert all(r.ok for r in results)
+
+    def test_errors_reported_per_item(self, domain):
+        """Test that one failing call does not affect the others."""
+        def fake_post(endpoint, data=None):
+            if data and data.get("fail"):
+                raise requests.ConnectionError("reset")
+            return {"status": True}
+
+        endpoint = domain.config.get_endpoint("WebBackupList")
+        calls = [(endpoint, {"fail": False}), (endpoint, {"fail": True}), (endpoint,)]
+        with patch.object(domain, 'post_data', side_effect=fake_post):
+            results = domain.post_many(calls)
+
+        assert [r.ok for r in results] == [True, False, True]
+        assert isinstance(results[1].error, requests.ConnectionError)
+        assert results[1].result is None
+        assert results[2].data is None
+
+    def test_concurrency_is_bounded(self, domain):
+        """Test that no more than max_workers calls run at once."""
+        lock = threading.Lock()
+        state = {"running": 0, "peak": 0}
+
+        def fake_post(endpoint, data=None):
+            with lock:
+                state["running"] += 1
+                state["peak"] = max(state["peak"], state["running"])
+            time.sleep(0.01)
+            with lock:
+                state["running"] -= 1
+            return {}
+
+        with patch.object(domain, 'post_data', side_effect=fake_post):
+            results = list(domain.iter_post_many(["/a"] * 12, max_workers=3))
+
+        assert len(results) == 12
+        assert sorted(r.index for r in results) == list(range(12))
+        assert state["peak"] <= 3
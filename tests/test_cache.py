@@ -0,0 +1,161 @@
+"""Test cases for the response cache."""
+
+import pytest
+from unittest.mock import MagicMock, patch
+from pybt.api import Panel, Website
+from pybt.core.cache import ResponseCache
+
+
+def make_response(payload):
+    """Create a mock requests response returning payload."""
+    response = MagicMock()
+    response.json.return_value = payload
+    return response
+
+
+@pytest.fixture
+def website():
+    """Create a Website instance with the cache enabled."""
+    return Website(
+        api_key="test_api_key",
+        bt_panel_host="http://test.example.com",
+        debug=False,
+        timeout=30,
+        verify_ssl=False,
+        cache=True
+    )
+
+
+class TestResponseCache:
+    """Test cases for ResponseCache class."""
+
+    def test_key_ignores_data_order(self):
+        """Test that request data is normalized in the key."""
+        first = ResponseCache.make_key("http://h", "/e", {"a": 1, "b": 2})
+        second = ResponseCache.make_key("http://h", "/e", {"b": 2, "a": 1})
+        assert first == second
+        assert first != ResponseCache.make_key("http://h", "/e", {"a": 2, "b": 2})
+
+    def test_lru_eviction(self):
+        """Test that the least recently used entry is evicted."""
+        cache = ResponseCache(max_size=2)
+        cache.set("a", 1, ttl=60)
+        cache.set("b", 2, ttl=60)
+        cache.get("a")
+        cache.set("c", 3, ttl=60)
+
+        assert cache.get("b") == (False, None)
+        assert cache.get("a") == (True, 1)
+        assert cache.get("c") == (True, 3)
+        assert cache.stats.evictions == 1
+        assert len(cache) == 2
+
+    def test_ttl_expiry(self):
+        """Test that entries expire after their TTL."""
+        cache = ResponseCache()
+        with patch("pybt.core.cache.time.monotonic", return_value=100.0):
+            cache.set("a", 1, ttl=10)
+        with patch("pybt.core.cache.time.monotonic", return_value=105.0):
+            assert cache.get("a") == (True, 1)
+        with patch("pybt.core.cache.time.monotonic", return_value=111.0):
+            assert cache.get("a") == (False, None)
+        assert cache.stats.expirations == 1
+        assert cache.stats.hits == 1
+        assert cache.stats.misses == 1
+        assert cache.stats.hit_rate == 0.5
+
+    def test_invalidate_by_name_and_host(self):
+        """Test that invalidation only drops the named endpoints of one host."""
+        cache = ResponseCache()
+        cache.set("a", 1, ttl=60, host="http://h1", name="Websites")
+        cache.set("b", 2, ttl=60, host="http://h1", name="Websites")
+        cache.set("c", 3, ttl=60, host="http://h1", name="GetPHPVersion")
+        cache.set("d", 4, ttl=60, host="http://h2", name="Websites")
+
+        assert cache.invalidate(["Websites"], host="http://h1") == 2
+        assert cache.get("a") == (False, None)
+        assert cache.get("c") == (True, 3)
+        assert cache.get("d") == (True, 4)
+        assert cache.stats.invalidations == 2
+
+
+class TestClientCache:
+    """Test cases for caching in Client.post_data."""
+
+    def test_cached_endpoint(self, website):
+        """Test that read-mostly endpoints are served from the cache."""
+        versions = [{"version": "00", "name": "Static"}]
+        with patch.object(website.session, 'post', return_value=make_response(versions)) as mock_post:
+            first = website.get_php_versions()
+            first.append({"version": "74"})
+            second = website.get_php_versions()
+
+        assert second == [{"version": "00", "name": "Static"}]
+        assert mock_post.call_count == 1
+        assert website.cache.stats.hits == 1
+
+    def test_error_response_not_cached(self, website):
+        """Test that a panel error is not served from the cache."""
+        denied = {"status": False, "msg": "IP verification failed"}
+        versions = [{"version": "00", "name": "Static"}]
+        with patch.object(website.session, 'post') as mock_post:
+            mock_post.side_effect = [make_response(denied), make_response(versions)]
+            assert website.get_php_versions() == denied
+            assert website.get_php_versions() == versions
+
+        assert mock_post.call_count == 2
+        assert len(website.cache) == 1
+
+    def test_uncached_endpoint(self, website):
+        """Test that endpoints without a TTL always hit the panel."""
+        with patch.object(website.session, 'post', return_value=make_response({"data": []})) as mock_post:
+            website.get_website_list()
+            website.get_website_list()
+        assert mock_post.call_count == 2
+
+    def test_disabled_by_default(self):
+        """Test that the cache is opt-in."""
+        website = Website(api_key="test_api_key", bt_panel_host="http://test.example.com")
+        assert website.cache is None
+
+    def test_panel_shares_cache(self):
+        """Test that the panel facade shares one cache."""
+        panel = Panel(api_key="test_api_key", bt_panel_host="http://test.example.com", cache=True)
+        assert panel.cache is not None
+        assert panel.website.cache is panel.cache
+        assert panel.directory.cache is panel.cache
+
+    def test_mutation_invalidates_affected_reads(self, website):
+        """Test that a successful write evicts only the reads it affects."""
+        website.config.cache_ttl["Websites"] = 60
+        listing = {"data": [{"id": 1, "status": "1"}]}
+        versions = [{"version": "00", "name": "Static"}]
+        with patch.object(website.session, 'post') as mock_post:
+            mock_post.side_effect = [make_response(listing), make_response(versions)]
+            website.get_website_list()
+            website.get_php_versions()
+
+            mock_post.side_effect = [make_response({"status": True, "msg": "ok"})]
+            website.stop_website(1, "example.com")
+
+            mock_post.side_effect = [make_response({"data": [{"id": 1, "status": "0"}]})]
+            assert website.get_website_list()["data"][0]["status"] == "0"
+            website.get_php_versions()
+
+        assert mock_post.call_count == 4
+        assert website.cache.stats.invalidations == 1
+
+    def test_failed_mutation_keeps_cache(self, website):
+        """Test that a write rejected by the panel does not evict reads."""
+        website.config.cache_ttl["Websites"] = 60
+        with patch.object(website.session, 'post') as mock_post:
+            mock_post.side_effect = [
+                make_response({"data": []}),
+                make_response({"status": False, "msg": "failed"}),
+            ]
+            website.get_website_list()
+            website.start_website(1, "example.com")
+            website.get_website_list()
+
+        assert mock_post.call_count == 2
+        assert website.cache.stats.invalidations == 0
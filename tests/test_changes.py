@@ -0,0 +1,119 @@
+"""Test cases for change detection."""
+
+from unittest.mock import patch
+from pybt.api import System, Website
+from pybt.api.records import Site
+from pybt.core.changes import ChangeTracker, diff, fingerprint, stream_key
+
+PAGE = {
+    "data": [
+        {"id": 2, "name": "b.com", "ps": "", "status": "1"},
+        {"id": 1, "name": "a.com", "ps": "", "status": "1"},
+    ],
+    "page": "<span class='Pcount'>共2条</span>",
+}
+
+
+def page_with(*rows):
+    """Build a website list page from rows."""
+    return {"data": list(rows), "page": PAGE["page"]}
+
+
+class TestFingerprint:
+    """Test cases for fingerprint and diff."""
+
+    def test_fingerprint(self):
+        """Test that fingerprints ignore key order and ignored keys."""
+        assert fingerprint({"a": 1, "b": [1, {"c": 2}]}) == fingerprint({"b": [1, {"c": 2}], "a": 1})
+        assert fingerprint({"a": 1}) != fingerprint({"a": 2})
+        assert fingerprint({"a": 1, "t": 5}, ignore=["t"]) == fingerprint({"a": 1, "t": 6}, ignore=["t"])
+
+    def test_fingerprint_records(self):
+        """Test that records fingerprint like the rows they came from."""
+        row = {"id": 1, "name": "a.com"}
+        assert fingerprint([Site.from_dict(row)]) == fingerprint([Site(**row).to_dict()])
+
+    def test_diff(self):
+        """Test added, removed and modified rows keyed by id."""
+        old = PAGE["data"]
+        new = [{"id": 3, "name": "c.com"}, {"id": 1, "name": "a.com", "ps": "main", "status": "1"}]
+        delta = diff(old, new)
+
+        assert delta.added == [{"id": 3, "name": "c.com"}]
+        assert delta.removed == [old[0]]
+        assert [(m.key, m.fields) for m in delta.modified] == [(1, ["ps"])]
+        assert delta.count == 3
+        assert not diff(old, list(old))
+
+    def test_diff_plain_values(self):
+        """Test diffing lists of plain values such as rewrite rule names."""
+        delta = diff(["wordpress", "thinkphp"], ["wordpress", "laravel"], key=None)
+        assert delta.added == ["laravel"] and delta.removed == ["thinkphp"]
+
+
+class TestChangeTracker:
+    """Test cases for ChangeTracker class."""
+
+    def test_update(self):
+        """Test unchanged detection and deltas between fetches."""
+        tracker = ChangeTracker()
+        first = tracker.update("sites", PAGE)
+        assert not first.unchanged and first.previous is None
+        assert len(first.delta.added) == 2
+
+        again = tracker.update("sites", {"page": PAGE["page"], "data": [dict(row) for row in PAGE["data"]]})
+        assert again.unchanged and again.delta is None
+
+        changed = tracker.update("sites", page_with(dict(PAGE["data"][0], status="0"), PAGE["data"][1]))
+        assert not changed.unchanged
+        assert [(m.key, m.old["status"], m.new["status"]) for m in changed.delta.modified] == [(2, "1", "0")]
+        assert not changed.delta.added and not changed.delta.removed
+
+    def test_streams_and_ignore(self):
+        """Test that streams are independent and ignored keys never count."""
+        tracker = ChangeTracker(ignore=["endtime"])
+        assert not tracker.unchanged("a", {"ssl": {"endtime": 5}})
+        assert tracker.unchanged("a", {"ssl": {"endtime": 4}})
+        assert not tracker.unchanged("b", {"ssl": {"endtime": 4}})
+
+        tracker.forget("a")
+        assert "a" not in tracker and len(tracker) == 1
+        assert not tracker.unchanged("a", {"ssl": {}})
+
+    def test_disk_rows(self):
+        """Test list responses keyed by another field."""
+        tracker = ChangeTracker()
+        tracker.update("disks", [{"path": "/", "size": ["8G", "4G", "4G", "50%"]}], key="path")
+        change = tracker.update("disks", [{"path": "/", "size": ["8G", "5G", "3G", "62%"]}], key="path")
+        assert change.delta.modified[0].key == "/"
+
+    def test_track(self):
+        """Test that tracked clients report only changed responses."""
+        website = Website(api_key="test_api_key", bt_panel_host="http://changes.example.com")
+        tracker = ChangeTracker()
+        changes = []
+        tracker.track(website)
+        tracker.subscribe(changes.append)
+
+        responses = [PAGE, PAGE, page_with(PAGE["data"][1])]
+        with patch.object(website, '_post', side_effect=responses):
+            for _ in responses:
+                website.get_website_list(page=1, limit=2)
+
+        assert len(changes) == 2
+        assert changes[1].delta.removed == [PAGE["data"][0]]
+        endpoint = website.config.get_endpoint("Websites")
+        data = {"p": 1, "limit": 2, "type": -1, "order": "id desc"}
+        assert changes[1].name == stream_key("http://changes.example.com", endpoint, data)
+
+    def test_track_ignores_other_endpoints(self):
+        """Test that only the watched endpoints are compared."""
+        system = System(api_key="test_api_key", bt_panel_host="http://changes.example.com")
+        tracker = ChangeTracker()
+        tracker.track(system, names=["GetDiskInfo"])
+        with patch.object(system, '_post', return_value={"cpu": [1, 2]}):
+            system.get_network()
+        assert len(tracker) == 0
+        with patch.object(system, '_post', return_value=[{"path": "/"}]):
+            system.get_disk_info()
+        assert len(tracker) == 1
@@ -0,0 +1,156 @@
+"""Test cases for columnar export."""
+
+import math
+from array import array
+import pytest
+from unittest.mock import patch
+from pybt.api import System, Website, WebsiteBackup
+from pybt.api.records import NetworkSample, Site
+from pybt.utils.columns import ColumnBuilder, to_columns
+
+BACKUPS = [
+    {"id": 1, "pid": 7, "name": "a", "size": 100, "addtime": "2024-01-01"},
+    {"id": 2, "pid": 8, "name": "b", "size": 50, "addtime": "2024-01-02"},
+    {"id": 3, "pid": 7, "name": "c", "size": 25, "addtime": "2024-01-03"},
+    {"id": 4, "pid": 9, "name": "d", "size": None, "addtime": "2024-01-04"},
+]
+
+
+@pytest.fixture(params=[False, True], ids=["array", "numpy"])
+def use_numpy(request):
+    """Run a test with array module columns and, if installed, NumPy columns."""
+    if request.param:
+        pytest.importorskip("numpy")
+    return request.param
+
+
+def make_client(api_class):
+    """Create an API object for column tests."""
+    return api_class(api_key="test_api_key", bt_panel_host="http://columns.example.com")
+
+
+class TestColumnBuilder:
+    """Test cases for ColumnBuilder and to_columns."""
+
+    def test_column_types(self):
+        """Test that columns get the narrowest storage for their values."""
+        columns = to_columns(BACKUPS, numpy=False)
+
+        assert columns.length == 4
+        assert list(columns) == ["id", "pid", "name", "size", "addtime"]
+        assert columns["id"] == array("q", [1, 2, 3, 4])
+        assert columns["size"].typecode == "d" and math.isnan(columns["size"][3])
+        assert columns["name"] == ["a", "b", "c", "d"]
+
+    def test_widening(self):
+        """Test that a column widens from int to float to object."""
+        columns = to_columns([{"v": 1}, {"v": None}, {"v": 2.5}, {"v": "x"}], numpy=False)
+        assert columns["v"] == [1.0, None, 2.5, "x"]
+
+    def test_late_and_missing_columns(self):
+        """Test that columns first seen later are padded with missing values."""
+        columns = to_columns([{"a": 1}, {"a": 2, "b": 3}], numpy=False)
+        assert math.isnan(columns["b"][0]) and columns["b"][1] == 3
+
+    def test_selected_fields(self):
+        """Test that only the requested fields are kept."""
+        columns = to_columns(BACKUPS, ["pid", "missing"], numpy=False)
+        assert list(columns) == ["pid", "missing"]
+        assert all(math.isnan(v) for v in columns["missing"])
+
+    def test_records(self):
+        """Test exporting records, e.g. network samples."""
+        samples = [
+            NetworkSample.from_dict({"down": 1.5, "cpu": [10, 4]}, timestamp=1.0),
+            NetworkSample.from_dict({"down": 2.5, "cpu": [30, 4]}, timestamp=2.0),
+        ]
+        columns = to_columns(samples, ["timestamp", "down", "cpu_percent"], numpy=False)
+        assert list(columns["cpu_percent"]) == [10.0, 30.0]
+        assert to_columns([Site(id=1, name="a.com")], ["id"], numpy=False)["id"] == array("q", [1])
+
+    def test_incremental(self):
+        """Test that a builder can keep growing after a build."""
+        builder = ColumnBuilder(["id"])
+        builder.extend(BACKUPS[:2])
+        first = builder.build()
+        builder.extend(BACKUPS[2:])
+        assert len(first["id"]) == 2 and len(builder.build()["id"]) == 4
+
+    def test_numpy_types(self):
+        """Test that numeric columns become typed NumPy arrays."""
+        np = pytest.importorskip("numpy")
+        columns = to_columns(BACKUPS, numpy=True)
+
+        assert columns.numpy
+        assert columns["id"].dtype == np.int64
+        assert columns["size"].dtype == np.float64
+        assert columns["name"].dtype == object
+
+    def test_numpy_required(self):
+        """Test that numpy=True fails clearly when NumPy is missing."""
+        with patch.dict("sys.modules", {"numpy": None}):
+            with pytest.raises(ImportError, match=r"bt-python-sdk\[numpy\]"):
+                to_columns(BACKUPS, numpy=True)
+            assert not to_columns(BACKUPS).numpy
+
+
+class TestColumnOperations:
+    """Test cases for Columns aggregations."""
+
+    def test_sum_by(self, use_numpy):
+        """Test totalling backup sizes per site."""
+        columns = to_columns(BACKUPS, numpy=use_numpy)
+        assert columns.sum_by("pid", "size") == {7: 125, 8: 50}
+
+        ints = to_columns([row for row in BACKUPS if row["size"] is not None], numpy=use_numpy)
+        totals = ints.sum_by("pid", "size")
+        assert totals == {7: 125, 8: 50} and all(type(v) is int for v in totals.values())
+
+    def test_percentile(self, use_numpy):
+        """Test percentiles skip missing values and interpolate linearly."""
+        columns = to_columns(BACKUPS, numpy=use_numpy)
+
+        assert columns.percentile("size", 50) == 50.0
+        assert columns.percentile("size", [0, 25, 100]) == [25.0, 37.5, 100.0]
+        assert math.isnan(to_columns([{"x": None}], numpy=use_numpy).percentile("x", 50))
+
+
+class TestColumnMethods:
+    """Test cases for the column methods of API classes."""
+
+    def test_website_columns(self, use_numpy):
+        """Test exporting every page of the website list."""
+        website = make_client(Website)
+        pages = {
+            1: {"data": [{"id": 3, "backup_count": 1}, {"id": 2, "backup_count": 0}], "page": "共3条"},
+            2: {"data": [{"id": 1, "backup_count": 4}], "page": "共3条"},
+        }
+        with patch.object(website, 'get_website_list', side_effect=lambda page, **kw: pages[page]):
+            columns = website.get_website_columns(["id", "backup_count"], limit=2, numpy=use_numpy)
+
+        assert list(columns["id"]) == [3, 2, 1]
+        assert columns.length == 3
+
+    def test_backup_columns(self, use_numpy):
+        """Test exporting the backups of a website."""
+        backup = make_client(WebsiteBackup)
+        with patch.object(backup, 'get_backup_list', return_value={"data": BACKUPS, "page": "共4条"}):
+            columns = backup.get_backup_columns(7, ["pid", "size"], numpy=use_numpy)
+        assert columns.sum_by("pid", "size")[7] == 125
+
+    def test_disk_columns(self, use_numpy):
+        """Test exporting disk partitions with parsed sizes."""
+        system = make_client(System)
+        disks = [
+            {"path": "/", "size": ["8.3G", "4.0G", "4.3G", "49%"], "inodes": ["10", "2", "8", "20%"]},
+            {"path": "/www", "size": ["9.8G", "3.7G", "5.6G", "40%"], "inodes": ["10", "5", "5", "50%"]},
+        ]
+        with patch.object(system, 'post_data', return_value=disks):
+            columns = system.get_disk_columns(numpy=use_numpy)
+
+        assert list(columns["path"]) == ["/", "/www"]
+        assert columns.percentile("size_usage", 50) == 44.5
+        assert list(columns["inodes_used"]) == [2, 5]
+
+        with patch.object(system, 'post_data', return_value={"status": False, "msg": "error"}):
+            assert system.get_disk_columns(numpy=use_numpy).length == 0
@@ -0,0 +1,113 @@
+"""Test cases for the domain-to-site index."""
+
+import pytest
+from unittest.mock import patch
+from pybt.api import Domain, Website
+from pybt.core.domain_index import DomainIndex, DomainMatch, created_site_domains, parse_domains
+
+
+ROWS = [
+    {"id": 1, "pid": 1, "name": "example.com", "port": 80},
+    {"id": 2, "pid": 1, "name": "www.example.com", "port": 80},
+    {"id": 3, "pid": 2, "name": "*.example.com", "port": 80},
+    {"id": 4, "pid": 3, "name": "*.api.example.com", "port": 80},
+    {"id": 5, "pid": 4, "name": "example.com", "port": 8080},
+    {"id": 6, "pid": 5, "name": "other.org", "port": 80},
+]
+
+
+@pytest.fixture
+def index():
+    """Create an index loaded with ROWS."""
+    index = DomainIndex()
+    index.load_rows(ROWS)
+    return index
+
+
+@pytest.fixture
+def domain():
+    """Create a Domain instance."""
+    return Domain(api_key="test_api_key", bt_panel_host="http://index.example.com")
+
+
+class TestDomainIndex:
+    """Test cases for DomainIndex class."""
+
+    def test_exact_lookup(self, index):
+        """Test exact matches, with and without a port."""
+        assert len(index) == 6
+        assert index.lookup("WWW.Example.com.") == DomainMatch("www.example.com", 1, 80)
+        assert index.lookup("example.com", port=8080) == DomainMatch("example.com", 4, 8080)
+        assert index.lookup("example.com").site_id == 1
+        assert index.lookup("unknown.net") is None
+
+    def test_wildcard_lookup(self, index):
+        """Test that the most specific wildcard wins."""
+        assert index.lookup("shop.example.com") == DomainMatch("*.example.com", 2, 80)
+        assert index.lookup("a.b.example.com").site_id == 2
+        assert index.lookup("v1.api.example.com") == DomainMatch("*.api.example.com", 3, 80)
+        assert index.lookup("shop.example.com", port=8080) is None
+
+    def test_suffix(self, index):
+        """Test listing every binding below a suffix."""
+        assert [m.domain for m in index.suffix("api.example.com")] == ["*.api.example.com"]
+        assert len(index.suffix("example.com")) == 5
+        assert index.suffix("net") == []
+
+    def test_add_and_remove(self, index):
+        """Test incremental updates and pruning."""
+        index.add("new.org", 9, 443)
+        assert "new.org" in index
+        index.remove("new.org")
+        assert "new.org" not in index
+        assert "org" not in index
+        assert index.lookup("other.org").site_id == 5
+        index.remove_site(1)
+        assert index.lookup("www.example.com").domain == "*.example.com"
+        assert len(index) == 4
+
+    def test_parse_domains(self):
+        """Test the panel's domain list format."""
+        assert parse_domains("a.com, B.com:81\nc.com") == [("a.com", 80), ("b.com", 81), ("c.com", 80)]
+
+    def test_created_site_domains(self):
+        """Test reading the domains of a create_website request."""
+        data = {"webname": '{"domain": "a.com", "domainlist": ["b.com:81"], "count": 1}', "port": "8080"}
+        assert created_site_domains(data) == [("a.com", 8080), ("b.com", 81)]
+        assert created_site_domains({"webname": {"domain": "c.com"}}) == [("c.com", 80)]
+
+    def test_load_from_panel(self, domain):
+        """Test bulk-loading the whole domain table."""
+        index = DomainIndex(domain)
+        response = {"data": ROWS, "page": "<span class='Pcount'>共6条</span>"}
+        with patch.object(domain, 'post_data', return_value=response) as mock_post:
+            assert index.load(limit=10) == 6
+        mock_post.assert_called_once_with(domain.config.get_endpoint("WebDomainList"), {"p": 1, "limit": 10})
+
+    def test_tracks_domain_changes(self, domain):
+        """Test that add_domain and delete_domain update the index."""
+        index = DomainIndex(domain)
+        with patch.object(domain, '_post', return_value={"status": True, "msg": "ok"}):
+            domain.add_domain(7, "site.com", "site.com,www.site.com:81")
+            assert index.lookup("www.site.com") == DomainMatch("www.site.com", 7, 81)
+            domain.delete_domain(7, "site.com", "www.site.com", 81)
+            assert index.lookup("www.site.com") is None
+            assert len(index) == 1
+
+        with patch.object(domain, '_post', return_value={"status": False, "msg": "exists"}):
+            domain.add_domain(8, "dup.com", "dup.com")
+        assert "dup.com" not in index
+
+    def test_tracks_site_changes(self):
+        """Test that created and deleted websites update the index."""
+        website = Website(api_key="test_api_key", bt_panel_host="http://index.example.com")
+        index = DomainIndex()
+        index.track(website)
+        webname = {"domain": "blog.com", "domainlist": ["www.blog.com"], "count": 1}
+        with patch.object(website, '_post', return_value={"siteStatus": True, "siteId": 11}):
+            website.create_website(webname, "/www/wwwroot/blog.com", 0, "74")
+        assert index.lookup("www.blog.com").site_id == 11
+
+        with patch.object(website, '_post', return_value={"status": True}):
+            website.delete_website(11, "blog.com")
+        assert len(index) == 0
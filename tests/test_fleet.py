@@ -0,0 +1,112 @@
+"""Test cases for the Fleet multi-panel API."""
+
+import time
+import pytest
+import requests
+from unittest.mock import patch
+from pybt.api import Fleet, System, Website
+
+
+HOSTS = ["http://panel1.example.com", "http://panel2.example.com", "http://panel3.example.com"]
+
+
+@pytest.fixture
+def fleet():
+    """Create a Fleet of three mocked panels."""
+    fleet = Fleet([(host, "test_api_key") for host in HOSTS], max_workers=8, timeout=5)
+    yield fleet
+    fleet.close()
+
+
+def fake_post_for(host, delay=0.0, error=None):
+    """Build a fake post_data answering with the panel host."""
+    def fake_post(endpoint, data=None):
+        time.sleep(delay)
+        if error:
+            raise error
+        return {"host": host, "endpoint": endpoint, "data": data}
+    return fake_post
+
+
+class TestFleet:
+    """Test cases for Fleet class."""
+
+    def test_panels_built_from_entries(self, fleet):
+        """Test that each entry becomes a panel with its own config."""
+        assert fleet.hosts == HOSTS
+        assert fleet.panel(HOSTS[0]).config.timeout == 5
+
+    def test_per_panel_timeout(self):
+        """Test that a third tuple element overrides the timeout."""
+        fleet = Fleet([(HOSTS[0], "key", 2), (HOSTS[1], "key")], timeout=9)
+        assert fleet.panel(HOSTS[0]).config.timeout == 2
+        assert fleet.panel(HOSTS[1]).config.timeout == 9
+
+    def test_run_unbound_method_concurrently(self, fleet):
+        """Test that a sweep takes the time of the slowest panel."""
+        patches = [
+            patch.object(fleet.panel(host).system, 'post_data', side_effect=fake_post_for(host, 0.2))
+            for host in HOSTS
+        ]
+        for p in patches:
+            p.start()
+        try:
+            start = time.perf_counter()
+            results = fleet.run(System.get_network)
+            elapsed = time.perf_counter() - start
+        finally:
+            for p in patches:
+                p.stop()
+
+        assert [r.host for r in results] == HOSTS
+        assert all(r.ok for r in results)
+        assert results[1].result["host"] == HOSTS[1]
+        assert elapsed < 0.5
+
+    def test_partial_failure(self, fleet):
+        """Test that failing panels are reported without failing the sweep."""
+        errors = {HOSTS[1]: requests.ConnectionError("down")}
+        patches = [
+            patch.object(
+                fleet.panel(host).website, 'post_data',
+                side_effect=fake_post_for(host, error=errors.get(host))
+            )
+            for host in HOSTS
+        ]
+        for p in patches:
+            p.start()
+        try:
+            results = fleet.run(Website.get_website_list, page=2)
+        finally:
+            for p in patches:
+                p.stop()
+
+        assert [r.ok for r in results] == [True, False, True]
+        assert isinstance(results[1].error, requests.ConnectionError)
+        assert results[0].result["data"]["p"] == 2
+
+    def test_deadline(self, fleet):
+        """Test that panels slower than the deadline get a TimeoutError."""
+        delays = {HOSTS[2]: 0.5}
+        patches = [
+            patch.object(
+                fleet.panel(host).system, 'post_data',
+                side_effect=fake_post_for(host, delays.get(host, 0.0))
+            )
+            for host in HOSTS
+        ]
+        for p in patches:
+            p.start()
+        try:
+            results = fleet.run(System.get_task_count, deadline=0.2)
+        finally:
+            for p in patches:
+                p.stop()
+
+        assert [r.ok for r in results] == [True, True, False]
+        assert isinstance(results[2].error, TimeoutError)
+
+    def test_run_callable(self, fleet):
+        """Test that any callable taking a panel can be fanned out."""
+        results = fleet.run(lambda panel, suffix: panel.config.bt_panel_host + suffix, "/x")
+        assert [r.result for r in results] == [host + "/x" for host in HOSTS]
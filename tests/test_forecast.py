@@ -0,0 +1,125 @@
+"""Test cases for disk-fill forecasting."""
+
+import random
+import pytest
+from unittest.mock import patch
+from pybt.api import System
+from pybt.api.records import DiskPartition
+from pybt.core.forecast import DiskForecaster, OnlineTrend
+
+HOST = "http://forecast.example.com"
+
+
+def disk(path, used_gb, inodes_used=1000, total_gb=100, inodes_total=100000):
+    """Build a get_disk_info row."""
+    return {
+        "path": path,
+        "size": [f"{total_gb}G", f"{used_gb}G", f"{total_gb - used_gb}G", f"{used_gb}%"],
+        "inodes": [str(inodes_total), str(inodes_used), str(inodes_total - inodes_used), "1%"],
+    }
+
+
+class TestOnlineTrend:
+    """Test cases for OnlineTrend class."""
+
+    def test_linear_fit(self):
+        """Test that an exact line is recovered."""
+        trend = OnlineTrend(half_life=None)
+        for i in range(10):
+            trend.add(1000.0 + 60 * i, 50.0 + 3 * i)
+
+        assert trend.slope == pytest.approx(3 / 60)
+        assert trend.level == pytest.approx(77.0)
+        assert trend.time_to(107.0) == pytest.approx(600.0)
+        assert trend.time_to(10.0) == 0.0
+
+    def test_not_enough_or_falling(self):
+        """Test that no estimate is given without a rising trend."""
+        trend = OnlineTrend()
+        trend.add(0, 10)
+        assert trend.time_to(100) is None and trend.slope is None
+        trend.add(60, 9)
+        assert trend.time_to(100) is None
+
+    def test_outliers_are_damped(self):
+        """Test that a single spike barely moves the slope."""
+        rng = random.Random(3)
+        trend = OnlineTrend(half_life=None)
+        for i in range(100):
+            value = 1000 + 5 * i + rng.gauss(0, 2) + (800 if i == 60 else 0)
+            trend.add(i, value)
+        assert trend.slope == pytest.approx(5, rel=0.02)
+
+    def test_recent_samples_dominate(self):
+        """Test that old growth fades with the half-life."""
+        trend = OnlineTrend(half_life=600)
+        for i in range(180):
+            trend.add(i * 60.0, (i * 100.0) if i < 60 else 6000.0 + (i - 60) * 10.0)
+        assert trend.slope * 60 == pytest.approx(10, rel=0.1)
+
+    def test_reset_on_drop(self):
+        """Test that a cleanup restarts the fit."""
+        trend = OnlineTrend(half_life=None, reset_drop=100)
+        for i in range(10):
+            trend.add(i, 1000 + 10 * i)
+        trend.add(10, 500)
+        trend.add(11, 502)
+        assert trend.count == 2 and trend.slope == pytest.approx(2)
+        trend.add(11, 0)
+        assert trend.count == 2
+
+
+class TestDiskForecaster:
+    """Test cases for DiskForecaster class."""
+
+    def test_time_to_full(self):
+        """Test estimates for bytes and inodes of each mount point."""
+        forecaster = DiskForecaster(half_life=None)
+        for hour in range(5):
+            forecaster.update(HOST, [
+                disk("/", 50 + hour, inodes_used=1000 + 10000 * hour),
+                disk("/www", 20),
+            ], timestamp=hour * 3600.0)
+
+        root = forecaster.forecast(HOST, "/")
+        assert root.bytes.rate * 3600 == pytest.approx(2 ** 30)
+        assert root.bytes.time_to_full / 3600 == pytest.approx(46)
+        assert root.inodes.time_to_full / 3600 == pytest.approx(5.9)
+        assert root.time_to_full == root.inodes.time_to_full
+        assert root.bytes.full_at == pytest.approx(4 * 3600 + root.bytes.time_to_full)
+        assert forecaster.forecast(HOST, "/www").time_to_full is None
+
+        assert [f.path for f in forecaster.forecasts()] == ["/", "/www"]
+        assert forecaster.forecasts(within=3600) == []
+        assert forecaster.forecast(HOST, "/missing") is None
+
+    def test_cleanup_restarts_trend(self):
+        """Test that freeing space restarts the forecast of a mount."""
+        forecaster = DiskForecaster(half_life=None, reset_fraction=0.05)
+        for hour, used in enumerate([50, 60, 70, 40, 41]):
+            forecaster.update(HOST, [disk("/", used)], timestamp=hour * 3600.0)
+        assert forecaster.forecast(HOST, "/").bytes.rate * 3600 == pytest.approx(2 ** 30)
+
+    def test_history_and_forget(self):
+        """Test the bounded history of readings."""
+        forecaster = DiskForecaster(capacity=3)
+        for hour in range(5):
+            forecaster.update(HOST, [DiskPartition.from_dict(disk("/", 50 + hour))], timestamp=hour)
+        history = forecaster.history(HOST, "/")
+        assert list(history["timestamp"]) == [2.0, 3.0, 4.0]
+        assert history["size_used"][0] == 52 * 2 ** 30
+
+        forecaster.forget(HOST)
+        assert len(forecaster) == 0 and forecaster.history(HOST, "/") is None
+        assert DiskForecaster(capacity=0).update(HOST, [disk("/", 1)]) == 1
+
+    def test_track(self):
+        """Test that tracked clients feed disk readings."""
+        system = System(api_key="test_api_key", bt_panel_host=HOST)
+        forecaster = DiskForecaster()
+        forecaster.track(system)
+        with patch.object(system, '_post', return_value=[disk("/", 50), disk("/www", 10)]):
+            system.get_disk_info()
+        with patch.object(system, '_post', return_value={"cpu": [1, 2]}):
+            system.get_network()
+        assert len(forecaster) == 2
@@ -0,0 +1,55 @@
+"""Test cases for side-effect-free import of pybt."""
+
+import subprocess
+import sys
+
+
+def run_python(code):
+    """Run code in a fresh interpreter and return its stdout."""
+    return subprocess.run(
+        [sys.executable, "-c", code],
+        capture_output=True, text=True, check=True
+    ).stdout.strip()
+
+
+class TestImport:
+    """Test cases for lazy loading."""
+
+    def test_api_import_is_lazy(self):
+        """Test that importing API classes loads no third-party modules."""
+        out = run_python(
+            "import sys, logging\n"
+            "from pybt.api import System\n"
+            "print(sorted(m for m in ('requests', 'dotenv', 'urllib3', 'pybt.api.website') if m in sys.modules))\n"
+            "print([type(h).__name__ for h in logging.getLogger('pybt').handlers])\n"
+        )
+        assert out.splitlines() == ["[]", "['NullHandler']"]
+
+    def test_opt_in_features_are_lazy(self):
+        """Test that importing API classes loads no opt-in feature modules."""
+        out = run_python(
+            "import sys\n"
+            "from pybt.api import Panel, System\n"
+            "modules = ('batch', 'cache', 'metrics', 'retry', 'records')\n"
+            "print(sorted(m for m in modules if 'pybt.core.' + m in sys.modules))\n"
+            "print(sorted(m for m in ('columns', 'jsonstream') if 'pybt.utils.' + m in sys.modules))\n"
+        )
+        assert out.splitlines() == ["[]", "[]"]
+
+    def test_client_loads_dependencies(self):
+        """Test that creating a client loads requests and the .env file."""
+        out = run_python(
+            "import sys\n"
+            "from pybt.api import System\n"
+            "System(api_key='k', bt_panel_host='http://h')\n"
+            "print(sorted(m for m in ('requests', 'dotenv') if m in sys.modules))\n"
+        )
+        assert out == "['dotenv', 'requests']"
+
+    def test_unknown_attribute(self):
+        """Test that unknown names still raise AttributeError."""
+        out = run_python(
+            "import pybt.api\n"
+            "print(hasattr(pybt.api, 'Nope'), 'Panel' in dir(pybt.api))\n"
+        )
+        assert out == "False True"
@@ -0,0 +1,110 @@
+"""Test cases for the pluggable JSON backend."""
+
+import sys
+import pytest
+import requests
+from unittest.mock import MagicMock, patch
+from pybt.api import System
+from pybt.core.cache import ResponseCache
+from pybt.utils import jsonlib
+
+
+@pytest.fixture(autouse=True)
+def restore_backend():
+    """Restore the default backend after each test."""
+    yield
+    jsonlib.set_backend("json")
+
+
+@pytest.fixture
+def system():
+    """Create a System instance."""
+    return System(api_key="test_api_key", bt_panel_host="http://json.example.com")
+
+
+def make_response(content):
+    """Create a mock requests response with a raw body."""
+    response = MagicMock()
+    response.content = content
+    response.text = content.decode()
+    response.json.side_effect = AssertionError("response.json() should not be used")
+    return response
+
+
+class TestBackends:
+    """Test cases for backend selection."""
+
+    def test_default_is_stdlib(self, monkeypatch):
+        """Test that the stdlib is used unless configured otherwise."""
+        monkeypatch.delenv("BT_JSON_BACKEND", raising=False)
+        monkeypatch.setattr(jsonlib, "_backend", None)
+        assert jsonlib.get_backend().name == "json"
+
+    def test_environment(self, monkeypatch):
+        """Test selecting the backend through BT_JSON_BACKEND."""
+        pytest.importorskip("orjson")
+        monkeypatch.setenv("BT_JSON_BACKEND", "orjson")
+        monkeypatch.setattr(jsonlib, "_backend", None)
+        assert jsonlib.get_backend().name == "orjson"
+
+    def test_auto_falls_back(self):
+        """Test that auto skips libraries that are not installed."""
+        with patch.dict(sys.modules, {"orjson": None, "msgspec": None}):
+            assert jsonlib.set_backend("auto") == "json"
+
+    def test_errors(self):
+        """Test unknown and missing backends."""
+        with pytest.raises(ValueError):
+            jsonlib.set_backend("simplejson")
+        with patch.dict(sys.modules, {"msgspec": None}):
+            with pytest.raises(ImportError):
+                jsonlib.set_backend("msgspec")
+
+    @pytest.mark.parametrize("name", jsonlib.BACKENDS)
+    def test_round_trip(self, name):
+        """Test that every installed backend agrees on bytes in and out."""
+        if name != "json":
+            pytest.importorskip(name)
+        jsonlib.set_backend(name)
+        payload = {"b": [1, 2.5, None, True], "a": "中文", "n": {"x": "y"}}
+
+        assert jsonlib.loads('{"a": "中文"}'.encode()) == {"a": "中文"}
+        assert jsonlib.loads(jsonlib.dumps(payload)) == payload
+        assert jsonlib.dumps({"b": 1, "a": 2}, sort_keys=True) == b'{"a":2,"b":1}'
+        with pytest.raises(ValueError):
+            jsonlib.loads(b"{not json")
+
+
+    def test_content_hash_ignores_backend(self):
+        """Test that content hashes are stable across key order and backends."""
+        first = jsonlib.content_hash({"b": 1, "a": ["中文", None]})
+        jsonlib.set_backend("auto")
+        assert jsonlib.content_hash({"a": ["中文", None], "b": 1}) == first
+        assert jsonlib.content_hash({"a": 1}) != first
+
+
+class TestClientDecoding:
+    """Test cases for response decoding in Client."""
+
+    def test_decodes_bytes(self, system):
+        """Test that accelerated backends decode the raw body."""
+        pytest.importorskip("orjson")
+        jsonlib.set_backend("orjson")
+        with patch.object(system.session, 'post', return_value=make_response(b'{"cpu": [4, 12.5]}')):
+            assert system.get_network() == {"cpu": [4, 12.5]}
+
+    def test_invalid_body(self, system):
+        """Test that invalid JSON raises requests.JSONDecodeError as before."""
+        pytest.importorskip("orjson")
+        jsonlib.set_backend("orjson")
+        with patch.object(system.session, 'post', return_value=make_response(b"<html>502</html>")):
+            with pytest.raises(requests.JSONDecodeError):
+                system.get_network()
+
+    def test_cache_returns_copies(self):
+        """Test that cached values are decoded afresh on every hit."""
+        cache = ResponseCache()
+        cache.set("k", {"sites": [1, 2]}, ttl=60)
+        found, value = cache.get("k")
+        value["sites"].append(3)
+        assert cache.get("k") == (True, {"sites": [1, 2]})
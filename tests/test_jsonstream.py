@@ -0,0 +1,128 @@
+"""Test cases for streaming JSON decoding."""
+
+import json
+import pytest
+import requests
+from unittest.mock import MagicMock, patch
+from pybt.api import Rewrite, Website
+from pybt.utils.exceptions import ConnectionRefused
+from pybt.utils.jsonstream import JSONStream
+
+PAGE = {
+    "where": "",
+    "data": [
+        {"id": 3, "name": "a.com", "ps": "brackets ] } [ { and \"quotes\" \\ here"},
+        {"id": 2, "name": "中文.com", "ssl": -1, "tags": [1, [2, {"x": None}]]},
+        {"id": 1, "name": "b.com", "ssl": {"dns": ["*.b.com"], "endtime": 73}},
+        7,
+        "text",
+        True,
+    ],
+    "page": "<div><span class='Pcount'>共3条</span></div>",
+}
+
+CONTENT = "line 1\n\ttab \"quoted\" back\\slash é 中文 😀   end\n" * 50
+
+
+def chunked(body, size):
+    """Split bytes into chunks of the given size."""
+    return [body[i:i + size] for i in range(0, len(body), size)]
+
+
+def make_response(payload):
+    """Create a mock streamed requests response."""
+    body = json.dumps(payload).encode()
+    response = MagicMock()
+    response.iter_content.side_effect = lambda size: iter(chunked(body, size))
+    return response
+
+
+class TestJSONStream:
+    """Test cases for JSONStream class."""
+
+    @pytest.mark.parametrize("size", [1, 2, 3, 7, 64, 1 << 20])
+    def test_items(self, size):
+        """Test that array items decode identically at any chunk size."""
+        body = json.dumps(PAGE, ensure_ascii=False).encode()
+        stream = JSONStream(chunked(body, size))
+
+        assert list(stream.items()) == PAGE["data"]
+        assert stream.meta == {"where": "", "page": PAGE["page"]}
+
+    @pytest.mark.parametrize("ensure_ascii", [True, False])
+    @pytest.mark.parametrize("size", [1, 5, 13, 4096])
+    def test_text(self, size, ensure_ascii):
+        """Test that escapes, multi-byte characters and surrogate pairs survive chunking."""
+        body = json.dumps({"status": True, "data": CONTENT, "encoding": "utf-8"}, ensure_ascii=ensure_ascii)
+        stream = JSONStream(chunked(body.encode(), size), chunk_size=100)
+        pieces = list(stream.text())
+
+        assert "".join(pieces) == CONTENT
+        assert len(pieces) > 1 or size >= len(body)
+        assert stream.meta == {"status": True, "encoding": "utf-8"}
+
+    def test_value_decoded_once(self):
+        """Test that a value spanning many chunks is decoded once."""
+        row = {"id": 1, "ps": "x\\" * 500, "tags": [[{"a": "]"}]] * 50}
+        body = json.dumps({"data": [row, 12345]}).encode()
+        stream = JSONStream(chunked(body, 3))
+        decode = stream._decoder.raw_decode
+        with patch.object(stream._decoder, "raw_decode", side_effect=decode) as raw_decode:
+            assert list(stream.items()) == [row, 12345]
+        # The member name and the two items
+        assert raw_decode.call_count == 3
+
+    def test_missing_member(self):
+        """Test that a response without the member yields nothing."""
+        stream = JSONStream([b'{"status": false, "msg": "not found"}'])
+        assert list(stream.items()) == []
+        assert not stream.found
+        assert stream.meta == {"status": False, "msg": "not found"}
+
+    def test_top_level_array(self):
+        """Test streaming a bare array."""
+        assert list(JSONStream([b' [1, {"a": ', b'2}] '], key=None).items()) == [1, {"a": 2}]
+
+    def test_malformed(self):
+        """Test that truncated and mistyped bodies are rejected."""
+        with pytest.raises(ValueError):
+            list(JSONStream([b'{"data": [{"id": 1}, {"id": ']).items())
+        with pytest.raises(ValueError):
+            list(JSONStream([b'{"data": "text"}']).items())
+
+    def test_close(self):
+        """Test that the response is released when iteration stops early."""
+        close = MagicMock()
+        items = JSONStream([json.dumps(PAGE).encode()], close=close).items()
+        next(items)
+        items.close()
+        close.assert_called_once()
+
+
+class TestClientStreaming:
+    """Test cases for Client.stream_data."""
+
+    def test_stream_rows(self):
+        """Test streaming the rows of a table page."""
+        website = Website(api_key="test_api_key", bt_panel_host="http://stream.example.com")
+        response = make_response(PAGE)
+        with patch.object(website.session, 'post', return_value=response) as mock_post:
+            stream = website.stream_data(website.config.get_endpoint("Websites"), {"p": 1}, chunk_size=16)
+            assert [row["id"] for row in stream.items() if isinstance(row, dict)] == [3, 2, 1]
+
+        assert mock_post.call_args.kwargs["stream"] is True
+        response.iter_content.assert_called_once_with(16)
+        response.close.assert_called_once()
+
+    def test_iter_rewrite_content(self):
+        """Test streaming file content."""
+        rewrite = Rewrite(api_key="test_api_key", bt_panel_host="http://stream.example.com")
+        with patch.object(rewrite.session, 'post', return_value=make_response({"status": True, "data": CONTENT})):
+            assert "".join(rewrite.iter_rewrite_content("/www/wwwlogs/a.log", chunk_size=256)) == CONTENT
+
+    def test_connection_error(self):
+        """Test that connection failures raise ConnectionRefused."""
+        rewrite = Rewrite(api_key="test_api_key", bt_panel_host="http://stream-down.example.com")
+        with patch.object(rewrite.session, 'post', side_effect=requests.ConnectionError("down")):
+            with pytest.raises(ConnectionRefused):
+                rewrite.stream_data("/files?action=GetFileBody", {"path": "/a"})
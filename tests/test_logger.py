@@ -0,0 +1,103 @@
+"""Test cases for request logging."""
+
+import logging
+import pytest
+from unittest.mock import MagicMock, patch
+from pybt.api import Rewrite
+from pybt.utils.logger import LogSampler, redact
+
+
+def make_response(payload):
+    """Create a mock requests response returning payload."""
+    response = MagicMock()
+    response.json.return_value = payload
+    return response
+
+
+def make_rewrite(debug):
+    """Create a Rewrite instance with the given debug flag."""
+    return Rewrite(
+        api_key="test_api_key",
+        bt_panel_host="http://test.example.com",
+        debug=debug,
+        timeout=30,
+        verify_ssl=False
+    )
+
+
+class TestRedact:
+    """Test cases for redact function."""
+
+    def test_secrets_masked(self):
+        """Test that tokens and passwords are masked."""
+        data = {
+            "request_token": "abc",
+            "username": "admin",
+            "password": "secret",
+            "nested": {"ftp_password": "x", "id": 5},
+        }
+        assert redact(data) == {
+            "request_token": "***",
+            "username": "admin",
+            "password": "***",
+            "nested": {"ftp_password": "***", "id": 5},
+        }
+
+    def test_long_values_truncated(self):
+        """Test that large payloads are replaced by their size."""
+        assert redact({"data": "x" * 10000}) == {"data": "<10000 chars>"}
+        assert redact({"data": "short"}) == {"data": "short"}
+
+
+class TestLogSampler:
+    """Test cases for LogSampler class."""
+
+    def test_rate(self):
+        """Test that one in every 1/rate calls is sampled per key."""
+        sampler = LogSampler(rate=0.25)
+        assert [sampler.sample("a") for _ in range(8)] == [True, False, False, False] * 2
+        assert sampler.sample("b")
+
+    def test_bounds(self):
+        """Test that rates of 1 and 0 log everything and nothing."""
+        assert all(LogSampler(1.0).sample("a") for _ in range(5))
+        assert not any(LogSampler(0).sample("a") for _ in range(5))
+
+
+class TestClientLogging:
+    """Test cases for logging in Client.post_data."""
+
+    def test_debug_logs_redacted_request(self, caplog):
+        """Test that debug clients log redacted request data."""
+        rewrite = make_rewrite(debug=True)
+        caplog.set_level(logging.DEBUG, logger="pybt")
+        with patch.object(rewrite.session, 'post', return_value=make_response({"status": True})):
+            rewrite.save_rewrite_content("/www/rewrite.conf", "rewrite " * 1000)
+
+        records = [r for r in caplog.records if "Making POST request" in r.getMessage()]
+        assert len(records) == 1
+        assert records[0].endpoint == "SaveFileBody"
+        assert "<8000 chars>" in records[0].getMessage()
+
+    def test_no_formatting_when_debug_off(self, caplog):
+        """Test that request data is not formatted when debug is off."""
+        rewrite = make_rewrite(debug=False)
+        caplog.set_level(logging.DEBUG, logger="pybt")
+        with patch("pybt.utils.logger.redact") as mock_redact, \
+                patch.object(rewrite.session, 'post', return_value=make_response({"status": True})):
+            rewrite.save_rewrite_content("/www/rewrite.conf", "content")
+
+        mock_redact.assert_not_called()
+        assert not [r for r in caplog.records if "Making POST request" in r.getMessage()]
+
+    @pytest.mark.parametrize("rate,expected", [(1.0, 4), (0.5, 2)])
+    def test_sampling(self, caplog, rate, expected):
+        """Test that high-volume calls are sampled."""
+        rewrite = make_rewrite(debug=True)
+        rewrite.log_sampler.rate = rate
+        caplog.set_level(logging.DEBUG, logger="pybt")
+        with patch.object(rewrite.session, 'post', return_value=make_response({})):
+            for _ in range(4):
+                rewrite.get_rewrite_list("example.com")
+
+        assert len([r for r in caplog.records if "Making POST request" in r.getMessage()]) == expected
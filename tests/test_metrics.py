@@ -0,0 +1,151 @@
+"""Test cases for request hooks and the metrics registry."""
+
+import pytest
+import requests
+from unittest.mock import MagicMock, patch
+from pybt.api import Panel, System
+from pybt.core.metrics import Histogram, MetricsRegistry, RequestEvent
+from pybt.core.retry import CircuitBreaker, RetryPolicy
+from pybt.utils.exceptions import ConnectionRefused
+
+
+def make_response(payload, content=b'{"cpu": [1, 2]}', body="request_token=x&request_time=1"):
+    """Create a mock requests response."""
+    response = MagicMock()
+    response.json.return_value = payload
+    response.content = content
+    response.request.body = body
+    return response
+
+
+@pytest.fixture
+def registry():
+    """Create an empty metrics registry."""
+    return MetricsRegistry()
+
+
+@pytest.fixture
+def system(registry):
+    """Create a System instance recording metrics."""
+    return System(
+        api_key="test_api_key",
+        bt_panel_host="http://test.example.com",
+        retry_policy=RetryPolicy(max_retries=1, jitter=False),
+        circuit_breaker=CircuitBreaker(),
+        metrics=registry
+    )
+
+
+class TestHistogram:
+    """Test cases for Histogram class."""
+
+    def test_quantiles(self):
+        """Test quantile estimation by bucket interpolation."""
+        histogram = Histogram(buckets=(1, 2, 4))
+        for value in (0.5, 0.5, 1.5, 3, 10):
+            histogram.observe(value)
+
+        assert histogram.counts == [2, 1, 1, 1]
+        assert histogram.quantile(0.4) == pytest.approx(1.0)
+        assert histogram.quantile(0.5) == pytest.approx(1.5)
+        assert histogram.quantile(1.0) == 4
+        assert Histogram().quantile(0.5) == 0.0
+
+
+class TestHooks:
+    """Test cases for Client request hooks."""
+
+    def test_before_and_after_hooks(self, system):
+        """Test that hooks see the request and its outcome."""
+        seen = []
+        system.add_hook("before", lambda event: seen.append(("before", event.name, event.status)))
+        system.add_hook("after", lambda event: seen.append(("after", event.name, event.status)))
+        with patch.object(system.session, 'post', return_value=make_response({"cpu": [1, 2]})):
+            system.get_network()
+
+        assert seen == [("before", "GetNetWork", "pending"), ("after", "GetNetWork", "ok")]
+
+    def test_event_details(self, system):
+        """Test that sizes, retries and latency are reported."""
+        events = []
+        system.add_hook("after", events.append)
+        with patch.object(system.session, 'post') as mock_post:
+            mock_post.side_effect = [requests.ConnectionError("reset"), make_response({"cpu": [1, 2]})]
+            with patch("pybt.core.client.time.sleep"):
+                system.get_network()
+
+        event = events[0]
+        assert event.status == "ok"
+        assert event.retries == 1
+        assert event.request_bytes == len("request_token=x&request_time=1")
+        assert event.response_bytes == len(b'{"cpu": [1, 2]}')
+        assert event.latency > 0
+        assert event.result == {"cpu": [1, 2]}
+
+    def test_failure_reported(self, system):
+        """Test that failed calls reach after hooks with their error."""
+        events = []
+        system.add_hook("after", events.append)
+        with patch.object(system.session, 'post', side_effect=requests.ConnectionError("down")):
+            with pytest.raises(ConnectionRefused):
+                system.update_panel()
+
+        assert events[0].status == "error"
+        assert isinstance(events[0].error, ConnectionRefused)
+
+    def test_hook_errors_are_isolated(self, system):
+        """Test that a failing hook does not fail the request."""
+        system.add_hook("before", lambda event: 1 / 0)
+        with patch.object(system.session, 'post', return_value=make_response(0)):
+            assert system.get_task_count() == 0
+
+    def test_unknown_hook_kind(self, system):
+        """Test that unknown hook kinds are rejected."""
+        with pytest.raises(ValueError):
+            system.add_hook("during", print)
+
+
+class TestMetricsRegistry:
+    """Test cases for MetricsRegistry class."""
+
+    def test_records_client_requests(self, system, registry):
+        """Test that requests are counted per endpoint and outcome."""
+        with patch.object(system.session, 'post', return_value=make_response({})):
+            system.get_network()
+            system.get_network()
+            system.get_task_count()
+
+        assert registry.count(endpoint="GetNetWork") == 2
+        assert registry.count(host="http://test.example.com", status="ok") == 3
+        assert registry.histogram(endpoint="GetNetWork").count == 2
+        assert set(registry.quantiles()) == {"p50", "p95", "p99"}
+
+    def test_slowest(self, registry):
+        """Test ranking host/endpoint pairs by latency."""
+        registry.observe(RequestEvent("/a", "Fast", "http://p1", status="ok", latency=0.001))
+        registry.observe(RequestEvent("/b", "Slow", "http://p2", status="ok", latency=2.0))
+        assert [(h, e) for h, e, _ in registry.slowest(2)] == [("http://p2", "Slow"), ("http://p1", "Fast")]
+
+    def test_prometheus_export(self, registry):
+        """Test the Prometheus text exposition format."""
+        registry.observe(RequestEvent(
+            "/system?action=GetNetWork", "GetNetWork", "http://p1", status="ok",
+            latency=0.02, request_bytes=10, response_bytes=300, retries=1
+        ))
+        registry.observe(RequestEvent("/x", "GetNetWork", "http://p1", status="cache_hit"))
+        text = registry.to_prometheus()
+
+        assert "# TYPE pybt_request_duration_seconds histogram" in text
+        assert 'pybt_request_duration_seconds_bucket{host="http://p1",endpoint="GetNetWork",le="0.01"} 0' in text
+        assert 'pybt_request_duration_seconds_bucket{host="http://p1",endpoint="GetNetWork",le="0.025"} 1' in text
+        assert 'pybt_request_duration_seconds_bucket{host="http://p1",endpoint="GetNetWork",le="+Inf"} 1' in text
+        assert 'pybt_request_duration_seconds_count{host="http://p1",endpoint="GetNetWork"} 1' in text
+        assert 'pybt_requests_total{host="http://p1",endpoint="GetNetWork",status="cache_hit"} 1' in text
+        assert 'pybt_response_bytes_total{host="http://p1",endpoint="GetNetWork"} 300' in text
+        assert 'pybt_request_retries_total{host="http://p1",endpoint="GetNetWork"} 1' in text
+
+    def test_panel_shares_registry(self, registry):
+        """Test that every API object of a panel reports to one registry."""
+        panel = Panel(api_key="test_api_key", bt_panel_host="http://metrics.example.com", metrics=registry)
+        assert panel.website.metrics is registry
+        assert registry.observe in panel.domain.hooks["after"]
@@ -0,0 +1,135 @@
+"""Test cases for the local SQLite mirror."""
+
+import pytest
+from unittest.mock import patch
+from pybt.api import Website
+from pybt.core.mirror import PanelMirror, default_path
+from pybt.utils.exceptions import ClientException
+
+
+class FakePanel:
+    """Serve getData table pages from in-memory rows, newest first."""
+
+    def __init__(self, client):
+        self.client = client
+        self.tables = {"sites": [], "domain": [], "backup": []}
+        self.requests = []
+
+    def post(self, endpoint, data=None, name=None, event=None):
+        if "table=" not in endpoint:
+            return {"status": True, "msg": "ok"}
+        table = endpoint.rsplit("table=", 1)[1]
+        self.requests.append((table, data["p"]))
+        rows = sorted(self.tables[table], key=lambda row: row["id"], reverse=True)
+        start = (data["p"] - 1) * data["limit"]
+        return {
+            "data": [dict(row) for row in rows[start:start + data["limit"]]],
+            "page": f"<div><span class='Pcount'>共{len(rows)}条</span></div>",
+        }
+
+    def pages(self, table):
+        return [page for t, page in self.requests if t == table]
+
+
+@pytest.fixture
+def website():
+    """Create a Website instance."""
+    return Website(api_key="test_api_key", bt_panel_host="http://mirror.example.com")
+
+
+@pytest.fixture
+def panel(website):
+    """Create a fake panel with 25 sites behind the website client."""
+    fake = FakePanel(website)
+    fake.tables["sites"] = [
+        {"id": i, "name": f"site{i}.com", "status": "1", "addtime": f"2024-01-{i:02d}"}
+        for i in range(1, 26)
+    ]
+    fake.tables["domain"] = [{"id": i, "pid": i, "name": f"site{i}.com", "port": 80} for i in range(1, 26)]
+    with patch.object(website, '_post', side_effect=fake.post):
+        yield fake
+
+
+@pytest.fixture
+def mirror(website, tmp_path):
+    """Create a mirror in a temporary file."""
+    with PanelMirror(website, path=str(tmp_path / "panel.sqlite3"), page_size=10, window=2) as m:
+        yield m
+
+
+class TestPanelMirror:
+    """Test cases for PanelMirror class."""
+
+    def test_initial_sync(self, mirror, panel):
+        """Test that the first refresh copies every row."""
+        stats = {s.table: s for s in mirror.refresh()}
+
+        assert stats["sites"].inserted == 25
+        assert stats["sites"].full
+        assert stats["backup"].inserted == 0
+        assert mirror.count("sites") == 25
+        assert mirror.count("domain") == 25
+        assert mirror.get("sites", 7)["name"] == "site7.com"
+        assert [row["id"] for row in mirror.rows("domain", port=80, limit=2)] == [25, 24]
+        assert mirror.last_refresh("sites") is not None
+
+    def test_unchanged_refresh_fetches_one_page(self, mirror, panel):
+        """Test that an unchanged table costs a single page."""
+        mirror.refresh()
+        panel.requests.clear()
+
+        stats = mirror.refresh_table("sites")
+        assert panel.pages("sites") == [1]
+        assert (stats.inserted, stats.updated, stats.deleted) == (0, 0, 0)
+
+    def test_new_and_changed_rows(self, mirror, panel):
+        """Test that new rows on the first page are picked up incrementally."""
+        mirror.refresh()
+        panel.tables["sites"].append({"id": 26, "name": "new.com", "status": "1", "addtime": "2024-02-01"})
+        panel.tables["sites"][23]["status"] = "0"
+        panel.requests.clear()
+
+        stats = mirror.refresh_table("sites")
+        assert panel.pages("sites") == [1, 2]
+        assert (stats.inserted, stats.updated) == (1, 1)
+        assert mirror.rows("sites", status="0")[0]["id"] == 24
+
+    def test_deleted_rows(self, mirror, panel):
+        """Test that a count mismatch walks the table and drops deleted rows."""
+        mirror.refresh()
+        del panel.tables["sites"][0]
+
+        stats = mirror.refresh_table("sites")
+        assert stats.deleted == 1
+        assert mirror.get("sites", 1) is None
+        assert mirror.count("sites") == 24
+
+    @pytest.mark.parametrize("full", [False, True])
+    def test_error_response_keeps_rows(self, mirror, panel, website, full):
+        """Test that a panel error never empties the mirror."""
+        mirror.refresh()
+        with patch.object(website, '_post', return_value={"status": False, "msg": "IP verification failed"}):
+            with pytest.raises(ClientException):
+                mirror.refresh_table("sites", full=full)
+        assert mirror.count("sites") == 25
+
+    def test_mutation_marks_table_dirty(self, mirror, panel, website):
+        """Test that mutating calls through the client force a full refresh."""
+        mirror.refresh()
+        website.delete_website(1, "site1.com")
+        panel.requests.clear()
+
+        stats = mirror.refresh_table("sites")
+        assert stats.full
+        assert sorted(panel.pages("sites")) == [1, 2, 3]
+
+    def test_filters_validated(self, mirror):
+        """Test that only indexed columns can be filtered on."""
+        with pytest.raises(ValueError):
+            mirror.rows("sites", ps="x")
+        with pytest.raises(ValueError):
+            mirror.count("databases")
+
+    def test_default_path(self):
+        """Test that each panel gets its own file."""
+        assert default_path("https://10.0.0.1:8888/").endswith("https_10_0_0_1_8888.sqlite3")
@@ -0,0 +1,128 @@
+"""Test cases for pagination helpers."""
+
+import asyncio
+import threading
+import time
+import pytest
+from pybt.utils.exceptions import ClientException
+from pybt.utils.pagination import apaginate, page_count, paginate, parse_total
+
+
+class TestParseTotal:
+    """Test cases for parse_total function."""
+
+    @pytest.mark.parametrize("page_html,expected", [
+        ("<div><span class='Pcurrent'>1</span><span class='Pcount'>Total: 42</span></div>", 42),
+        ("<div><span class='Pcurrent'>1</span><span class='Pcount'>共1234条</span></div>", 1234),
+        ('<span class="Pcount">7</span>', 7),
+        ("<div><span class='Pcurrent'>1</span></div>", None),
+        (None, None),
+    ])
+    def test_formats(self, page_html, expected):
+        """Test English, Chinese and missing pager counts."""
+        assert parse_total(page_html) == expected
+
+    def test_page_count(self):
+        """Test rounding row counts up to whole pages."""
+        assert [page_count(n, 10) for n in (0, 1, 10, 11)] == [0, 1, 1, 2]
+
+
+class TestPaginate:
+    """Test cases for paginate function."""
+
+    def test_stops_on_short_page_without_total(self):
+        """Test that a short page ends iteration when the pager has no count."""
+        pages = {1: {"data": [1, 2]}, 2: {"data": [3]}}
+        fetched = []
+
+        def fetch(page):
+            fetched.append(page)
+            return pages[page]
+
+        assert list(paginate(fetch, limit=2)) == [1, 2, 3]
+        assert fetched == [1, 2]
+
+    def test_empty_table(self):
+        """Test that an empty first page yields nothing."""
+        assert list(paginate(lambda page: {"data": [], "page": ""}, limit=10)) == []
+
+    def test_prefetch_in_order(self):
+        """Test that prefetched pages are yielded in page order."""
+        def fetch(page):
+            # Later pages answer first
+            time.sleep(0.01 * (10 - page))
+            return {"data": [page * 10, page * 10 + 1], "page": "<span class='Pcount'>Total: 19</span>"}
+
+        rows = list(paginate(fetch, limit=2, window=4))
+        assert rows == [n for page in range(1, 11) for n in (page * 10, page * 10 + 1)]
+
+    def test_prefetch_window_bounded(self):
+        """Test that no more than window pages are in flight."""
+        lock = threading.Lock()
+        state = {"active": 0, "peak": 0}
+
+        def fetch(page):
+            with lock:
+                state["active"] += 1
+                state["peak"] = max(state["peak"], state["active"])
+            time.sleep(0.01)
+            with lock:
+                state["active"] -= 1
+            return {"data": [page], "page": "<span class='Pcount'>Total: 20</span>"}
+
+        assert list(paginate(fetch, limit=1, window=3)) == list(range(1, 21))
+        assert state["peak"] <= 3
+
+    def test_prefetch_stops_early(self):
+        """Test that closing the iterator stops requesting pages."""
+        fetched = []
+
+        def fetch(page):
+            fetched.append(page)
+            return {"data": [page], "page": "<span class='Pcount'>Total: 1000</span>"}
+
+        rows = paginate(fetch, limit=1, window=2)
+        assert [next(rows) for _ in range(3)] == [1, 2, 3]
+        rows.close()
+        assert max(fetched) <= 5
+
+    def test_error_page_raises(self):
+        """Test that a panel error is not mistaken for the end of the table."""
+        pages = {
+            1: {"data": [1, 2], "page": "<span class='Pcount'>Total: 6</span>"},
+            2: {"status": False, "msg": "IP verification failed"},
+        }
+        rows = paginate(lambda page: pages[page], limit=2)
+        assert next(rows) == 1 and next(rows) == 2
+        with pytest.raises(ClientException, match="IP verification failed"):
+            next(rows)
+        with pytest.raises(ClientException):
+            list(paginate(lambda page: {"page": ""}, limit=2, window=3))
+
+
+class TestApaginate:
+    """Test cases for apaginate function."""
+
+    def test_rows_in_order(self):
+        """Test sequential and windowed async pagination."""
+        async def fetch(page):
+            await asyncio.sleep(0.001 * (5 - page))
+            return {"data": [page * 10, page * 10 + 1], "page": "<span class='Pcount'>Total: 9</span>"}
+
+        async def collect(window):
+            return [row async for row in apaginate(fetch, limit=2, window=window)]
+
+        expected = [n for page in range(1, 6) for n in (page * 10, page * 10 + 1)]
+        assert asyncio.run(collect(1)) == expected
+        assert asyncio.run(collect(3)) == expected
+
+    def test_error_page_raises(self):
+        """Test that a failed page raises."""
+        async def fetch(page):
+            return {"status": False, "msg": "denied"}
+
+        async def collect():
+            return [row async for row in apaginate(fetch, limit=2)]
+
+        with pytest.raises(ClientException, match="denied"):
+            asyncio.run(collect())
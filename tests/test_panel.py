@@ -0,0 +1,82 @@
+"""Test cases for the Panel facade and shared transport."""
+
+import pytest
+from unittest.mock import patch
+from pybt.api import Panel, System, Website, Domain
+from pybt.core.transport import TransportRegistry, registry, normalize_host
+
+
+@pytest.fixture
+def panel():
+    """Create a Panel instance with mocked config."""
+    return Panel(
+        api_key="test_api_key",
+        bt_panel_host="http://test.example.com",
+        debug=False,
+        timeout=30,
+        verify_ssl=False
+    )
+
+
+class TestTransportRegistry:
+    """Test cases for TransportRegistry."""
+
+    def test_normalize_host(self):
+        """Test that equivalent host URLs map to the same key."""
+        assert normalize_host("HTTP://Test.Example.com:8888/") == "http://test.example.com:8888"
+        assert normalize_host("http://test.example.com:8888") == "http://test.example.com:8888"
+
+    def test_same_host_shares_session(self):
+        """Test that one session is returned per host."""
+        transports = TransportRegistry()
+        first = transports.get_session("http://a.example.com")
+        second = transports.get_session("http://a.example.com/")
+        other = transports.get_session("http://b.example.com")
+
+        assert first is second
+        assert first is not other
+        transports.close()
+
+    def test_pool_size_grows(self):
+        """Test that asking for a larger pool re-mounts and closes the adapter."""
+        transports = TransportRegistry()
+        session = transports.get_session("http://a.example.com", pool_size=4)
+        assert session.get_adapter("http://a.example.com")._pool_maxsize == 4
+
+        old = session.get_adapter("http://a.example.com")
+        with patch.object(old, 'close') as close:
+            transports.get_session("http://a.example.com", pool_size=16)
+        close.assert_called_once_with()
+        assert transports.pool_size("http://a.example.com") == 16
+        assert session.get_adapter("http://a.example.com")._pool_maxsize == 16
+
+        transports.get_session("http://a.example.com", pool_size=2)
+        assert transports.pool_size("http://a.example.com") == 16
+        transports.close()
+
+
+class TestPanel:
+    """Test cases for Panel class."""
+
+    def test_clients_share_session(self, panel):
+        """Test that every API object of a panel uses one session."""
+        assert isinstance(panel.system, System)
+        assert isinstance(panel.website, Website)
+        assert isinstance(panel.domain, Domain)
+        assert panel.website.session is panel.system.session
+        assert panel.domain.session is panel.session
+        assert panel.website is panel.website
+
+    def test_separate_clients_share_session(self):
+        """Test that independently built clients of one host share a session."""
+        system = System(api_key="test_api_key", bt_panel_host="http://shared.example.com")
+        website = Website(api_key="test_api_key", bt_panel_host="http://shared.example.com")
+
+        assert system.session is website.session
+        assert system.session is registry.get_session("http://shared.example.com")
+
+    def test_panel_call(self, panel):
+        """Test that API calls go through the facade objects."""
+        with patch.object(panel.system, 'post_data', return_value={"cpu": [1.0, 2]}) as mock_post:
+            assert panel.system.get_network() == {"cpu": [1.0, 2]}
+            mock_post.assert_called_once_with(panel.config.get_endpoint("GetNetWork"))
@@ -0,0 +1,128 @@
+"""Test cases for counter rates."""
+
+import math
+import pytest
+from unittest.mock import patch
+from pybt.api import NetworkSample
+from pybt.core.sampler import RingBuffer
+from pybt.utils.rates import RateEngine, Rates, counter_rate, network_rates, rate_series
+
+
+@pytest.fixture(params=[False, True], ids=["python", "numpy"])
+def use_numpy(request):
+    """Run a test with the Python loop and, if installed, NumPy."""
+    if request.param:
+        pytest.importorskip("numpy")
+    return request.param
+
+
+def sample(timestamp, up, down=0, up_packets=0, down_packets=0):
+    """Build a get_network style response with a timestamp."""
+    return {
+        "timestamp": timestamp, "upTotal": up, "downTotal": down,
+        "upPackets": up_packets, "downPackets": down_packets,
+    }
+
+
+class TestRateSeries:
+    """Test cases for rate_series and network_rates."""
+
+    def test_counter_rate(self):
+        """Test rates, resets and unusable intervals."""
+        assert counter_rate(100, 300, 2) == (100.0, False)
+        assert counter_rate(1000, 50, 5) == (10.0, True)
+        assert math.isnan(counter_rate(100, 300, 0)[0])
+        assert math.isnan(counter_rate(float("nan"), 300, 1)[0])
+
+    def test_irregular_intervals_and_resets(self):
+        """Test that each rate uses its own interval and survives resets."""
+        rates = rate_series([0, 1, 3, 4, 10], [0, 100, 300, 40, 100])
+        assert math.isnan(rates[0])
+        assert list(rates)[1:] == [100.0, 100.0, 40.0, 10.0]
+
+    def test_smoothing(self):
+        """Test that smoothing weighs each rate by its interval."""
+        rates = rate_series([0, 1, 2, 12], [0, 100, 300, 300], half_life=10)
+        assert rates[1] == 100.0
+        assert rates[2] == pytest.approx(100 + (1 - 0.5 ** 0.1) * 100)
+        assert rates[3] == pytest.approx(rates[2] * 0.5)
+
+    def test_network_rates(self):
+        """Test rates from a ring buffer read."""
+        ring = RingBuffer(10)
+        for t, total in [(0, 0), (5, 5000), (10, 15000)]:
+            ring.append(NetworkSample.from_dict(sample(t, total, total * 2), timestamp=t))
+        columns = network_rates(ring.read())
+        assert list(columns["up_bytes"])[1:] == [1000.0, 2000.0]
+        assert list(columns["down_bytes"])[1:] == [2000.0, 4000.0]
+        assert columns.length == 3
+
+
+class TestRateEngine:
+    """Test cases for RateEngine class."""
+
+    def test_rates_per_panel(self, use_numpy):
+        """Test raw rates of several panels updated together."""
+        engine = RateEngine(half_life=None, numpy=use_numpy)
+        first = engine.update({"a": sample(0, 0), "b": sample(0, 0, 0, 0, 0)})
+        assert math.isnan(first["a"].up_bytes)
+
+        rates = engine.update({"a": sample(10, 1000, 500, 20, 10), "b": sample(4, 400)})
+        assert rates["a"] == Rates(100.0, 50.0, 2.0, 1.0, False)
+        assert rates["b"].up_bytes == 100.0
+        assert engine.rates("a") == Rates(100.0, 50.0, 2.0, 1.0)
+        assert len(engine) == 2
+
+    def test_reset_and_stale_samples(self, use_numpy):
+        """Test counter resets and ignoring repeated samples."""
+        engine = RateEngine(half_life=None, numpy=use_numpy)
+        engine.update({"a": sample(0, 5000)})
+        reset = engine.update({"a": sample(10, 300)})["a"]
+        assert reset.reset and reset.up_bytes == 30.0
+
+        repeated = engine.update({"a": sample(10, 999999)})["a"]
+        assert not repeated.reset and repeated.up_bytes == 30.0
+        assert engine.update({"a": sample(20, 600)})["a"].up_bytes == 30.0
+
+    def test_smoothing_and_gaps(self, use_numpy):
+        """Test EWMA smoothing and restarting it after a long gap."""
+        engine = RateEngine(half_life=10, max_gap=60, numpy=use_numpy)
+        engine.update({"a": sample(0, 0)})
+        assert engine.update({"a": sample(10, 1000)})["a"].up_bytes == 100.0
+        assert engine.update({"a": sample(20, 4000)})["a"].up_bytes == pytest.approx(200.0)
+        assert engine.update({"a": sample(200, 4000)})["a"].up_bytes == 0.0
+
+    def test_records_missing_values_and_forget(self, use_numpy):
+        """Test records, missing counters and reusing a forgotten slot."""
+        engine = RateEngine(half_life=None, numpy=use_numpy)
+        engine.update({"a": NetworkSample.from_dict(sample(0, 0, 0), timestamp=0)})
+        partial = {"upTotal": 100}
+        rates = engine.update({"a": NetworkSample.from_dict(partial, timestamp=1)})["a"]
+        assert rates.up_bytes == 100.0 and math.isnan(rates.down_bytes)
+
+        engine.forget("a")
+        assert "a" not in engine and engine.rates("a") is None
+        engine.update({"b": sample(0, 0)}, timestamp=0)
+        assert engine.update({"b": sample(None, 50)}, timestamp=1)["b"].up_bytes == 50.0
+
+    def test_numpy_matches_python(self):
+        """Test that both update paths agree."""
+        pytest.importorskip("numpy")
+        engines = [RateEngine(half_life=15, max_gap=30, numpy=flag) for flag in (False, True)]
+        ticks = [
+            {"a": sample(0, 0, 0), "b": sample(0, 10, 10)},
+            {"a": sample(5, 500, 100), "b": sample(3, 5, 40)},
+            {"a": sample(50, 900, None), "b": sample(3, 50, 50)},
+            {"a": sample(55, 1400, 300), "b": sample(9, 80, 90)},
+        ]
+        for tick in ticks:
+            python, vectorized = (engine.update(tick) for engine in engines)
+            for key in tick:
+                for x, y in zip(python[key], vectorized[key]):
+                    assert x == pytest.approx(y, nan_ok=True)
+
+    def test_numpy_required(self):
+        """Test that numpy=True fails with the install hint when NumPy is missing."""
+        with patch.dict("sys.modules", {"numpy": None}):
+            with pytest.raises(ImportError, match=r"bt-python-sdk\[numpy\]"):
+                RateEngine(numpy=True)
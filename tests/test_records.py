@@ -0,0 +1,221 @@
+"""Test cases for compact listing records."""
+
+import asyncio
+import json
+import pickle
+import tracemalloc
+import pytest
+from unittest.mock import AsyncMock, patch
+from pybt.api import AsyncWebsite, Domain, System, Website
+from pybt.api.records import (
+    Backup, Certificate, DiskPartition, DomainEntry, NetworkSample, Site, parse_percent, parse_size
+)
+
+SITE = {
+    "id": 7, "name": "a.com", "path": "/www/wwwroot/a.com", "status": "1",
+    "ps": "shop", "addtime": "2024-01-01 00:00:00", "edate": "0000-00-00",
+    "type_id": 0, "backup_count": 2, "domain": 1, "php_version": "74",
+    "ssl": {
+        "issuer": "R3", "subject": "a.com", "notBefore": "2024-12-09",
+        "notAfter": "2025-03-09", "endtime": 73, "dns": ["a.com"],
+    },
+}
+
+NETWORK = {
+    "downTotal": 446326699, "upTotal": 77630707, "downPackets": 1519428, "upPackets": 175326,
+    "down": 36.22, "up": 72.81, "cpu": [1.87, 6],
+    "mem": {"memFree": 189, "memTotal": 1741, "memCached": 722, "memBuffers": 139, "memRealUsed": 691},
+    "load": {"max": 12, "safe": 9.0, "one": 0.01, "five": 0.02, "limit": 12, "fifteen": 0.05},
+}
+
+
+def make_client(api_class, records=True):
+    """Create an API object in records mode."""
+    return api_class(api_key="test_api_key", bt_panel_host="http://records.example.com", records=records)
+
+
+class TestParsers:
+    """Test cases for size and percentage parsing."""
+
+    @pytest.mark.parametrize("value, expected", [
+        ("8.3G", int(8.3 * (1 << 30))),
+        ("512M", 512 << 20),
+        ("1.5T", int(1.5 * (1 << 40))),
+        ("301K", 301 << 10),
+        ("8675328", 8675328),
+        ("4 GiB", 4 << 30),
+        (1024, 1024),
+        ("", None),
+        ("-", None),
+        (None, None),
+    ])
+    def test_parse_size(self, value, expected):
+        """Test converting df-style sizes to bytes."""
+        assert parse_size(value) == expected
+
+    def test_parse_percent(self):
+        """Test converting percentages to floats."""
+        assert parse_percent("49%") == 49.0
+        assert parse_percent(12.5) == 12.5
+        assert parse_percent("n/a") is None
+
+
+class TestRecord:
+    """Test cases for Record classes."""
+
+    def test_round_trip(self):
+        """Test that a row survives decoding and to_dict, extra keys included."""
+        row = dict(SITE, project_type="PHP")
+        site = Site.from_dict(row)
+
+        assert site.name == "a.com"
+        assert isinstance(site.ssl, Certificate) and site.ssl.endtime == 73
+        assert site.extra == {"project_type": "PHP"}
+        assert site.to_dict() == row
+        assert Site.from_dict(SITE).extra is None
+
+    def test_dict_access(self):
+        """Test that records can be read like the dictionaries they replace."""
+        site = Site.from_dict(dict(SITE, project_type="PHP"))
+
+        assert site["id"] == 7
+        assert site["project_type"] == "PHP"
+        assert site.get("missing", "x") == "x"
+        assert "name" in site and "missing" not in site
+        with pytest.raises(KeyError):
+            site["missing"]
+
+    def test_no_instance_dict(self):
+        """Test that records carry no per-instance dictionary."""
+        site = Site.from_dict(SITE)
+        assert not hasattr(site, "__dict__")
+        with pytest.raises(AttributeError):
+            site.unknown = 1
+
+    def test_interned_columns(self):
+        """Test that low-cardinality columns share one string object."""
+        rows = json.loads(json.dumps([SITE, dict(SITE, id=8)]))
+        first, second = Site.from_rows(rows)
+
+        assert first.php_version is second.php_version
+        assert first.edate is second.edate
+        assert first.ssl.issuer is second.ssl.issuer
+
+    def test_pickle_and_equality(self):
+        """Test that records pickle and compare by value."""
+        backup = Backup(id=1, pid=7, name="a.tar.gz", size=1024)
+
+        assert pickle.loads(pickle.dumps(backup)) == backup
+        assert backup != Backup(id=2)
+        assert DomainEntry(id=1) != Backup(id=1)
+
+    def test_from_rows_is_lazy(self):
+        """Test that rows are decoded only as they are consumed."""
+        def rows():
+            yield dict(SITE)
+            raise AssertionError("read too far")
+
+        assert next(Site.from_rows(rows())).id == 7
+
+    def test_disk_partition(self):
+        """Test that disk sizes are parsed to bytes and percentages."""
+        disk = DiskPartition.from_dict({
+            "path": "/www", "filesystem": "/dev/vdb1", "type": "ext4",
+            "inodes": ["655360", "295093", "360267", "46%"],
+            "size": ["9.8G", "3.7G", "5.6G", "40%"],
+        })
+
+        assert disk.path == "/www"
+        assert disk.size_total == int(9.8 * (1 << 30))
+        assert disk.size_usage == 40.0
+        assert disk.inodes_used == 295093
+        assert disk.extra is None
+
+    def test_network_sample(self):
+        """Test that a network reading is flattened to numbers."""
+        sample = NetworkSample.from_dict(NETWORK, timestamp=100.0)
+
+        assert sample.timestamp == 100.0
+        assert sample.down_total == 446326699
+        assert sample.cpu_percent == 1.87
+        assert sample.cpu_count == 6
+        assert sample.mem_used == 691
+        assert sample.load_fifteen == 0.05
+
+    def test_memory(self):
+        """Test that records take far less memory than the decoded rows."""
+        payload = json.dumps([dict(SITE, id=i, name=f"site{i}.com") for i in range(2000)])
+
+        def measure(decode):
+            tracemalloc.start()
+            try:
+                rows = decode(json.loads(payload))
+                return tracemalloc.get_traced_memory()[0], rows
+            finally:
+                tracemalloc.stop()
+
+        dict_size, _ = measure(lambda rows: rows)
+        record_size, _ = measure(lambda rows: list(Site.from_rows(rows)))
+        assert record_size < dict_size * 0.6
+
+
+class TestRecordsMode:
+    """Test cases for the records option of API clients."""
+
+    def test_default_returns_dicts(self):
+        """Test that rows stay dictionaries unless records mode is on."""
+        website = make_client(Website, records=False)
+        with patch.object(website, 'post_data', return_value={"data": [SITE], "page": ""}):
+            assert website.get_website_list()["data"] == [SITE]
+
+    def test_website_list(self):
+        """Test that listing rows are returned as records."""
+        website = make_client(Website)
+        with patch.object(website, 'post_data', return_value={"data": [dict(SITE)], "page": "共1条"}):
+            result = website.get_website_list()
+
+        assert result["data"] == [Site.from_dict(SITE)]
+        assert result["page"] == "共1条"
+
+    def test_iter_websites(self):
+        """Test that iterating a listing yields records."""
+        website = make_client(Website)
+        page = {"data": [dict(SITE)], "page": "<span class='Pcount'>共1条</span>"}
+        with patch.object(website, 'post_data', return_value=page):
+            assert [type(site) for site in website.iter_websites()] == [Site]
+
+    def test_domains(self):
+        """Test that domain rows are returned as records."""
+        domain = make_client(Domain)
+        row = {"id": 1, "pid": 7, "name": "a.com", "port": 80, "addtime": "2024-01-01"}
+        with patch.object(domain, 'post_data', return_value=[row]):
+            assert domain.get_domain_list(7) == [DomainEntry(**row)]
+
+    def test_error_response_unchanged(self):
+        """Test that error responses pass through records mode."""
+        system = make_client(System)
+        error = {"status": False, "msg": "invalid key"}
+        with patch.object(system, 'post_data', return_value=error):
+            assert system.get_network() == error
+            assert system.get_disk_info() == error
+
+    def test_system(self):
+        """Test that system readings are returned as records."""
+        system = make_client(System)
+        with patch.object(system, 'post_data', return_value=NETWORK):
+            assert system.get_network().mem_total == 1741
+        with patch.object(system, 'post_data', return_value=[{"path": "/", "size": ["8.3G", "4.0G", "4.3G", "49%"]}]):
+            assert system.get_disk_info()[0].size_usage == 49.0
+
+    def test_async(self):
+        """Test that async clients convert after the response resolves."""
+        website = make_client(AsyncWebsite)
+        with patch.object(website, 'post_data', AsyncMock(return_value={"data": [dict(SITE)]})):
+            result = asyncio.run(website.get_website_list())
+        assert result["data"][0].name == "a.com"
+
+    def test_panel_option(self):
+        """Test that Panel passes records mode to every API object."""
+        from pybt.api import Panel
+        panel = Panel(api_key="test_api_key", bt_panel_host="http://records-panel.example.com", records=True)
+        assert panel.website.config.records and panel.system.config.records
@@ -0,0 +1,171 @@
+"""Test cases for retries and the circuit breaker."""
+
+import pytest
+import requests
+from unittest.mock import MagicMock, patch
+from pybt.api import System, Website
+from pybt.core.retry import CircuitBreaker, RetryPolicy, breakers
+from pybt.utils.exceptions import ConnectionRefused, EmptyResponse
+
+
+def make_response(payload=None, status_code=200, content=b'{}'):
+    """Create a mock requests response."""
+    response = MagicMock()
+    response.status_code = status_code
+    response.content = content
+    response.json.return_value = payload
+    if status_code >= 400:
+        response.raise_for_status.side_effect = requests.HTTPError(response=response)
+    return response
+
+
+@pytest.fixture
+def system():
+    """Create a System instance with its own circuit breaker."""
+    return System(
+        api_key="test_api_key",
+        bt_panel_host="http://test.example.com",
+        retry_policy=RetryPolicy(max_retries=2, jitter=False),
+        circuit_breaker=CircuitBreaker(failure_threshold=3, recovery_timeout=30)
+    )
+
+
+@pytest.fixture(autouse=True)
+def no_sleep():
+    """Skip backoff delays."""
+    with patch("pybt.core.client.time.sleep") as mock_sleep:
+        yield mock_sleep
+
+
+class TestRetryPolicy:
+    """Test cases for RetryPolicy class."""
+
+    def test_exponential_backoff(self):
+        """Test that delays double up to the maximum."""
+        policy = RetryPolicy(backoff_factor=0.5, max_backoff=3, jitter=False)
+        assert [policy.backoff(a) for a in range(4)] == [0.5, 1.0, 2.0, 3]
+
+    def test_jitter(self):
+        """Test that jittered delays stay within the exponential bound."""
+        policy = RetryPolicy(backoff_factor=1, jitter=True)
+        assert all(0 <= policy.backoff(2) <= 4 for _ in range(50))
+
+    def test_only_idempotent_by_default(self):
+        """Test that mutations are not retried unless allowed."""
+        assert RetryPolicy().should_retry(0, idempotent=True)
+        assert not RetryPolicy().should_retry(0, idempotent=False)
+        assert RetryPolicy(retry_mutations=True).should_retry(0, idempotent=False)
+        assert not RetryPolicy(max_retries=2).should_retry(2, idempotent=True)
+
+
+class TestCircuitBreaker:
+    """Test cases for CircuitBreaker class."""
+
+    def test_state_transitions(self):
+        """Test closed -> open -> half open -> closed."""
+        breaker = CircuitBreaker(failure_threshold=2, recovery_timeout=10)
+        with patch("pybt.core.retry.time.monotonic", return_value=100.0):
+            breaker.record_failure()
+            assert breaker.allow()
+            breaker.record_failure()
+            assert breaker.state == CircuitBreaker.OPEN
+            assert not breaker.allow()
+        with patch("pybt.core.retry.time.monotonic", return_value=111.0):
+            assert breaker.state == CircuitBreaker.HALF_OPEN
+            assert breaker.allow()
+            assert not breaker.allow()
+            breaker.record_success()
+            assert breaker.state == CircuitBreaker.CLOSED
+
+    def test_failed_trial_reopens(self):
+        """Test that a failed trial request re-opens the circuit."""
+        breaker = CircuitBreaker(failure_threshold=1, recovery_timeout=10)
+        with patch("pybt.core.retry.time.monotonic", return_value=100.0):
+            breaker.record_failure()
+        with patch("pybt.core.retry.time.monotonic", return_value=111.0):
+            assert breaker.allow()
+            breaker.record_failure()
+            assert not breaker.allow()
+
+    def test_registry_shares_breaker_per_host(self):
+        """Test that clients opting in share the circuit breaker of their host."""
+        first = System(api_key="test_api_key", bt_panel_host="http://breaker.example.com", circuit_breaker=True)
+        second = Website(api_key="test_api_key", bt_panel_host="http://breaker.example.com/", circuit_breaker=True)
+        assert first.circuit_breaker is second.circuit_breaker
+        assert first.circuit_breaker is breakers.get_breaker("http://breaker.example.com")
+        assert System(api_key="test_api_key", bt_panel_host="http://breaker.example.com").circuit_breaker is None
+
+
+class TestClientRetry:
+    """Test cases for retries in Client.post_data."""
+
+    def test_read_retried(self, system, no_sleep):
+        """Test that a transient failure of a read endpoint is retried."""
+        with patch.object(system.session, 'post') as mock_post:
+            mock_post.side_effect = [requests.ConnectionError("reset"), make_response({"cpu": [1, 2]})]
+            assert system.get_network() == {"cpu": [1, 2]}
+        assert mock_post.call_count == 2
+        no_sleep.assert_called_once_with(0.5)
+
+    def test_gateway_error_retried(self, system):
+        """Test that 503 responses are retried."""
+        with patch.object(system.session, 'post') as mock_post:
+            mock_post.side_effect = [make_response(status_code=503), make_response(0)]
+            assert system.get_task_count() == 0
+        assert mock_post.call_count == 2
+
+    def test_retries_exhausted(self, system):
+        """Test that exhausted retries raise ConnectionRefused."""
+        with patch.object(system.session, 'post', side_effect=requests.ConnectionError("refused")) as mock_post:
+            with pytest.raises(ConnectionRefused) as exc_info:
+                system.get_network()
+        assert mock_post.call_count == 3
+        assert isinstance(exc_info.value.__cause__, requests.ConnectionError)
+        # Handlers written for requests keep catching it
+        assert isinstance(exc_info.value, requests.ConnectionError)
+
+    def test_mutation_not_retried(self, system):
+        """Test that mutating endpoints are not retried by default."""
+        with patch.object(system.session, 'post', side_effect=requests.Timeout("slow")) as mock_post:
+            with pytest.raises(requests.Timeout):
+                system.update_panel(force=True)
+        assert mock_post.call_count == 1
+
+    def test_client_error_not_retried(self, system):
+        """Test that non-transient HTTP errors are raised as before."""
+        with patch.object(system.session, 'post', return_value=make_response(status_code=404)) as mock_post:
+            with pytest.raises(requests.HTTPError):
+                system.get_network()
+        assert mock_post.call_count == 1
+
+    def test_empty_response(self, system):
+        """Test that an empty body raises EmptyResponse."""
+        with patch.object(system.session, 'post', return_value=make_response(content=b' ')):
+            with pytest.raises(EmptyResponse):
+                system.get_network()
+
+    def test_circuit_fails_fast(self, system):
+        """Test that an open circuit rejects requests without sending them."""
+        with patch.object(system.session, 'post', side_effect=requests.ConnectionError("down")) as mock_post:
+            with pytest.raises(ConnectionRefused):
+                system.get_network()
+            assert mock_post.call_count == 3
+
+            with pytest.raises(ConnectionRefused, match="Circuit open"):
+                system.get_network()
+            assert mock_post.call_count == 3
+
+    def test_undecodable_trial_closes_circuit(self, system):
+        """Test that a half-open trial answered with a non-JSON page ends the trial."""
+        breaker = system.circuit_breaker
+        login_page = make_response(content=b'<html>login</html>')
+        login_page.json.side_effect = requests.JSONDecodeError("Expecting value", "<html>", 0)
+        with patch("pybt.core.retry.time.monotonic", return_value=100.0):
+            for _ in range(3):
+                breaker.record_failure()
+        with patch("pybt.core.retry.time.monotonic", return_value=131.0), \
+                patch.object(system.session, 'post', return_value=login_page):
+            with pytest.raises(requests.JSONDecodeError):
+                system.get_network()
+            assert breaker.state == CircuitBreaker.CLOSED
+            assert breaker.allow()
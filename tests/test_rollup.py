@@ -0,0 +1,96 @@
+"""Test cases for metric rollups."""
+
+import math
+import pytest
+from pybt.api import NetworkSample
+from pybt.core.rollup import Rollup
+
+
+def feed(rollup, seconds, step=5, start=0):
+    """Add samples whose CPU is the second within the minute."""
+    for t in range(start, start + seconds, step):
+        rollup.add({"timestamp": t, "cpu_percent": t % 60, "up": 1.0, "down": None})
+
+
+class TestRollup:
+    """Test cases for Rollup class."""
+
+    def test_aggregates(self):
+        """Test min, max, average and last of each bucket."""
+        rollup = Rollup()
+        feed(rollup, 600)
+        minutes = rollup.query(resolution=60)
+
+        assert minutes.length == 10
+        assert list(minutes["timestamp"]) == [60.0 * i for i in range(10)]
+        assert minutes["cpu_percent_min"][0] == 0 and minutes["cpu_percent_max"][0] == 55
+        assert minutes["cpu_percent_avg"][0] == 27.5 and minutes["cpu_percent_last"][9] == 55
+        assert math.isnan(minutes["down_avg"][0])
+
+        five = rollup.query(resolution=300)
+        assert five.length == 2 and five["cpu_percent_avg"][1] == 27.5
+        assert rollup.query(resolution=3600).length == 1
+
+    def test_open_bucket_is_included(self):
+        """Test that the bucket being filled is part of query results."""
+        rollup = Rollup()
+        feed(rollup, 90)
+        minutes = rollup.query(resolution=60)
+        assert list(minutes["timestamp"]) == [0.0, 60.0]
+        assert minutes["cpu_percent_max"][1] == 25
+
+    def test_time_range_and_fields(self):
+        """Test buckets overlapping a range and field selection."""
+        rollup = Rollup()
+        feed(rollup, 600)
+        columns = rollup.query(start=100, end=200, resolution=60, fields=["up"])
+        assert list(columns) == ["timestamp", "up_min", "up_max", "up_avg", "up_last"]
+        assert list(columns["timestamp"]) == [60.0, 120.0, 180.0]
+        with pytest.raises(ValueError):
+            rollup.query(resolution=7)
+
+    def test_resolution_choice(self):
+        """Test that long ranges are read at coarse resolutions."""
+        rollup = Rollup(resolutions=((60, 60), (300, 100), (3600, 100)))
+        feed(rollup, 3 * 86400, step=60)
+        now = rollup.last_time
+        assert rollup.choose_resolution(start=now - 1800) == 60
+        assert rollup.choose_resolution(start=now - 6 * 3600) == 300
+        assert rollup.choose_resolution(start=now - 2 * 86400) == 3600
+        assert rollup.choose_resolution(start=now - 1800, max_points=10) == 300
+        assert rollup.query(start=0).length == 72
+
+    def test_bounded_retention(self):
+        """Test that every resolution keeps a fixed number of buckets."""
+        rollup = Rollup(resolutions=((60, 5), (300, 2)), raw=10)
+        feed(rollup, 3600)
+        assert rollup.query(resolution=60).length == 6
+        assert rollup.query(resolution=300).length == 3
+        raw = rollup.raw()
+        assert raw.length == 10 and raw["timestamp"][-1] == 3595
+
+    def test_late_samples_and_records(self):
+        """Test counting late and dropped samples and adding records."""
+        rollup = Rollup()
+        rollup.add(NetworkSample.from_dict({"cpu": [10, 4], "up": 2}, timestamp=125.0))
+        rollup.add({"cpu_percent": 20}, timestamp=121.0)
+        rollup.add({"cpu_percent": 99}, timestamp=30.0)
+        assert (rollup.late, rollup.dropped) == (2, 0)
+        minutes = rollup.query(resolution=60)
+        assert minutes.length == 1 and minutes["cpu_percent_max"][0] == 20
+        assert rollup.query(resolution=300)["cpu_percent_max"][0] == 99
+        assert rollup.raw().length == 1
+
+        rollup.add({"cpu_percent": 1}, timestamp=7200.0)
+        rollup.add({"cpu_percent": 1}, timestamp=3000.0)
+        assert (rollup.late, rollup.dropped) == (3, 1)
+        assert Rollup(raw=0).raw() is None
+
+    def test_numpy(self):
+        """Test reading NumPy columns."""
+        np = pytest.importorskip("numpy")
+        rollup = Rollup()
+        feed(rollup, 120)
+        columns = rollup.query(resolution=60, numpy=True)
+        assert columns.numpy and columns["cpu_percent_avg"].dtype == np.float64
+        assert columns["cpu_percent_avg"].tolist() == [27.5, 27.5]
@@ -0,0 +1,123 @@
+"""Test cases for the metrics sampler."""
+
+import math
+import time
+import pytest
+from unittest.mock import patch
+from pybt.api import NetworkSample, System
+from pybt.core.sampler import MetricsSampler, RingBuffer, get_sampler, stop_samplers
+
+NETWORK = {
+    "down": 12.5, "up": 3.25, "downTotal": 1000, "upTotal": 500, "downPackets": 10, "upPackets": 5,
+    "cpu": [42.0, 4], "mem": {"memTotal": 7821, "memRealUsed": 2048},
+    "load": {"one": 0.5, "five": 0.4, "fifteen": 0.3},
+}
+TOTAL = {"system": "Ubuntu", "cpuNum": 4, "memTotal": 7821}
+
+
+def make_system(host="http://sampler.example.com"):
+    """Create a System client for sampler tests."""
+    return System(api_key="test_api_key", bt_panel_host=host)
+
+
+class TestRingBuffer:
+    """Test cases for RingBuffer class."""
+
+    def test_wraps_at_capacity(self):
+        """Test that the oldest samples are overwritten once full."""
+        ring = RingBuffer(3)
+        for t in range(5):
+            ring.append({"timestamp": t, "cpu_percent": t * 10})
+
+        assert len(ring) == 3 and ring.total == 5
+        columns = ring.read()
+        assert list(columns["timestamp"]) == [2.0, 3.0, 4.0]
+        assert list(columns["cpu_percent"]) == [20.0, 30.0, 40.0]
+        assert math.isnan(columns["load_one"][0])
+        assert ring.latest()["cpu_percent"] == 40.0
+
+    def test_read_window(self):
+        """Test reading the newest samples or samples after a time."""
+        ring = RingBuffer(10)
+        for t in range(6):
+            ring.append({"timestamp": t})
+
+        assert list(ring.read(since=3)["timestamp"]) == [4.0, 5.0]
+        assert list(ring.read(since=1, until=3)["timestamp"]) == [2.0, 3.0]
+        assert list(ring.read(last=3, fields=["timestamp"])["timestamp"]) == [3.0, 4.0, 5.0]
+        assert ring.read(since=10).length == 0
+        ring.clear()
+        assert ring.latest() is None and ring.read().length == 0
+
+    def test_records_and_numpy(self):
+        """Test storing records and reading NumPy columns."""
+        np = pytest.importorskip("numpy")
+        ring = RingBuffer(2)
+        ring.append(NetworkSample.from_dict(NETWORK, timestamp=1.0))
+        ring.append([2.0] + [None] * (len(ring.fields) - 1))
+        columns = ring.read(numpy=True)
+        assert np.isnan(columns["cpu_percent"][1])
+        assert columns.numpy and columns["down_total"].dtype == np.float64
+        assert columns["mem_used"][0] == 2048
+
+    def test_invalid(self):
+        """Test that invalid layouts are rejected."""
+        with pytest.raises(ValueError):
+            RingBuffer(0)
+        with pytest.raises(ValueError):
+            RingBuffer(4, fields=["cpu_percent"])
+
+
+class TestMetricsSampler:
+    """Test cases for MetricsSampler class."""
+
+    def test_sample(self):
+        """Test that a poll stores the network reading and system info."""
+        system = make_system()
+        sampler = MetricsSampler(system, info_every=2)
+        seen = []
+        sampler.subscribe(seen.append)
+        with patch.object(system, 'get_network', return_value=NETWORK), \
+                patch.object(system, 'get_system_total', return_value=TOTAL) as total:
+            for _ in range(3):
+                sampler.sample()
+
+        assert total.call_count == 2
+        assert sampler.info == TOTAL
+        assert len(seen) == 3 and seen[0].cpu_percent == 42.0
+        assert list(sampler.read(last=1)["load_fifteen"]) == [0.3]
+
+    def test_failures_are_counted(self):
+        """Test that failed polls are skipped without stopping sampling."""
+        system = make_system()
+        sampler = MetricsSampler(system)
+        with patch.object(system, 'get_system_total', return_value=TOTAL), \
+                patch.object(system, 'get_network', side_effect=[{"status": False, "msg": "denied"}, NETWORK]):
+            assert sampler.sample() is None
+            assert sampler.sample() is not None
+
+        assert sampler.errors == 1 and isinstance(sampler.last_error, ValueError)
+        assert len(sampler.ring) == 1
+
+    def test_background_thread(self):
+        """Test polling on the background thread until stopped."""
+        system = make_system()
+        with patch.object(system, 'get_network', return_value=NETWORK), \
+                patch.object(system, 'get_system_total', return_value=TOTAL):
+            with MetricsSampler(system, interval=0.01) as sampler:
+                deadline = time.monotonic() + 2
+                while len(sampler.ring) < 3 and time.monotonic() < deadline:
+                    time.sleep(0.01)
+                assert sampler.running
+        assert not sampler.running
+        assert len(sampler.ring) >= 3
+
+    def test_shared_per_panel(self):
+        """Test that consumers of one panel share a sampler."""
+        try:
+            first = get_sampler(make_system(), capacity=10)
+            assert get_sampler(make_system("http://SAMPLER.example.com/")) is first
+            assert first.ring.capacity == 10
+            assert get_sampler(make_system("http://other.example.com")) is not first
+        finally:
+            stop_samplers()
@@ -0,0 +1,189 @@
+"""Test cases for the adaptive polling scheduler."""
+
+import threading
+import pytest
+from unittest.mock import patch
+from pybt.api import System
+from pybt.core.scheduler import AdaptiveScheduler, change_score, signals, DEFAULT_TOLERANCES
+
+NETWORK = {"cpu": [5.0, 4], "mem": {"memTotal": 1000, "memRealUsed": 400}, "load": {"one": 0.2}, "up": 1, "down": 2}
+DISKS = [{"path": "/", "size": ["50G", "20G", "30G", "40%"], "inodes": ["1M", "1K", "1M", "1%"]}]
+
+
+class Clock:
+    """Manually advanced clock."""
+
+    def __init__(self):
+        self.now = 0.0
+
+    def __call__(self):
+        return self.now
+
+
+def make_system(host="http://scheduler.example.com"):
+    """Create a System client for scheduler tests."""
+    return System(api_key="test_api_key", bt_panel_host=host)
+
+
+def make_scheduler(clock, **kwargs):
+    """Create a deterministic single-threaded scheduler."""
+    options = dict(min_interval=5, max_interval=40, jitter=0.0, max_workers=1, clock=clock, seed=1)
+    options.update(kwargs)
+    return AdaptiveScheduler(**options)
+
+
+class TestSignals:
+    """Test cases for signals and change_score."""
+
+    def test_signals(self):
+        """Test the signals of each polled endpoint."""
+        assert signals("get_network", NETWORK) == {"cpu": 5.0, "mem": 40.0, "load": 0.2, "up": 1.0, "down": 2.0}
+        assert signals("get_disk_info", DISKS) == {"disk:/": 40.0, "inodes:/": 1.0}
+        assert signals("get_task_count", 2) == {"tasks": 2.0}
+        assert signals("get_network", {"status": False, "msg": "error"}) == {}
+
+    def test_change_score(self):
+        """Test scoring changes in tolerances."""
+        previous = signals("get_network", NETWORK)
+        busy = dict(previous, cpu=20.0)
+        assert change_score(previous, dict(previous, cpu=7.0), DEFAULT_TOLERANCES) < 1
+        assert change_score(previous, busy, DEFAULT_TOLERANCES) == 3.0
+        assert change_score({"disk:/": 40.0}, {"disk:/": 40.0, "disk:/www": 1.0}, DEFAULT_TOLERANCES) == float("inf")
+
+
+class TestAdaptiveScheduler:
+    """Test cases for AdaptiveScheduler class."""
+
+    def test_intervals_adapt(self):
+        """Test that calm polls back off and activity tightens the interval."""
+        clock = Clock()
+        scheduler = make_scheduler(clock)
+        system = make_system()
+        job, = scheduler.add(system, ["get_network"])
+        readings = [NETWORK] * 4 + [dict(NETWORK, cpu=[80.0, 4])]
+
+        with patch.object(system, 'get_network', side_effect=readings):
+            intervals = []
+            for _ in readings:
+                clock.now = scheduler.next_due()
+                assert scheduler.run_due() == 1
+                intervals.append(job.interval)
+
+        assert intervals == [7.5, 11.25, 16.875, 25.3125, 12.65625]
+        assert job.polls == 5 and job.changes == 1
+
+    def test_bounds_and_latency(self):
+        """Test the interval bounds and the latency floor."""
+        clock = Clock()
+        scheduler = make_scheduler(clock, latency_factor=10)
+        system = make_system()
+        job, = scheduler.add(system, ["get_task_count"])
+
+        def slow():
+            clock.now += 3.0
+            return 0
+
+        with patch.object(system, 'get_task_count', side_effect=slow):
+            scheduler.poll(job)
+        assert job.latency == 3.0 and job.interval == 30.0
+
+        with patch.object(system, 'get_task_count', return_value=0):
+            for _ in range(10):
+                scheduler.poll(job)
+        assert job.interval == 40
+
+        with patch.object(system, 'get_task_count', side_effect=range(1, 20)):
+            for _ in range(10):
+                scheduler.poll(job)
+        assert job.interval == max(5, job.latency * 10)
+
+    def test_jitter_spreads_polls(self):
+        """Test that panels added together get different due times."""
+        scheduler = AdaptiveScheduler(min_interval=10, jitter=0.2, clock=Clock(), seed=3)
+        for i in range(20):
+            scheduler.add(make_system(f"http://panel-{i}.example.com"), ["get_network"])
+        due = [job.due for job in scheduler.jobs]
+        assert len(set(due)) == 20 and all(0 <= t <= 10 for t in due)
+
+    def test_failures_and_subscribers(self):
+        """Test that failures back off and results reach subscribers."""
+        clock = Clock()
+        scheduler = make_scheduler(clock)
+        system = make_system()
+        results = []
+        scheduler.subscribe(lambda job, result: results.append((job.method, result)))
+        job, = scheduler.add(system, ["get_disk_info"])
+
+        with patch.object(system, 'get_disk_info', side_effect=[ConnectionError("down"), DISKS]):
+            assert scheduler.poll(job) is None
+            assert scheduler.poll(job) == DISKS
+        assert job.errors == 1 and job.interval == 11.25
+        assert results == [("get_disk_info", DISKS)]
+
+    def test_add_remove_and_stale_entries(self):
+        """Test job lookup, removal and polling a job only once per due time."""
+        clock = Clock()
+        scheduler = make_scheduler(clock)
+        system = make_system()
+        jobs = scheduler.add(system)
+        assert len(scheduler) == 3 and scheduler.add(system, ["get_network"]) == jobs[:1]
+
+        with patch.object(system, 'get_network', return_value=NETWORK):
+            scheduler.poll(jobs[0])
+        clock.now = 1000
+        with patch.object(system, 'get_network', return_value=NETWORK) as network, \
+                patch.object(system, 'get_disk_info', return_value=DISKS), \
+                patch.object(system, 'get_task_count', return_value=0):
+            assert scheduler.run_due() == 3
+        assert network.call_count == 1
+
+        scheduler.remove(system, ["get_disk_info", "get_task_count"])
+        assert [job.method for job in scheduler.jobs] == ["get_network"]
+        scheduler.remove(system)
+        assert scheduler.next_due() is None
+
+    def test_slow_panel_does_not_block(self):
+        """Test that a slow poll neither delays other panels nor runs twice."""
+        clock = Clock()
+        scheduler = make_scheduler(clock, max_workers=4)
+        slow, fast = make_system("http://slow.example.com"), make_system("http://fast.example.com")
+        slow_job, = scheduler.add(slow, ["get_task_count"])
+        fast_job, = scheduler.add(fast, ["get_task_count"])
+        release = threading.Event()
+        fast_polls = threading.Semaphore(0)
+
+        try:
+            with patch.object(slow, 'get_task_count', side_effect=lambda: release.wait(5) and 0) as slow_call, \
+                    patch.object(fast, 'get_task_count', side_effect=lambda: fast_polls.release() or 0):
+                clock.now = 100
+                assert scheduler.run_due() == 2
+                assert fast_polls.acquire(timeout=2)
+
+                clock.now = 200
+                assert scheduler.run_due() == 1
+                assert fast_polls.acquire(timeout=2)
+                assert slow_job.polling and slow_call.call_count == 1
+                release.set()
+                scheduler.stop()
+        finally:
+            release.set()
+            scheduler.stop()
+
+        assert fast_job.polls == 2 and slow_job.polls == 1
+        assert not slow_job.polling and scheduler.next_due() is not None
+
+    def test_background_thread(self):
+        """Test polling on the background thread."""
+        system = make_system()
+        polled = threading.Event()
+        with patch.object(system, 'get_task_count', side_effect=lambda: polled.set() or 0):
+            with AdaptiveScheduler(min_interval=0.01, max_interval=0.02) as scheduler:
+                scheduler.add(system, ["get_task_count"])
+                assert polled.wait(2)
+                assert scheduler.running
+        assert not scheduler.running
+
+    def test_invalid_bounds(self):
+        """Test that inverted bounds are rejected."""
+        with pytest.raises(ValueError):
+            AdaptiveScheduler(min_interval=10, max_interval=5)
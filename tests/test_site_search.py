@@ -0,0 +1,141 @@
+"""Test cases for the client-side site search index."""
+
+import pytest
+from unittest.mock import patch
+from pybt.api import Directory, Domain, Website
+from pybt.api.records import Site
+from pybt.core.site_search import SiteHit, SiteSearch
+
+HOST = "http://search.example.com"
+
+SITES = [
+    {"id": 1, "name": "shop.example.com", "ps": "Online store", "path": "/www/wwwroot/shop.example.com"},
+    {"id": 2, "name": "blog.example.com", "ps": "公司博客", "path": "/www/wwwroot/blog"},
+    {"id": 3, "name": "api.other.org", "ps": "", "path": "/data/api"},
+]
+
+DOMAINS = [
+    {"pid": 1, "name": "shop.example.com"},
+    {"pid": 1, "name": "store.example.net"},
+    {"pid": 3, "name": "v2.api.other.org"},
+]
+
+
+@pytest.fixture
+def search():
+    """Create an index loaded with SITES and DOMAINS."""
+    search = SiteSearch()
+    search.load_rows(HOST, SITES, DOMAINS)
+    return search
+
+
+def ids(hits):
+    """Get the site IDs of search hits."""
+    return [hit.site_id for hit in hits]
+
+
+class TestSiteSearch:
+    """Test cases for SiteSearch class."""
+
+    def test_substring(self, search):
+        """Test substring queries over every field, case-insensitively."""
+        assert ids(search.substring("EXAMPLE")) == [1, 2]
+        assert ids(search.substring("store")) == [1]
+        assert ids(search.substring("博客")) == [2]
+        assert ids(search.substring("/data")) == [3]
+        assert ids(search.substring("ap")) == [3]
+        assert search.substring("nothing here") == []
+
+    def test_prefix(self, search):
+        """Test prefix queries over words, names and domains."""
+        assert ids(search.prefix("sto")) == [1]
+        assert ids(search.prefix("blog.ex")) == [2]
+        assert ids(search.prefix("v2.api")) == [3]
+        assert search.prefix("xample") == []
+
+    def test_search_and_limit(self, search):
+        """Test that search ranks prefix matches first and honours the limit."""
+        hits = search.search("api")
+        assert hits[0] == SiteHit(HOST, 3, "api.other.org")
+        assert len(search.search("o", limit=2)) == 2
+
+    def test_records_and_fleets(self, search):
+        """Test loading Site records and keeping panels apart."""
+        search.load_rows("http://other.example.com", [Site(id=1, name="shop.other.com", ps="", path="")])
+        assert len(search) == 4
+        assert {hit.host for hit in search.substring("shop")} == {HOST, "http://other.example.com"}
+
+        search.load_rows(HOST, SITES[:1])
+        assert len(search) == 2
+        assert ids(search.substring("blog")) == []
+
+    def test_updates(self, search):
+        """Test that updated sites are found by their new values only."""
+        assert search.update_site(HOST, 2, ps="engineering notes")
+        assert ids(search.substring("notes")) == [2]
+        assert ids(search.substring("博客")) == []
+        assert search.get(HOST, 2)["path"] == "/www/wwwroot/blog"
+
+        search.remove_site(HOST, 2)
+        assert search.get(HOST, 2) is None
+        assert not search.update_site(HOST, 2, ps="x")
+        assert len(search) == 2
+
+    def test_compaction(self):
+        """Test that postings are rebuilt once tombstones pile up."""
+        search = SiteSearch()
+        for i in range(3000):
+            search.add_site(HOST, 1, f"site{i}.com")
+        assert len(search._docs) < 3000
+        assert ids(search.prefix("site2999")) == [1]
+        assert search.prefix("site0.") == []
+
+
+class TestSiteSearchTracking:
+    """Test cases for keeping the index current through hooks."""
+
+    def test_load_from_panel(self, search):
+        """Test loading the website and domain tables."""
+        website = Website(api_key="test_api_key", bt_panel_host=HOST)
+        search = SiteSearch()
+
+        def post_data(endpoint, data):
+            rows = SITES if "sites" in endpoint else DOMAINS
+            return {"data": rows, "page": f"<span class='Pcount'>共{len(rows)}条</span>"}
+
+        with patch.object(website, 'post_data', side_effect=post_data):
+            assert search.load(website, limit=10) == 3
+        assert ids(search.prefix("store")) == [1]
+
+    def test_tracks_site_changes(self, search):
+        """Test that create, remark, path and delete calls update the index."""
+        website = Website(api_key="test_api_key", bt_panel_host=HOST)
+        directory = Directory(api_key="test_api_key", bt_panel_host=HOST)
+        search.track(website, directory)
+        webname = {"domain": "wiki.example.com", "domainlist": ["docs.example.com"], "count": 1}
+        with patch.object(website, '_post', return_value={"siteStatus": True, "siteId": 9}):
+            website.create_website(webname, "/www/wwwroot/wiki", 0, "74", ps="Team wiki")
+        assert search.search("docs") == [SiteHit(HOST, 9, "wiki.example.com")]
+
+        ok = {"status": True, "msg": "ok"}
+        with patch.object(website, '_post', return_value=ok), patch.object(directory, '_post', return_value=ok):
+            website.set_website_remark(9, "Knowledge base")
+            directory.set_root_path(9, "/data/kb")
+            assert ids(search.substring("knowledge")) == [9]
+            assert ids(search.prefix("/data/kb")) == [] and ids(search.substring("/data/kb")) == [9]
+            website.delete_website(9, "wiki.example.com")
+        assert search.get(HOST, 9) is None
+
+        with patch.object(website, '_post', return_value={"status": False, "msg": "error"}):
+            website.set_website_remark(1, "ignored")
+        assert search.get(HOST, 1)["ps"] == "Online store"
+
+    def test_tracks_domain_changes(self, search):
+        """Test that added and deleted domains update the index."""
+        domain = Domain(api_key="test_api_key", bt_panel_host=HOST)
+        search.track(domain)
+        with patch.object(domain, '_post', return_value={"status": True, "msg": "ok"}):
+            domain.add_domain(2, "blog.example.com", "news.example.com,www.news.example.com:81")
+            assert ids(search.prefix("www.news")) == [2]
+            domain.delete_domain(2, "blog.example.com", "www.news.example.com", 81)
+        assert search.get(HOST, 2)["domains"] == ["news.example.com"]
@@ -245,6 +245,31 @@ class TestWebsite:
                 {"id": 1, "webname": "test.com", "ftp": 1, "database": 1, "path": 1}
             )
 
+    def test_iter_websites(self, website):
+        """Test iter_websites walks every page."""
+        pages = {
+            1: {"data": [{"id": 5}, {"id": 4}], "page": "<span class='Pcount'>共5条</span>"},
+            2: {"data": [{"id": 3}, {"id": 2}], "page": "<span class='Pcount'>共5条</span>"},
+            3: {"data": [{"id": 1}], "page": "<span class='Pcount'>共5条</span>"},
+        }
+
+        with patch.object(website, 'get_website_list', side_effect=lambda page, **kw: pages[page]) as mock_list:
+            result = [site["id"] for site in website.iter_websites(limit=2)]
+
+            assert result == [5, 4, 3, 2, 1]
+            assert mock_list.call_count == 3
+            mock_list.assert_called_with(page=3, limit=2, type_id=-1, order="id desc", search=None)
+
+    def test_iter_websites_lazy(self, website):
+        """Test iter_websites fetches no more pages than consumed."""
+        page = {"data": [{"id": 1}, {"id": 2}], "page": "<span class='Pcount'>Total: 1000</span>"}
+
+        with patch.object(website, 'get_website_list', return_value=page) as mock_list:
+            sites = website.iter_websites(limit=2)
+            assert mock_list.call_count == 0
+            assert [next(sites) for _ in range(3)] == [{"id": 1}, {"id": 2}, {"id": 1}]
+            assert mock_list.call_count == 2
+
 
 class TestWebsiteBackup:
     """Test cases for WebsiteBackup class."""
@@ -276,6 +301,17 @@ class TestWebsiteBackup:
                 {"p": 1, "limit": 5, "type": 0, "search": 1}
             )
 
+    def test_iter_backups(self, website_backup):
+        """Test iter_backups prefetches the remaining pages."""
+        def get_backup_list(search, page, limit):
+            return {"data": [{"id": page}], "page": "<span class='Pcount'>共3条</span>"}
+
+        with patch.object(website_backup, 'get_backup_list', side_effect=get_backup_list) as mock_list:
+            result = list(website_backup.iter_backups(search=1, limit=1, window=2))
+
+            assert result == [{"id": 1}, {"id": 2}, {"id": 3}]
+            assert mock_list.call_count == 3
+
     def test_create_backup(self, website_backup):
         """Test create_backup method."""
         mock_response = {
@@ -320,6 +356,22 @@ class TestDomain:
                 {"search": 1, "list": True}
             )
 
+    def test_iter_domains(self, domain):
+        """Test iter_domains pages through the whole domain table."""
+        responses = [
+            {"data": [{"id": 1}, {"id": 2}], "page": "<span class='Pcount'>Total: 3</span>"},
+            {"data": [{"id": 3}], "page": "<span class='Pcount'>Total: 3</span>"},
+        ]
+
+        with patch.object(domain, 'post_data', side_effect=responses) as mock_post:
+            result = list(domain.iter_domains(limit=2))
+
+            assert [d["id"] for d in result] == [1, 2, 3]
+            mock_post.assert_called_with(
+                domain.config.get_endpoint("WebDomainList"),
+                {"p": 2, "limit": 2}
+            )
+
     def test_add_domain(self, domain):
         """Test add_domain method."""
         mock_response = {